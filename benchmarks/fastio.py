@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark reading N integers from stdin and writing them back with fscanf
+and printf against read_int() and write_int(). N defaults to 10^7.
+
+    python benchmarks/fastio.py [N]
+"""
+
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from compiler import compile_lang_sources
+
+
+STDIO_SOURCE = """
+def main() -> int:
+    n: int
+    x: int
+    fscanf(stdin, "%d", &n)
+    printf("%d\\n", n)
+    for i in range(n):
+        fscanf(stdin, "%d", &x)
+        printf("%d\\n", x + 1)
+    return 0
+"""
+
+FASTIO_SOURCE = """
+def main() -> int:
+    n = read_int()
+    write_int(n)
+    write_char('\\n')
+    for i in range(n):
+        write_int(read_int() + 1)
+        write_char('\\n')
+    return 0
+"""
+
+# Each run is repeated and the fastest one is kept
+REPEAT = 3
+
+
+def time_run(exe, input_path, output_path):
+    best = None
+    for _ in range(REPEAT):
+        with open(input_path, "rb") as stdin, open(output_path, "wb") as stdout:
+            start = time.perf_counter()
+            subprocess.run([exe], stdin=stdin, stdout=stdout, check=True)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "input.txt")
+        rand = random.Random(0)
+        numbers = [rand.randint(-10 ** 9, 10 ** 9) for _ in range(n)]
+        with open(input_path, "w") as f:
+            f.write("{}\n".format(n))
+            f.write("\n".join(map(str, numbers)))
+            f.write("\n")
+
+        expected = "{}\n{}\n".format(n, "\n".join(str(x + 1) for x in numbers))
+        results = []
+        for name, code in (("fscanf/printf", STDIO_SOURCE),
+                           ("read_int/write_int", FASTIO_SOURCE)):
+            source = os.path.join(tmp, name.split("/")[0] + ".cu")
+            with open(source, "w") as f:
+                f.write(code)
+            exe = source + ".out"
+            compile_lang_sources([source], output=exe)
+
+            output_path = os.path.join(tmp, "output.txt")
+            elapsed = time_run(exe, input_path, output_path)
+            with open(output_path) as f:
+                assert f.read() == expected, name + " gave the wrong output"
+            results.append((name, elapsed))
+
+        print("{} integers".format(n))
+        base = results[0][1]
+        for name, elapsed in results:
+            print("  {:20s} {:8.3f}s  speedup {:5.2f}x".format(
+                name, elapsed, base / elapsed))
+
+
+if __name__ == "__main__":
+    main()
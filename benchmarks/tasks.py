@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark the spawn/join thread pool on recursive fib and parallel merge
+sort with 1 to N threads. N defaults to the number of cores.
+
+    python benchmarks/tasks.py [N]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from compiler import compile_lang_sources
+
+
+# Sources and the arguments they are run with
+BENCHMARKS = (
+    ("examples/spawn_fib.cu", ["40"]),
+    ("examples/spawn_sort.cu", ["5000000"]),
+)
+
+# Each run is repeated and the fastest one is kept
+REPEAT = 3
+
+
+def time_run(exe, args, threads):
+    env = dict(os.environ, LANG_NUM_THREADS=str(threads))
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        subprocess.run([exe] + args, env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for source, args in BENCHMARKS:
+            exe = os.path.join(tmp, os.path.basename(source) + ".out")
+            compile_lang_sources([os.path.join(ROOT, source)], output=exe)
+
+            print("{} {}".format(source, " ".join(args)))
+            base = None
+            for threads in range(1, max_threads + 1):
+                elapsed = time_run(exe, args, threads)
+                base = base or elapsed
+                print("  {:3d} threads: {:8.3f}s  speedup {:5.2f}x".format(
+                    threads, elapsed, base / elapsed))
+
+
+if __name__ == "__main__":
+    main()
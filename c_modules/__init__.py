@@ -1,7 +1,22 @@
+import os.path
+
 from .stdio_module import STDIO_VARS
 from .stdlib_module import STDLIB_VARS, STDLIB_TYPES
 from .assert_module import ASSERT_VARS
 from .string_module import STRING_VARS, STRING_TYPES
+from .arena_module import ARENA_VARS, ARENA_TYPES
+from .hash_module import HASH_VARS
+from .str_module import STR_VARS, STR_TYPES
+from .simd_module import SIMD_VARS, SIMD_TYPES
+from .stdint_module import STDINT_TYPES
+from .atomic_module import ATOMIC_VARS, ATOMIC_TYPES
+from .pthread_module import PTHREAD_VARS, PTHREAD_TYPES
+from .io_module import FCNTL_VARS, UNISTD_VARS, MMAN_VARS, IO_VARS
+from .fastio_module import FASTIO_VARS
+
+
+# Headers for the runtime that ships with the compiler (the lang_*.h headers)
+C_INCLUDE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "include")
 
 
 C_VARS = {}
@@ -9,8 +24,47 @@ C_VARS.update(STDIO_VARS)
 C_VARS.update(STDLIB_VARS)
 C_VARS.update(ASSERT_VARS)
 C_VARS.update(STRING_VARS)
+C_VARS.update(ARENA_VARS)
+C_VARS.update(HASH_VARS)
+C_VARS.update(STR_VARS)
+C_VARS.update(SIMD_VARS)
+C_VARS.update(ATOMIC_VARS)
+C_VARS.update(PTHREAD_VARS)
+C_VARS.update(FCNTL_VARS)
+C_VARS.update(UNISTD_VARS)
+C_VARS.update(MMAN_VARS)
+C_VARS.update(IO_VARS)
+C_VARS.update(FASTIO_VARS)
 
 
 C_TYPES = {}
 C_TYPES.update(STDLIB_TYPES)
 C_TYPES.update(STRING_TYPES)
+C_TYPES.update(ARENA_TYPES)
+C_TYPES.update(STR_TYPES)
+C_TYPES.update(SIMD_TYPES)
+C_TYPES.update(STDINT_TYPES)
+C_TYPES.update(ATOMIC_TYPES)
+C_TYPES.update(PTHREAD_TYPES)
+
+
+# Generic classes written in the language that can be used without being
+# declared. They are only parsed when specialized.
+C_TEMPLATES = {
+    "List": os.path.join(os.path.dirname(os.path.abspath(__file__)), "list.hu"),
+    "Dict": os.path.join(os.path.dirname(os.path.abspath(__file__)), "dict.hu"),
+}
+
+
+# Sorting and binary search functions specialized by sort(), bisect_left()
+# and bisect_right()
+C_SORT_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sort.hu")
+
+# map_file() and unmap_file(), which are only parsed when used
+C_IO_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "io.hu")
+
+# The struct and functions of Span<T>
+C_SPAN_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "span.hu")
+
+# The struct and the functions that do not depend on the rank of NDArray<T, N>
+C_NDARRAY_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ndarray.hu")
@@ -0,0 +1,127 @@
+from lang_types import *
+
+
+# Declarations for the arena runtime in include/lang_arena.h. Arena is opaque
+# in language space; it is only ever handled through pointers.
+ARENA_MODULE = Module([
+    Ifndef("_LANG_ARENA_H"),
+    Define("_LANG_ARENA_H"),
+
+    StructDecl(Struct("Arena", [])),
+
+    FuncDecl(
+        "arena_new",
+        [
+            VarDecl("size", NameType("size_t")),
+        ],
+        Pointer(NameType("Arena"))
+    ),
+
+    FuncDecl(
+        "arena_new_nested",
+        [
+            VarDecl("size", NameType("size_t")),
+            VarDecl("parent", Pointer(NameType("Arena"))),
+        ],
+        Pointer(NameType("Arena"))
+    ),
+
+    FuncDecl(
+        "arena_alloc",
+        [
+            VarDecl("arena", Pointer(NameType("Arena"))),
+            VarDecl("size", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "arena_alloc_aligned",
+        [
+            VarDecl("arena", Pointer(NameType("Arena"))),
+            VarDecl("size", NameType("size_t")),
+            VarDecl("align", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "arena_calloc",
+        [
+            VarDecl("arena", Pointer(NameType("Arena"))),
+            VarDecl("count", NameType("size_t")),
+            VarDecl("size", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "arena_realloc",
+        [
+            VarDecl("arena", Pointer(NameType("Arena"))),
+            VarDecl("ptr", Pointer(NameType("void"))),
+            VarDecl("size", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "arena_owns",
+        [
+            VarDecl("arena", Pointer(NameType("Arena"))),
+            VarDecl("ptr", Pointer(NameType("void"))),
+        ],
+        NameType("int")
+    ),
+
+    FuncDecl(
+        "arena_release",
+        [
+            VarDecl("arena", Pointer(NameType("Arena"))),
+            VarDecl("ptr", Pointer(NameType("void"))),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "arena_reset",
+        [
+            VarDecl("arena", Pointer(NameType("Arena"))),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "arena_free",
+        [
+            VarDecl("arena", Pointer(NameType("Arena"))),
+        ],
+        NameType("void")
+    ),
+
+    Endif(),
+])
+
+
+ARENA_VARS = dict.fromkeys(
+    {
+        "arena_new",
+        "arena_new_nested",
+        "arena_alloc",
+        "arena_alloc_aligned",
+        "arena_calloc",
+        "arena_realloc",
+        "arena_owns",
+        "arena_release",
+        "arena_reset",
+        "arena_free",
+    },
+    ("lang_arena.h", ARENA_MODULE)
+)
+
+ARENA_TYPES = dict.fromkeys(
+    {
+        "Arena",
+    },
+    ("lang_arena.h", ARENA_MODULE)
+)
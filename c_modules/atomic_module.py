@@ -0,0 +1,155 @@
+from lang_types import *
+
+
+MEMORY_ORDERS = (
+    "memory_order_relaxed",
+    "memory_order_consume",
+    "memory_order_acquire",
+    "memory_order_release",
+    "memory_order_acq_rel",
+    "memory_order_seq_cst",
+)
+
+# Atomic types in include/lang_atomic.h and the types of their values. The
+# atomic types are opaque so they can only be used through their functions.
+ATOMIC_VALUE_TYPES = {
+    "atomic_int": NameType("int"),
+    "atomic_uint": NameType("uint"),
+    "atomic_long": NameType("long"),
+    "atomic_ulong": NameType("ulong"),
+    "atomic_ptr": Pointer(NameType("void")),
+}
+
+ATOMIC_INT_OPS = ("add", "sub", "and", "or", "xor")
+
+
+def _atomic_decls(name, elem):
+    """The declaration of an atomic type and its functions."""
+    atomic = Pointer(NameType(name))
+    order = NameType("memory_order")
+    decls = [
+        StructDecl(Struct(name, [])),
+
+        FuncDecl(
+            name + "_init",
+            [
+                VarDecl("a", atomic),
+                VarDecl("x", elem),
+            ],
+            NameType("void")
+        ),
+
+        FuncDecl(
+            name + "_load",
+            [
+                VarDecl("a", atomic),
+                VarDecl("order", order),
+            ],
+            elem
+        ),
+
+        FuncDecl(
+            name + "_store",
+            [
+                VarDecl("a", atomic),
+                VarDecl("x", elem),
+                VarDecl("order", order),
+            ],
+            NameType("void")
+        ),
+
+        FuncDecl(
+            name + "_exchange",
+            [
+                VarDecl("a", atomic),
+                VarDecl("x", elem),
+                VarDecl("order", order),
+            ],
+            elem
+        ),
+
+        FuncDecl(
+            name + "_compare_exchange",
+            [
+                VarDecl("a", atomic),
+                VarDecl("expected", Pointer(elem)),
+                VarDecl("x", elem),
+                VarDecl("success", order),
+                VarDecl("failure", order),
+            ],
+            NameType("int")
+        ),
+    ]
+
+    if not isinstance(elem, Pointer):
+        decls += [
+            FuncDecl(
+                "{}_fetch_{}".format(name, op),
+                [
+                    VarDecl("a", atomic),
+                    VarDecl("x", elem),
+                    VarDecl("order", order),
+                ],
+                elem
+            )
+            for op in ATOMIC_INT_OPS
+        ]
+
+    return decls
+
+
+def _atomic_funcs(name, elem):
+    funcs = {"init", "load", "store", "exchange", "compare_exchange"}
+    if not isinstance(elem, Pointer):
+        funcs |= {"fetch_" + op for op in ATOMIC_INT_OPS}
+    return {name + "_" + func for func in funcs}
+
+
+# Declarations for the atomic types in include/lang_atomic.h. The memory
+# orders and fences are the ones of stdatomic.h.
+ATOMIC_MODULE = Module(
+    [
+        Ifndef("_LANG_ATOMIC_H"),
+        Define("_LANG_ATOMIC_H"),
+
+        TypeDefStmt(NameType("int"), "memory_order"),
+    ] +
+    [
+        VarDeclStmt(VarDecl(order, NameType("memory_order")))
+        for order in MEMORY_ORDERS
+    ] +
+    [
+        FuncDecl(
+            "atomic_thread_fence",
+            [
+                VarDecl("order", NameType("memory_order")),
+            ],
+            NameType("void")
+        ),
+    ] +
+    [
+        decl
+        for name, elem in ATOMIC_VALUE_TYPES.items()
+        for decl in _atomic_decls(name, elem)
+    ] +
+    [
+        Endif(),
+    ]
+)
+
+
+ATOMIC_VARS = dict.fromkeys(
+    set(MEMORY_ORDERS) |
+    {"atomic_thread_fence"} |
+    {
+        func
+        for name, elem in ATOMIC_VALUE_TYPES.items()
+        for func in _atomic_funcs(name, elem)
+    },
+    ("lang_atomic.h", ATOMIC_MODULE)
+)
+
+ATOMIC_TYPES = dict.fromkeys(
+    set(ATOMIC_VALUE_TYPES) | {"memory_order"},
+    ("lang_atomic.h", ATOMIC_MODULE)
+)
@@ -0,0 +1,89 @@
+from lang_types import *
+
+
+# Declarations for the buffered number IO in include/lang_fastio.h
+FASTIO_MODULE = Module([
+    Ifndef("_LANG_FASTIO_H"),
+    Define("_LANG_FASTIO_H"),
+
+    # Reading from stdin
+
+    FuncDecl("read_int", [], NameType("int")),
+    FuncDecl("read_long", [], NameType("long")),
+    FuncDecl("read_float", [], NameType("double")),
+    FuncDecl("read_eof", [], NameType("int")),
+
+    FuncDecl(
+        "read_line",
+        [
+            VarDecl("buf", Pointer(NameType("char"))),
+            VarDecl("size", NameType("size_t")),
+        ],
+        NameType("long")
+    ),
+
+    # Writing to stdout
+
+    FuncDecl(
+        "write_int",
+        [
+            VarDecl("x", NameType("long")),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "write_uint",
+        [
+            VarDecl("x", NameType("ulong")),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "write_float",
+        [
+            VarDecl("x", NameType("double")),
+            VarDecl("precision", NameType("int")),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "write_char",
+        [
+            VarDecl("c", NameType("char")),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "write_str",
+        [
+            VarDecl("s", Pointer(NameType("char"))),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl("write_flush", [], NameType("void")),
+
+    Endif(),
+])
+
+
+FASTIO_VARS = dict.fromkeys(
+    {
+        "read_int",
+        "read_long",
+        "read_float",
+        "read_eof",
+        "read_line",
+        "write_int",
+        "write_uint",
+        "write_float",
+        "write_char",
+        "write_str",
+        "write_flush",
+    },
+    ("lang_fastio.h", FASTIO_MODULE)
+)
@@ -0,0 +1,55 @@
+from lang_types import *
+
+
+# Declarations for the hash functions in include/lang_hash.h. These are not
+# usually called directly; hash() and hash_eq() are lowered to them.
+HASH_MODULE = Module([
+    Ifndef("_LANG_HASH_H"),
+    Define("_LANG_HASH_H"),
+
+    FuncDecl(
+        "lang_hash_int",
+        [
+            VarDecl("x", NameType("ulong")),
+        ],
+        NameType("size_t")
+    ),
+
+    FuncDecl(
+        "lang_hash_ptr",
+        [
+            VarDecl("p", Pointer(NameType("void"))),
+        ],
+        NameType("size_t")
+    ),
+
+    FuncDecl(
+        "lang_hash_str",
+        [
+            VarDecl("s", Pointer(NameType("char"))),
+        ],
+        NameType("size_t")
+    ),
+
+    FuncDecl(
+        "lang_eq_str",
+        [
+            VarDecl("a", Pointer(NameType("char"))),
+            VarDecl("b", Pointer(NameType("char"))),
+        ],
+        NameType("int")
+    ),
+
+    Endif(),
+])
+
+
+HASH_VARS = dict.fromkeys(
+    {
+        "lang_hash_int",
+        "lang_hash_ptr",
+        "lang_hash_str",
+        "lang_eq_str",
+    },
+    ("lang_hash.h", HASH_MODULE)
+)
@@ -0,0 +1,244 @@
+#ifndef _LANG_ARENA_H
+#define _LANG_ARENA_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+/*
+ * Bump allocator backing `with arena(size) as a:` blocks.
+ *
+ * The arena header and its first chunk are a single malloc. Allocations that
+ * do not fit in the current chunk get a new chunk twice the size of the last
+ * one, so a block only ever calls malloc O(log n) times. Everything is
+ * released at once by arena_free().
+ *
+ * An arena made inside the block of another one knows its parent, so memory
+ * from any enclosing arena is recognized by arena_release() and
+ * arena_realloc().
+ */
+
+#define LANG_ARENA_ALIGN _Alignof(max_align_t)
+#define LANG_ARENA_ROUND(n) \
+    (((n) + LANG_ARENA_ALIGN - 1) & ~(size_t)(LANG_ARENA_ALIGN - 1))
+#define LANG_ARENA_MIN_SIZE 256
+
+typedef struct ArenaChunk ArenaChunk;
+struct ArenaChunk {
+    ArenaChunk *prev;
+    unsigned char *end;
+};
+
+typedef struct Arena Arena;
+struct Arena {
+    unsigned char *cur;      /* Next free byte in the current chunk */
+    unsigned char *end;      /* End of the current chunk */
+    unsigned char *base;     /* Start of the chunk allocated with the arena */
+    unsigned char *base_end;
+    ArenaChunk *overflow;    /* Chunks allocated after the first one */
+    size_t next_size;
+    Arena *parent;           /* Arena of the enclosing block, if any */
+};
+
+static inline Arena *arena_new(size_t size) {
+    size_t header = LANG_ARENA_ROUND(sizeof(Arena));
+    Arena *arena;
+
+    if (size < LANG_ARENA_MIN_SIZE) {
+        size = LANG_ARENA_MIN_SIZE;
+    }
+    size = LANG_ARENA_ROUND(size);
+
+    arena = (Arena*)malloc(header + size);
+    if (!arena) {
+        abort();
+    }
+
+    arena->base = arena->cur = (unsigned char*)arena + header;
+    arena->base_end = arena->end = arena->cur + size;
+    arena->overflow = NULL;
+    arena->next_size = size * 2;
+    arena->parent = NULL;
+    return arena;
+}
+
+static inline Arena *arena_new_nested(size_t size, Arena *parent) {
+    Arena *arena = arena_new(size);
+    arena->parent = parent;
+    return arena;
+}
+
+static inline void *arena_grow_(Arena *arena, size_t size) {
+    size_t header = LANG_ARENA_ROUND(sizeof(ArenaChunk));
+    size_t chunk_size = arena->next_size;
+    ArenaChunk *chunk;
+    unsigned char *start;
+
+    if (chunk_size < size) {
+        chunk_size = size;
+    }
+
+    chunk = (ArenaChunk*)malloc(header + chunk_size);
+    if (!chunk) {
+        abort();
+    }
+    start = (unsigned char*)chunk + header;
+    chunk->prev = arena->overflow;
+    chunk->end = start + chunk_size;
+    arena->overflow = chunk;
+    arena->next_size = chunk_size * 2;
+
+    arena->cur = start + size;
+    arena->end = chunk->end;
+    return start;
+}
+
+static inline void *arena_alloc(Arena *arena, size_t size) {
+    void *ptr;
+
+    size = LANG_ARENA_ROUND(size);
+    if ((size_t)(arena->end - arena->cur) < size) {
+        return arena_grow_(arena, size);
+    }
+
+    ptr = arena->cur;
+    arena->cur += size;
+    return ptr;
+}
+
+/*
+ * Allocate with an alignment past LANG_ARENA_ALIGN, like aligned_alloc().
+ * align must be a power of 2. Chunks are only aligned to LANG_ARENA_ALIGN, so
+ * a new chunk is made big enough to align the allocation inside it.
+ */
+static inline void *arena_alloc_aligned(Arena *arena, size_t size, size_t align) {
+    uintptr_t start;
+
+    if (align <= LANG_ARENA_ALIGN) {
+        return arena_alloc(arena, size);
+    }
+
+    size = LANG_ARENA_ROUND(size);
+    start = ((uintptr_t)arena->cur + align - 1) & ~(uintptr_t)(align - 1);
+    if (start > (uintptr_t)arena->end || (uintptr_t)arena->end - start < size) {
+        unsigned char *chunk = (unsigned char*)arena_grow_(arena, size + align);
+        start = ((uintptr_t)chunk + align - 1) & ~(uintptr_t)(align - 1);
+    }
+
+    arena->cur = (unsigned char*)start + size;
+    return (void*)start;
+}
+
+static inline void *arena_calloc(Arena *arena, size_t count, size_t size) {
+    void *ptr;
+
+    if (size && count > SIZE_MAX / size) {
+        return NULL;
+    }
+    ptr = arena_alloc(arena, count * size);
+    memset(ptr, 0, count * size);
+    return ptr;
+}
+
+static inline int arena_in_(const void *ptr, const void *start, const void *end) {
+    return (uintptr_t)ptr >= (uintptr_t)start && (uintptr_t)ptr < (uintptr_t)end;
+}
+
+/*
+ * Find the arena owning ptr, which is this arena or one enclosing it, and the
+ * end of the chunk holding ptr. Returns NULL if ptr was not allocated from an
+ * arena.
+ */
+static inline Arena *arena_owner_(Arena *arena, const void *ptr,
+                                  unsigned char **end) {
+    size_t header = LANG_ARENA_ROUND(sizeof(ArenaChunk));
+    ArenaChunk *chunk;
+
+    for (; arena; arena = arena->parent) {
+        if (arena_in_(ptr, arena->base, arena->base_end)) {
+            *end = arena->base_end;
+            return arena;
+        }
+        for (chunk = arena->overflow; chunk; chunk = chunk->prev) {
+            if (arena_in_(ptr, (unsigned char*)chunk + header, chunk->end)) {
+                *end = chunk->end;
+                return arena;
+            }
+        }
+    }
+    return NULL;
+}
+
+static inline int arena_owns(Arena *arena, const void *ptr) {
+    unsigned char *end;
+    return arena_owner_(arena, ptr, &end) != NULL;
+}
+
+/* free() inside an arena block. Memory owned by an arena is left to it. */
+static inline void arena_release(Arena *arena, void *ptr) {
+    if (ptr && !arena_owns(arena, ptr)) {
+        free(ptr);
+    }
+}
+
+/*
+ * realloc() inside an arena block. Memory owned by an arena is moved to a new
+ * allocation from the same arena. The size of the old allocation is not
+ * stored, so everything up to the end of its chunk (or the next free byte if
+ * it is in the current chunk) is copied, which is at least the old
+ * allocation. Heap memory stays on the heap.
+ */
+static inline void *arena_realloc(Arena *arena, void *ptr, size_t size) {
+    unsigned char *end;
+    Arena *owner;
+    size_t available;
+    void *moved;
+
+    if (!ptr) {
+        return arena_alloc(arena, size);
+    }
+    owner = arena_owner_(arena, ptr, &end);
+    if (!owner) {
+        return realloc(ptr, size);
+    }
+
+    if (arena_in_(owner->cur, ptr, end)) {
+        end = owner->cur;
+    }
+    available = (size_t)(end - (unsigned char*)ptr);
+    moved = arena_alloc(owner, size);
+    memcpy(moved, ptr, available < size ? available : size);
+    return moved;
+}
+
+static inline void arena_free_overflow_(Arena *arena) {
+    ArenaChunk *chunk = arena->overflow;
+    while (chunk) {
+        ArenaChunk *prev = chunk->prev;
+        free(chunk);
+        chunk = prev;
+    }
+    arena->overflow = NULL;
+}
+
+/* Drop every allocation but keep the first chunk around for reuse. */
+static inline void arena_reset(Arena *arena) {
+    arena_free_overflow_(arena);
+    arena->cur = arena->base;
+    arena->end = arena->base_end;
+}
+
+static inline void arena_free(Arena *arena) {
+    arena_free_overflow_(arena);
+    free(arena);
+}
+
+/* Used with __attribute__((cleanup)) to free the arena of a with block. */
+static inline void arena_cleanup(Arena **arena) {
+    if (*arena) {
+        arena_free(*arena);
+    }
+}
+
+#endif
@@ -0,0 +1,77 @@
+#ifndef _LANG_ATOMIC_H
+#define _LANG_ATOMIC_H
+
+#include <stdatomic.h>
+
+/*
+ * Typed functions on the C11 atomic types. The generic functions of
+ * stdatomic.h are macros, so every atomic type gets its own functions that
+ * the compiler can check the arguments of:
+ * - NAME_init(a, x): initialize a to x, which is not atomic
+ * - NAME_load(a, order): the value of a
+ * - NAME_store(a, x, order): set a to x
+ * - NAME_exchange(a, x, order): set a to x and get its previous value
+ * - NAME_compare_exchange(a, expected, x, success, failure): set a to x if it
+ *   is *expected and return 1, otherwise set *expected to the value of a and
+ *   return 0
+ * The integer types also get:
+ * - NAME_fetch_add, NAME_fetch_sub, NAME_fetch_and, NAME_fetch_or,
+ *   NAME_fetch_xor(a, x, order): apply the operation to a and get its
+ *   previous value
+ */
+
+typedef _Atomic(void *) atomic_ptr;
+
+/*
+ * long is long long in language space, which is the same size as long but
+ * not the same type, so values are passed as elem and converted to the
+ * value type of the atomic (base) when a pointer to them is needed.
+ */
+
+#define LANG_ATOMIC_TYPE(name, elem, base) \
+    static inline void name##_init(name *a, elem x) { \
+        atomic_init(a, x); \
+    } \
+    \
+    static inline elem name##_load(name *a, memory_order order) { \
+        return atomic_load_explicit(a, order); \
+    } \
+    \
+    static inline void name##_store(name *a, elem x, memory_order order) { \
+        atomic_store_explicit(a, x, order); \
+    } \
+    \
+    static inline elem name##_exchange(name *a, elem x, memory_order order) { \
+        return atomic_exchange_explicit(a, x, order); \
+    } \
+    \
+    static inline int name##_compare_exchange(name *a, elem *expected, elem x, \
+                                              memory_order success, \
+                                              memory_order failure) { \
+        base e = *expected; \
+        int ok = atomic_compare_exchange_strong_explicit(a, &e, x, \
+                                                         success, failure); \
+        *expected = e; \
+        return ok; \
+    }
+
+#define LANG_ATOMIC_INT_OP(name, elem, op) \
+    static inline elem name##_fetch_##op(name *a, elem x, memory_order order) { \
+        return atomic_fetch_##op##_explicit(a, x, order); \
+    }
+
+#define LANG_ATOMIC_INT_TYPE(name, elem, base) \
+    LANG_ATOMIC_TYPE(name, elem, base) \
+    LANG_ATOMIC_INT_OP(name, elem, add) \
+    LANG_ATOMIC_INT_OP(name, elem, sub) \
+    LANG_ATOMIC_INT_OP(name, elem, and) \
+    LANG_ATOMIC_INT_OP(name, elem, or) \
+    LANG_ATOMIC_INT_OP(name, elem, xor)
+
+LANG_ATOMIC_INT_TYPE(atomic_int, int, int)
+LANG_ATOMIC_INT_TYPE(atomic_uint, unsigned int, unsigned int)
+LANG_ATOMIC_INT_TYPE(atomic_long, long long, long)
+LANG_ATOMIC_INT_TYPE(atomic_ulong, unsigned long, unsigned long)
+LANG_ATOMIC_TYPE(atomic_ptr, void *, void *)
+
+#endif
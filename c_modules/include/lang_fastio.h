@@ -0,0 +1,233 @@
+#ifndef _LANG_FASTIO_H
+#define _LANG_FASTIO_H
+
+#include <stddef.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+/*
+ * Buffered reading of numbers from stdin and writing to stdout without
+ * format strings.
+ *
+ * stdin is read and stdout is written in blocks of LANG_FASTIO_SIZE bytes
+ * with fread and fwrite, and numbers are parsed and formatted directly in
+ * those buffers instead of going through the format string interpreter of
+ * scanf and printf. Whitespace before a number is skipped like "%d" does.
+ *
+ * The buffers are separate from the ones of stdio, so output of printf and
+ * write_*() only comes out in order if write_flush() is called in between.
+ * The output buffer is flushed at exit. The state is made of weak symbols
+ * so every translation unit shares the same buffers.
+ */
+
+#define LANG_FASTIO_SIZE (1 << 16)
+
+typedef struct lang_reader lang_reader;
+struct lang_reader {
+    size_t pos;
+    size_t length;
+    int eof;
+    char buf[LANG_FASTIO_SIZE];
+};
+
+typedef struct lang_writer lang_writer;
+struct lang_writer {
+    size_t length;
+    int registered;      /* The buffer is flushed at exit */
+    char buf[LANG_FASTIO_SIZE];
+};
+
+__attribute__((weak)) lang_reader lang_reader_;
+__attribute__((weak)) lang_writer lang_writer_;
+
+/* The next byte of stdin without consuming it, or EOF */
+static inline int lang_reader_peek_(void) {
+    lang_reader *r = &lang_reader_;
+    if (r->pos == r->length) {
+        if (r->eof) {
+            return EOF;
+        }
+        r->pos = 0;
+        r->length = fread(r->buf, 1, LANG_FASTIO_SIZE, stdin);
+        if (r->length == 0) {
+            r->eof = 1;
+            return EOF;
+        }
+    }
+    return (unsigned char)r->buf[r->pos];
+}
+
+static inline void lang_reader_skip_space_(void) {
+    int c = lang_reader_peek_();
+    while (c != EOF && c <= ' ') {
+        lang_reader_.pos++;
+        c = lang_reader_peek_();
+    }
+}
+
+/* Check if only whitespace is left in stdin */
+static inline int read_eof(void) {
+    lang_reader_skip_space_();
+    return lang_reader_peek_() == EOF;
+}
+
+/* The next integer in stdin, or 0 if there is none */
+static inline long long read_long(void) {
+    unsigned long long x = 0;
+    int negative = 0;
+    int c;
+
+    lang_reader_skip_space_();
+    c = lang_reader_peek_();
+    if (c == '-' || c == '+') {
+        negative = c == '-';
+        lang_reader_.pos++;
+        c = lang_reader_peek_();
+    }
+    while (c >= '0' && c <= '9') {
+        x = x * 10 + (unsigned)(c - '0');
+        lang_reader_.pos++;
+        c = lang_reader_peek_();
+    }
+    return negative ? -(long long)x : (long long)x;
+}
+
+static inline int read_int(void) {
+    return (int)read_long();
+}
+
+/*
+ * The next floating point number in stdin, or 0 if there is none. The
+ * number is copied out of the buffer and converted with strtod, which
+ * rounds correctly.
+ */
+static inline double read_float(void) {
+    char token[64];
+    size_t length = 0;
+    int c;
+
+    lang_reader_skip_space_();
+    c = lang_reader_peek_();
+    while (c != EOF && c > ' ' && length < sizeof(token) - 1) {
+        token[length++] = (char)c;
+        lang_reader_.pos++;
+        c = lang_reader_peek_();
+    }
+    token[length] = '\0';
+    return strtod(token, NULL);
+}
+
+/*
+ * Read the rest of the current line of stdin into buf, which holds size
+ * bytes, and null terminate it. The newline is consumed but not stored. A
+ * line that does not fit is split. Returns the length of the line, or -1 at
+ * the end of stdin.
+ */
+static inline long long read_line(char *buf, size_t size) {
+    size_t length = 0;
+    int c = lang_reader_peek_();
+
+    if (c == EOF || size == 0) {
+        return -1;
+    }
+    while (c != EOF && c != '\n' && length < size - 1) {
+        buf[length++] = (char)c;
+        lang_reader_.pos++;
+        c = lang_reader_peek_();
+    }
+    if (c == '\n') {
+        lang_reader_.pos++;
+    }
+    buf[length] = '\0';
+    return (long long)length;
+}
+
+/* Write the output buffer to stdout */
+static inline void write_flush(void) {
+    lang_writer *w = &lang_writer_;
+    fwrite(w->buf, 1, w->length, stdout);
+    fflush(stdout);
+    w->length = 0;
+}
+
+/* Make room for n bytes in the output buffer */
+static inline char *lang_writer_reserve_(size_t n) {
+    lang_writer *w = &lang_writer_;
+    if (!w->registered) {
+        w->registered = 1;
+        atexit(write_flush);
+    }
+    if (LANG_FASTIO_SIZE - w->length < n) {
+        write_flush();
+    }
+    return w->buf + w->length;
+}
+
+static inline void write_char(char c) {
+    *lang_writer_reserve_(1) = c;
+    lang_writer_.length++;
+}
+
+static inline void write_str(const char *s) {
+    size_t n = strlen(s);
+    while (n) {
+        size_t chunk = n < LANG_FASTIO_SIZE ? n : LANG_FASTIO_SIZE;
+        memcpy(lang_writer_reserve_(chunk), s, chunk);
+        lang_writer_.length += chunk;
+        s += chunk;
+        n -= chunk;
+    }
+}
+
+static inline void write_int(long long x) {
+    char digits[20];
+    size_t n = 0;
+    unsigned long long u = x < 0 ? -(unsigned long long)x : (unsigned long long)x;
+    char *out = lang_writer_reserve_(sizeof(digits) + 1);
+
+    do {
+        digits[n++] = (char)('0' + u % 10);
+        u /= 10;
+    } while (u);
+
+    if (x < 0) {
+        *out++ = '-';
+        lang_writer_.length++;
+    }
+    lang_writer_.length += n;
+    while (n) {
+        *out++ = digits[--n];
+    }
+}
+
+static inline void write_uint(unsigned long long x) {
+    char digits[20];
+    size_t n = 0;
+    char *out = lang_writer_reserve_(sizeof(digits));
+
+    do {
+        digits[n++] = (char)('0' + x % 10);
+        x /= 10;
+    } while (x);
+
+    lang_writer_.length += n;
+    while (n) {
+        *out++ = digits[--n];
+    }
+}
+
+/* Write a double with the given number of digits after the point */
+static inline void write_float(double x, int precision) {
+    char *out = lang_writer_reserve_(64);
+    int n = snprintf(out, 64, "%.*f", precision, x);
+    if (n >= 64) {
+        /* Too long for the reserved space, so go through stdio */
+        write_flush();
+        printf("%.*f", precision, x);
+        return;
+    }
+    lang_writer_.length += (size_t)n;
+}
+
+#endif
@@ -0,0 +1,44 @@
+#ifndef _LANG_HASH_H
+#define _LANG_HASH_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+/*
+ * Hash and equality functions that hash(x) and hash_eq(a, b) are lowered to.
+ *
+ * They are all static inline so each Dict specialization gets them inlined
+ * into its lookups. Dict picks slots with the low bits of a hash, so every
+ * function here mixes its input into the low bits.
+ */
+
+/* splitmix64 finalizer */
+static inline size_t lang_hash_int(unsigned long long x) {
+    x ^= x >> 30;
+    x *= 0xbf58476d1ce4e5b9ULL;
+    x ^= x >> 27;
+    x *= 0x94d049bb133111ebULL;
+    x ^= x >> 31;
+    return (size_t)x;
+}
+
+static inline size_t lang_hash_ptr(const void *p) {
+    return lang_hash_int((uintptr_t)p);
+}
+
+/* FNV-1a over the bytes of a null terminated string */
+static inline size_t lang_hash_str(const char *s) {
+    unsigned long long h = 0xcbf29ce484222325ULL;
+    for (; *s; s++) {
+        h ^= (unsigned char)*s;
+        h *= 0x100000001b3ULL;
+    }
+    return lang_hash_int(h);
+}
+
+static inline int lang_eq_str(const char *a, const char *b) {
+    return a == b || strcmp(a, b) == 0;
+}
+
+#endif
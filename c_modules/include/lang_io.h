@@ -0,0 +1,60 @@
+#ifndef _LANG_IO_H
+#define _LANG_IO_H
+
+#include <fcntl.h>
+#include <stddef.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+/*
+ * Read only mappings of whole files backing map_file() and unmap_file().
+ *
+ * The pages of a mapped file are read by the kernel as they are touched, so
+ * a file of any size is mapped in O(1) and its bytes are never copied into
+ * a buffer. The mapping is advised to be read sequentially, which makes the
+ * kernel read ahead aggressively.
+ *
+ * Empty files cannot be mapped, so they get a non NULL pointer to no bytes.
+ * NULL is only returned on errors, in which case errno is set.
+ */
+
+static inline unsigned char *lang_map_file(const char *path, size_t *length) {
+    static unsigned char empty[1];
+    struct stat st;
+    void *data;
+    int fd;
+
+    *length = 0;
+    fd = open(path, O_RDONLY);
+    if (fd < 0) {
+        return NULL;
+    }
+    if (fstat(fd, &st)) {
+        close(fd);
+        return NULL;
+    }
+    if (st.st_size == 0) {
+        close(fd);
+        return empty;
+    }
+
+    /* The mapping stays valid after the file is closed */
+    data = mmap(NULL, (size_t)st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (data == MAP_FAILED) {
+        return NULL;
+    }
+    madvise(data, (size_t)st.st_size, MADV_SEQUENTIAL);
+
+    *length = (size_t)st.st_size;
+    return data;
+}
+
+static inline void lang_unmap_file(unsigned char *data, size_t length) {
+    if (data && length) {
+        munmap(data, length);
+    }
+}
+
+#endif
@@ -0,0 +1,74 @@
+#ifndef _LANG_SIMD_H
+#define _LANG_SIMD_H
+
+#include <stddef.h>
+#include <string.h>
+
+/*
+ * SIMD vector types using the gcc vector extensions. Arithmetic, bitwise
+ * and comparison operators on them are applied to every lane and compile
+ * to SSE/AVX or NEON instructions depending on the target.
+ *
+ * Every vector type gets the functions:
+ * - NAME_load(p): the vector of the elements starting at p, which does not
+ *   need to be aligned
+ * - NAME_store(p, v): write the lanes of v to the elements starting at p
+ * - NAME_splat(x): the vector with x in every lane
+ * - NAME_shuffle(v, mask): the vector whose lane i is lane mask[i] of v
+ * - NAME_sum(v): the sum of the lanes of v
+ */
+
+#define LANG_VECTOR_SIZE 16
+
+/*
+ * The lanes of a vector have the type lane, and the scalars loaded into and
+ * stored from it have the type elem. They only differ for int8x16, whose
+ * lanes are signed char since comparisons set lanes to -1 and the
+ * signedness of char depends on the target, while the language's char
+ * (char in C) is what gets loaded into it.
+ */
+#define LANG_SIMD_TYPE(name, elem, lane, mask) \
+    typedef lane name __attribute__((vector_size(LANG_VECTOR_SIZE))); \
+    \
+    static inline name name##_load(const elem *p) { \
+        name v; \
+        memcpy(&v, p, sizeof(v)); \
+        return v; \
+    } \
+    \
+    static inline void name##_store(elem *p, name v) { \
+        memcpy(p, &v, sizeof(v)); \
+    } \
+    \
+    static inline name name##_splat(elem x) { \
+        name v = {0}; \
+        return v + x; \
+    } \
+    \
+    static inline name name##_shuffle(name v, mask m) { \
+        return __builtin_shuffle(v, m); \
+    } \
+    \
+    static inline elem name##_sum(name v) { \
+        elem s = 0; \
+        for (size_t i = 0; i < sizeof(v) / sizeof(elem); i++) { \
+            s += v[i]; \
+        } \
+        return s; \
+    }
+
+/* The signed integer vectors come first since they are the shuffle masks */
+LANG_SIMD_TYPE(int8x16, char, signed char, int8x16)
+LANG_SIMD_TYPE(int16x8, short, short, int16x8)
+LANG_SIMD_TYPE(int32x4, int, int, int32x4)
+LANG_SIMD_TYPE(int64x2, long long, long long, int64x2)
+LANG_SIMD_TYPE(uint8x16, unsigned char, unsigned char, int8x16)
+LANG_SIMD_TYPE(uint16x8, unsigned short, unsigned short, int16x8)
+LANG_SIMD_TYPE(uint32x4, unsigned int, unsigned int, int32x4)
+LANG_SIMD_TYPE(uint64x2, unsigned long, unsigned long, int64x2)
+LANG_SIMD_TYPE(float32x4, float, float, int32x4)
+LANG_SIMD_TYPE(float64x2, double, double, int64x2)
+
+#undef LANG_SIMD_TYPE
+
+#endif
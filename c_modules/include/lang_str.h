@@ -0,0 +1,157 @@
+#ifndef _LANG_STR_H
+#define _LANG_STR_H
+
+#include <stddef.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <lang_hash.h>
+
+/*
+ * Strings that carry their length.
+ *
+ * A str is a view of bytes owned by something else (a literal, a buffer or a
+ * StrBuilder), so getting its length and slicing it are O(1) and never copy.
+ * The bytes are not necessarily null terminated.
+ *
+ * A StrBuilder owns a buffer that grows geometrically, so appending to it in
+ * a loop is amortized O(1) per byte instead of the O(n) of strcat. Its buffer
+ * is always null terminated so it can be passed to C functions.
+ */
+
+typedef struct str str;
+struct str {
+    char *data;
+    size_t length;
+};
+
+typedef struct StrBuilder StrBuilder;
+struct StrBuilder {
+    char *data;
+    size_t length;
+    size_t capacity;     /* Not including the null terminator */
+};
+
+static inline str str_from(char *s) {
+    return (str){s, strlen(s)};
+}
+
+/* The bytes in [start, end) clamped to the string like Python slices */
+static inline str str_slice(str s, size_t start, size_t end) {
+    if (end > s.length) end = s.length;
+    if (start > end) start = end;
+    return (str){s.data + start, end - start};
+}
+
+static inline int str_eq(str a, str b) {
+    return a.length == b.length &&
+           (a.data == b.data || memcmp(a.data, b.data, a.length) == 0);
+}
+
+/* FNV-1a like lang_hash_str */
+static inline size_t str_hash(str s) {
+    unsigned long long h = 0xcbf29ce484222325ULL;
+    for (size_t i = 0; i < s.length; i++) {
+        h ^= (unsigned char)s.data[i];
+        h *= 0x100000001b3ULL;
+    }
+    return lang_hash_int(h);
+}
+
+/* A null terminated copy of the string that must be freed with str_free() */
+static inline str str_copy(str s) {
+    char *data = malloc(s.length + 1);
+    memcpy(data, s.data, s.length);
+    data[s.length] = '\0';
+    return (str){data, s.length};
+}
+
+static inline void str_free(str s) {
+    free(s.data);
+}
+
+static inline void str_print(str s) {
+    fwrite(s.data, 1, s.length, stdout);
+}
+
+static inline void str_builder_reserve(StrBuilder *b, size_t length) {
+    if (length <= b->capacity) return;
+    size_t capacity = b->capacity ? b->capacity * 2 : 15;
+    while (capacity < length) capacity *= 2;
+    b->data = realloc(b->data, capacity + 1);
+    b->capacity = capacity;
+}
+
+static inline StrBuilder *str_builder_new(void) {
+    StrBuilder *b = malloc(sizeof(StrBuilder));
+    b->data = NULL;
+    b->length = 0;
+    b->capacity = 0;
+    str_builder_reserve(b, 15);
+    b->data[0] = '\0';
+    return b;
+}
+
+static inline void str_builder_append(StrBuilder *b, str s) {
+    str_builder_reserve(b, b->length + s.length);
+    memcpy(b->data + b->length, s.data, s.length);
+    b->length += s.length;
+    b->data[b->length] = '\0';
+}
+
+static inline void str_builder_append_char(StrBuilder *b, char c) {
+    str_builder_reserve(b, b->length + 1);
+    b->data[b->length++] = c;
+    b->data[b->length] = '\0';
+}
+
+static inline void str_builder_append_int(StrBuilder *b, long long x) {
+    /* Enough for the digits of any 64 bit integer and the sign */
+    char buf[21];
+    char *end = buf + sizeof(buf);
+    char *p = end;
+    unsigned long long u = x < 0 ? -(unsigned long long)x : (unsigned long long)x;
+    do {
+        *--p = '0' + u % 10;
+        u /= 10;
+    } while (u);
+    if (x < 0) *--p = '-';
+    str_builder_append(b, (str){p, (size_t)(end - p)});
+}
+
+static inline void str_builder_append_uint(StrBuilder *b, unsigned long long x) {
+    char buf[20];
+    char *end = buf + sizeof(buf);
+    char *p = end;
+    do {
+        *--p = '0' + x % 10;
+        x /= 10;
+    } while (x);
+    str_builder_append(b, (str){p, (size_t)(end - p)});
+}
+
+/* Append a double with the given number of digits after the point */
+static inline void str_builder_append_float(StrBuilder *b, double x, int precision) {
+    int n = snprintf(NULL, 0, "%.*f", precision, x);
+    str_builder_reserve(b, b->length + (size_t)n);
+    snprintf(b->data + b->length, (size_t)n + 1, "%.*f", precision, x);
+    b->length += (size_t)n;
+}
+
+/* A view of the contents that is invalidated by the next append */
+static inline str str_builder_view(StrBuilder *b) {
+    return (str){b->data, b->length};
+}
+
+static inline void str_builder_clear(StrBuilder *b) {
+    b->length = 0;
+    b->data[0] = '\0';
+}
+
+static inline void str_builder_free(StrBuilder *b) {
+    free(b->data);
+    free(b);
+}
+
+#endif
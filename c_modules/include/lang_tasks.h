@@ -0,0 +1,199 @@
+#ifndef _LANG_TASKS_H
+#define _LANG_TASKS_H
+
+#include <pthread.h>
+#include <sched.h>
+#include <stdatomic.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <unistd.h>
+
+/*
+ * Work stealing thread pool backing `spawn` and `join`.
+ *
+ * Every thread of the pool, including the main thread, owns a deque of
+ * tasks. Spawning pushes a task to the bottom of the deque of the current
+ * thread, and a thread looking for work pops from the bottom of its own
+ * deque, so it keeps working on the most recent (and smallest) tasks, or
+ * steals from the top of the deque of another thread, which takes the
+ * oldest (and largest) tasks. Threads waiting on a task run other tasks
+ * until it is done instead of blocking.
+ *
+ * Tasks are not allocated by the pool. They are embedded in the futures
+ * the compiler generates for each spawned function, which live on the stack
+ * of the function that spawned them until they are joined.
+ *
+ * The pool is started on the first spawn with one thread per core, or
+ * LANG_NUM_THREADS threads if that environment variable is set. Its state
+ * is made of weak symbols so every translation unit shares the same pool.
+ */
+
+#define LANG_DEQUE_SIZE 1024
+#define LANG_MAX_THREADS 64
+
+typedef struct lang_task lang_task;
+struct lang_task {
+    void (*run)(lang_task *);
+    atomic_int done;
+};
+
+typedef struct lang_deque lang_deque;
+struct lang_deque {
+    pthread_mutex_t lock;
+    size_t top;      /* Next task to steal */
+    size_t bottom;   /* Where the next task is pushed */
+    lang_task *tasks[LANG_DEQUE_SIZE];
+};
+
+typedef struct lang_pool lang_pool;
+struct lang_pool {
+    int num_threads;
+    lang_deque deques[LANG_MAX_THREADS];
+    atomic_int queued;     /* Tasks in all the deques */
+    atomic_int sleeping;   /* Threads waiting for tasks to be queued */
+    pthread_mutex_t sleep_lock;
+    pthread_cond_t wake;
+};
+
+__attribute__((weak)) lang_pool lang_pool_;
+__attribute__((weak)) pthread_once_t lang_pool_once_ = PTHREAD_ONCE_INIT;
+__attribute__((weak)) _Thread_local int lang_thread_id_;
+
+static inline lang_task *lang_deque_pop_(lang_deque *deque) {
+    lang_task *task = NULL;
+    pthread_mutex_lock(&deque->lock);
+    if (deque->bottom != deque->top) {
+        task = deque->tasks[--deque->bottom % LANG_DEQUE_SIZE];
+    }
+    pthread_mutex_unlock(&deque->lock);
+    return task;
+}
+
+static inline lang_task *lang_deque_steal_(lang_deque *deque) {
+    lang_task *task = NULL;
+    pthread_mutex_lock(&deque->lock);
+    if (deque->bottom != deque->top) {
+        task = deque->tasks[deque->top++ % LANG_DEQUE_SIZE];
+    }
+    pthread_mutex_unlock(&deque->lock);
+    return task;
+}
+
+/* Get a task from the deque of this thread, or steal one. */
+static inline lang_task *lang_pool_find_task_(void) {
+    lang_pool *pool = &lang_pool_;
+    int id = lang_thread_id_;
+    lang_task *task = lang_deque_pop_(&pool->deques[id]);
+
+    for (int i = 1; !task && i < pool->num_threads; i++) {
+        task = lang_deque_steal_(&pool->deques[(id + i) % pool->num_threads]);
+    }
+    if (task) {
+        atomic_fetch_sub(&pool->queued, 1);
+    }
+    return task;
+}
+
+static inline void lang_task_run_(lang_task *task) {
+    task->run(task);
+    atomic_store_explicit(&task->done, 1, memory_order_release);
+}
+
+static inline void *lang_pool_worker_(void *arg) {
+    lang_pool *pool = &lang_pool_;
+    lang_thread_id_ = (int)(intptr_t)arg;
+
+    for (;;) {
+        lang_task *task = lang_pool_find_task_();
+        if (task) {
+            lang_task_run_(task);
+            continue;
+        }
+
+        pthread_mutex_lock(&pool->sleep_lock);
+        atomic_fetch_add(&pool->sleeping, 1);
+        while (atomic_load(&pool->queued) == 0) {
+            pthread_cond_wait(&pool->wake, &pool->sleep_lock);
+        }
+        atomic_fetch_sub(&pool->sleeping, 1);
+        pthread_mutex_unlock(&pool->sleep_lock);
+    }
+    return NULL;
+}
+
+static inline void lang_pool_start_(void) {
+    lang_pool *pool = &lang_pool_;
+    const char *env = getenv("LANG_NUM_THREADS");
+    long num_threads = env ? atol(env) : sysconf(_SC_NPROCESSORS_ONLN);
+
+    if (num_threads < 1) {
+        num_threads = 1;
+    } else if (num_threads > LANG_MAX_THREADS) {
+        num_threads = LANG_MAX_THREADS;
+    }
+
+    pool->num_threads = (int)num_threads;
+    pthread_mutex_init(&pool->sleep_lock, NULL);
+    pthread_cond_init(&pool->wake, NULL);
+    for (int i = 0; i < pool->num_threads; i++) {
+        pthread_mutex_init(&pool->deques[i].lock, NULL);
+    }
+
+    /* The thread that starts the pool is thread 0 */
+    for (long i = 1; i < num_threads; i++) {
+        pthread_t thread;
+        if (pthread_create(&thread, NULL, lang_pool_worker_, (void*)i)) {
+            abort();
+        }
+        pthread_detach(thread);
+    }
+}
+
+/* Queue a task to be run by any thread of the pool. */
+static inline void lang_task_spawn(lang_task *task, void (*run)(lang_task *)) {
+    lang_pool *pool = &lang_pool_;
+    lang_deque *deque;
+
+    pthread_once(&lang_pool_once_, lang_pool_start_);
+    task->run = run;
+    atomic_store_explicit(&task->done, 0, memory_order_relaxed);
+
+    deque = &pool->deques[lang_thread_id_];
+    pthread_mutex_lock(&deque->lock);
+    if (deque->bottom - deque->top == LANG_DEQUE_SIZE) {
+        /* Run the task now if the deque is full */
+        pthread_mutex_unlock(&deque->lock);
+        lang_task_run_(task);
+        return;
+    }
+    deque->tasks[deque->bottom++ % LANG_DEQUE_SIZE] = task;
+    pthread_mutex_unlock(&deque->lock);
+
+    atomic_fetch_add(&pool->queued, 1);
+    if (atomic_load(&pool->sleeping)) {
+        pthread_mutex_lock(&pool->sleep_lock);
+        pthread_cond_signal(&pool->wake);
+        pthread_mutex_unlock(&pool->sleep_lock);
+    }
+}
+
+/*
+ * Wait for a task to be done, running other tasks in the meantime. A task
+ * that was never spawned is done.
+ */
+static inline void lang_task_wait(lang_task *task) {
+    if (!task->run) {
+        return;
+    }
+    while (!atomic_load_explicit(&task->done, memory_order_acquire)) {
+        lang_task *other = lang_pool_find_task_();
+        if (other) {
+            lang_task_run_(other);
+        } else {
+            sched_yield();
+        }
+    }
+}
+
+#endif
@@ -0,0 +1,194 @@
+from lang_types import *
+
+
+# Unbuffered IO on file descriptors
+FCNTL_MODULE = Module([
+    Ifndef("_FCNTL_H"),
+    Define("_FCNTL_H"),
+
+    VarDeclStmt(VarDecl("O_RDONLY", NameType("int"))),
+    VarDeclStmt(VarDecl("O_WRONLY", NameType("int"))),
+    VarDeclStmt(VarDecl("O_RDWR", NameType("int"))),
+    VarDeclStmt(VarDecl("O_CREAT", NameType("int"))),
+    VarDeclStmt(VarDecl("O_TRUNC", NameType("int"))),
+    VarDeclStmt(VarDecl("O_APPEND", NameType("int"))),
+
+    # The mode of the created file is only passed with O_CREAT
+    FuncDecl(
+        "open",
+        [
+            VarDecl("path", Pointer(NameType("char"))),
+            VarDecl("flags", NameType("int")),
+            Ellipsis(),
+        ],
+        NameType("int")
+    ),
+
+    Endif(),
+])
+
+
+UNISTD_MODULE = Module([
+    Ifndef("_UNISTD_H"),
+    Define("_UNISTD_H"),
+
+    FuncDecl(
+        "read",
+        [
+            VarDecl("fd", NameType("int")),
+            VarDecl("buf", Pointer(NameType("void"))),
+            VarDecl("count", NameType("size_t")),
+        ],
+        NameType("long")
+    ),
+
+    FuncDecl(
+        "write",
+        [
+            VarDecl("fd", NameType("int")),
+            VarDecl("buf", Pointer(NameType("void"))),
+            VarDecl("count", NameType("size_t")),
+        ],
+        NameType("long")
+    ),
+
+    FuncDecl(
+        "close",
+        [
+            VarDecl("fd", NameType("int")),
+        ],
+        NameType("int")
+    ),
+
+    Endif(),
+])
+
+
+# Memory mappings
+MMAN_MODULE = Module([
+    Ifndef("_SYS_MMAN_H"),
+    Define("_SYS_MMAN_H"),
+
+    VarDeclStmt(VarDecl("PROT_READ", NameType("int"))),
+    VarDeclStmt(VarDecl("PROT_WRITE", NameType("int"))),
+    VarDeclStmt(VarDecl("MAP_PRIVATE", NameType("int"))),
+    VarDeclStmt(VarDecl("MAP_SHARED", NameType("int"))),
+    VarDeclStmt(VarDecl("MAP_FAILED", Pointer(NameType("void")))),
+    VarDeclStmt(VarDecl("MADV_NORMAL", NameType("int"))),
+    VarDeclStmt(VarDecl("MADV_SEQUENTIAL", NameType("int"))),
+    VarDeclStmt(VarDecl("MADV_RANDOM", NameType("int"))),
+    VarDeclStmt(VarDecl("MADV_WILLNEED", NameType("int"))),
+    VarDeclStmt(VarDecl("MADV_DONTNEED", NameType("int"))),
+
+    FuncDecl(
+        "mmap",
+        [
+            VarDecl("addr", Pointer(NameType("void"))),
+            VarDecl("length", NameType("size_t")),
+            VarDecl("prot", NameType("int")),
+            VarDecl("flags", NameType("int")),
+            VarDecl("fd", NameType("int")),
+            VarDecl("offset", NameType("long")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "munmap",
+        [
+            VarDecl("addr", Pointer(NameType("void"))),
+            VarDecl("length", NameType("size_t")),
+        ],
+        NameType("int")
+    ),
+
+    FuncDecl(
+        "madvise",
+        [
+            VarDecl("addr", Pointer(NameType("void"))),
+            VarDecl("length", NameType("size_t")),
+            VarDecl("advice", NameType("int")),
+        ],
+        NameType("int")
+    ),
+
+    Endif(),
+])
+
+
+# Declarations for the file mappings in include/lang_io.h. map_file() and
+# unmap_file() in io.hu wrap these to take and return a Span<uchar>.
+IO_MODULE = Module([
+    Ifndef("_LANG_IO_H"),
+    Define("_LANG_IO_H"),
+
+    FuncDecl(
+        "lang_map_file",
+        [
+            VarDecl("path", Pointer(NameType("char"))),
+            VarDecl("length", Pointer(NameType("size_t"))),
+        ],
+        Pointer(NameType("uchar"))
+    ),
+
+    FuncDecl(
+        "lang_unmap_file",
+        [
+            VarDecl("data", Pointer(NameType("uchar"))),
+            VarDecl("length", NameType("size_t")),
+        ],
+        NameType("void")
+    ),
+
+    Endif(),
+])
+
+
+FCNTL_VARS = dict.fromkeys(
+    {
+        "O_RDONLY",
+        "O_WRONLY",
+        "O_RDWR",
+        "O_CREAT",
+        "O_TRUNC",
+        "O_APPEND",
+        "open",
+    },
+    ("fcntl.h", FCNTL_MODULE)
+)
+
+UNISTD_VARS = dict.fromkeys(
+    {
+        "read",
+        "write",
+        "close",
+    },
+    ("unistd.h", UNISTD_MODULE)
+)
+
+MMAN_VARS = dict.fromkeys(
+    {
+        "PROT_READ",
+        "PROT_WRITE",
+        "MAP_PRIVATE",
+        "MAP_SHARED",
+        "MAP_FAILED",
+        "MADV_NORMAL",
+        "MADV_SEQUENTIAL",
+        "MADV_RANDOM",
+        "MADV_WILLNEED",
+        "MADV_DONTNEED",
+        "mmap",
+        "munmap",
+        "madvise",
+    },
+    ("sys/mman.h", MMAN_MODULE)
+)
+
+IO_VARS = dict.fromkeys(
+    {
+        "lang_map_file",
+        "lang_unmap_file",
+    },
+    ("lang_io.h", IO_MODULE)
+)
@@ -0,0 +1,114 @@
+from lang_types import *
+
+
+VOID_PTR_TYPE = Pointer(NameType("void"))
+
+
+def _func(name, params, returns=NameType("int")):
+    return FuncDecl(
+        name,
+        [VarDecl(param, t) for param, t in params],
+        returns
+    )
+
+
+# Declarations for pthread.h. The thread, mutex and condition variable types
+# are opaque in language space and their attributes are only ever NULL.
+PTHREAD_MODULE = Module([
+    Ifndef("_PTHREAD_H"),
+    Define("_PTHREAD_H"),
+
+    StructDecl(Struct("pthread_t", [])),
+    StructDecl(Struct("pthread_attr_t", [])),
+    StructDecl(Struct("pthread_mutex_t", [])),
+    StructDecl(Struct("pthread_mutexattr_t", [])),
+    StructDecl(Struct("pthread_cond_t", [])),
+    StructDecl(Struct("pthread_condattr_t", [])),
+
+    # Threads
+
+    _func("pthread_create", [
+        ("thread", Pointer(NameType("pthread_t"))),
+        ("attr", Pointer(NameType("pthread_attr_t"))),
+        ("start", FuncType([VOID_PTR_TYPE], VOID_PTR_TYPE)),
+        ("arg", VOID_PTR_TYPE),
+    ]),
+    _func("pthread_join", [
+        ("thread", NameType("pthread_t")),
+        ("result", Pointer(VOID_PTR_TYPE)),
+    ]),
+    _func("pthread_self", [], NameType("pthread_t")),
+
+    # Mutexes
+
+    _func("pthread_mutex_init", [
+        ("mutex", Pointer(NameType("pthread_mutex_t"))),
+        ("attr", Pointer(NameType("pthread_mutexattr_t"))),
+    ]),
+    _func("pthread_mutex_destroy", [
+        ("mutex", Pointer(NameType("pthread_mutex_t"))),
+    ]),
+    _func("pthread_mutex_lock", [
+        ("mutex", Pointer(NameType("pthread_mutex_t"))),
+    ]),
+    _func("pthread_mutex_trylock", [
+        ("mutex", Pointer(NameType("pthread_mutex_t"))),
+    ]),
+    _func("pthread_mutex_unlock", [
+        ("mutex", Pointer(NameType("pthread_mutex_t"))),
+    ]),
+
+    # Condition variables
+
+    _func("pthread_cond_init", [
+        ("cond", Pointer(NameType("pthread_cond_t"))),
+        ("attr", Pointer(NameType("pthread_condattr_t"))),
+    ]),
+    _func("pthread_cond_destroy", [
+        ("cond", Pointer(NameType("pthread_cond_t"))),
+    ]),
+    _func("pthread_cond_wait", [
+        ("cond", Pointer(NameType("pthread_cond_t"))),
+        ("mutex", Pointer(NameType("pthread_mutex_t"))),
+    ]),
+    _func("pthread_cond_signal", [
+        ("cond", Pointer(NameType("pthread_cond_t"))),
+    ]),
+    _func("pthread_cond_broadcast", [
+        ("cond", Pointer(NameType("pthread_cond_t"))),
+    ]),
+
+    Endif(),
+])
+
+
+PTHREAD_VARS = dict.fromkeys(
+    {
+        "pthread_create",
+        "pthread_join",
+        "pthread_self",
+        "pthread_mutex_init",
+        "pthread_mutex_destroy",
+        "pthread_mutex_lock",
+        "pthread_mutex_trylock",
+        "pthread_mutex_unlock",
+        "pthread_cond_init",
+        "pthread_cond_destroy",
+        "pthread_cond_wait",
+        "pthread_cond_signal",
+        "pthread_cond_broadcast",
+    },
+    ("pthread.h", PTHREAD_MODULE)
+)
+
+PTHREAD_TYPES = dict.fromkeys(
+    {
+        "pthread_t",
+        "pthread_attr_t",
+        "pthread_mutex_t",
+        "pthread_mutexattr_t",
+        "pthread_cond_t",
+        "pthread_condattr_t",
+    },
+    ("pthread.h", PTHREAD_MODULE)
+)
@@ -0,0 +1,87 @@
+from lang_types import *
+
+
+def _vector_decls(name, vector_t):
+    """The typedef of a builtin vector type and its functions."""
+    vector = NameType(name)
+    elem = NameType(vector_t.contents.name)
+    mask = NameType(vector_type_name(vector_mask_type(vector_t)))
+    return [
+        TypeDefStmt(Vector(elem, vector_t.lanes), name),
+
+        FuncDecl(
+            name + "_load",
+            [
+                VarDecl("p", Pointer(elem)),
+            ],
+            vector
+        ),
+
+        FuncDecl(
+            name + "_store",
+            [
+                VarDecl("p", Pointer(elem)),
+                VarDecl("v", vector),
+            ],
+            NameType("void")
+        ),
+
+        FuncDecl(
+            name + "_splat",
+            [
+                VarDecl("x", elem),
+            ],
+            vector
+        ),
+
+        FuncDecl(
+            name + "_shuffle",
+            [
+                VarDecl("v", vector),
+                VarDecl("m", mask),
+            ],
+            vector
+        ),
+
+        FuncDecl(
+            name + "_sum",
+            [
+                VarDecl("v", vector),
+            ],
+            elem
+        ),
+    ]
+
+
+# Declarations for the vector types in include/lang_simd.h. The masks of the
+# shuffles are the signed integer vectors, so they are declared first.
+SIMD_MODULE = Module(
+    [
+        Ifndef("_LANG_SIMD_H"),
+        Define("_LANG_SIMD_H"),
+    ] +
+    [
+        decl
+        for name, vector_t in sorted(VECTOR_TYPES.items(),
+                                     key=lambda item: not item[0].startswith("int"))
+        for decl in _vector_decls(name, vector_t)
+    ] +
+    [
+        Endif(),
+    ]
+)
+
+
+SIMD_VARS = dict.fromkeys(
+    {
+        name + "_" + func
+        for name in VECTOR_TYPES
+        for func in ("load", "store", "splat", "shuffle", "sum")
+    },
+    ("lang_simd.h", SIMD_MODULE)
+)
+
+SIMD_TYPES = dict.fromkeys(
+    VECTOR_TYPES,
+    ("lang_simd.h", SIMD_MODULE)
+)
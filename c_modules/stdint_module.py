@@ -0,0 +1,36 @@
+from lang_types import *
+
+
+# Fixed width integers are typedefs of the builtin integer types of the same
+# width. They keep their stdint.h names in C (int8 -> int8_t).
+STDINT_MODULE = Module([
+    Ifndef("_STDINT_H"),
+    Define("_STDINT_H"),
+
+    TypeDefStmt(NameType("char"), "int8"),
+    TypeDefStmt(NameType("short"), "int16"),
+    TypeDefStmt(NameType("int"), "int32"),
+    TypeDefStmt(NameType("long"), "int64"),
+
+    TypeDefStmt(NameType("uchar"), "uint8"),
+    TypeDefStmt(NameType("ushort"), "uint16"),
+    TypeDefStmt(NameType("uint"), "uint32"),
+    TypeDefStmt(NameType("ulong"), "uint64"),
+
+    Endif(),
+])
+
+
+STDINT_TYPES = dict.fromkeys(
+    {
+        "int8",
+        "int16",
+        "int32",
+        "int64",
+        "uint8",
+        "uint16",
+        "uint32",
+        "uint64",
+    },
+    ("stdint.h", STDINT_MODULE)
+)
@@ -8,8 +8,14 @@ STDIO_MODULE = Module([
     # Variables
 
     VarDeclStmt(VarDecl("stdin", Pointer(NameType("FILE")))),
+    VarDeclStmt(VarDecl("stdout", Pointer(NameType("FILE")))),
     VarDeclStmt(VarDecl("stderr", Pointer(NameType("FILE")))),
 
+    # Buffering modes of setvbuf
+    VarDeclStmt(VarDecl("_IOFBF", NameType("int"))),
+    VarDeclStmt(VarDecl("_IOLBF", NameType("int"))),
+    VarDeclStmt(VarDecl("_IONBF", NameType("int"))),
+
     # Functions
 
     # 22
@@ -42,6 +48,66 @@ STDIO_MODULE = Module([
         NameType("int")
     ),
 
+    # Bulk IO
+
+    FuncDecl(
+        "fopen",
+        [
+            VarDecl("path", Pointer(NameType("char"))),
+            VarDecl("mode", Pointer(NameType("char"))),
+        ],
+        Pointer(NameType("FILE"))
+    ),
+
+    FuncDecl(
+        "fclose",
+        [
+            VarDecl("stream", Pointer(NameType("FILE"))),
+        ],
+        NameType("int")
+    ),
+
+    FuncDecl(
+        "fread",
+        [
+            VarDecl("ptr", Pointer(NameType("void"))),
+            VarDecl("size", NameType("size_t")),
+            VarDecl("count", NameType("size_t")),
+            VarDecl("stream", Pointer(NameType("FILE"))),
+        ],
+        NameType("size_t")
+    ),
+
+    FuncDecl(
+        "fwrite",
+        [
+            VarDecl("ptr", Pointer(NameType("void"))),
+            VarDecl("size", NameType("size_t")),
+            VarDecl("count", NameType("size_t")),
+            VarDecl("stream", Pointer(NameType("FILE"))),
+        ],
+        NameType("size_t")
+    ),
+
+    FuncDecl(
+        "fflush",
+        [
+            VarDecl("stream", Pointer(NameType("FILE"))),
+        ],
+        NameType("int")
+    ),
+
+    FuncDecl(
+        "setvbuf",
+        [
+            VarDecl("stream", Pointer(NameType("FILE"))),
+            VarDecl("buf", Pointer(NameType("char"))),
+            VarDecl("mode", NameType("int")),
+            VarDecl("size", NameType("size_t")),
+        ],
+        NameType("int")
+    ),
+
     Endif(),
 ])
 
@@ -50,12 +116,22 @@ STDIO_VARS = dict.fromkeys(
     {
         # Variables
         "stdin",
+        "stdout",
         "stderr",
+        "_IOFBF",
+        "_IOLBF",
+        "_IONBF",
 
         # Funcs
         "printf",
         "fscanf",
         "fputs",
+        "fopen",
+        "fclose",
+        "fread",
+        "fwrite",
+        "fflush",
+        "setvbuf",
     },
     ("stdio.h", STDIO_MODULE)
 )
@@ -15,6 +15,33 @@ STDLIB_MODULE = Module([
         Pointer(NameType("void"))
     ),
 
+    FuncDecl(
+        "aligned_alloc",
+        [
+            VarDecl("alignment", NameType("size_t")),
+            VarDecl("size", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "calloc",
+        [
+            VarDecl("num", NameType("size_t")),
+            VarDecl("size", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "realloc",
+        [
+            VarDecl("ptr", Pointer(NameType("void"))),
+            VarDecl("size", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
     FuncDecl(
         "free",
         [
@@ -23,6 +50,14 @@ STDLIB_MODULE = Module([
         NameType("void")
     ),
 
+    FuncDecl(
+        "atoi",
+        [
+            VarDecl("str", Pointer(NameType("char"))),
+        ],
+        NameType("int")
+    ),
+
     FuncDecl(
         "exit",
         [
@@ -38,7 +73,11 @@ STDLIB_MODULE = Module([
 STDLIB_VARS = dict.fromkeys(
     {
         "malloc",
+        "aligned_alloc",
+        "calloc",
+        "realloc",
         "free",
+        "atoi",
         "exit",
     },
     ("stdlib.h", STDLIB_MODULE)
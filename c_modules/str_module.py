@@ -0,0 +1,203 @@
+from lang_types import *
+
+
+STR_TYPE = NameType("str")
+STR_BUILDER_PTR_TYPE = Pointer(NameType("StrBuilder"))
+
+
+# Declarations for the string runtime in include/lang_str.h. String literals
+# used where a str is expected are converted to a str without calling
+# str_from() since their length is known at compile time.
+STR_MODULE = Module([
+    Ifndef("_LANG_STR_H"),
+    Define("_LANG_STR_H"),
+
+    StructDecl(Struct("str", [
+        VarDecl("data", Pointer(NameType("char"))),
+        VarDecl("length", NameType("size_t")),
+    ])),
+
+    StructDecl(Struct("StrBuilder", [
+        VarDecl("data", Pointer(NameType("char"))),
+        VarDecl("length", NameType("size_t")),
+        VarDecl("capacity", NameType("size_t")),
+    ])),
+
+    FuncDecl(
+        "str_from",
+        [
+            VarDecl("s", Pointer(NameType("char"))),
+        ],
+        STR_TYPE
+    ),
+
+    FuncDecl(
+        "str_slice",
+        [
+            VarDecl("s", STR_TYPE),
+            VarDecl("start", NameType("size_t")),
+            VarDecl("end", NameType("size_t")),
+        ],
+        STR_TYPE
+    ),
+
+    FuncDecl(
+        "str_eq",
+        [
+            VarDecl("a", STR_TYPE),
+            VarDecl("b", STR_TYPE),
+        ],
+        NameType("int")
+    ),
+
+    FuncDecl(
+        "str_hash",
+        [
+            VarDecl("s", STR_TYPE),
+        ],
+        NameType("size_t")
+    ),
+
+    FuncDecl(
+        "str_copy",
+        [
+            VarDecl("s", STR_TYPE),
+        ],
+        STR_TYPE
+    ),
+
+    FuncDecl(
+        "str_free",
+        [
+            VarDecl("s", STR_TYPE),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "str_print",
+        [
+            VarDecl("s", STR_TYPE),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "str_builder_new",
+        [],
+        STR_BUILDER_PTR_TYPE
+    ),
+
+    FuncDecl(
+        "str_builder_reserve",
+        [
+            VarDecl("b", STR_BUILDER_PTR_TYPE),
+            VarDecl("length", NameType("size_t")),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "str_builder_append",
+        [
+            VarDecl("b", STR_BUILDER_PTR_TYPE),
+            VarDecl("s", STR_TYPE),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "str_builder_append_char",
+        [
+            VarDecl("b", STR_BUILDER_PTR_TYPE),
+            VarDecl("c", NameType("char")),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "str_builder_append_int",
+        [
+            VarDecl("b", STR_BUILDER_PTR_TYPE),
+            VarDecl("x", NameType("long")),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "str_builder_append_uint",
+        [
+            VarDecl("b", STR_BUILDER_PTR_TYPE),
+            VarDecl("x", NameType("ulong")),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "str_builder_append_float",
+        [
+            VarDecl("b", STR_BUILDER_PTR_TYPE),
+            VarDecl("x", NameType("double")),
+            VarDecl("precision", NameType("int")),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "str_builder_view",
+        [
+            VarDecl("b", STR_BUILDER_PTR_TYPE),
+        ],
+        STR_TYPE
+    ),
+
+    FuncDecl(
+        "str_builder_clear",
+        [
+            VarDecl("b", STR_BUILDER_PTR_TYPE),
+        ],
+        NameType("void")
+    ),
+
+    FuncDecl(
+        "str_builder_free",
+        [
+            VarDecl("b", STR_BUILDER_PTR_TYPE),
+        ],
+        NameType("void")
+    ),
+
+    Endif(),
+])
+
+
+STR_VARS = dict.fromkeys(
+    {
+        "str_from",
+        "str_slice",
+        "str_eq",
+        "str_hash",
+        "str_copy",
+        "str_free",
+        "str_print",
+        "str_builder_new",
+        "str_builder_reserve",
+        "str_builder_append",
+        "str_builder_append_char",
+        "str_builder_append_int",
+        "str_builder_append_uint",
+        "str_builder_append_float",
+        "str_builder_view",
+        "str_builder_clear",
+        "str_builder_free",
+    },
+    ("lang_str.h", STR_MODULE)
+)
+
+STR_TYPES = dict.fromkeys(
+    {
+        "str",
+        "StrBuilder",
+    },
+    ("lang_str.h", STR_MODULE)
+)
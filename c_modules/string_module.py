@@ -19,6 +19,46 @@ STRING_MODULE = Module([
         ],
         NameType("void")
     ),
+
+    FuncDecl(
+        "memcpy",
+        [
+            VarDecl("dest", Pointer(NameType("void"))),
+            VarDecl("src", Pointer(NameType("void"))),
+            VarDecl("n", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "memmove",
+        [
+            VarDecl("dest", Pointer(NameType("void"))),
+            VarDecl("src", Pointer(NameType("void"))),
+            VarDecl("n", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "memset",
+        [
+            VarDecl("s", Pointer(NameType("void"))),
+            VarDecl("c", NameType("int")),
+            VarDecl("n", NameType("size_t")),
+        ],
+        Pointer(NameType("void"))
+    ),
+
+    FuncDecl(
+        "memcmp",
+        [
+            VarDecl("s1", Pointer(NameType("void"))),
+            VarDecl("s2", Pointer(NameType("void"))),
+            VarDecl("n", NameType("size_t")),
+        ],
+        NameType("int")
+    ),
 ])
 
 
@@ -26,6 +66,10 @@ STRING_VARS = dict.fromkeys(
     {
         "strlen",
         "strncpy",
+        "memcpy",
+        "memmove",
+        "memset",
+        "memcmp",
     },
     ("string.h", STRING_MODULE)
 )
@@ -46,10 +46,18 @@ class Lexer:
         "elif": "ELIF",
         "while": "WHILE",
         "dowhile": "DOWHILE",
+        "for": "FOR",
+        "in": "IN",
         "switch": "SWITCH",
         "case": "CASE",
         "return": "RETURN",
+        "yield": "YIELD",
         "break": "BREAK",
+        "with": "WITH",
+        "spawn": "SPAWN",
+        "join": "JOIN",
+        "sync": "SYNC",
+        "as": "AS",
 
         # Exprs
         "not": "NOT",
@@ -64,6 +72,8 @@ class Lexer:
         "enum": "ENUM",
         "struct": "STRUCT",
         "typedef": "TYPEDEF",
+        "const": "CONST",
+        "restrict": "RESTRICT",
 
         # Operators
         "and": "AND",
@@ -77,7 +87,7 @@ class Lexer:
         'NAME',
 
         # Literals
-        'INT', "FLOAT", 'STRING', "CHAR",
+        'INT', "FLOAT", 'STRING', "FSTRING", "CHAR",
 
         # Container chars
         # ( ) [ ] { }
@@ -131,7 +141,7 @@ class Lexer:
         "ELLIPSIS",
 
         # Misc
-        'COLON', "CARROT", "PIPE",
+        'COLON', "CARROT", "PIPE", "AT",
     ) + tuple(RESERVED.values())
 
     # This line is necessary until the version of ply that comes out contains the
@@ -179,6 +189,7 @@ class Lexer:
     t_PIPE = r"\|"
     t_CARROT = r"\^"
     t_ELLIPSIS = r"\.\.\."
+    t_AT = r"@"
 
 
     ########## Lexer interface #########
@@ -402,6 +413,17 @@ class Lexer:
         t.value = float(t.value)
         return t
 
+    # Defined before NAME so the f is not taken as a name
+    @lex.TOKEN("f(" + _make_str_regex() + ")")
+    def t_FSTRING(self, t):
+        s = t.value[1:]
+        if s.startswith('"""'):
+            t.value = s[3:-3]
+        else:
+            t.value = s[1:-1]
+        t.lexer.lineno += t.value.count("\n")
+        return t
+
     @lex.TOKEN(_make_str_regex())
     def t_STRING(self, t):
         s = t.value
@@ -1,7 +1,9 @@
 from cparse import Parser
 from lang_ast import *
 from inference import Inferer
+from optimize import fold_constants
 from file_conversion import *
+from c_modules import C_INCLUDE_DIR
 
 import subprocess
 import os.path
@@ -17,8 +19,21 @@ def create_c_file(source, ast):
     return c_fname
 
 
+def uses_openmp(ast):
+    """Check if an ast has parallel loops."""
+    return contains_node(ast, lambda n: isinstance(n, ForRange) and n.parallel)
+
+
+def uses_threads(ast):
+    """Check if an ast spawns calls on the thread pool or uses pthreads."""
+    return contains_node(ast, lambda n: (
+        isinstance(n, SpawnStmt) or
+        isinstance(n, CInclude) and n.path == "pthread.h"
+    ))
+
+
 def compile_c_sources(sources, asts, *, compiler="gcc", std="c11", output=None,
-                      optomize=2):
+                      optomize=2, release=False):
     # Keep only lang files
     c_sources = (s for s in sources if is_c_source(s))
     c_source_str = " ".join(c_sources)
@@ -34,8 +49,33 @@ def compile_c_sources(sources, asts, *, compiler="gcc", std="c11", output=None,
     else:
         optomize = ""
 
+    # Release builds remove assertions, like the bounds checks on lists
+    if release:
+        release = "-DNDEBUG"
+    else:
+        release = ""
+
+    include_dir = C_INCLUDE_DIR
+
+    # Parallel loops need OpenMP. Otherwise, only honor the omp simd pragmas
+    # on elementwise loops without linking OpenMP.
+    if any(uses_openmp(ast) for ast in asts):
+        openmp = "-fopenmp"
+    else:
+        openmp = "-fopenmp-simd"
+
+    # Threads and the thread pool of spawned calls use pthreads
+    if any(uses_threads(ast) for ast in asts):
+        threads = "-pthread"
+    else:
+        threads = ""
+
+    # Strict ISO C hides the POSIX and BSD parts of the system headers, like
+    # the advice for madvise()
+    features = "-D_DEFAULT_SOURCE"
+
     subprocess.run(
-        "{compiler} -std={std} -o {output} {c_source_str} {optomize}"
+        "{compiler} -std={std} {features} -I{include_dir} -o {output} {c_source_str} {optomize} {release} {openmp} {threads}"
         .format(**locals()).split(),
         check=True,
     )
@@ -50,10 +90,16 @@ def compile_asts(sources, asts, **kwargs):
     return compile_c_sources(c_sources, asts, **kwargs)
 
 
-def compile_lang_sources_to_asts(sources, **kwargs):
+def compile_lang_sources_to_asts(sources, *, reorder_fields=False,
+                                 fold=True, layout_report=None, **kwargs):
     """
     Args:
         source (list[str]): Source strings
+        reorder_fields (bool): Reorder struct fields to minimize padding.
+        fold (bool): Fold constant expressions and remove the code they make
+            unreachable.
+        layout_report (optional[list[str]]): If provided, the struct layout
+            report lines of each source are added to this.
 
     Returns:
         dict[str, Node]: Mapping between the lang file and its type inferred ast
@@ -64,28 +110,42 @@ def compile_lang_sources_to_asts(sources, **kwargs):
     for i, ast in enumerate(asts):
         source = sources[i]
 
-        inferer = Inferer(source_file=source)
+        inferer = Inferer(source_file=source, reorder_fields=reorder_fields)
         src_map[source] = inferer.check(ast)
 
+        if layout_report is not None:
+            for line in inferer.layout_report():
+                if line not in layout_report:
+                    layout_report.append(line)
+
         # Add the includes found
         for include, include_ast in inferer.includes().items():
             if include not in src_map:
                 src_map[include] = include_ast
 
+    if fold:
+        src_map = {src: fold_constants(ast) for src, ast in src_map.items()}
+
     return src_map
 
 
-def compile_lang_sources(sources, **kwargs):
+def compile_lang_sources(sources, *, reorder_fields=False, fold=True,
+                         **kwargs):
     """
     Takes a list of filenames, compiles them, and returns the executable.
 
     Args:
         source (list[str]): Source strings
+        reorder_fields (bool): Reorder struct fields to minimize padding.
+        fold (bool): Fold constant expressions and remove the code they make
+            unreachable.
 
     Returns:
         str: The final executable
     """
-    src_map = compile_lang_sources_to_asts(sources, **kwargs)
+    src_map = compile_lang_sources_to_asts(sources,
+                                           reorder_fields=reorder_fields,
+                                           fold=fold)
     src_names, inferred_asts = zip(*src_map.items())
     return compile_asts(src_names, inferred_asts, **kwargs)
 
@@ -124,6 +184,15 @@ def dump_c_code_from_files(sources, dump_headers=True, **kwargs):
         print(ast.c_code())
 
 
+def dump_layout_report_from_files(sources, **kwargs):
+    """Dump the size and padding of every struct and class before and after
+    reordering their fields."""
+    report = []
+    compile_lang_sources_to_asts(sources, layout_report=report, **kwargs)
+    for line in report:
+        print(line)
+
+
 def dump_ast_trees(asts):
     for ast in asts:
         print("------- {} --------".format(ast.filename))
@@ -175,6 +175,8 @@ class Parser:
 
     def p_small_stmt(self, p):
         """small_stmt : return_stmt
+                      | yield_stmt
+                      | sync_stmt
                       | include_stmt
                       | define_stmt
                       | ifndef_stmt
@@ -303,6 +305,12 @@ class Parser:
         lineno, colno = self.prod_loc(p)
         p[0] = VarDecl(p[1], p[3], p[5], lineno=lineno, colno=colno)
 
+    # @align(64) x: int
+    def p_vardecl_decorated(self, p):
+        "var_decl : inline_decorator var_decl"
+        p[2].decorators.insert(0, p[1])
+        p[0] = p[2]
+
     """
     Type decls:
     Name: int
@@ -329,9 +337,41 @@ class Parser:
         p[0] = p[2]
 
     def p_type_declaration_generic(self, p):
-        "type_declaration : type_declaration LT typedecl_list optional_comma GT"
+        "type_declaration : type_declaration LT type_param_list optional_comma GT"
         p[0] = Generic(p[1], p[3])
 
+    def p_type_param_list_one(self, p):
+        "type_param_list : type_param"
+        p[0] = [p[1]]
+
+    def p_type_param_list_many(self, p):
+        "type_param_list : type_param_list COMMA type_param"
+        p[0] = p[1] + [p[3]]
+
+    def p_type_param(self, p):
+        "type_param : type_declaration"
+        p[0] = p[1]
+
+    def p_type_param_int(self, p):
+        "type_param : INT"
+        # Integer parameters are only used for the rank of an NDArray
+        lineno, colno = self.prod_loc(p)
+        p[0] = Int(p[1], lineno=lineno, colno=colno)
+
+    # Qualifiers apply to the type before them like in C. They are written
+    # after the type so char const* (pointer to const char) and
+    # char* const (const pointer) do not need parentheses.
+
+    def p_type_declaration_const(self, p):
+        "type_declaration : type_declaration CONST"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Qualified(p[1], "const", lineno=lineno, colno=colno)
+
+    def p_type_declaration_restrict(self, p):
+        "type_declaration : type_declaration RESTRICT"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Qualified(p[1], "restrict", lineno=lineno, colno=colno)
+
     # Function type declarations
 
     def p_function_declaration(self, p):
@@ -420,17 +460,78 @@ class Parser:
         lineno, colno = self.prod_loc(p)
         p[0] = Return(p[2], lineno=lineno, colno=colno)
 
+    def p_yield_stmt(self, p):
+        "yield_stmt : YIELD expr"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Yield(p[2], lineno=lineno, colno=colno)
+
+    def p_sync_stmt(self, p):
+        "sync_stmt : SYNC"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Sync(lineno=lineno, colno=colno)
+
     # compound_stmt is a multiline statement
 
     def p_compound_stmt(self, p):
         """compound_stmt : if_stmt
                          | while_stmt
                          | dowhile_stmt
+                         | for_stmt
                          | switch_stmt
+                         | with_stmt
                          | funcdef
-                         | classdef"""
+                         | classdef
+                         | decorated"""
         p[0] = p[1]
 
+    ###### Decorators ##########
+
+    def p_decorator(self, p):
+        "decorator : AT NAME NEWLINE"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Decorator(p[2], lineno=lineno, colno=colno)
+
+    def p_decorator_args(self, p):
+        "decorator : AT NAME LPAR arglist RPAR NEWLINE"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Decorator(p[2], p[4], lineno=lineno, colno=colno)
+
+    def p_decorators(self, p):
+        "decorators : decorator"
+        p[0] = [p[1]]
+
+    def p_decorators_many(self, p):
+        "decorators : decorators decorator"
+        p[0] = p[1] + [p[2]]
+
+    def p_decorated(self, p):
+        """decorated : decorators simple_stmt
+                     | decorators classdef
+                     | decorators for_stmt"""
+        node = p[2]
+        if isinstance(node, VarDeclStmt):
+            node.decl.decorators = p[1] + node.decl.decorators
+        elif isinstance(node, (StructDecl, ClassDef, For)):
+            node.decorators = p[1]
+        else:
+            # Raising a SyntaxError here would put ply into error recovery
+            raise RuntimeError("Only structs, classes, for loops, and variable declarations can be decorated at ({}, {})".format(
+                node.lineno, node.colno
+            ))
+        p[0] = node
+
+    # Decorators on the same line as a variable declaration, like struct
+    # fields
+    def p_inline_decorator(self, p):
+        "inline_decorator : AT NAME"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Decorator(p[2], lineno=lineno, colno=colno)
+
+    def p_inline_decorator_args(self, p):
+        "inline_decorator : AT NAME LPAR arglist RPAR"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Decorator(p[2], p[4], lineno=lineno, colno=colno)
+
     ###### Control flow ##########
 
     # Do while stmt
@@ -455,6 +556,12 @@ class Parser:
         "while_orelse : ELSE COLON suite"
         p[0] = p[3]
 
+    # For stmt
+    def p_for_stmt(self, p):
+        "for_stmt : FOR NAME IN expr COLON suite"
+        lineno, colno = self.prod_loc(p)
+        p[0] = For(p[2], p[4], p[6], lineno=lineno, colno=colno)
+
     # If stmt
     def p_if_stmt(self, p):
         'if_stmt : IF expr COLON suite'
@@ -480,6 +587,17 @@ class Parser:
         lineno, colno = self.prod_loc(p)
         p[0] = [If(p[2], p[4], p[5], lineno=lineno, colno=colno)]
 
+    # With stmt
+    def p_with_stmt(self, p):
+        "with_stmt : WITH expr COLON suite"
+        lineno, colno = self.prod_loc(p)
+        p[0] = With(p[2], p[4], lineno=lineno, colno=colno)
+
+    def p_with_stmt_as(self, p):
+        "with_stmt : WITH expr AS NAME COLON suite"
+        lineno, colno = self.prod_loc(p)
+        p[0] = With(p[2], p[6], p[4], lineno=lineno, colno=colno)
+
     # Switch statement
     def p_switch(self, p):
         "switch_stmt : SWITCH expr COLON switch_suite"
@@ -708,6 +826,16 @@ class Parser:
         lineno, colno = self.prod_loc(p)
         p[0] = UnaryOp(Not(), p[2], lineno=lineno, colno=colno)
 
+    def p_spawn_expr(self, p):
+        "expr : SPAWN expr %prec NOT"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Spawn(p[2], lineno=lineno, colno=colno)
+
+    def p_join_expr(self, p):
+        "expr : JOIN expr %prec NOT"
+        lineno, colno = self.prod_loc(p)
+        p[0] = Join(p[2], lineno=lineno, colno=colno)
+
     def p_inv_expr(self, p):
         "expr : INV expr"
         lineno, colno = self.prod_loc(p)
@@ -735,9 +863,50 @@ class Parser:
     # Indexing
 
     def p_index(self, p):
-        "expr : expr LBRACKET expr RBRACKET"
+        "expr : expr LBRACKET subscript_list RBRACKET"
+        lineno, colno = self.prod_loc(p)
+        subscripts = p[3]
+        if len(subscripts) > 1:
+            p[0] = MultiIndex(p[1], subscripts, lineno=lineno, colno=colno)
+        elif isinstance(subscripts[0], SliceRange):
+            p[0] = Slice(p[1], subscripts[0].start, subscripts[0].end,
+                         lineno=lineno, colno=colno)
+        else:
+            p[0] = Index(p[1], subscripts[0], lineno=lineno, colno=colno)
+
+    def p_subscript_list_one(self, p):
+        "subscript_list : subscript"
+        p[0] = [p[1]]
+
+    def p_subscript_list_many(self, p):
+        "subscript_list : subscript_list COMMA subscript"
+        p[0] = p[1] + [p[3]]
+
+    def p_subscript(self, p):
+        "subscript : expr"
+        p[0] = p[1]
+
+    # Slicing
+
+    def p_slice(self, p):
+        "subscript : expr COLON expr"
+        lineno, colno = self.prod_loc(p)
+        p[0] = SliceRange(p[1], p[3], lineno=lineno, colno=colno)
+
+    def p_slice_from(self, p):
+        "subscript : expr COLON"
+        lineno, colno = self.prod_loc(p)
+        p[0] = SliceRange(p[1], lineno=lineno, colno=colno)
+
+    def p_slice_to(self, p):
+        "subscript : COLON expr"
         lineno, colno = self.prod_loc(p)
-        p[0] = Index(p[1], p[3], lineno=lineno, colno=colno)
+        p[0] = SliceRange(end=p[2], lineno=lineno, colno=colno)
+
+    def p_slice_all(self, p):
+        "subscript : COLON"
+        lineno, colno = self.prod_loc(p)
+        p[0] = SliceRange(lineno=lineno, colno=colno)
 
     # Address of
 
@@ -770,6 +939,81 @@ class Parser:
         lineno, colno = self.prod_loc(p)
         p[0] = Str(p[1], lineno=lineno, colno=colno)
 
+    def p_atom_fstring(self, p):
+        "atom : FSTRING"
+        lineno, colno = self.prod_loc(p)
+        p[0] = FString(self.__fstring_parts(p[1], lineno, colno),
+                       lineno=lineno, colno=colno)
+
+    def __fstring_parts(self, s, lineno, colno):
+        """Split the contents of an f-string into Strs and FormattedValues.
+        {{ and }} are literal braces."""
+        parts = []
+        literal = ""
+        i = 0
+        while i < len(s):
+            c = s[i]
+            if c in "{}" and s[i + 1:i + 2] == c:
+                literal += c
+                i += 2
+            elif c == "}":
+                raise RuntimeError("Single '}}' in f-string at ({}, {})".format(
+                    lineno, colno))
+            elif c == "{":
+                if literal:
+                    parts.append(Str(literal, lineno=lineno, colno=colno))
+                    literal = ""
+                value, i = self.__fstring_field(s, i + 1, lineno, colno)
+                parts.append(value)
+            else:
+                literal += c
+                i += 1
+        if literal:
+            parts.append(Str(literal, lineno=lineno, colno=colno))
+        return parts
+
+    def __fstring_field(self, s, start, lineno, colno):
+        """Parse the field of an f-string starting after its {. Returns the
+        FormattedValue and the index after the closing }."""
+        depth = 0
+        spec_start = None
+        i = start
+        while i < len(s):
+            c = s[i]
+            if c == "'":
+                # Skip chars, which could be brackets
+                i = s.index("'", i + 2 if s[i + 1:i + 2] == "\\" else i + 1)
+            elif c in "([{":
+                depth += 1
+            elif c in ")]" or (c == "}" and depth):
+                depth -= 1
+            elif c == ":" and not depth and spec_start is None:
+                spec_start = i
+            elif c == "}":
+                break
+            i += 1
+        else:
+            raise RuntimeError("Expected '}}' in f-string at ({}, {})".format(
+                lineno, colno))
+
+        expr_end = i if spec_start is None else spec_start
+        expr = s[start:expr_end].strip()
+        spec = None if spec_start is None else s[spec_start + 1:i]
+
+        module = self.__fstring_parser().parse(expr) if expr else None
+        if (not module or len(module.body) != 1 or
+                not isinstance(module.body[0], ExprStmt)):
+            raise RuntimeError("Expected an expression in f-string field '{{{}}}' at ({}, {})".format(
+                s[start:i], lineno, colno))
+        value = module.body[0].value
+        return FormattedValue(value, spec, lineno=lineno, colno=colno), i + 1
+
+    def __fstring_parser(self):
+        """Parser for the expressions in f-strings."""
+        if not hasattr(self, "_fstring_parser"):
+            self._fstring_parser = Parser(source_file=self.__source_file)
+        return self._fstring_parser
+
     def p_atom_char(self, p):
         "atom : CHAR"
         lineno, colno = self.prod_loc(p)
@@ -0,0 +1,53 @@
+#include <stdio.h>
+#include <stdlib.h>
+typedef struct Counters Counters;
+struct Counters {_Alignas(64) long long hits; _Alignas(64) long long misses;};
+typedef struct PacketHeader PacketHeader;
+struct PacketHeader {char kind; unsigned int length; char flags;} __attribute__((packed));
+typedef struct Vec3 Vec3;
+struct Vec3 {float x; float y; float z;} __attribute__((aligned(16)));
+typedef struct Worker Worker;
+struct Worker {_Alignas(64) long long count; int id; int (*__init__)(Worker*, int);};
+int Worker___init__(Worker *self, int id){
+    self->count = 0;
+    self->id = id;
+}
+Worker* init_Worker(Worker *obj, int id){
+    obj->__init__ = Worker___init__;
+    Worker___init__(obj, id);
+    return obj;
+}
+Worker* new_Worker(int id){
+    return init_Worker(((Worker*)aligned_alloc(64, sizeof(Worker))), id);
+}
+void del_Worker(Worker *self){
+    free(self);
+}
+Worker* init_Worker_array(Worker *lang_objs, size_t lang_count, int id){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Worker((lang_objs + lang_idx), id);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+Worker* new_Worker_array(size_t lang_count, int id){
+    return init_Worker_array(((Worker*)aligned_alloc(64, (sizeof(Worker) * lang_count))), lang_count, id);
+}
+void del_Worker_array(Worker *lang_objs, size_t lang_count){
+    free(lang_objs);
+}
+int main(){
+    Counters counters;
+    counters.hits = 3;
+    counters.misses = 4;
+    printf("%d %d\n", ((int)sizeof(Counters)), ((int)(counters.hits + counters.misses)));
+    printf("%d\n", ((int)sizeof(PacketHeader)));
+    printf("%d\n", ((int)sizeof(Vec3)));
+    Worker *w = new_Worker(7);
+    printf("%d %d\n", ((int)sizeof(Worker)), w->id);
+    del_Worker(w);
+    _Alignas(32) char buf[10];
+    printf("%d\n", ((int)(((unsigned long)buf) % 32)));
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,50 @@
+# Counters updated by different threads should not share a cache line, so
+# each one is aligned to the start of its own line.
+
+struct Counters {
+    @align(64) hits: long,
+    @align(64) misses: long,
+}
+
+# Packed structs match the exact layout of data read from the network
+@packed
+struct PacketHeader {
+    kind: char,
+    length: uint,
+    flags: char,
+}
+
+@align(16)
+struct Vec3 {
+    x: float,
+    y: float,
+    z: float,
+}
+
+class Worker:
+    @align(64)
+    count: long
+
+    id: int
+
+    def __init__(self: Worker*, id: int):
+        self->count = 0
+        self->id = id
+
+
+def main():
+    counters: Counters
+    counters.hits = 3
+    counters.misses = 4
+    printf("%d %d\n", <int>sizeof(Counters), <int>(counters.hits + counters.misses))
+
+    printf("%d\n", <int>sizeof(PacketHeader))
+    printf("%d\n", <int>sizeof(Vec3))
+
+    w = new_Worker(7)
+    printf("%d %d\n", <int>sizeof(Worker), w->id)
+    del_Worker(w)
+
+    @align(32) buf: char[10]
+    printf("%d\n", <int>((<ulong>buf) % 32))
+    return 0
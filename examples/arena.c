@@ -0,0 +1,156 @@
+#include <stdio.h>
+#include <lang_arena.h>
+#include <stdlib.h>
+typedef struct Point Point;
+struct Point {int x; int y; int (*__init__)(Point*, int, int);};
+int Point___init__(Point *self, int x, int y){
+    self->x = x;
+    self->y = y;
+}
+Point* init_Point(Point *obj, int x, int y){
+    obj->__init__ = Point___init__;
+    Point___init__(obj, x, y);
+    return obj;
+}
+Point* new_Point(int x, int y){
+    return init_Point(((Point*)malloc(sizeof(Point))), x, y);
+}
+void del_Point(Point *self){
+    free(self);
+}
+Point* init_Point_array(Point *lang_objs, size_t lang_count, int x, int y){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Point((lang_objs + lang_idx), x, y);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+Point* new_Point_array(size_t lang_count, int x, int y){
+    return init_Point_array(((Point*)malloc((sizeof(Point) * lang_count))), lang_count, x, y);
+}
+void del_Point_array(Point *lang_objs, size_t lang_count){
+    free(lang_objs);
+}
+typedef struct Buffer Buffer;
+struct Buffer {int size; int (*__init__)(Buffer*, int); int (*__del__)(Buffer*);};
+int Buffer___init__(Buffer *self, int size){
+    self->size = size;
+}
+int Buffer___del__(Buffer *self){
+    printf("closed %d\n", self->size);
+}
+Buffer* init_Buffer(Buffer *obj, int size){
+    obj->__init__ = Buffer___init__;
+    obj->__del__ = Buffer___del__;
+    Buffer___init__(obj, size);
+    return obj;
+}
+Buffer* new_Buffer(int size){
+    return init_Buffer(((Buffer*)malloc(sizeof(Buffer))), size);
+}
+void del_Buffer(Buffer *self){
+    Buffer___del__(self);
+    free(self);
+}
+Buffer* init_Buffer_array(Buffer *lang_objs, size_t lang_count, int size){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Buffer((lang_objs + lang_idx), size);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+Buffer* new_Buffer_array(size_t lang_count, int size){
+    return init_Buffer_array(((Buffer*)malloc((sizeof(Buffer) * lang_count))), lang_count, size);
+}
+void fini_Buffer_array(Buffer *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        Buffer___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+void del_Buffer_array(Buffer *lang_objs, size_t lang_count){
+    fini_Buffer_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+int handle_request(int req){
+    int total = 0;
+    {
+        Arena *a __attribute__((cleanup(arena_cleanup))) = arena_new(4096);
+        int i = 0;
+        while ((i < 1000)) {
+            Point *p = init_Point(((Point*)arena_alloc(a, sizeof(Point))), req, i);
+            total = ((total + p->x) + p->y);
+            i++;
+        }
+        int *buf = ((int*)arena_alloc(a, (sizeof(int) * 100)));
+        buf[0] = total;
+        total = buf[0];
+    }
+    return total;
+}
+int first_point_sum(int req){
+    {
+        Arena *__arena_0 __attribute__((cleanup(arena_cleanup))) = arena_new(64);
+        Point *p = init_Point(((Point*)arena_alloc(__arena_0, sizeof(Point))), req, req);
+        return (p->x + p->y);
+    }
+}
+#ifndef _LANG_SPEC_lang_arena_del_Buffer
+#define _LANG_SPEC_lang_arena_del_Buffer
+static void lang_arena_del_Buffer(Arena *arena, Buffer *self){
+    if (arena_owns(arena, self)) {
+        Buffer___del__(self);
+    }
+    else {
+        del_Buffer(self);
+    }
+}
+#endif
+#ifndef _LANG_SPEC_lang_arena_del_Buffer_array
+#define _LANG_SPEC_lang_arena_del_Buffer_array
+static void lang_arena_del_Buffer_array(Arena *arena, Buffer *self, size_t count){
+    if (arena_owns(arena, self)) {
+        fini_Buffer_array(self, count);
+    }
+    else {
+        del_Buffer_array(self, count);
+    }
+}
+#endif
+#ifndef _LANG_SPEC_lang_arena_del_Point
+#define _LANG_SPEC_lang_arena_del_Point
+static void lang_arena_del_Point(Arena *arena, Point *self){
+    if (!arena_owns(arena, self)) {
+        del_Point(self);
+    }
+}
+#endif
+int release_in_arena(){
+    Buffer *heap_buf = new_Buffer(16);
+    {
+        Arena *__arena_1 __attribute__((cleanup(arena_cleanup))) = arena_new(256);
+        Buffer *b = init_Buffer(((Buffer*)arena_alloc(__arena_1, sizeof(Buffer))), 8);
+        lang_arena_del_Buffer(__arena_1, b);
+        Buffer *bufs = init_Buffer_array(((Buffer*)arena_alloc(__arena_1, (sizeof(Buffer) * 2))), 2, 4);
+        lang_arena_del_Buffer_array(__arena_1, bufs, 2);
+        Point *p = init_Point(((Point*)arena_alloc(__arena_1, sizeof(Point))), 1, 2);
+        lang_arena_del_Point(__arena_1, p);
+        arena_release(__arena_1, p);
+        lang_arena_del_Buffer(__arena_1, heap_buf);
+    }
+}
+int main(){
+    int total = 0;
+    int req = 0;
+    while ((req < 100)) {
+        total = (total + handle_request(req));
+        req++;
+    }
+    printf("%d\n", total);
+    printf("%d\n", first_point_sum(21));
+    release_in_arena();
+    return 0;
+}
\ No newline at end of file
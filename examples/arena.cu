@@ -0,0 +1,74 @@
+# Every request allocates lots of short lived objects. Serving them from an
+# arena turns each malloc/free pair into a pointer bump, and all of the
+# objects are released at once when the with block exits.
+
+class Point:
+    x: int
+    y: int
+
+    def __init__(self: Point*, x: int, y: int):
+        self->x = x
+        self->y = y
+
+
+class Buffer:
+    size: int
+
+    def __init__(self: Buffer*, size: int):
+        self->size = size
+
+    def __del__(self: Buffer*):
+        printf("closed %d\n", self->size)
+
+
+def handle_request(req: int) -> int:
+    total = 0
+    with arena(4096) as a:
+        i = 0
+        while i < 1000:
+            # Allocated from the arena instead of the heap
+            p = new_Point(req, i)
+            total = total + p->x + p->y
+            i++
+
+        buf = <int*>malloc(sizeof(int) * 100)
+        buf[0] = total
+        total = buf[0]
+    return total
+
+
+def first_point_sum(req: int) -> int:
+    with arena(64):
+        p = new_Point(req, req)
+
+        # The arena is still freed when returning from inside the block
+        return p->x + p->y
+
+
+def release_in_arena():
+    heap_buf = new_Buffer(16)
+    with arena(256):
+        # The arena owns the memory allocated in the block, so destructors
+        # only run __del__ and free leaves the memory to the arena
+        b = new_Buffer(8)
+        del_Buffer(b)
+        bufs = new_Buffer_array(2, 4)
+        del_Buffer_array(bufs, 2)
+        p = new_Point(1, 2)
+        del_Point(p)
+        free(p)
+
+        # Memory from the heap is still freed
+        del_Buffer(heap_buf)
+
+
+def main():
+    total = 0
+    req = 0
+    while req < 100:
+        total = total + handle_request(req)
+        req++
+    printf("%d\n", total)
+    printf("%d\n", first_point_sum(21))
+    release_in_arena()
+    return 0
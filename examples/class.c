@@ -0,0 +1,155 @@
+#include <stdio.h>
+#include <string.h>
+#include <stdlib.h>
+int cpystr(char **dest, char **src){
+    size_t len = strlen((*src));
+    (*dest) = ((char*)malloc((len + 1)));
+    strncpy((*dest), (*src), len);
+    (*dest)[len] = '\0';
+}
+typedef struct A A;
+struct A {int x; char *y; int (*print)(A*); int (*__init__)(A*, int, char*); int (*__del__)(A*);};
+int A_print(A *self){
+    printf("A: %d, %s\n", self->x, self->y);
+}
+int A___init__(A *self, int x, char *name){
+    self->x = x;
+    cpystr(&(self->y), &(name));
+}
+int A___del__(A *self){
+    free(self->y);
+}
+A* init_A(A *obj, int x, char *name){
+    obj->x = 0;
+    obj->print = A_print;
+    obj->__init__ = A___init__;
+    obj->__del__ = A___del__;
+    A___init__(obj, x, name);
+    return obj;
+}
+A* new_A(int x, char *name){
+    return init_A(((A*)malloc(sizeof(A))), x, name);
+}
+void del_A(A *self){
+    A___del__(self);
+    free(self);
+}
+A* init_A_array(A *lang_objs, size_t lang_count, int x, char *name){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_A((lang_objs + lang_idx), x, name);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+A* new_A_array(size_t lang_count, int x, char *name){
+    return init_A_array(((A*)malloc((sizeof(A) * lang_count))), lang_count, x, name);
+}
+void fini_A_array(A *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        A___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+void del_A_array(A *lang_objs, size_t lang_count){
+    fini_A_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+typedef struct Object Object;
+struct Object {int (*print)(Object*);};
+int Object_print(Object *self){
+    printf("<Object at %p>\n", self);
+}
+Object* init_Object(Object *obj){
+    obj->print = Object_print;
+    return obj;
+}
+Object* new_Object(){
+    return init_Object(((Object*)malloc(sizeof(Object))));
+}
+void del_Object(Object *self){
+    free(self);
+}
+Object* init_Object_array(Object *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Object((lang_objs + lang_idx));
+        lang_idx++;
+    }
+    return lang_objs;
+}
+Object* new_Object_array(size_t lang_count){
+    return init_Object_array(((Object*)malloc((sizeof(Object) * lang_count))), lang_count);
+}
+void del_Object_array(Object *lang_objs, size_t lang_count){
+    free(lang_objs);
+}
+typedef struct Person Person;
+struct Person {char *name; int (*__init__)(Person*, char*); int (*__del__)(Person*); int (*print)(Person*);};
+int Person___init__(Person *self, char *name){
+    cpystr(&(self->name), &(name));
+}
+int Person___del__(Person *self){
+    free(self->name);
+}
+int Person_print(Person *self){
+    printf("%s is a Person\n", self->name);
+}
+Person* init_Person(Person *obj, char *name){
+    obj->__init__ = Person___init__;
+    obj->__del__ = Person___del__;
+    obj->print = Person_print;
+    Person___init__(obj, name);
+    return obj;
+}
+Person* new_Person(char *name){
+    return init_Person(((Person*)malloc(sizeof(Person))), name);
+}
+void del_Person(Person *self){
+    Person___del__(self);
+    free(self);
+}
+Person* init_Person_array(Person *lang_objs, size_t lang_count, char *name){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Person((lang_objs + lang_idx), name);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+Person* new_Person_array(size_t lang_count, char *name){
+    return init_Person_array(((Person*)malloc((sizeof(Person) * lang_count))), lang_count, name);
+}
+void fini_Person_array(Person *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        Person___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+void del_Person_array(Person *lang_objs, size_t lang_count){
+    fini_Person_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+int main(){
+    A *a = new_A(10, "something");
+    A_print(a);
+    del_A(a);
+    Object *o = new_Object();
+    Object_print(o);
+    del_Object(o);
+    Person *p = new_Person("Jon");
+    Person_print(p);
+    p->print(p);
+    int (*x)(Person*) = p->print;
+    x(p);
+    x = (*p).print;
+    x(&((*p)));
+    int (*y)(Person*) = (*p).print;
+    y(&((*p)));
+    int (*x2)(Person*) = p->print;
+    x2(p);
+    del_Person(p);
+    return 0;
+}
\ No newline at end of file
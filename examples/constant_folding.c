@@ -0,0 +1,38 @@
+#include <stdio.h>
+#include <stdlib.h>
+#define SIZE 16
+#define HALF (SIZE / 2)
+#define VERBOSE 0
+int check(int n){
+    if (VERBOSE) {
+        printf("checking %d\n", n);
+    }
+    if ((n > HALF)) {
+        return 1;
+    }
+    else if ((!VERBOSE && (n < 0))) {
+        return -1;
+    }
+    return 0;
+    printf("unreachable\n");
+}
+int main(){
+    printf("%d %d %d %d\n", (-7 / 2), (-7 % 2), (7 / -2), (7 % -2));
+    printf("%d %d %d\n", ~SIZE, (SIZE << 3), ((SIZE | 3) ^ 5));
+    printf("%d %d %d\n", (SIZE > HALF), (1 && 0), (0 || SIZE));
+    printf("%f %d\n", ((((double)SIZE) / 5) + 0.5), ((int)-2.5));
+    int total = 0;
+    for (int i = 0, lang_i_stop = SIZE; i < lang_i_stop; i++) {
+        total = (total + check((i - 2)));
+    }
+    while (1) {
+        if (VERBOSE) {
+            printf("never\n");
+        }
+        else {
+            printf("total %d\n", total);
+            break;
+        }
+    }
+    return 0;
+}
\ No newline at end of file
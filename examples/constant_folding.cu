@@ -0,0 +1,33 @@
+# Constant expressions are computed by the compiler, with the same results as
+# in C, and the code they make unreachable is removed
+define SIZE 16
+define HALF SIZE / 2
+define VERBOSE 0
+
+def check(n: int) -> int:
+    if VERBOSE:
+        printf("checking %d\n", n)
+
+    if n > HALF:
+        return 1
+    elif not VERBOSE and n < 0:
+        return -1
+    return 0
+    printf("unreachable\n")
+
+def main() -> int:
+    printf("%d %d %d %d\n", -7 / 2, -7 % 2, 7 / -2, 7 % -2)
+    printf("%d %d %d\n", ~SIZE, SIZE << 3, (SIZE | 3) ^ 5)
+    printf("%d %d %d\n", SIZE > HALF, 1 and 0, 0 or SIZE)
+    printf("%f %d\n", <double>SIZE / 5 + 0.5, <int>-2.5)
+
+    total = 0
+    for i in range(SIZE):
+        total = total + check(i - 2)
+
+    while VERBOSE:
+        printf("never\n")
+    else:
+        printf("total %d\n", total)
+
+    return 0
@@ -0,0 +1,650 @@
+#include <lang_hash.h>
+#include <stdio.h>
+#include <assert.h>
+#include <string.h>
+#include <stdlib.h>
+typedef struct Word Word;
+struct Word {char *text; int length; int (*__init__)(Word*, char*); size_t (*__hash__)(Word*); int (*__eq__)(Word*, Word*);};
+int Word___init__(Word *self, char *text){
+    self->text = text;
+    self->length = strlen(text);
+}
+size_t Word___hash__(Word *self){
+    return lang_hash_str(self->text);
+}
+int Word___eq__(Word *self, Word *other){
+    return ((self->length == other->length) && lang_eq_str(self->text, other->text));
+}
+Word* init_Word(Word *obj, char *text){
+    obj->__init__ = Word___init__;
+    obj->__hash__ = Word___hash__;
+    obj->__eq__ = Word___eq__;
+    Word___init__(obj, text);
+    return obj;
+}
+Word* new_Word(char *text){
+    return init_Word(((Word*)malloc(sizeof(Word))), text);
+}
+void del_Word(Word *self){
+    free(self);
+}
+Word* init_Word_array(Word *lang_objs, size_t lang_count, char *text){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Word((lang_objs + lang_idx), text);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+Word* new_Word_array(size_t lang_count, char *text){
+    return init_Word_array(((Word*)malloc((sizeof(Word) * lang_count))), lang_count, text);
+}
+void del_Word_array(Word *lang_objs, size_t lang_count){
+    free(lang_objs);
+}
+#ifndef _LANG_SPEC_Dict_int_int
+#define _LANG_SPEC_Dict_int_int
+typedef struct Dict_int_int Dict_int_int;
+struct Dict_int_int {int *keys; int *values; unsigned int *dists; size_t length; size_t capacity; void (*__init__)(Dict_int_int*); size_t (*index)(Dict_int_int*, int); int* (*find)(Dict_int_int*, int); int (*contains)(Dict_int_int*, int); int (*get)(Dict_int_int*, int, int); void (*insert_new)(Dict_int_int*, int, int); void (*rehash)(Dict_int_int*, size_t); void (*reserve)(Dict_int_int*, size_t); void (*__setitem__)(Dict_int_int*, int, int); int* (*__getitem__)(Dict_int_int*, int); int (*remove)(Dict_int_int*, int); void (*clear)(Dict_int_int*); void (*__del__)(Dict_int_int*);};
+static void Dict_int_int___init__(Dict_int_int *self){
+    self->keys = NULL;
+    self->values = NULL;
+    self->dists = NULL;
+    self->length = 0;
+    self->capacity = 0;
+}
+static size_t Dict_int_int_index(Dict_int_int *self, int key){
+    if ((self->length == 0)) {
+        return self->capacity;
+    }
+    size_t mask = (self->capacity - 1);
+    size_t i = (lang_hash_int(key) & mask);
+    unsigned int dist = 1;
+    while ((self->dists[i] >= dist)) {
+        if (((self->dists[i] == dist) && (self->keys[i] == key))) {
+            return i;
+        }
+        i = ((size_t)((i + 1) & mask));
+        dist++;
+    }
+    return self->capacity;
+}
+static int* Dict_int_int_find(Dict_int_int *self, int key){
+    size_t i = Dict_int_int_index(self, key);
+    if ((i == self->capacity)) {
+        return NULL;
+    }
+    return &(self->values[i]);
+}
+static int Dict_int_int_contains(Dict_int_int *self, int key){
+    return (Dict_int_int_index(self, key) != self->capacity);
+}
+static int Dict_int_int_get(Dict_int_int *self, int key, int fallback){
+    size_t i = Dict_int_int_index(self, key);
+    if ((i == self->capacity)) {
+        return fallback;
+    }
+    return self->values[i];
+}
+static void Dict_int_int_insert_new(Dict_int_int *self, int key, int value){
+    size_t mask = (self->capacity - 1);
+    size_t i = (lang_hash_int(key) & mask);
+    unsigned int dist = 1;
+    while (self->dists[i]) {
+        if ((self->dists[i] < dist)) {
+            int tmp_key = self->keys[i];
+            int tmp_value = self->values[i];
+            unsigned int tmp_dist = self->dists[i];
+            self->keys[i] = key;
+            self->values[i] = value;
+            self->dists[i] = dist;
+            key = tmp_key;
+            value = tmp_value;
+            dist = tmp_dist;
+        }
+        i = ((size_t)((i + 1) & mask));
+        dist++;
+    }
+    self->keys[i] = key;
+    self->values[i] = value;
+    self->dists[i] = dist;
+}
+static void Dict_int_int_rehash(Dict_int_int *self, size_t capacity){
+    int *old_keys = self->keys;
+    int *old_values = self->values;
+    unsigned int *old_dists = self->dists;
+    size_t old_capacity = self->capacity;
+    self->keys = ((int*)malloc((sizeof(int) * capacity)));
+    self->values = ((int*)malloc((sizeof(int) * capacity)));
+    self->dists = ((unsigned int*)calloc(capacity, sizeof(self->dists[0])));
+    self->capacity = capacity;
+    size_t i = 0;
+    while ((i < old_capacity)) {
+        if (old_dists[i]) {
+            Dict_int_int_insert_new(self, old_keys[i], old_values[i]);
+        }
+        i++;
+    }
+    free(old_keys);
+    free(old_values);
+    free(old_dists);
+}
+static void Dict_int_int_reserve(Dict_int_int *self, size_t length){
+    size_t capacity = 8;
+    if (self->capacity) {
+        capacity = self->capacity;
+    }
+    while (((length * 8) > (capacity * 7))) {
+        capacity = (capacity * 2);
+    }
+    if ((capacity != self->capacity)) {
+        Dict_int_int_rehash(self, capacity);
+    }
+}
+static void Dict_int_int___setitem__(Dict_int_int *self, int key, int value){
+    size_t i = Dict_int_int_index(self, key);
+    if ((i != self->capacity)) {
+        self->values[i] = value;
+    }
+    else {
+        Dict_int_int_reserve(self, (self->length + 1));
+        Dict_int_int_insert_new(self, key, value);
+        self->length++;
+    }
+}
+static int* Dict_int_int___getitem__(Dict_int_int *self, int key){
+    size_t i = Dict_int_int_index(self, key);
+    assert((i != self->capacity));
+    return &(self->values[i]);
+}
+static int Dict_int_int_remove(Dict_int_int *self, int key){
+    size_t i = Dict_int_int_index(self, key);
+    if ((i == self->capacity)) {
+        return 0;
+    }
+    size_t mask = (self->capacity - 1);
+    size_t j = ((i + 1) & mask);
+    while ((self->dists[j] > 1)) {
+        self->keys[i] = self->keys[j];
+        self->values[i] = self->values[j];
+        self->dists[i] = (self->dists[j] - 1);
+        i = j;
+        j = ((size_t)((j + 1) & mask));
+    }
+    self->dists[i] = 0;
+    self->length--;
+    return 1;
+}
+static void Dict_int_int_clear(Dict_int_int *self){
+    if (self->capacity) {
+        memset(self->dists, 0, (sizeof(self->dists[0]) * self->capacity));
+    }
+    self->length = 0;
+}
+static void Dict_int_int___del__(Dict_int_int *self){
+    free(self->keys);
+    free(self->values);
+    free(self->dists);
+}
+static Dict_int_int* init_Dict_int_int(Dict_int_int *obj){
+    obj->__init__ = Dict_int_int___init__;
+    obj->index = Dict_int_int_index;
+    obj->find = Dict_int_int_find;
+    obj->contains = Dict_int_int_contains;
+    obj->get = Dict_int_int_get;
+    obj->insert_new = Dict_int_int_insert_new;
+    obj->rehash = Dict_int_int_rehash;
+    obj->reserve = Dict_int_int_reserve;
+    obj->__setitem__ = Dict_int_int___setitem__;
+    obj->__getitem__ = Dict_int_int___getitem__;
+    obj->remove = Dict_int_int_remove;
+    obj->clear = Dict_int_int_clear;
+    obj->__del__ = Dict_int_int___del__;
+    Dict_int_int___init__(obj);
+    return obj;
+}
+static Dict_int_int* new_Dict_int_int(){
+    return init_Dict_int_int(((Dict_int_int*)malloc(sizeof(Dict_int_int))));
+}
+static void del_Dict_int_int(Dict_int_int *self){
+    Dict_int_int___del__(self);
+    free(self);
+}
+static Dict_int_int* init_Dict_int_int_array(Dict_int_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Dict_int_int((lang_objs + lang_idx));
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static Dict_int_int* new_Dict_int_int_array(size_t lang_count){
+    return init_Dict_int_int_array(((Dict_int_int*)malloc((sizeof(Dict_int_int) * lang_count))), lang_count);
+}
+static void fini_Dict_int_int_array(Dict_int_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        Dict_int_int___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_Dict_int_int_array(Dict_int_int *lang_objs, size_t lang_count){
+    fini_Dict_int_int_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+#ifndef _LANG_SPEC_Dict_char_ptr_int
+#define _LANG_SPEC_Dict_char_ptr_int
+typedef struct Dict_char_ptr_int Dict_char_ptr_int;
+struct Dict_char_ptr_int {char **keys; int *values; unsigned int *dists; size_t length; size_t capacity; void (*__init__)(Dict_char_ptr_int*); size_t (*index)(Dict_char_ptr_int*, char*); int* (*find)(Dict_char_ptr_int*, char*); int (*contains)(Dict_char_ptr_int*, char*); int (*get)(Dict_char_ptr_int*, char*, int); void (*insert_new)(Dict_char_ptr_int*, char*, int); void (*rehash)(Dict_char_ptr_int*, size_t); void (*reserve)(Dict_char_ptr_int*, size_t); void (*__setitem__)(Dict_char_ptr_int*, char*, int); int* (*__getitem__)(Dict_char_ptr_int*, char*); int (*remove)(Dict_char_ptr_int*, char*); void (*clear)(Dict_char_ptr_int*); void (*__del__)(Dict_char_ptr_int*);};
+static void Dict_char_ptr_int___init__(Dict_char_ptr_int *self){
+    self->keys = NULL;
+    self->values = NULL;
+    self->dists = NULL;
+    self->length = 0;
+    self->capacity = 0;
+}
+static size_t Dict_char_ptr_int_index(Dict_char_ptr_int *self, char *key){
+    if ((self->length == 0)) {
+        return self->capacity;
+    }
+    size_t mask = (self->capacity - 1);
+    size_t i = (lang_hash_str(key) & mask);
+    unsigned int dist = 1;
+    while ((self->dists[i] >= dist)) {
+        if (((self->dists[i] == dist) && lang_eq_str(self->keys[i], key))) {
+            return i;
+        }
+        i = ((size_t)((i + 1) & mask));
+        dist++;
+    }
+    return self->capacity;
+}
+static int* Dict_char_ptr_int_find(Dict_char_ptr_int *self, char *key){
+    size_t i = Dict_char_ptr_int_index(self, key);
+    if ((i == self->capacity)) {
+        return NULL;
+    }
+    return &(self->values[i]);
+}
+static int Dict_char_ptr_int_contains(Dict_char_ptr_int *self, char *key){
+    return (Dict_char_ptr_int_index(self, key) != self->capacity);
+}
+static int Dict_char_ptr_int_get(Dict_char_ptr_int *self, char *key, int fallback){
+    size_t i = Dict_char_ptr_int_index(self, key);
+    if ((i == self->capacity)) {
+        return fallback;
+    }
+    return self->values[i];
+}
+static void Dict_char_ptr_int_insert_new(Dict_char_ptr_int *self, char *key, int value){
+    size_t mask = (self->capacity - 1);
+    size_t i = (lang_hash_str(key) & mask);
+    unsigned int dist = 1;
+    while (self->dists[i]) {
+        if ((self->dists[i] < dist)) {
+            char *tmp_key = self->keys[i];
+            int tmp_value = self->values[i];
+            unsigned int tmp_dist = self->dists[i];
+            self->keys[i] = key;
+            self->values[i] = value;
+            self->dists[i] = dist;
+            key = tmp_key;
+            value = tmp_value;
+            dist = tmp_dist;
+        }
+        i = ((size_t)((i + 1) & mask));
+        dist++;
+    }
+    self->keys[i] = key;
+    self->values[i] = value;
+    self->dists[i] = dist;
+}
+static void Dict_char_ptr_int_rehash(Dict_char_ptr_int *self, size_t capacity){
+    char **old_keys = self->keys;
+    int *old_values = self->values;
+    unsigned int *old_dists = self->dists;
+    size_t old_capacity = self->capacity;
+    self->keys = ((char**)malloc((sizeof(char*) * capacity)));
+    self->values = ((int*)malloc((sizeof(int) * capacity)));
+    self->dists = ((unsigned int*)calloc(capacity, sizeof(self->dists[0])));
+    self->capacity = capacity;
+    size_t i = 0;
+    while ((i < old_capacity)) {
+        if (old_dists[i]) {
+            Dict_char_ptr_int_insert_new(self, old_keys[i], old_values[i]);
+        }
+        i++;
+    }
+    free(old_keys);
+    free(old_values);
+    free(old_dists);
+}
+static void Dict_char_ptr_int_reserve(Dict_char_ptr_int *self, size_t length){
+    size_t capacity = 8;
+    if (self->capacity) {
+        capacity = self->capacity;
+    }
+    while (((length * 8) > (capacity * 7))) {
+        capacity = (capacity * 2);
+    }
+    if ((capacity != self->capacity)) {
+        Dict_char_ptr_int_rehash(self, capacity);
+    }
+}
+static void Dict_char_ptr_int___setitem__(Dict_char_ptr_int *self, char *key, int value){
+    size_t i = Dict_char_ptr_int_index(self, key);
+    if ((i != self->capacity)) {
+        self->values[i] = value;
+    }
+    else {
+        Dict_char_ptr_int_reserve(self, (self->length + 1));
+        Dict_char_ptr_int_insert_new(self, key, value);
+        self->length++;
+    }
+}
+static int* Dict_char_ptr_int___getitem__(Dict_char_ptr_int *self, char *key){
+    size_t i = Dict_char_ptr_int_index(self, key);
+    assert((i != self->capacity));
+    return &(self->values[i]);
+}
+static int Dict_char_ptr_int_remove(Dict_char_ptr_int *self, char *key){
+    size_t i = Dict_char_ptr_int_index(self, key);
+    if ((i == self->capacity)) {
+        return 0;
+    }
+    size_t mask = (self->capacity - 1);
+    size_t j = ((i + 1) & mask);
+    while ((self->dists[j] > 1)) {
+        self->keys[i] = self->keys[j];
+        self->values[i] = self->values[j];
+        self->dists[i] = (self->dists[j] - 1);
+        i = j;
+        j = ((size_t)((j + 1) & mask));
+    }
+    self->dists[i] = 0;
+    self->length--;
+    return 1;
+}
+static void Dict_char_ptr_int_clear(Dict_char_ptr_int *self){
+    if (self->capacity) {
+        memset(self->dists, 0, (sizeof(self->dists[0]) * self->capacity));
+    }
+    self->length = 0;
+}
+static void Dict_char_ptr_int___del__(Dict_char_ptr_int *self){
+    free(self->keys);
+    free(self->values);
+    free(self->dists);
+}
+static Dict_char_ptr_int* init_Dict_char_ptr_int(Dict_char_ptr_int *obj){
+    obj->__init__ = Dict_char_ptr_int___init__;
+    obj->index = Dict_char_ptr_int_index;
+    obj->find = Dict_char_ptr_int_find;
+    obj->contains = Dict_char_ptr_int_contains;
+    obj->get = Dict_char_ptr_int_get;
+    obj->insert_new = Dict_char_ptr_int_insert_new;
+    obj->rehash = Dict_char_ptr_int_rehash;
+    obj->reserve = Dict_char_ptr_int_reserve;
+    obj->__setitem__ = Dict_char_ptr_int___setitem__;
+    obj->__getitem__ = Dict_char_ptr_int___getitem__;
+    obj->remove = Dict_char_ptr_int_remove;
+    obj->clear = Dict_char_ptr_int_clear;
+    obj->__del__ = Dict_char_ptr_int___del__;
+    Dict_char_ptr_int___init__(obj);
+    return obj;
+}
+static Dict_char_ptr_int* new_Dict_char_ptr_int(){
+    return init_Dict_char_ptr_int(((Dict_char_ptr_int*)malloc(sizeof(Dict_char_ptr_int))));
+}
+static void del_Dict_char_ptr_int(Dict_char_ptr_int *self){
+    Dict_char_ptr_int___del__(self);
+    free(self);
+}
+static Dict_char_ptr_int* init_Dict_char_ptr_int_array(Dict_char_ptr_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Dict_char_ptr_int((lang_objs + lang_idx));
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static Dict_char_ptr_int* new_Dict_char_ptr_int_array(size_t lang_count){
+    return init_Dict_char_ptr_int_array(((Dict_char_ptr_int*)malloc((sizeof(Dict_char_ptr_int) * lang_count))), lang_count);
+}
+static void fini_Dict_char_ptr_int_array(Dict_char_ptr_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        Dict_char_ptr_int___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_Dict_char_ptr_int_array(Dict_char_ptr_int *lang_objs, size_t lang_count){
+    fini_Dict_char_ptr_int_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+#ifndef _LANG_SPEC_Dict_Word_ptr_int
+#define _LANG_SPEC_Dict_Word_ptr_int
+typedef struct Dict_Word_ptr_int Dict_Word_ptr_int;
+struct Dict_Word_ptr_int {Word **keys; int *values; unsigned int *dists; size_t length; size_t capacity; void (*__init__)(Dict_Word_ptr_int*); size_t (*index)(Dict_Word_ptr_int*, Word*); int* (*find)(Dict_Word_ptr_int*, Word*); int (*contains)(Dict_Word_ptr_int*, Word*); int (*get)(Dict_Word_ptr_int*, Word*, int); void (*insert_new)(Dict_Word_ptr_int*, Word*, int); void (*rehash)(Dict_Word_ptr_int*, size_t); void (*reserve)(Dict_Word_ptr_int*, size_t); void (*__setitem__)(Dict_Word_ptr_int*, Word*, int); int* (*__getitem__)(Dict_Word_ptr_int*, Word*); int (*remove)(Dict_Word_ptr_int*, Word*); void (*clear)(Dict_Word_ptr_int*); void (*__del__)(Dict_Word_ptr_int*);};
+static void Dict_Word_ptr_int___init__(Dict_Word_ptr_int *self){
+    self->keys = NULL;
+    self->values = NULL;
+    self->dists = NULL;
+    self->length = 0;
+    self->capacity = 0;
+}
+static size_t Dict_Word_ptr_int_index(Dict_Word_ptr_int *self, Word *key){
+    if ((self->length == 0)) {
+        return self->capacity;
+    }
+    size_t mask = (self->capacity - 1);
+    size_t i = (Word___hash__(key) & mask);
+    unsigned int dist = 1;
+    while ((self->dists[i] >= dist)) {
+        if (((self->dists[i] == dist) && Word___eq__(self->keys[i], key))) {
+            return i;
+        }
+        i = ((size_t)((i + 1) & mask));
+        dist++;
+    }
+    return self->capacity;
+}
+static int* Dict_Word_ptr_int_find(Dict_Word_ptr_int *self, Word *key){
+    size_t i = Dict_Word_ptr_int_index(self, key);
+    if ((i == self->capacity)) {
+        return NULL;
+    }
+    return &(self->values[i]);
+}
+static int Dict_Word_ptr_int_contains(Dict_Word_ptr_int *self, Word *key){
+    return (Dict_Word_ptr_int_index(self, key) != self->capacity);
+}
+static int Dict_Word_ptr_int_get(Dict_Word_ptr_int *self, Word *key, int fallback){
+    size_t i = Dict_Word_ptr_int_index(self, key);
+    if ((i == self->capacity)) {
+        return fallback;
+    }
+    return self->values[i];
+}
+static void Dict_Word_ptr_int_insert_new(Dict_Word_ptr_int *self, Word *key, int value){
+    size_t mask = (self->capacity - 1);
+    size_t i = (Word___hash__(key) & mask);
+    unsigned int dist = 1;
+    while (self->dists[i]) {
+        if ((self->dists[i] < dist)) {
+            Word *tmp_key = self->keys[i];
+            int tmp_value = self->values[i];
+            unsigned int tmp_dist = self->dists[i];
+            self->keys[i] = key;
+            self->values[i] = value;
+            self->dists[i] = dist;
+            key = tmp_key;
+            value = tmp_value;
+            dist = tmp_dist;
+        }
+        i = ((size_t)((i + 1) & mask));
+        dist++;
+    }
+    self->keys[i] = key;
+    self->values[i] = value;
+    self->dists[i] = dist;
+}
+static void Dict_Word_ptr_int_rehash(Dict_Word_ptr_int *self, size_t capacity){
+    Word **old_keys = self->keys;
+    int *old_values = self->values;
+    unsigned int *old_dists = self->dists;
+    size_t old_capacity = self->capacity;
+    self->keys = ((Word**)malloc((sizeof(Word*) * capacity)));
+    self->values = ((int*)malloc((sizeof(int) * capacity)));
+    self->dists = ((unsigned int*)calloc(capacity, sizeof(self->dists[0])));
+    self->capacity = capacity;
+    size_t i = 0;
+    while ((i < old_capacity)) {
+        if (old_dists[i]) {
+            Dict_Word_ptr_int_insert_new(self, old_keys[i], old_values[i]);
+        }
+        i++;
+    }
+    free(old_keys);
+    free(old_values);
+    free(old_dists);
+}
+static void Dict_Word_ptr_int_reserve(Dict_Word_ptr_int *self, size_t length){
+    size_t capacity = 8;
+    if (self->capacity) {
+        capacity = self->capacity;
+    }
+    while (((length * 8) > (capacity * 7))) {
+        capacity = (capacity * 2);
+    }
+    if ((capacity != self->capacity)) {
+        Dict_Word_ptr_int_rehash(self, capacity);
+    }
+}
+static void Dict_Word_ptr_int___setitem__(Dict_Word_ptr_int *self, Word *key, int value){
+    size_t i = Dict_Word_ptr_int_index(self, key);
+    if ((i != self->capacity)) {
+        self->values[i] = value;
+    }
+    else {
+        Dict_Word_ptr_int_reserve(self, (self->length + 1));
+        Dict_Word_ptr_int_insert_new(self, key, value);
+        self->length++;
+    }
+}
+static int* Dict_Word_ptr_int___getitem__(Dict_Word_ptr_int *self, Word *key){
+    size_t i = Dict_Word_ptr_int_index(self, key);
+    assert((i != self->capacity));
+    return &(self->values[i]);
+}
+static int Dict_Word_ptr_int_remove(Dict_Word_ptr_int *self, Word *key){
+    size_t i = Dict_Word_ptr_int_index(self, key);
+    if ((i == self->capacity)) {
+        return 0;
+    }
+    size_t mask = (self->capacity - 1);
+    size_t j = ((i + 1) & mask);
+    while ((self->dists[j] > 1)) {
+        self->keys[i] = self->keys[j];
+        self->values[i] = self->values[j];
+        self->dists[i] = (self->dists[j] - 1);
+        i = j;
+        j = ((size_t)((j + 1) & mask));
+    }
+    self->dists[i] = 0;
+    self->length--;
+    return 1;
+}
+static void Dict_Word_ptr_int_clear(Dict_Word_ptr_int *self){
+    if (self->capacity) {
+        memset(self->dists, 0, (sizeof(self->dists[0]) * self->capacity));
+    }
+    self->length = 0;
+}
+static void Dict_Word_ptr_int___del__(Dict_Word_ptr_int *self){
+    free(self->keys);
+    free(self->values);
+    free(self->dists);
+}
+static Dict_Word_ptr_int* init_Dict_Word_ptr_int(Dict_Word_ptr_int *obj){
+    obj->__init__ = Dict_Word_ptr_int___init__;
+    obj->index = Dict_Word_ptr_int_index;
+    obj->find = Dict_Word_ptr_int_find;
+    obj->contains = Dict_Word_ptr_int_contains;
+    obj->get = Dict_Word_ptr_int_get;
+    obj->insert_new = Dict_Word_ptr_int_insert_new;
+    obj->rehash = Dict_Word_ptr_int_rehash;
+    obj->reserve = Dict_Word_ptr_int_reserve;
+    obj->__setitem__ = Dict_Word_ptr_int___setitem__;
+    obj->__getitem__ = Dict_Word_ptr_int___getitem__;
+    obj->remove = Dict_Word_ptr_int_remove;
+    obj->clear = Dict_Word_ptr_int_clear;
+    obj->__del__ = Dict_Word_ptr_int___del__;
+    Dict_Word_ptr_int___init__(obj);
+    return obj;
+}
+static Dict_Word_ptr_int* new_Dict_Word_ptr_int(){
+    return init_Dict_Word_ptr_int(((Dict_Word_ptr_int*)malloc(sizeof(Dict_Word_ptr_int))));
+}
+static void del_Dict_Word_ptr_int(Dict_Word_ptr_int *self){
+    Dict_Word_ptr_int___del__(self);
+    free(self);
+}
+static Dict_Word_ptr_int* init_Dict_Word_ptr_int_array(Dict_Word_ptr_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Dict_Word_ptr_int((lang_objs + lang_idx));
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static Dict_Word_ptr_int* new_Dict_Word_ptr_int_array(size_t lang_count){
+    return init_Dict_Word_ptr_int_array(((Dict_Word_ptr_int*)malloc((sizeof(Dict_Word_ptr_int) * lang_count))), lang_count);
+}
+static void fini_Dict_Word_ptr_int_array(Dict_Word_ptr_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        Dict_Word_ptr_int___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_Dict_Word_ptr_int_array(Dict_Word_ptr_int *lang_objs, size_t lang_count){
+    fini_Dict_Word_ptr_int_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+int main(){
+    Dict_int_int *squares = new_Dict_int_int();
+    int i = 0;
+    while ((i < 10000)) {
+        Dict_int_int___setitem__(squares, i, (i * i));
+        i++;
+    }
+    i = 0;
+    while ((i < 10000)) {
+        squares->remove(squares, i);
+        i = (i + 2);
+    }
+    printf("%d %d %d %d\n", ((int)squares->length), (*Dict_int_int___getitem__(squares, 99)), squares->contains(squares, 98), squares->get(squares, 98, -1));
+    Dict_char_ptr_int *counts = new_Dict_char_ptr_int();
+    char *words[6] = {"the", "cat", "and", "the", "hat", "the"};
+    i = 0;
+    while ((i < 6)) {
+        Dict_char_ptr_int___setitem__(counts, words[i], (counts->get(counts, words[i], 0) + 1));
+        i++;
+    }
+    printf("%d %d %d\n", ((int)counts->length), (*Dict_char_ptr_int___getitem__(counts, "the")), (*Dict_char_ptr_int___getitem__(counts, "cat")));
+    Dict_Word_ptr_int *lengths = new_Dict_Word_ptr_int();
+    Word *word = new_Word("mat");
+    Word *other = new_Word("mat");
+    Dict_Word_ptr_int___setitem__(lengths, word, word->length);
+    printf("%d\n", (*Dict_Word_ptr_int___getitem__(lengths, other)));
+    del_Word(word);
+    del_Word(other);
+    del_Dict_Word_ptr_int(lengths);
+    del_Dict_char_ptr_int(counts);
+    del_Dict_int_int(squares);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,55 @@
+# Dicts are specialized for their key and value types, so looking up a key
+# hashes and compares it inline instead of through void pointers.
+
+class Word:
+    text: char*
+    length: int
+
+    def __init__(self: Word*, text: char*):
+        self->text = text
+        self->length = strlen(text)
+
+    def __hash__(self: Word*) -> size_t:
+        return lang_hash_str(self->text)
+
+    def __eq__(self: Word*, other: Word*) -> int:
+        return self->length == other->length and lang_eq_str(self->text, other->text)
+
+
+def main():
+    squares: Dict<int, int>* = new_Dict_int_int()
+    i = 0
+    while i < 10000:
+        (*squares)[i] = i * i
+        i++
+
+    # Removing every other key shifts the entries after each one back
+    i = 0
+    while i < 10000:
+        squares->remove(i)
+        i = i + 2
+    printf("%d %d %d %d\n", <int>squares->length, (*squares)[99], squares->contains(98),
+           squares->get(98, -1))
+
+    # Strings are compared by their contents
+    counts: Dict<char*, int>* = new_Dict_char_ptr_int()
+    words: char*[6] = ["the", "cat", "and", "the", "hat", "the"]
+    i = 0
+    while i < 6:
+        (*counts)[words[i]] = counts->get(words[i], 0) + 1
+        i++
+    printf("%d %d %d\n", <int>counts->length, (*counts)["the"], (*counts)["cat"])
+
+    # Classes can be keys by defining __hash__ and __eq__
+    lengths: Dict<Word*, int>* = new_Dict_Word_ptr_int()
+    word = new_Word("mat")
+    other = new_Word("mat")
+    (*lengths)[word] = word->length
+    printf("%d\n", (*lengths)[other])
+
+    del_Word(word)
+    del_Word(other)
+    del_Dict_Word_ptr_int(lengths)
+    del_Dict_char_ptr_int(counts)
+    del_Dict_int_int(squares)
+    return 0
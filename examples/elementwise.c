@@ -0,0 +1,188 @@
+#include <stdio.h>
+#include <assert.h>
+#include <stdlib.h>
+#ifndef _LANG_SPEC_Span_float
+#define _LANG_SPEC_Span_float
+typedef struct Span_float Span_float;
+struct Span_float {float *data; size_t length;};
+static Span_float Span_float_slice(float *data, size_t length, size_t start, size_t end){
+    assert(((start <= end) && (end <= length)));
+    Span_float s;
+    s.data = (data + start);
+    s.length = (end - start);
+    return s;
+}
+static float* Span_float_at(Span_float s, size_t i){
+    assert((i < s.length));
+    return (s.data + i);
+}
+static Span_float Span_float_subspan(Span_float s, size_t start, size_t end){
+    return Span_float_slice(s.data, s.length, start, end);
+}
+static Span_float Span_float_suffix(Span_float s, size_t start){
+    return Span_float_slice(s.data, s.length, start, s.length);
+}
+#endif
+int smooth(Span_float out, Span_float signal, float weight){
+    {
+        Span_float lang_ew0 = out;
+        Span_float lang_ew1 = Span_float_subspan(signal, 0, (signal.length - 1));
+        Span_float lang_ew2 = Span_float_suffix(signal, 1);
+        assert((lang_ew1.length == lang_ew0.length));
+        assert((lang_ew2.length == lang_ew0.length));
+        #pragma omp simd
+        for (size_t lang_i = 0; lang_i < lang_ew0.length; lang_i++) {
+            lang_ew0.data[lang_i] = ((lang_ew1.data[lang_i] * weight) + (lang_ew2.data[lang_i] * (1.0 - weight)));
+        }
+    }
+}
+#ifndef _LANG_SPEC_List_float
+#define _LANG_SPEC_List_float
+typedef struct List_float List_float;
+struct List_float {float *data; size_t length; size_t capacity; void (*__init__)(List_float*); void (*reserve)(List_float*, size_t); void (*shrink)(List_float*); void (*append)(List_float*, float); float (*pop)(List_float*); void (*clear)(List_float*); float* (*__getitem__)(List_float*, size_t); void (*__del__)(List_float*);};
+static void List_float___init__(List_float *self){
+    self->data = NULL;
+    self->length = 0;
+    self->capacity = 0;
+}
+static void List_float_reserve(List_float *self, size_t capacity){
+    if ((capacity > self->capacity)) {
+        self->data = ((float*)realloc(self->data, (sizeof(float) * capacity)));
+        self->capacity = capacity;
+    }
+}
+static void List_float_shrink(List_float *self){
+    if ((self->length == 0)) {
+        free(self->data);
+        self->data = NULL;
+    }
+    else if ((self->length < self->capacity)) {
+        self->data = ((float*)realloc(self->data, (sizeof(float) * self->length)));
+    }
+    self->capacity = self->length;
+}
+static void List_float_append(List_float *self, float x){
+    if ((self->length == self->capacity)) {
+        if (self->capacity) {
+            List_float_reserve(self, (self->capacity * 2));
+        }
+        else {
+            List_float_reserve(self, 8);
+        }
+    }
+    self->data[self->length] = x;
+    self->length++;
+}
+static float List_float_pop(List_float *self){
+    assert((self->length > 0));
+    self->length--;
+    return self->data[self->length];
+}
+static void List_float_clear(List_float *self){
+    self->length = 0;
+}
+static float* List_float___getitem__(List_float *self, size_t i){
+    assert((i < self->length));
+    return &(self->data[i]);
+}
+static void List_float___del__(List_float *self){
+    free(self->data);
+}
+static List_float* init_List_float(List_float *obj){
+    obj->__init__ = List_float___init__;
+    obj->reserve = List_float_reserve;
+    obj->shrink = List_float_shrink;
+    obj->append = List_float_append;
+    obj->pop = List_float_pop;
+    obj->clear = List_float_clear;
+    obj->__getitem__ = List_float___getitem__;
+    obj->__del__ = List_float___del__;
+    List_float___init__(obj);
+    return obj;
+}
+static List_float* new_List_float(){
+    return init_List_float(((List_float*)malloc(sizeof(List_float))));
+}
+static void del_List_float(List_float *self){
+    List_float___del__(self);
+    free(self);
+}
+static List_float* init_List_float_array(List_float *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_List_float((lang_objs + lang_idx));
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static List_float* new_List_float_array(size_t lang_count){
+    return init_List_float_array(((List_float*)malloc((sizeof(List_float) * lang_count))), lang_count);
+}
+static void fini_List_float_array(List_float *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        List_float___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_List_float_array(List_float *lang_objs, size_t lang_count){
+    fini_List_float_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+int main(){
+    float a[8] = {1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0};
+    float b[8] = {8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0};
+    float c[8];
+    {
+        Span_float lang_ew0 = Span_float_slice(c, 8, 0, 8);
+        Span_float lang_ew1 = Span_float_slice(a, 8, 0, 8);
+        Span_float lang_ew2 = Span_float_slice(b, 8, 0, 8);
+        Span_float lang_ew3 = Span_float_slice(a, 8, 0, 8);
+        assert((lang_ew1.length == lang_ew0.length));
+        assert((lang_ew2.length == lang_ew0.length));
+        assert((lang_ew3.length == lang_ew0.length));
+        #pragma omp simd
+        for (size_t lang_i = 0; lang_i < lang_ew0.length; lang_i++) {
+            lang_ew0.data[lang_i] = ((lang_ew1.data[lang_i] * lang_ew2.data[lang_i]) + lang_ew3.data[lang_i]);
+        }
+    }
+    printf("%g %g %g\n", c[0], c[3], c[7]);
+    float d[7];
+    smooth(Span_float_slice(d, 7, 0, 7), Span_float_slice(c, 8, 0, 8), 0.5);
+    printf("%g %g\n", d[0], d[6]);
+    {
+        Span_float lang_ew0 = Span_float_slice(c, 8, 4, 8);
+        Span_float lang_ew1 = Span_float_slice(a, 8, 0, 4);
+        assert((lang_ew1.length == lang_ew0.length));
+        #pragma omp simd
+        for (size_t lang_i = 0; lang_i < lang_ew0.length; lang_i++) {
+            lang_ew0.data[lang_i] = -lang_ew1.data[lang_i];
+        }
+    }
+    printf("%g %g %g\n", c[3], c[4], c[7]);
+    List_float *samples = new_List_float();
+    int i = 0;
+    while ((i < 1000)) {
+        samples->append(samples, ((float)i));
+        i++;
+    }
+    float total = 0.0;
+    {
+        Span_float lang_ew0 = Span_float_slice(samples->data, samples->length, 0, samples->length);
+        Span_float lang_ew1 = Span_float_slice(samples->data, samples->length, 0, samples->length);
+        assert((lang_ew1.length == lang_ew0.length));
+        #pragma omp simd
+        for (size_t lang_i = 0; lang_i < lang_ew0.length; lang_i++) {
+            lang_ew0.data[lang_i] = (lang_ew1.data[lang_i] * 2.0);
+        }
+    }
+    i = 0;
+    while ((i < 1000)) {
+        total = (total + (*List_float___getitem__(samples, i)));
+        i++;
+    }
+    printf("%g\n", total);
+    del_List_float(samples);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,40 @@
+# Arithmetic on whole arrays, Spans and Lists is computed one element at a
+# time in a single loop that gcc vectorizes, without temporary arrays for the
+# intermediate results.
+
+def smooth(out: Span<float>, signal: Span<float>, weight: float):
+    # Blend each sample with the one after it
+    out = signal[:signal.length - 1] * weight + signal[1:] * (1.0 - weight)
+
+
+def main():
+    a: float[8] = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+    b: float[8] = [8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0]
+
+    # New variables are declared as arrays of the same size
+    c = a * b + a
+    printf("%g %g %g\n", c[0], c[3], c[7])
+
+    d: float[7]
+    smooth(d, c, 0.5)
+    printf("%g %g\n", d[0], d[6])
+
+    # Assigning to a slice only writes those elements
+    c[4:] = -a[:4]
+    printf("%g %g %g\n", c[3], c[4], c[7])
+
+    samples: List<float>* = new_List_float()
+    i = 0
+    while i < 1000:
+        samples->append(<float>i)
+        i++
+    total = 0.0
+    samples[:] = samples[:] * 2.0
+    i = 0
+    while i < 1000:
+        total = total + (*samples)[i]
+        i++
+    printf("%g\n", total)
+
+    del_List_float(samples)
+    return 0
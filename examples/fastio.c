@@ -0,0 +1,24 @@
+#include <lang_fastio.h>
+#include <stdlib.h>
+int main(){
+    int count = 0;
+    long long total = 0;
+    while (!read_eof()) {
+        long long x = read_long();
+        total = (total + x);
+        count++;
+        write_int((x * 2));
+        write_char(' ');
+    }
+    write_char('\n');
+    write_str("count ");
+    write_int(count);
+    write_str(", sum ");
+    write_int(total);
+    if (count) {
+        write_str(", mean ");
+        write_float((((double)total) / count), 2);
+    }
+    write_char('\n');
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,24 @@
+# Sum the numbers on stdin and echo them back doubled with the buffered
+# readers and writers, which skip the format strings of scanf and printf.
+#
+#   python language.py examples/fastio.cu && seq 10 | ./a.out
+
+def main() -> int:
+    count = 0
+    total: long = 0
+    while not read_eof():
+        x = read_long()
+        total = total + x
+        count++
+        write_int(x * 2)
+        write_char(' ')
+    write_char('\n')
+    write_str("count ")
+    write_int(count)
+    write_str(", sum ")
+    write_int(total)
+    if count:
+        write_str(", mean ")
+        write_float(<double>total / count, 2)
+    write_char('\n')
+    return 0
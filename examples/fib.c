@@ -0,0 +1,13 @@
+#include <stdio.h>
+#include <stdlib.h>
+int fib(int n){
+    if ((n < 2)) {
+        return n;
+    }
+    return (fib((n - 1)) + fib((n - 2)));
+}
+int main(){
+    int x = 30;
+    printf("fib #%d: %d\n", x, fib(x));
+    return 0;
+}
\ No newline at end of file
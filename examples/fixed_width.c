@@ -0,0 +1,33 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+typedef struct Pixel Pixel;
+struct Pixel {uint8_t r; uint8_t g; uint8_t b; uint8_t a;};
+int saxpy(size_t n, float k, float const *restrict x, float *restrict y){
+    size_t i = 0;
+    while ((i < n)) {
+        y[i] = (y[i] + (k * x[i]));
+        i++;
+    }
+}
+uint32_t brightness(Pixel const *p){
+    return ((uint32_t)((p->r + p->g) + p->b));
+}
+int main(){
+    float x[8] = {1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0};
+    float y[8] = {0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5};
+    saxpy(8, 2.0, x, y);
+    printf("%g %g\n", y[0], y[7]);
+    Pixel p;
+    p.r = 200;
+    p.g = 100;
+    p.b = 50;
+    p.a = 255;
+    printf("%d %d\n", ((int)sizeof(p)), ((int)brightness(&(p))));
+    int64_t big = 1;
+    big = ((((big * 1024) * 1024) * 1024) * 1024);
+    int8_t small = ((int8_t)200);
+    char const *greeting = "hi";
+    printf("%lld %d %s\n", ((long long)big), small, greeting);
+    return 0;
+}
\ No newline at end of file
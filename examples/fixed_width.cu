@@ -0,0 +1,43 @@
+# Fixed width integers make structs exactly as large as their data needs.
+# const marks data that is only read, and restrict tells gcc that nothing
+# else points to the same data, so it can keep values in registers and
+# vectorize the loop without checking if the arrays overlap.
+
+struct Pixel {
+    r: uint8,
+    g: uint8,
+    b: uint8,
+    a: uint8,
+}
+
+
+def saxpy(n: size_t, k: float, x: float const* restrict, y: float* restrict):
+    i: size_t = 0
+    while i < n:
+        y[i] = y[i] + k * x[i]
+        i++
+
+
+def brightness(p: Pixel const*) -> uint32:
+    return <uint32>(p->r + p->g + p->b)
+
+
+def main():
+    x: float[8] = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+    y: float[8] = [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5]
+    saxpy(8, 2.0, x, y)
+    printf("%g %g\n", y[0], y[7])
+
+    p: Pixel
+    p.r = 200
+    p.g = 100
+    p.b = 50
+    p.a = 255
+    printf("%d %d\n", <int>sizeof(p), <int>brightness(&p))
+
+    big: int64 = 1
+    big = big * 1024 * 1024 * 1024 * 1024
+    small: int8 = <int8>200
+    greeting: char const* = "hi"
+    printf("%lld %d %s\n", <long>big, small, greeting)
+    return 0
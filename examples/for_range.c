@@ -0,0 +1,33 @@
+#include <stdio.h>
+#include <stdlib.h>
+size_t sum_squares(size_t n){
+    size_t total = 0;
+    for (size_t i = 0, lang_i_stop = n; i < lang_i_stop; i++) {
+        total = (total + (i * i));
+    }
+    return total;
+}
+int main(){
+    printf("%zu\n", sum_squares(10));
+    for (size_t k = (sum_squares(3) - 1) + 1; k-- > 0; ) {
+        printf("%zu ", k);
+    }
+    printf("\n");
+    for (int i = 10; i > 0; i -= 3) {
+        printf("%d ", i);
+    }
+    printf("\n");
+    int nums[6] = {4, 8, 15, 16, 23, 42};
+    int step = 2;
+    for (int i = 1, lang_i_step = step; (lang_i_step > 0 ? i < 6 : i > 6); i += lang_i_step) {
+        printf("%d ", nums[i]);
+    }
+    printf("\n");
+    char i = 'x';
+    for (int i = 0; i < 3; i++) {
+        for (int j = 0, lang_j_stop = i; j < lang_j_stop; j++) {
+            printf("%d%d ", i, j);
+        }
+    }
+    printf("%c\n", i);
+}
\ No newline at end of file
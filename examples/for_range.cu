@@ -0,0 +1,34 @@
+# for loops over range() become plain C for loops. The index is only
+# visible inside the loop and no range object is created.
+
+def sum_squares(n: size_t) -> size_t:
+    total: size_t = 0
+    for i in range(n):
+        total = total + i * i
+    return total
+
+
+def main():
+    printf("%zu\n", sum_squares(10))
+
+    # Unsigned indices count down to 0 without wrapping around
+    for k in range(sum_squares(3) - 1, -1, -1):
+        printf("%zu ", k)
+    printf("\n")
+
+    for i in range(10, 0, -3):
+        printf("%d ", i)
+    printf("\n")
+
+    nums: int[6] = [4, 8, 15, 16, 23, 42]
+    step: int = 2
+    for i in range(1, 6, step):
+        printf("%d ", nums[i])
+    printf("\n")
+
+    # The index shadows variables of the same name outside the loop
+    i: char = 'x'
+    for i in range(3):
+        for j in range(i):
+            printf("%d%d ", i, j)
+    printf("%c\n", i)
@@ -0,0 +1,43 @@
+#include <stdio.h>
+#include <lang_str.h>
+#include <lang_fastio.h>
+#include <stdlib.h>
+int fib(int n){
+    if ((n < 2)) {
+        return n;
+    }
+    return (fib((n - 1)) + fib((n - 2)));
+}
+int main(){
+    for (int x = 5; x < 8; x++) {
+        printf("fib #%lld: %lld\n", ((long long)x), ((long long)fib(x)));
+    }
+    double ratio = 0.3333333333333333;
+    size_t count = 3;
+    char name[7] = "thirds";
+    printf("%8s [%4lu] %.3f 100%%\n", name, ((unsigned long)count), ratio);
+    unsigned long big = 1099511627776;
+    write_str(name);
+    write_str(" ");
+    write_uint(count);
+    write_str(" ");
+    write_float(ratio, 2);
+    write_str(" ");
+    write_uint(big);
+    write_str(" ");
+    write_char('!');
+    write_str("\n");
+    write_flush();
+    StrBuilder *b = str_builder_new();
+    for (int i = 0; i < 3; i++) {
+        str_builder_append(b, ((str){"[", 1}));
+        str_builder_append_int(b, i);
+        str_builder_append(b, ((str){":", 1}));
+        str_builder_append_int(b, fib((i + 10)));
+        str_builder_append(b, ((str){"]", 1}));
+    }
+    str view = str_builder_view(b);
+    printf("%.*s has %lu chars\n", ((int)view.length), view.data, ((unsigned long)view.length));
+    str_builder_free(b);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,33 @@
+# The format of an f-string is worked out from the types of its values when
+# compiling. printf() gets the conversion that matches each value, while
+# write_str() and str_builder_append() call the writer for each type
+# directly instead of interpreting a format string when run.
+
+def fib(n: int) -> int:
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+
+def main() -> int:
+    for x in range(5, 8):
+        printf(f"fib #{x}: {fib(x)}\n")
+
+    # Flags, width and precision go after a colon like in printf
+    ratio: double = 1.0 / 3
+    count: size_t = 3
+    name = "thirds"
+    printf(f"{name:8} [{count:4}] {ratio:.3} 100%\n")
+
+    # Buffered output without format strings
+    big: ulong = 1099511627776
+    write_str(f"{name} {count} {ratio:.2} {big} {'!'}\n")
+    write_flush()
+
+    b = str_builder_new()
+    for i in range(3):
+        str_builder_append(b, f"[{i}:{fib(i + 10)}]")
+    view = str_builder_view(b)
+    printf(f"{view} has {view.length} chars\n")
+    str_builder_free(b)
+    return 0
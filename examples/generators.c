@@ -0,0 +1,106 @@
+#include <stdio.h>
+#include <stdlib.h>
+typedef struct numbers_state numbers_state;
+struct numbers_state {int lang_state; char *text; int i; int n; int in_number; char c;};
+numbers_state numbers(char *text){
+    numbers_state lang_gen;
+    lang_gen.lang_state = 0;
+    lang_gen.text = text;
+    return lang_gen;
+}
+int numbers_next(numbers_state *lang_gen, int *lang_out){
+    switch (lang_gen->lang_state) {
+        case 0:
+            break;
+        case 1:
+            goto lang_resume_1;
+        case 2:
+            goto lang_resume_2;
+        default:
+            return 0;
+    }
+    lang_gen->i = 0;
+    lang_gen->n = 0;
+    lang_gen->in_number = 0;
+    while ((lang_gen->text[lang_gen->i] != '\0')) {
+        lang_gen->c = lang_gen->text[lang_gen->i];
+        if (((lang_gen->c >= '0') && (lang_gen->c <= '9'))) {
+            lang_gen->n = ((lang_gen->n * 10) + (lang_gen->c - '0'));
+            lang_gen->in_number = 1;
+        }
+        else if (lang_gen->in_number) {
+            *lang_out = lang_gen->n;
+            lang_gen->lang_state = 1;
+            return 1;
+            lang_resume_1:;
+            lang_gen->n = 0;
+            lang_gen->in_number = 0;
+        }
+        lang_gen->i++;
+    }
+    if (lang_gen->in_number) {
+        *lang_out = lang_gen->n;
+        lang_gen->lang_state = 2;
+        return 1;
+        lang_resume_2:;
+    }
+    lang_gen->lang_state = -1;
+    return 0;
+}
+typedef struct running_max_state running_max_state;
+struct running_max_state {int lang_state; numbers_state src; int best; int n;};
+running_max_state running_max(numbers_state src){
+    running_max_state lang_gen;
+    lang_gen.lang_state = 0;
+    lang_gen.src = src;
+    return lang_gen;
+}
+int running_max_next(running_max_state *lang_gen, int *lang_out){
+    switch (lang_gen->lang_state) {
+        case 0:
+            break;
+        case 1:
+            goto lang_resume_1;
+        default:
+            return 0;
+    }
+    lang_gen->best = -1;
+    while (numbers_next(&(lang_gen->src), &(lang_gen->n))) {
+        if ((lang_gen->n > lang_gen->best)) {
+            lang_gen->best = lang_gen->n;
+            *lang_out = lang_gen->best;
+            lang_gen->lang_state = 1;
+            return 1;
+            lang_resume_1:;
+        }
+    }
+    lang_gen->lang_state = -1;
+    return 0;
+}
+int main(){
+    char log[35] = "took 12ms, 7ms, 40ms, 3ms and 41ms";
+    {
+        numbers_state lang_n_gen = numbers(log);
+        int n;
+        while (numbers_next(&(lang_n_gen), &(n))) {
+            printf("%d ", n);
+        }
+    }
+    printf("\n");
+    {
+        running_max_state lang_n_gen = running_max(numbers(log));
+        int n;
+        while (running_max_next(&(lang_n_gen), &(n))) {
+            printf("%d ", n);
+        }
+    }
+    printf("\n");
+    numbers_state gen = numbers("1 2 3");
+    int x;
+    while (numbers_next(&(gen), &(x))) {
+        for (int i = 0, lang_i_stop = x; i < lang_i_stop; i++) {
+            printf("*");
+        }
+        printf("\n");
+    }
+}
\ No newline at end of file
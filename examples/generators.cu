@@ -0,0 +1,48 @@
+# Generators produce their values one at a time, so a pipeline of them
+# processes its input without building intermediate arrays. The state of a
+# generator is a struct kept by whoever iterates over it, so nothing is
+# allocated.
+
+def numbers(text: char*) -> int:
+    i = 0
+    n = 0
+    in_number = 0
+    while text[i] != '\0':
+        c = text[i]
+        if c >= '0' and c <= '9':
+            n = n * 10 + (c - '0')
+            in_number = 1
+        elif in_number:
+            yield n
+            n = 0
+            in_number = 0
+        i++
+    if in_number:
+        yield n
+
+
+def running_max(src: numbers_state) -> int:
+    best = -1
+    for n in src:
+        if n > best:
+            best = n
+            yield best
+
+
+def main():
+    log = "took 12ms, 7ms, 40ms, 3ms and 41ms"
+    for n in numbers(log):
+        printf("%d ", n)
+    printf("\n")
+
+    for n in running_max(numbers(log)):
+        printf("%d ", n)
+    printf("\n")
+
+    # Generators can also be advanced by hand
+    gen = numbers("1 2 3")
+    x: int
+    while numbers_next(&gen, &x):
+        for i in range(x):
+            printf("*")
+        printf("\n")
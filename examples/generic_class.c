@@ -0,0 +1,288 @@
+#include <stdio.h>
+#include <stdlib.h>
+typedef struct Point Point;
+struct Point {int x; int y;};
+#ifndef _LANG_SPEC_ArrayList_int
+#define _LANG_SPEC_ArrayList_int
+typedef struct ArrayList_int ArrayList_int;
+struct ArrayList_int {int *buffer; size_t length; size_t capacity; int (*__init__)(ArrayList_int*, size_t); int (*append)(ArrayList_int*, int); int (*get)(ArrayList_int*, size_t); int (*__del__)(ArrayList_int*);};
+static int ArrayList_int___init__(ArrayList_int *self, size_t capacity){
+    self->length = 0;
+    self->capacity = capacity;
+    self->buffer = ((int*)malloc((sizeof(int) * capacity)));
+}
+static int ArrayList_int_append(ArrayList_int *self, int x){
+    if ((self->length == self->capacity)) {
+        self->capacity = (self->capacity * 2);
+        self->buffer = ((int*)realloc(self->buffer, (sizeof(int) * self->capacity)));
+    }
+    self->buffer[self->length] = x;
+    self->length++;
+}
+static int ArrayList_int_get(ArrayList_int *self, size_t i){
+    return self->buffer[i];
+}
+static int ArrayList_int___del__(ArrayList_int *self){
+    free(self->buffer);
+}
+static ArrayList_int* init_ArrayList_int(ArrayList_int *obj, size_t capacity){
+    obj->__init__ = ArrayList_int___init__;
+    obj->append = ArrayList_int_append;
+    obj->get = ArrayList_int_get;
+    obj->__del__ = ArrayList_int___del__;
+    ArrayList_int___init__(obj, capacity);
+    return obj;
+}
+static ArrayList_int* new_ArrayList_int(size_t capacity){
+    return init_ArrayList_int(((ArrayList_int*)malloc(sizeof(ArrayList_int))), capacity);
+}
+static void del_ArrayList_int(ArrayList_int *self){
+    ArrayList_int___del__(self);
+    free(self);
+}
+static ArrayList_int* init_ArrayList_int_array(ArrayList_int *lang_objs, size_t lang_count, size_t capacity){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_ArrayList_int((lang_objs + lang_idx), capacity);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static ArrayList_int* new_ArrayList_int_array(size_t lang_count, size_t capacity){
+    return init_ArrayList_int_array(((ArrayList_int*)malloc((sizeof(ArrayList_int) * lang_count))), lang_count, capacity);
+}
+static void fini_ArrayList_int_array(ArrayList_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        ArrayList_int___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_ArrayList_int_array(ArrayList_int *lang_objs, size_t lang_count){
+    fini_ArrayList_int_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+int sum_ints(ArrayList_int *lst){
+    int total = 0;
+    int i = 0;
+    while ((i < lst->length)) {
+        total = (total + lst->get(lst, i));
+        i++;
+    }
+    return total;
+}
+#ifndef _LANG_SPEC_ArrayList_double
+#define _LANG_SPEC_ArrayList_double
+typedef struct ArrayList_double ArrayList_double;
+struct ArrayList_double {double *buffer; size_t length; size_t capacity; int (*__init__)(ArrayList_double*, size_t); int (*append)(ArrayList_double*, double); double (*get)(ArrayList_double*, size_t); int (*__del__)(ArrayList_double*);};
+static int ArrayList_double___init__(ArrayList_double *self, size_t capacity){
+    self->length = 0;
+    self->capacity = capacity;
+    self->buffer = ((double*)malloc((sizeof(double) * capacity)));
+}
+static int ArrayList_double_append(ArrayList_double *self, double x){
+    if ((self->length == self->capacity)) {
+        self->capacity = (self->capacity * 2);
+        self->buffer = ((double*)realloc(self->buffer, (sizeof(double) * self->capacity)));
+    }
+    self->buffer[self->length] = x;
+    self->length++;
+}
+static double ArrayList_double_get(ArrayList_double *self, size_t i){
+    return self->buffer[i];
+}
+static int ArrayList_double___del__(ArrayList_double *self){
+    free(self->buffer);
+}
+static ArrayList_double* init_ArrayList_double(ArrayList_double *obj, size_t capacity){
+    obj->__init__ = ArrayList_double___init__;
+    obj->append = ArrayList_double_append;
+    obj->get = ArrayList_double_get;
+    obj->__del__ = ArrayList_double___del__;
+    ArrayList_double___init__(obj, capacity);
+    return obj;
+}
+static ArrayList_double* new_ArrayList_double(size_t capacity){
+    return init_ArrayList_double(((ArrayList_double*)malloc(sizeof(ArrayList_double))), capacity);
+}
+static void del_ArrayList_double(ArrayList_double *self){
+    ArrayList_double___del__(self);
+    free(self);
+}
+static ArrayList_double* init_ArrayList_double_array(ArrayList_double *lang_objs, size_t lang_count, size_t capacity){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_ArrayList_double((lang_objs + lang_idx), capacity);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static ArrayList_double* new_ArrayList_double_array(size_t lang_count, size_t capacity){
+    return init_ArrayList_double_array(((ArrayList_double*)malloc((sizeof(ArrayList_double) * lang_count))), lang_count, capacity);
+}
+static void fini_ArrayList_double_array(ArrayList_double *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        ArrayList_double___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_ArrayList_double_array(ArrayList_double *lang_objs, size_t lang_count){
+    fini_ArrayList_double_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+#ifndef _LANG_SPEC_ArrayList_Point
+#define _LANG_SPEC_ArrayList_Point
+typedef struct ArrayList_Point ArrayList_Point;
+struct ArrayList_Point {Point *buffer; size_t length; size_t capacity; int (*__init__)(ArrayList_Point*, size_t); int (*append)(ArrayList_Point*, Point); Point (*get)(ArrayList_Point*, size_t); int (*__del__)(ArrayList_Point*);};
+static int ArrayList_Point___init__(ArrayList_Point *self, size_t capacity){
+    self->length = 0;
+    self->capacity = capacity;
+    self->buffer = ((Point*)malloc((sizeof(Point) * capacity)));
+}
+static int ArrayList_Point_append(ArrayList_Point *self, Point x){
+    if ((self->length == self->capacity)) {
+        self->capacity = (self->capacity * 2);
+        self->buffer = ((Point*)realloc(self->buffer, (sizeof(Point) * self->capacity)));
+    }
+    self->buffer[self->length] = x;
+    self->length++;
+}
+static Point ArrayList_Point_get(ArrayList_Point *self, size_t i){
+    return self->buffer[i];
+}
+static int ArrayList_Point___del__(ArrayList_Point *self){
+    free(self->buffer);
+}
+static ArrayList_Point* init_ArrayList_Point(ArrayList_Point *obj, size_t capacity){
+    obj->__init__ = ArrayList_Point___init__;
+    obj->append = ArrayList_Point_append;
+    obj->get = ArrayList_Point_get;
+    obj->__del__ = ArrayList_Point___del__;
+    ArrayList_Point___init__(obj, capacity);
+    return obj;
+}
+static ArrayList_Point* new_ArrayList_Point(size_t capacity){
+    return init_ArrayList_Point(((ArrayList_Point*)malloc(sizeof(ArrayList_Point))), capacity);
+}
+static void del_ArrayList_Point(ArrayList_Point *self){
+    ArrayList_Point___del__(self);
+    free(self);
+}
+static ArrayList_Point* init_ArrayList_Point_array(ArrayList_Point *lang_objs, size_t lang_count, size_t capacity){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_ArrayList_Point((lang_objs + lang_idx), capacity);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static ArrayList_Point* new_ArrayList_Point_array(size_t lang_count, size_t capacity){
+    return init_ArrayList_Point_array(((ArrayList_Point*)malloc((sizeof(ArrayList_Point) * lang_count))), lang_count, capacity);
+}
+static void fini_ArrayList_Point_array(ArrayList_Point *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        ArrayList_Point___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_ArrayList_Point_array(ArrayList_Point *lang_objs, size_t lang_count){
+    fini_ArrayList_Point_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+#ifndef _LANG_SPEC_ArrayList_ArrayList_int_ptr
+#define _LANG_SPEC_ArrayList_ArrayList_int_ptr
+typedef struct ArrayList_ArrayList_int_ptr ArrayList_ArrayList_int_ptr;
+struct ArrayList_ArrayList_int_ptr {ArrayList_int **buffer; size_t length; size_t capacity; int (*__init__)(ArrayList_ArrayList_int_ptr*, size_t); int (*append)(ArrayList_ArrayList_int_ptr*, ArrayList_int*); ArrayList_int* (*get)(ArrayList_ArrayList_int_ptr*, size_t); int (*__del__)(ArrayList_ArrayList_int_ptr*);};
+static int ArrayList_ArrayList_int_ptr___init__(ArrayList_ArrayList_int_ptr *self, size_t capacity){
+    self->length = 0;
+    self->capacity = capacity;
+    self->buffer = ((ArrayList_int**)malloc((sizeof(ArrayList_int*) * capacity)));
+}
+static int ArrayList_ArrayList_int_ptr_append(ArrayList_ArrayList_int_ptr *self, ArrayList_int *x){
+    if ((self->length == self->capacity)) {
+        self->capacity = (self->capacity * 2);
+        self->buffer = ((ArrayList_int**)realloc(self->buffer, (sizeof(ArrayList_int*) * self->capacity)));
+    }
+    self->buffer[self->length] = x;
+    self->length++;
+}
+static ArrayList_int* ArrayList_ArrayList_int_ptr_get(ArrayList_ArrayList_int_ptr *self, size_t i){
+    return self->buffer[i];
+}
+static int ArrayList_ArrayList_int_ptr___del__(ArrayList_ArrayList_int_ptr *self){
+    free(self->buffer);
+}
+static ArrayList_ArrayList_int_ptr* init_ArrayList_ArrayList_int_ptr(ArrayList_ArrayList_int_ptr *obj, size_t capacity){
+    obj->__init__ = ArrayList_ArrayList_int_ptr___init__;
+    obj->append = ArrayList_ArrayList_int_ptr_append;
+    obj->get = ArrayList_ArrayList_int_ptr_get;
+    obj->__del__ = ArrayList_ArrayList_int_ptr___del__;
+    ArrayList_ArrayList_int_ptr___init__(obj, capacity);
+    return obj;
+}
+static ArrayList_ArrayList_int_ptr* new_ArrayList_ArrayList_int_ptr(size_t capacity){
+    return init_ArrayList_ArrayList_int_ptr(((ArrayList_ArrayList_int_ptr*)malloc(sizeof(ArrayList_ArrayList_int_ptr))), capacity);
+}
+static void del_ArrayList_ArrayList_int_ptr(ArrayList_ArrayList_int_ptr *self){
+    ArrayList_ArrayList_int_ptr___del__(self);
+    free(self);
+}
+static ArrayList_ArrayList_int_ptr* init_ArrayList_ArrayList_int_ptr_array(ArrayList_ArrayList_int_ptr *lang_objs, size_t lang_count, size_t capacity){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_ArrayList_ArrayList_int_ptr((lang_objs + lang_idx), capacity);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static ArrayList_ArrayList_int_ptr* new_ArrayList_ArrayList_int_ptr_array(size_t lang_count, size_t capacity){
+    return init_ArrayList_ArrayList_int_ptr_array(((ArrayList_ArrayList_int_ptr*)malloc((sizeof(ArrayList_ArrayList_int_ptr) * lang_count))), lang_count, capacity);
+}
+static void fini_ArrayList_ArrayList_int_ptr_array(ArrayList_ArrayList_int_ptr *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        ArrayList_ArrayList_int_ptr___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_ArrayList_ArrayList_int_ptr_array(ArrayList_ArrayList_int_ptr *lang_objs, size_t lang_count){
+    fini_ArrayList_ArrayList_int_ptr_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+int main(){
+    ArrayList_int *ints = new_ArrayList_int(2);
+    int i = 0;
+    while ((i < 100)) {
+        ints->append(ints, i);
+        i++;
+    }
+    printf("%d\n", sum_ints(ints));
+    del_ArrayList_int(ints);
+    ArrayList_double *doubles = new_ArrayList_double(1);
+    doubles->append(doubles, 1.5);
+    doubles->append(doubles, 2.25);
+    printf("%.2f\n", (doubles->get(doubles, 0) + doubles->get(doubles, 1)));
+    del_ArrayList_double(doubles);
+    Point p;
+    p.x = 3;
+    p.y = 4;
+    ArrayList_Point *points = new_ArrayList_Point(1);
+    points->append(points, p);
+    points->append(points, p);
+    Point q = points->get(points, 1);
+    printf("%d\n", (q.x * q.y));
+    del_ArrayList_Point(points);
+    ArrayList_ArrayList_int_ptr *nested = new_ArrayList_ArrayList_int_ptr(1);
+    nested->append(nested, new_ArrayList_int(1));
+    nested->get(nested, 0)->append(nested->get(nested, 0), 42);
+    printf("%d\n", nested->get(nested, 0)->get(nested->get(nested, 0), 0));
+    del_ArrayList_int(nested->get(nested, 0));
+    del_ArrayList_ArrayList_int_ptr(nested);
+    return 0;
+}
\ No newline at end of file
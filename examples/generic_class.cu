@@ -0,0 +1,75 @@
+# Each use of ArrayList with a new type creates a specialized struct and set
+# of methods for that type, so elements are stored unboxed.
+
+class ArrayList<T>:
+    buffer: T*
+    length: size_t
+    capacity: size_t
+
+    def __init__(self: ArrayList<T>*, capacity: size_t):
+        self->length = 0
+        self->capacity = capacity
+        self->buffer = <T*>malloc(sizeof(T) * capacity)
+
+    def append(self: ArrayList<T>*, x: T):
+        if self->length == self->capacity:
+            self->capacity = self->capacity * 2
+            self->buffer = <T*>realloc(self->buffer, sizeof(T) * self->capacity)
+        self->buffer[self->length] = x
+        self->length++
+
+    def get(self: ArrayList<T>*, i: size_t) -> T:
+        return self->buffer[i]
+
+    def __del__(self: ArrayList<T>*):
+        free(self->buffer)
+
+
+struct Point {
+    x: int,
+    y: int,
+}
+
+
+def sum_ints(lst: ArrayList<int>*) -> int:
+    total = 0
+    i = 0
+    while i < lst->length:
+        total = total + lst->get(i)
+        i++
+    return total
+
+
+def main():
+    ints: ArrayList<int>* = new_ArrayList_int(2)
+    i = 0
+    while i < 100:
+        ints->append(i)
+        i++
+    printf("%d\n", sum_ints(ints))
+    del_ArrayList_int(ints)
+
+    doubles: ArrayList<double>* = new_ArrayList_double(1)
+    doubles->append(1.5)
+    doubles->append(2.25)
+    printf("%.2f\n", doubles->get(0) + doubles->get(1))
+    del_ArrayList_double(doubles)
+
+    p: Point
+    p.x = 3
+    p.y = 4
+    points: ArrayList<Point>* = new_ArrayList_Point(1)
+    points->append(p)
+    points->append(p)
+    q = points->get(1)
+    printf("%d\n", q.x * q.y)
+    del_ArrayList_Point(points)
+
+    # Lists of lists are specialized recursively
+    nested: ArrayList<ArrayList<int>*>* = new_ArrayList_ArrayList_int_ptr(1)
+    nested->append(new_ArrayList_int(1))
+    nested->get(0)->append(42)
+    printf("%d\n", nested->get(0)->get(0))
+    del_ArrayList_int(nested->get(0))
+    del_ArrayList_ArrayList_int_ptr(nested)
+    return 0
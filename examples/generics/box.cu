@@ -0,0 +1,7 @@
+include "box.hu"
+
+def twice(x: int) -> int:
+    b: Box<int>* = new_Box_int(x)
+    result = b->value * 2
+    del_Box_int(b)
+    return result
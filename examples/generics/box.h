@@ -0,0 +1 @@
+int twice(int x);
\ No newline at end of file
@@ -0,0 +1,42 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include "box.h"
+#ifndef _LANG_SPEC_Box_int
+#define _LANG_SPEC_Box_int
+typedef struct Box_int Box_int;
+struct Box_int {int value; int (*__init__)(Box_int*, int);};
+static int Box_int___init__(Box_int *self, int value){
+    self->value = value;
+}
+static Box_int* init_Box_int(Box_int *obj, int value){
+    obj->__init__ = Box_int___init__;
+    Box_int___init__(obj, value);
+    return obj;
+}
+static Box_int* new_Box_int(int value){
+    return init_Box_int(((Box_int*)malloc(sizeof(Box_int))), value);
+}
+static void del_Box_int(Box_int *self){
+    free(self);
+}
+static Box_int* init_Box_int_array(Box_int *lang_objs, size_t lang_count, int value){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Box_int((lang_objs + lang_idx), value);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static Box_int* new_Box_int_array(size_t lang_count, int value){
+    return init_Box_int_array(((Box_int*)malloc((sizeof(Box_int) * lang_count))), lang_count, value);
+}
+static void del_Box_int_array(Box_int *lang_objs, size_t lang_count){
+    free(lang_objs);
+}
+#endif
+int main(){
+    Box_int *b = new_Box_int(20);
+    printf("%d\n", (twice(b->value) + 2));
+    del_Box_int(b);
+    return 0;
+}
\ No newline at end of file
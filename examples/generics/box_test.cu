@@ -0,0 +1,7 @@
+include "box.hu"
+
+def main():
+    b: Box<int>* = new_Box_int(20)
+    printf("%d\n", twice(b->value) + 2)
+    del_Box_int(b)
+    return 0
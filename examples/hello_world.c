@@ -0,0 +1,6 @@
+#include <stdio.h>
+#include <stdlib.h>
+int main(int argc, char **argv){
+    printf("Hello world\n");
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,265 @@
+#include <stdio.h>
+#include <assert.h>
+#include <string.h>
+#include <stdlib.h>
+#include <stdint.h>
+#define DAYS_IN_YEAR 365
+#define MACRO_VARIABLE
+typedef enum days days;
+enum days {SUN, MON, TUE, WED, THU, FRI, SAT};
+#include "myheader.h"
+void function_1();
+void demo_func_ptrs();
+int add_two_ints(int x1, int x2);
+int add_two_things(int x1, int x2);
+int func_no_specified_ret();
+typedef struct squares_state squares_state;
+struct squares_state {int lang_state; int n; int i; int lang_i_stop;};
+squares_state squares(int n){
+    squares_state lang_gen;
+    lang_gen.lang_state = 0;
+    lang_gen.n = n;
+    return lang_gen;
+}
+int squares_next(squares_state *lang_gen, int *lang_out){
+    switch (lang_gen->lang_state) {
+        case 0:
+            break;
+        case 1:
+            goto lang_resume_1;
+        default:
+            return 0;
+    }
+    lang_gen->i = 0;
+    lang_gen->lang_i_stop = lang_gen->n;
+    while ((lang_gen->i < lang_gen->lang_i_stop)) {
+        *lang_out = (lang_gen->i * lang_gen->i);
+        lang_gen->lang_state = 1;
+        return 1;
+        lang_resume_1:;
+        lang_gen->i = (lang_gen->i + 1);
+    }
+    lang_gen->lang_state = -1;
+    return 0;
+}
+static int lang_switch0(const char *data) {
+    size_t n = 0;
+    static const unsigned int displacements[2] = {8u, 0u};
+    static const char *const keys[4] = {"run", 0, "stop", "start"};
+    static const size_t lengths[4] = {3, 0, 4, 5};
+    static const int ids[4] = {0, -1, 1, 0};
+    unsigned int h = 0u;
+    for (; data[n]; n++) {
+        h = (h ^ (unsigned char)data[n]) * 16777619u;
+    }
+    h ^= h >> 16;
+    h = ((h ^ displacements[h & 1u]) * 2654435761u) >> 30;
+    if (keys[h] && lengths[h] == n && memcmp(keys[h], data, n) == 0) {
+        return ids[h];
+    }
+    return -1;
+}
+int main(int argc, char **argv){
+    printf("%d\n", 0);
+    int x;
+    int y = 4;
+    int z = 4;
+    char x_char = 0;
+    char y_char = 'y';
+    short x_short;
+    int x_int;
+    long long x_long;
+    unsigned int x_uint;
+    float x_float = 0.0;
+    double x_double = 0.0;
+    int8_t x_int8 = 0;
+    uint64_t x_uint64 = 0;
+    int const x_const = 1;
+    char const *const_chars = "abc";
+    int *restrict no_alias = NULL;
+    size_t int_size = sizeof(int);
+    size_t large_num_size = sizeof(9223372036854775807);
+    printf("sizeof(int): %zu\n", int_size);
+    printf("sizeof(2^63): %zu\n", large_num_size);
+    int a = 1;
+    printf("original value of a: %d\n", a);
+    size_t size = sizeof(a++);
+    printf("sizeof(a++) = %zu where new value of a = %d\n", size, a);
+    char my_char_array[20];
+    int my_int_array[20];
+    char my_array[20] = {0};
+    int my_array_default[3] = {1, 2, 3};
+    my_array[0];
+    my_array[1] = 2;
+    printf("%d\n", my_array[1]);
+    printf("Enter the array size: ");
+    int array_size;
+    assert(fscanf(stdin, "%d", &(array_size)));
+    int var_length_array[array_size];
+    printf("sizeof(var_length_array) in bytes: %zu\n", sizeof(var_length_array));
+    char a_string[17] = "This is a string";
+    printf("%s\n", a_string);
+    printf("%d\n", a_string[16]);
+    printf("%s has %lu bytes\n", a_string, ((unsigned long)sizeof(a_string)));
+    int multi_array[2][5] = {{1, 2, 3, 4, 5}, {6, 7, 8, 9, 10}};
+    int array_int = multi_array[0][2];
+    printf("%d\n", array_int);
+    assert((9 == (multi_array[1][2] + 1)));
+    int i1 = 1;
+    int i2 = 2;
+    float f1 = 1.0;
+    float f2 = 2.0;
+    assert(((i1 + i2) == 3));
+    assert(((i2 - i1) == 1));
+    assert(((i2 * i1) == 2));
+    assert(((i1 / i2) == 0));
+    float x_cast1 = (((float)i1) / i2);
+    printf("Should be 0.5: %f\n", x_cast1);
+    printf("Should also be 0.5: %f\n", (i1 / ((double)i2)));
+    printf("Should also be 0.5: %f\n", (f1 / f2));
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    a = 6;
+    int between_7_and_5 = ((7 > a) > 5);
+    assert(!between_7_and_5);
+    between_7_and_5 = ((7 > a) && (a > 5));
+    assert(between_7_and_5);
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    int j = 0;
+    int s = j++;
+    assert((s == 0));
+    assert((j == 1));
+    s = (--j);
+    assert((s == 0));
+    assert((j == 0));
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    assert(1);
+    printf("This prints\n");
+    int ii = 0;
+    while ((ii < 10)) {
+        printf("%d, ", ii++);
+    }
+    printf("\n");
+    int kk = 0;
+    do {
+        printf("%d, ", kk);
+    } while (((++kk) < 10));
+    printf("\n");
+    for (int i = 0; i < 10; i += 2) {
+        printf("%d, ", i);
+    }
+    {
+        squares_state lang_sq_gen = squares(5);
+        int sq;
+        while (squares_next(&(lang_sq_gen), &(sq))) {
+            printf("%d, ", sq);
+        }
+    }
+    printf("\n");
+    a = 3;
+    switch (a){
+        case 0:
+            printf("a == 0\n");
+            break;
+        case 1:
+            printf("a == 1\n");
+            break;
+        case 3:
+        case 4:
+            printf("a is 3 or 4\n");
+            break;
+        default:
+            fputs("Error\n", stderr);
+            exit(-1);
+            break;
+    }
+    char command[5] = "stop";
+    switch (lang_switch0(command)){
+        case 0:
+            printf("starting\n");
+            break;
+        case 1:
+            printf("stopping\n");
+            break;
+    }
+    int x_val = 1;
+    printf("%d\n", x_val);
+    printf("%d\n", ((short)x_val));
+    printf("%d\n", ((char)x_val));
+    assert((((unsigned char)257) == 1));
+    printf("%f\n", ((float)100));
+    printf("%lf\n", 100.0);
+    printf("%d\n", ((char)100.0));
+    x = 5;
+    printf("%p\n", ((void*)&(x)));
+    int *px = &(x);
+    int not_a_pointer;
+    printf("%p\n", ((void*)px));
+    printf("pointer size: %zu, int size: %zu\n", sizeof(px), sizeof(not_a_pointer));
+    assert(((*px) == 5));
+    int *px_cpy = px;
+    (*px)++;
+    assert(((*px) == 6));
+    assert((px == px_cpy));
+    int x_array[5] = {1, 2, 3, 4, 5};
+    int *x_ptr = x_array;
+    assert(((*x_ptr) == 1));
+    char otherarr[11] = "somestring";
+    char *ptr = otherarr;
+    printf("%s, %s\n", otherarr, ptr);
+    assert(((*(ptr + 1)) == ptr[1]));
+    int *my_ptr = ((int*)malloc((sizeof(int) * 3)));
+    my_ptr[0] = 1;
+    my_ptr[1] = 2;
+    my_ptr[2] = 3;
+    assert(((my_ptr[0] + my_ptr[1]) == my_ptr[2]));
+    free(my_ptr);
+    function_1();
+    demo_func_ptrs();
+}
+int add_two_ints(int x1, int x2){
+    return (x1 + x2);
+}
+int add_two_ints_plus_1(int x1, int x2){
+    return ((x1 + x2) + 1);
+}
+typedef int my_type;
+my_type my_type_var = 0;
+typedef struct rectangle rectangle;
+struct rectangle {unsigned int width; unsigned int height;};
+void function_1(){
+    rectangle my_rect;
+    my_rect.width = 10;
+    my_rect.height = 20;
+    rectangle *my_rect_ptr = &(my_rect);
+    (*my_rect_ptr).width = 30;
+    assert((my_rect.width == 30));
+    my_rect_ptr->width = 15;
+    assert((my_rect.width == 15));
+    assert((my_rect_ptr->width == my_rect.width));
+}
+void demo_func_ptrs(){
+    int (*adder_func)(int, int);
+    adder_func = add_two_ints;
+    assert((adder_func(1, 2) == 3));
+    assert((adder_func(3, 0) == adder_func(1, 2)));
+    adder_func = add_two_ints_plus_1;
+    assert((adder_func(1, 2) == 4));
+    typedef int (*adder_func_t)(int, int);
+    adder_func_t adder_func2 = add_two_ints;
+    assert((adder_func2(2, 3) == 5));
+}
\ No newline at end of file
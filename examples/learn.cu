@@ -40,6 +40,14 @@ def add_two_things(x1: int, x2: int) -> int
 # to int type, like C.
 def func_no_specified_ret()
 
+# Functions that yield are generators. The return type is the type of the
+# values they yield. Calling one returns its state, which is advanced by
+# the for loop that iterates over it, so no memory is allocated.
+# Generators cannot be declared, so they are defined before they are used.
+def squares(n: int) -> int:
+    for i in range(n):
+        yield i * i
+
 # The program's entry poiny is a function called "main"
 # which can accept either no arguments, or 2 arguments, and 
 # returns a string, similar to C.
@@ -88,6 +96,16 @@ def main(argc: int, argv: char**):
     # doubles are usually 64-bit floating point numbers
     x_double: double = 0.0
 
+    # Integers of an exact width (from stdint.h) have the number of bits in
+    # their name
+    x_int8: int8 = 0
+    x_uint64: uint64 = 0
+
+    # const and restrict qualify the type before them, like in C
+    x_const: int const = 1  # x_const cannot be assigned to
+    const_chars: char const* = "abc"  # The chars cannot be changed through const_chars
+    no_alias: int* restrict = NULL  # Only no_alias is used to access what it points to
+
     # The sizeof function will give you the the size of a variable or type
     # in bytes. Only the function is available, not the sizeof statement.
     int_size = sizeof(int)
@@ -134,6 +152,9 @@ def main(argc: int, argv: char**):
     printf("%s\n", a_string)
     printf("%d\n", a_string[16])
 
+    # f-strings get the printf conversions from the types of their values
+    printf(f"{a_string} has {sizeof(a_string)} bytes\n")
+
     # Multidimensional arrays 
     multi_array = [
         [1, 2, 3, 4, 5],
@@ -241,6 +262,13 @@ def main(argc: int, argv: char**):
         printf("%d, ", kk)
     printf("\n")
 
+    # For loops iterate over range() or a generator
+    for i in range(0, 10, 2):
+        printf("%d, ", i)
+    for sq in squares(5):
+        printf("%d, ", sq)
+    printf("\n")
+
     # Switch statement 
     a = 3
     switch a:
@@ -258,6 +286,16 @@ def main(argc: int, argv: char**):
             exit(-1)
             break 
 
+    # Switches on strings compare the string to only one of the cases
+    command = "stop"
+    switch command:
+        case "start", "run":
+            printf("starting\n")
+            break
+        case "stop":
+            printf("stopping\n")
+            break
+
     """
     Typecasting
     """
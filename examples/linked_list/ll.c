@@ -0,0 +1,46 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include "ll.h"
+List* new_list(){
+    List *lst = ((List*)malloc(sizeof(List)));
+    lst->head = NULL;
+    lst->length = 0;
+    return lst;
+}
+void del_list(List *l){
+    while ((l->head != NULL)) {
+        Node *next_head = l->head->next;
+        free(l->head);
+        l->head = next_head;
+    }
+    free(l);
+}
+void list_prepend(List *l, int i){
+    Node *node = ((Node*)malloc(sizeof(Node)));
+    node->value = i;
+    node->next = l->head;
+    l->head = node;
+    l->length++;
+}
+void print_list(List *lst){
+    printf("[");
+    Node *node = lst->head;
+    if (node) {
+        printf("%d", node->value);
+        node = node->next;
+    }
+    while (node) {
+        printf(", %d", node->value);
+        node = node->next;
+    }
+    printf("]\n");
+}
+int list_pop(List *lst){
+    Node *head = lst->head;
+    int x = head->value;
+    Node *new_head = head->next;
+    lst->head = new_head;
+    free(head);
+    lst->length--;
+    return x;
+}
\ No newline at end of file
@@ -0,0 +1,13 @@
+#include <stdlib.h>
+#ifndef _LINKED_LIST_H
+#define _LINKED_LIST_H
+typedef struct Node Node;
+struct Node {int value; Node *next;};
+typedef struct List List;
+struct List {Node *head; size_t length;};
+List* new_list();
+void del_list(List *l);
+void print_list(List *l);
+void list_prepend(List *l, int i);
+int list_pop(List *l);
+#endif
\ No newline at end of file
@@ -0,0 +1,23 @@
+#include <stdio.h>
+#include <assert.h>
+#include <stdlib.h>
+#include "ll.h"
+int main(){
+    List *lst = new_list();
+    assert(!lst->length);
+    printf("Empty list: ");
+    print_list(lst);
+    del_list(lst);
+    lst = new_list();
+    list_prepend(lst, 10);
+    printf("List of size 1: ");
+    print_list(lst);
+    assert((lst->length == 1));
+    int x = list_pop(lst);
+    printf("Popped from list: %d\n", x);
+    printf("list: ");
+    print_list(lst);
+    assert(!lst->length);
+    del_list(lst);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,229 @@
+#include <stdio.h>
+#include <assert.h>
+#include <stdlib.h>
+typedef struct Point Point;
+struct Point {int x; int y;};
+#ifndef _LANG_SPEC_List_int
+#define _LANG_SPEC_List_int
+typedef struct List_int List_int;
+struct List_int {int *data; size_t length; size_t capacity; void (*__init__)(List_int*); void (*reserve)(List_int*, size_t); void (*shrink)(List_int*); void (*append)(List_int*, int); int (*pop)(List_int*); void (*clear)(List_int*); int* (*__getitem__)(List_int*, size_t); void (*__del__)(List_int*);};
+static void List_int___init__(List_int *self){
+    self->data = NULL;
+    self->length = 0;
+    self->capacity = 0;
+}
+static void List_int_reserve(List_int *self, size_t capacity){
+    if ((capacity > self->capacity)) {
+        self->data = ((int*)realloc(self->data, (sizeof(int) * capacity)));
+        self->capacity = capacity;
+    }
+}
+static void List_int_shrink(List_int *self){
+    if ((self->length == 0)) {
+        free(self->data);
+        self->data = NULL;
+    }
+    else if ((self->length < self->capacity)) {
+        self->data = ((int*)realloc(self->data, (sizeof(int) * self->length)));
+    }
+    self->capacity = self->length;
+}
+static void List_int_append(List_int *self, int x){
+    if ((self->length == self->capacity)) {
+        if (self->capacity) {
+            List_int_reserve(self, (self->capacity * 2));
+        }
+        else {
+            List_int_reserve(self, 8);
+        }
+    }
+    self->data[self->length] = x;
+    self->length++;
+}
+static int List_int_pop(List_int *self){
+    assert((self->length > 0));
+    self->length--;
+    return self->data[self->length];
+}
+static void List_int_clear(List_int *self){
+    self->length = 0;
+}
+static int* List_int___getitem__(List_int *self, size_t i){
+    assert((i < self->length));
+    return &(self->data[i]);
+}
+static void List_int___del__(List_int *self){
+    free(self->data);
+}
+static List_int* init_List_int(List_int *obj){
+    obj->__init__ = List_int___init__;
+    obj->reserve = List_int_reserve;
+    obj->shrink = List_int_shrink;
+    obj->append = List_int_append;
+    obj->pop = List_int_pop;
+    obj->clear = List_int_clear;
+    obj->__getitem__ = List_int___getitem__;
+    obj->__del__ = List_int___del__;
+    List_int___init__(obj);
+    return obj;
+}
+static List_int* new_List_int(){
+    return init_List_int(((List_int*)malloc(sizeof(List_int))));
+}
+static void del_List_int(List_int *self){
+    List_int___del__(self);
+    free(self);
+}
+static List_int* init_List_int_array(List_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_List_int((lang_objs + lang_idx));
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static List_int* new_List_int_array(size_t lang_count){
+    return init_List_int_array(((List_int*)malloc((sizeof(List_int) * lang_count))), lang_count);
+}
+static void fini_List_int_array(List_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        List_int___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_List_int_array(List_int *lang_objs, size_t lang_count){
+    fini_List_int_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+int sum_squares(List_int *nums){
+    int total = 0;
+    int i = 0;
+    while ((i < nums->length)) {
+        total = (total + ((*List_int___getitem__(nums, i)) * (*List_int___getitem__(nums, i))));
+        i++;
+    }
+    return total;
+}
+#ifndef _LANG_SPEC_List_Point
+#define _LANG_SPEC_List_Point
+typedef struct List_Point List_Point;
+struct List_Point {Point *data; size_t length; size_t capacity; void (*__init__)(List_Point*); void (*reserve)(List_Point*, size_t); void (*shrink)(List_Point*); void (*append)(List_Point*, Point); Point (*pop)(List_Point*); void (*clear)(List_Point*); Point* (*__getitem__)(List_Point*, size_t); void (*__del__)(List_Point*);};
+static void List_Point___init__(List_Point *self){
+    self->data = NULL;
+    self->length = 0;
+    self->capacity = 0;
+}
+static void List_Point_reserve(List_Point *self, size_t capacity){
+    if ((capacity > self->capacity)) {
+        self->data = ((Point*)realloc(self->data, (sizeof(Point) * capacity)));
+        self->capacity = capacity;
+    }
+}
+static void List_Point_shrink(List_Point *self){
+    if ((self->length == 0)) {
+        free(self->data);
+        self->data = NULL;
+    }
+    else if ((self->length < self->capacity)) {
+        self->data = ((Point*)realloc(self->data, (sizeof(Point) * self->length)));
+    }
+    self->capacity = self->length;
+}
+static void List_Point_append(List_Point *self, Point x){
+    if ((self->length == self->capacity)) {
+        if (self->capacity) {
+            List_Point_reserve(self, (self->capacity * 2));
+        }
+        else {
+            List_Point_reserve(self, 8);
+        }
+    }
+    self->data[self->length] = x;
+    self->length++;
+}
+static Point List_Point_pop(List_Point *self){
+    assert((self->length > 0));
+    self->length--;
+    return self->data[self->length];
+}
+static void List_Point_clear(List_Point *self){
+    self->length = 0;
+}
+static Point* List_Point___getitem__(List_Point *self, size_t i){
+    assert((i < self->length));
+    return &(self->data[i]);
+}
+static void List_Point___del__(List_Point *self){
+    free(self->data);
+}
+static List_Point* init_List_Point(List_Point *obj){
+    obj->__init__ = List_Point___init__;
+    obj->reserve = List_Point_reserve;
+    obj->shrink = List_Point_shrink;
+    obj->append = List_Point_append;
+    obj->pop = List_Point_pop;
+    obj->clear = List_Point_clear;
+    obj->__getitem__ = List_Point___getitem__;
+    obj->__del__ = List_Point___del__;
+    List_Point___init__(obj);
+    return obj;
+}
+static List_Point* new_List_Point(){
+    return init_List_Point(((List_Point*)malloc(sizeof(List_Point))));
+}
+static void del_List_Point(List_Point *self){
+    List_Point___del__(self);
+    free(self);
+}
+static List_Point* init_List_Point_array(List_Point *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_List_Point((lang_objs + lang_idx));
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static List_Point* new_List_Point_array(size_t lang_count){
+    return init_List_Point_array(((List_Point*)malloc((sizeof(List_Point) * lang_count))), lang_count);
+}
+static void fini_List_Point_array(List_Point *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        List_Point___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_List_Point_array(List_Point *lang_objs, size_t lang_count){
+    fini_List_Point_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+int main(){
+    List_int *nums = new_List_int();
+    int i = 0;
+    while ((i < 1000)) {
+        nums->append(nums, i);
+        i++;
+    }
+    printf("%d %d\n", ((int)nums->length), sum_squares(nums));
+    (*List_int___getitem__(nums, 0)) = 7;
+    int last = nums->pop(nums);
+    printf("%d %d %d\n", (*List_int___getitem__(nums, 0)), last, ((int)nums->length));
+    nums->clear(nums);
+    nums->shrink(nums);
+    printf("%d\n", ((int)nums->capacity));
+    del_List_int(nums);
+    List_Point points;
+    init_List_Point(&(points));
+    points.reserve(&(points), 4);
+    Point p;
+    p.x = 1;
+    p.y = 2;
+    points.append(&(points), p);
+    (*List_Point___getitem__(&(points), 0)).y = 5;
+    printf("%d %d\n", ((*List_Point___getitem__(&(points), 0)).x + (*List_Point___getitem__(&(points), 0)).y), ((int)points.capacity));
+    List_Point___del__(&(points));
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,49 @@
+# Lists store their elements by value in one growable buffer, unlike the
+# linked list example where every node is a separate allocation.
+
+struct Point {
+    x: int,
+    y: int,
+}
+
+
+def sum_squares(nums: List<int>*) -> int:
+    total = 0
+    i = 0
+    while i < nums->length:
+        total = total + (*nums)[i] * (*nums)[i]
+        i++
+    return total
+
+
+def main():
+    nums: List<int>* = new_List_int()
+    i = 0
+    while i < 1000:
+        nums->append(i)
+        i++
+    printf("%d %d\n", <int>nums->length, sum_squares(nums))
+
+    # Elements can be assigned through indexing. Pointers to Lists are
+    # dereferenced first, since indexing a pointer indexes an array of Lists
+    (*nums)[0] = 7
+    last = nums->pop()
+    printf("%d %d %d\n", (*nums)[0], last, <int>nums->length)
+
+    nums->clear()
+    nums->shrink()
+    printf("%d\n", <int>nums->capacity)
+    del_List_int(nums)
+
+    # Lists can also be stored by value
+    points: List<Point>
+    init_List_Point(&points)
+    points.reserve(4)
+    p: Point
+    p.x = 1
+    p.y = 2
+    points.append(p)
+    points[0].y = 5
+    printf("%d %d\n", points[0].x + points[0].y, <int>points.capacity)
+    List_Point___del__(&points)
+    return 0
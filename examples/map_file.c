@@ -0,0 +1,102 @@
+#include <unistd.h>
+#include <stdio.h>
+#include <assert.h>
+#include <lang_io.h>
+#include <stdlib.h>
+#include <fcntl.h>
+void write_numbers(char *path, int n){
+    FILE *f = fopen(path, "w");
+    setvbuf(f, NULL, _IOFBF, 65536);
+    char line[16];
+    for (int i = 0, lang_i_stop = n; i < lang_i_stop; i++) {
+        int x = i;
+        char digits[16];
+        int len = 0;
+        do {
+            digits[len++] = ((char)('0' + (x % 10)));
+            x = (x / 10);
+        } while (x);
+        for (int j = 0, lang_j_stop = len; j < lang_j_stop; j++) {
+            line[j] = digits[((len - 1) - j)];
+        }
+        line[len] = '\n';
+        fwrite(line, 1, (len + 1), f);
+    }
+    fclose(f);
+}
+#ifndef _LANG_SPEC_Span_uchar
+#define _LANG_SPEC_Span_uchar
+typedef struct Span_uchar Span_uchar;
+struct Span_uchar {unsigned char *data; size_t length;};
+static Span_uchar Span_uchar_slice(unsigned char *data, size_t length, size_t start, size_t end){
+    assert(((start <= end) && (end <= length)));
+    Span_uchar s;
+    s.data = (data + start);
+    s.length = (end - start);
+    return s;
+}
+static unsigned char* Span_uchar_at(Span_uchar s, size_t i){
+    assert((i < s.length));
+    return (s.data + i);
+}
+static Span_uchar Span_uchar_subspan(Span_uchar s, size_t start, size_t end){
+    return Span_uchar_slice(s.data, s.length, start, end);
+}
+static Span_uchar Span_uchar_suffix(Span_uchar s, size_t start){
+    return Span_uchar_slice(s.data, s.length, start, s.length);
+}
+#endif
+long long sum_numbers(Span_uchar file){
+    long long total = 0;
+    int x = 0;
+    for (size_t i = 0, lang_i_stop = file.length; i < lang_i_stop; i++) {
+        unsigned char c = (*Span_uchar_at(file, i));
+        if ((c == '\n')) {
+            total = (total + x);
+            x = 0;
+        }
+        else {
+            x = ((x * 10) + (c - '0'));
+        }
+    }
+    return total;
+}
+int count_lines(char *path){
+    int fd = open(path, O_RDONLY);
+    char buf[4096];
+    int lines = 0;
+    long long n = read(fd, buf, 4096);
+    while ((n > 0)) {
+        for (long long i = 0, lang_i_stop = n; i < lang_i_stop; i++) {
+            if ((buf[i] == '\n')) {
+                lines++;
+            }
+        }
+        n = read(fd, buf, 4096);
+    }
+    close(fd);
+    return lines;
+}
+#ifndef _LANG_SPEC_lang_io
+#define _LANG_SPEC_lang_io
+static Span_uchar map_file(char *path){
+    size_t length;
+    unsigned char *data = lang_map_file(path, &(length));
+    return Span_uchar_slice(data, ((size_t)-1), 0, length);
+}
+static void unmap_file(Span_uchar file){
+    lang_unmap_file(file.data, file.length);
+}
+#endif
+int main(int argc, char **argv){
+    char path[12] = "numbers.txt";
+    write_numbers(path, 100000);
+    Span_uchar file = map_file(path);
+    if (!file.data) {
+        fputs("could not map the file\n", stderr);
+        return 1;
+    }
+    printf("%d lines, %lld bytes, sum %lld\n", count_lines(path), ((long long)file.length), sum_numbers(file));
+    unmap_file(file);
+    return 0;
+}
\ No newline at end of file
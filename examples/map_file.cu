@@ -0,0 +1,63 @@
+# Bulk IO instead of reading one token at a time. The file is written in
+# large blocks through a big stdio buffer, then mapped into memory and
+# scanned in place without copying it.
+
+def write_numbers(path: char*, n: int) -> void:
+    f = fopen(path, "w")
+    setvbuf(f, NULL, _IOFBF, 1 << 16)
+    line: char[16]
+    for i in range(n):
+        # Write each number backwards then reverse it into line
+        x = i
+        digits: char[16]
+        len = 0
+        dowhile x:
+            digits[len++] = <char>('0' + x % 10)
+            x = x / 10
+        for j in range(len):
+            line[j] = digits[len - 1 - j]
+        line[len] = '\n'
+        fwrite(line, 1, len + 1, f)
+    fclose(f)
+
+
+def sum_numbers(file: Span<uchar>) -> long:
+    total: long = 0
+    x = 0
+    for i in range(file.length):
+        c = file[i]
+        if c == '\n':
+            total = total + x
+            x = 0
+        else:
+            x = x * 10 + (c - '0')
+    return total
+
+
+def count_lines(path: char*) -> int:
+    # Plain reads on a file descriptor in blocks
+    fd = open(path, O_RDONLY)
+    buf: char[4096]
+    lines = 0
+    n = read(fd, buf, 4096)
+    while n > 0:
+        for i in range(n):
+            if buf[i] == '\n':
+                lines++
+        n = read(fd, buf, 4096)
+    close(fd)
+    return lines
+
+
+def main(argc: int, argv: char**) -> int:
+    path = "numbers.txt"
+    write_numbers(path, 100000)
+
+    file = map_file(path)
+    if not file.data:
+        fputs("could not map the file\n", stderr)
+        return 1
+    printf("%d lines, %lld bytes, sum %lld\n", count_lines(path),
+           <long>file.length, sum_numbers(file))
+    unmap_file(file)
+    return 0
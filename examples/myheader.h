@@ -0,0 +1,3 @@
+#ifndef _MYHEADER_H
+#define _MYHEADER_H
+#endif
\ No newline at end of file
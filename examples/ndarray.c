@@ -0,0 +1,208 @@
+#include <stdio.h>
+#include <assert.h>
+#include <stdlib.h>
+#ifndef _LANG_SPEC_NDArray_float_2
+#define _LANG_SPEC_NDArray_float_2
+typedef struct NDArray_float_2 NDArray_float_2;
+struct NDArray_float_2 {float *data; size_t shape[2]; size_t strides[2];};
+static NDArray_float_2 NDArray_float_2_alloc(size_t *shape){
+    NDArray_float_2 a;
+    size_t n = 1;
+    int i = 2;
+    while ((i > 0)) {
+        i--;
+        a.shape[i] = shape[i];
+        a.strides[i] = n;
+        n = ((size_t)(n * shape[i]));
+    }
+    a.data = calloc(n, sizeof(a.data[0]));
+    return a;
+}
+static size_t NDArray_float_2_size(NDArray_float_2 a){
+    size_t n = 1;
+    int i = 0;
+    while ((i < 2)) {
+        n = ((size_t)(n * a.shape[i]));
+        i++;
+    }
+    return n;
+}
+static NDArray_float_2 NDArray_float_2_transpose(NDArray_float_2 a){
+    NDArray_float_2 t;
+    t.data = a.data;
+    int i = 0;
+    while ((i < 2)) {
+        t.shape[i] = a.shape[(1 - i)];
+        t.strides[i] = a.strides[(1 - i)];
+        i++;
+    }
+    return t;
+}
+static int NDArray_float_2_is_contiguous(NDArray_float_2 a){
+    size_t n = 1;
+    int i = 2;
+    while ((i > 0)) {
+        i--;
+        if (((a.shape[i] != 1) && (a.strides[i] != n))) {
+            return 0;
+        }
+        n = ((size_t)(n * a.shape[i]));
+    }
+    return 1;
+}
+static NDArray_float_2 NDArray_float_2_new(size_t d0, size_t d1){
+    size_t shape[2] = {d0, d1};
+    return NDArray_float_2_alloc(shape);
+}
+static float* NDArray_float_2_at(NDArray_float_2 a, size_t i0, size_t i1){
+    assert(((i0 < a.shape[0]) && (i1 < a.shape[1])));
+    return ((a.data + (i0 * a.strides[0])) + (i1 * a.strides[1]));
+}
+static NDArray_float_2 NDArray_float_2_view(NDArray_float_2 a, size_t start0, size_t end0, size_t start1, size_t end1){
+    if ((end0 == ((size_t)-1))) {
+        end0 = a.shape[0];
+    }
+    if ((end1 == ((size_t)-1))) {
+        end1 = a.shape[1];
+    }
+    assert((((start0 <= end0) && (end0 <= a.shape[0])) && ((start1 <= end1) && (end1 <= a.shape[1]))));
+    NDArray_float_2 v;
+    v.data = ((a.data + (start0 * a.strides[0])) + (start1 * a.strides[1]));
+    v.shape[0] = (end0 - start0);
+    v.strides[0] = a.strides[0];
+    v.shape[1] = (end1 - start1);
+    v.strides[1] = a.strides[1];
+    return v;
+}
+static void NDArray_float_2_free(NDArray_float_2 a){
+    free(a.data);
+}
+#endif
+int blur(NDArray_float_2 src, NDArray_float_2 dst){
+    size_t h = src.shape[0];
+    size_t w = src.shape[1];
+    int i = 1;
+    while ((i < (h - 1))) {
+        int j = 1;
+        while ((j < (w - 1))) {
+            (*NDArray_float_2_at(dst, i, j)) = ((((((*NDArray_float_2_at(src, i, j)) + (*NDArray_float_2_at(src, (i - 1), j))) + (*NDArray_float_2_at(src, (i + 1), j))) + (*NDArray_float_2_at(src, i, (j - 1)))) + (*NDArray_float_2_at(src, i, (j + 1)))) / 5);
+            j++;
+        }
+        i++;
+    }
+}
+float total(NDArray_float_2 a){
+    float t = 0.0;
+    int i = 0;
+    while ((i < a.shape[0])) {
+        int j = 0;
+        while ((j < a.shape[1])) {
+            t = (t + (*NDArray_float_2_at(a, i, j)));
+            j++;
+        }
+        i++;
+    }
+    return t;
+}
+#ifndef _LANG_SPEC_NDArray_int_3
+#define _LANG_SPEC_NDArray_int_3
+typedef struct NDArray_int_3 NDArray_int_3;
+struct NDArray_int_3 {int *data; size_t shape[3]; size_t strides[3];};
+static NDArray_int_3 NDArray_int_3_alloc(size_t *shape){
+    NDArray_int_3 a;
+    size_t n = 1;
+    int i = 3;
+    while ((i > 0)) {
+        i--;
+        a.shape[i] = shape[i];
+        a.strides[i] = n;
+        n = ((size_t)(n * shape[i]));
+    }
+    a.data = calloc(n, sizeof(a.data[0]));
+    return a;
+}
+static size_t NDArray_int_3_size(NDArray_int_3 a){
+    size_t n = 1;
+    int i = 0;
+    while ((i < 3)) {
+        n = ((size_t)(n * a.shape[i]));
+        i++;
+    }
+    return n;
+}
+static NDArray_int_3 NDArray_int_3_transpose(NDArray_int_3 a){
+    NDArray_int_3 t;
+    t.data = a.data;
+    int i = 0;
+    while ((i < 3)) {
+        t.shape[i] = a.shape[(2 - i)];
+        t.strides[i] = a.strides[(2 - i)];
+        i++;
+    }
+    return t;
+}
+static int NDArray_int_3_is_contiguous(NDArray_int_3 a){
+    size_t n = 1;
+    int i = 3;
+    while ((i > 0)) {
+        i--;
+        if (((a.shape[i] != 1) && (a.strides[i] != n))) {
+            return 0;
+        }
+        n = ((size_t)(n * a.shape[i]));
+    }
+    return 1;
+}
+static NDArray_int_3 NDArray_int_3_new(size_t d0, size_t d1, size_t d2){
+    size_t shape[3] = {d0, d1, d2};
+    return NDArray_int_3_alloc(shape);
+}
+static int* NDArray_int_3_at(NDArray_int_3 a, size_t i0, size_t i1, size_t i2){
+    assert((((i0 < a.shape[0]) && (i1 < a.shape[1])) && (i2 < a.shape[2])));
+    return (((a.data + (i0 * a.strides[0])) + (i1 * a.strides[1])) + (i2 * a.strides[2]));
+}
+static NDArray_int_3 NDArray_int_3_view(NDArray_int_3 a, size_t start0, size_t end0, size_t start1, size_t end1, size_t start2, size_t end2){
+    if ((end0 == ((size_t)-1))) {
+        end0 = a.shape[0];
+    }
+    if ((end1 == ((size_t)-1))) {
+        end1 = a.shape[1];
+    }
+    if ((end2 == ((size_t)-1))) {
+        end2 = a.shape[2];
+    }
+    assert(((((start0 <= end0) && (end0 <= a.shape[0])) && ((start1 <= end1) && (end1 <= a.shape[1]))) && ((start2 <= end2) && (end2 <= a.shape[2]))));
+    NDArray_int_3 v;
+    v.data = (((a.data + (start0 * a.strides[0])) + (start1 * a.strides[1])) + (start2 * a.strides[2]));
+    v.shape[0] = (end0 - start0);
+    v.strides[0] = a.strides[0];
+    v.shape[1] = (end1 - start1);
+    v.strides[1] = a.strides[1];
+    v.shape[2] = (end2 - start2);
+    v.strides[2] = a.strides[2];
+    return v;
+}
+static void NDArray_int_3_free(NDArray_int_3 a){
+    free(a.data);
+}
+#endif
+int main(){
+    NDArray_float_2 img = NDArray_float_2_new(4, 6);
+    NDArray_float_2 out = NDArray_float_2_new(4, 6);
+    (*NDArray_float_2_at(img, 1, 2)) = 10.0;
+    (*NDArray_float_2_at(img, 2, 3)) = 5.0;
+    blur(img, out);
+    printf("%g %g %g\n", (*NDArray_float_2_at(out, 1, 2)), (*NDArray_float_2_at(out, 2, 2)), total(out));
+    NDArray_float_2 t = NDArray_float_2_transpose(img);
+    (*NDArray_float_2_at(t, 5, 0)) = 1.0;
+    printf("%g %d %d\n", (*NDArray_float_2_at(img, 0, 5)), ((int)t.shape[0]), NDArray_float_2_is_contiguous(t));
+    NDArray_float_2 center = NDArray_float_2_view(img, 1, 3, 2, ((size_t)-1));
+    printf("%g %d %d\n", total(center), ((int)center.shape[1]), ((int)NDArray_float_2_size(center)));
+    NDArray_float_2_free(img);
+    NDArray_float_2_free(out);
+    NDArray_int_3 cube = NDArray_int_3_new(2, 3, 4);
+    (*NDArray_int_3_at(cube, 1, 2, 3)) = 7;
+    printf("%d %d\n", cube.data[23], ((int)cube.strides[0]));
+    NDArray_int_3_free(cube);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,58 @@
+# NDArrays store all their elements in one allocation and index them with
+# offset arithmetic instead of going through an array of row pointers.
+# Transposing and slicing make views that share the elements.
+
+def blur(src: NDArray<float, 2>, dst: NDArray<float, 2>):
+    # Average of each pixel and its 4 neighbors, skipping the border
+    h = src.shape[0]
+    w = src.shape[1]
+    i = 1
+    while i < h - 1:
+        j = 1
+        while j < w - 1:
+            dst[i, j] = (src[i, j] + src[i - 1, j] + src[i + 1, j] +
+                         src[i, j - 1] + src[i, j + 1]) / 5
+            j++
+        i++
+
+
+def total(a: NDArray<float, 2>) -> float:
+    t = 0.0
+    i = 0
+    while i < a.shape[0]:
+        j = 0
+        while j < a.shape[1]:
+            t = t + a[i, j]
+            j++
+        i++
+    return t
+
+
+def main():
+    img: NDArray<float, 2> = NDArray_float_2_new(4, 6)
+    out: NDArray<float, 2> = NDArray_float_2_new(4, 6)
+    img[1, 2] = 10.0
+    img[2, 3] = 5.0
+    blur(img, out)
+    printf("%g %g %g\n", out[1, 2], out[2, 2], total(out))
+
+    # The transpose is a view of the same elements
+    t = NDArray_float_2_transpose(img)
+    t[5, 0] = 1.0
+    printf("%g %d %d\n", img[0, 5], <int>t.shape[0],
+           NDArray_float_2_is_contiguous(t))
+
+    # So are slices
+    center = img[1:3, 2:]
+    printf("%g %d %d\n", total(center), <int>center.shape[1],
+           <int>NDArray_float_2_size(center))
+
+    NDArray_float_2_free(img)
+    NDArray_float_2_free(out)
+
+    # Arrays of other ranks
+    cube: NDArray<int, 3> = NDArray_int_3_new(2, 3, 4)
+    cube[1, 2, 3] = 7
+    printf("%d %d\n", cube.data[23], <int>cube.strides[0])
+    NDArray_int_3_free(cube)
+    return 0
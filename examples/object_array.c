@@ -0,0 +1,94 @@
+#include <stdio.h>
+#include <lang_arena.h>
+#include <stdlib.h>
+typedef struct Particle Particle;
+struct Particle {int x; int v; int (*__init__)(Particle*, int); int (*step)(Particle*); int (*__del__)(Particle*);};
+int Particle___init__(Particle *self, int v){
+    self->x = 0;
+    self->v = v;
+}
+int Particle_step(Particle *self){
+    self->x = (self->x + self->v);
+}
+int Particle___del__(Particle *self){
+    self->v = 0;
+}
+Particle* init_Particle(Particle *obj, int v){
+    obj->__init__ = Particle___init__;
+    obj->step = Particle_step;
+    obj->__del__ = Particle___del__;
+    Particle___init__(obj, v);
+    return obj;
+}
+Particle* new_Particle(int v){
+    return init_Particle(((Particle*)malloc(sizeof(Particle))), v);
+}
+void del_Particle(Particle *self){
+    Particle___del__(self);
+    free(self);
+}
+Particle* init_Particle_array(Particle *lang_objs, size_t lang_count, int v){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Particle((lang_objs + lang_idx), v);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+Particle* new_Particle_array(size_t lang_count, int v){
+    return init_Particle_array(((Particle*)malloc((sizeof(Particle) * lang_count))), lang_count, v);
+}
+void fini_Particle_array(Particle *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        Particle___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+void del_Particle_array(Particle *lang_objs, size_t lang_count){
+    fini_Particle_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+int simulate(int n, int steps){
+    Particle *particles = new_Particle_array(n, 3);
+    int i = 0;
+    while ((i < n)) {
+        particles[i].v = (particles[i].v + i);
+        i++;
+    }
+    int s = 0;
+    while ((s < steps)) {
+        i = 0;
+        while ((i < n)) {
+            particles[i].step(&(particles[i]));
+            i++;
+        }
+        s++;
+    }
+    int total = 0;
+    i = 0;
+    while ((i < n)) {
+        total = (total + particles[i].x);
+        i++;
+    }
+    del_Particle_array(particles, n);
+    return total;
+}
+int arena_sum(int n){
+    int total = 0;
+    {
+        Arena *__arena_0 __attribute__((cleanup(arena_cleanup))) = arena_new(1024);
+        Particle *particles = init_Particle_array(((Particle*)arena_alloc(__arena_0, (sizeof(Particle) * n))), n, 1);
+        int i = 0;
+        while ((i < n)) {
+            total = (total + particles[i].v);
+            i++;
+        }
+    }
+    return total;
+}
+int main(){
+    printf("%d\n", simulate(10, 5));
+    printf("%d\n", arena_sum(8));
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,61 @@
+# Particles are allocated contiguously in one block instead of as an array of
+# pointers to individually allocated objects, so iterating over them walks
+# memory linearly.
+
+class Particle:
+    x: int
+    v: int
+
+    def __init__(self: Particle*, v: int):
+        self->x = 0
+        self->v = v
+
+    def step(self: Particle*):
+        self->x = self->x + self->v
+
+    def __del__(self: Particle*):
+        self->v = 0
+
+
+def simulate(n: int, steps: int) -> int:
+    particles = new_Particle_array(n, 3)
+
+    i = 0
+    while i < n:
+        # Elements are accessed by value
+        particles[i].v = particles[i].v + i
+        i++
+
+    s = 0
+    while s < steps:
+        i = 0
+        while i < n:
+            particles[i].step()
+            i++
+        s++
+
+    total = 0
+    i = 0
+    while i < n:
+        total = total + particles[i].x
+        i++
+
+    del_Particle_array(particles, n)
+    return total
+
+
+def arena_sum(n: int) -> int:
+    total = 0
+    with arena(1024):
+        particles = new_Particle_array(n, 1)
+        i = 0
+        while i < n:
+            total = total + particles[i].v
+            i++
+    return total
+
+
+def main():
+    printf("%d\n", simulate(10, 5))
+    printf("%d\n", arena_sum(8))
+    return 0
@@ -0,0 +1,39 @@
+#include <stdio.h>
+#include <stdlib.h>
+int fill(double *a, int n){
+    {
+        int lang_i_stop = n;
+        #pragma omp parallel for
+        for (int i = 0; i < lang_i_stop; i++) {
+            double x = ((double)i);
+            a[i] = (x * x);
+        }
+    }
+}
+int stats(double *a, int n, int *flags){
+    double total = 0.0;
+    int odd = 0;
+    int bits = 0;
+    {
+        int lang_i_stop = n;
+        #pragma omp parallel for reduction(+:odd, total) reduction(|:bits)
+        for (int i = 0; i < lang_i_stop; i++) {
+            total = (total + a[i]);
+            if ((i % 2)) {
+                odd++;
+            }
+            bits = (bits | flags[i]);
+        }
+    }
+    printf("%.0f %d %d\n", total, odd, bits);
+}
+int main(){
+    int n = 1000;
+    double a[1000];
+    int flags[1000];
+    for (int i = 0, lang_i_stop = n; i < lang_i_stop; i++) {
+        flags[i] = (1 << (i % 5));
+    }
+    fill(a, n);
+    stats(a, n, flags);
+}
\ No newline at end of file
@@ -0,0 +1,33 @@
+# The iterations of a @parallel loop are split between threads with OpenMP.
+# Variables declared outside the loop are shared by the threads, so they can
+# only be updated as reductions, which each thread computes separately
+# before they are combined.
+
+def fill(a: double*, n: int):
+    @parallel
+    for i in range(n):
+        x = <double>i
+        a[i] = x * x
+
+
+def stats(a: double*, n: int, flags: int*):
+    total: double = 0.0
+    odd = 0
+    bits = 0
+    @parallel
+    for i in range(n):
+        total = total + a[i]
+        if i % 2:
+            odd++
+        bits = bits | flags[i]
+    printf("%.0f %d %d\n", total, odd, bits)
+
+
+def main():
+    n = 1000
+    a: double[1000]
+    flags: int[1000]
+    for i in range(n):
+        flags[i] = 1 << (i % 5)
+    fill(a, n)
+    stats(a, n, flags)
@@ -0,0 +1,53 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <lang_simd.h>
+float dot(float *a, float *b, int n){
+    float32x4 acc = float32x4_splat(0.0);
+    int i = 0;
+    while (((i + 4) <= n)) {
+        acc = (acc + (float32x4_load((a + i)) * float32x4_load((b + i))));
+        i = (i + 4);
+    }
+    float total = float32x4_sum(acc);
+    while ((i < n)) {
+        total = (total + (a[i] * b[i]));
+        i++;
+    }
+    return total;
+}
+int clamp(unsigned char *pixels, int n, unsigned char limit){
+    uint8x16 lim = uint8x16_splat(limit);
+    int i = 0;
+    while (((i + 16) <= n)) {
+        uint8x16 v = uint8x16_load((pixels + i));
+        int8x16 over = (v > lim);
+        v = ((v & ~((uint8x16)over)) | (lim & ((uint8x16)over)));
+        uint8x16_store((pixels + i), v);
+        i = (i + 16);
+    }
+}
+int main(){
+    float a[10];
+    float b[10];
+    int i = 0;
+    while ((i < 10)) {
+        a[i] = ((float)i);
+        b[i] = 2.0;
+        i++;
+    }
+    printf("%g\n", dot(a, b, 10));
+    int32x4 v = {1, 2, 3, 4};
+    int32x4 w = ((v * 10) + 1);
+    int32x4 reverse = {3, 2, 1, 0};
+    int32x4 r = int32x4_shuffle(w, reverse);
+    printf("%d %d %d %d\n", r[0], r[1], r[2], r[3]);
+    unsigned char pixels[32];
+    i = 0;
+    while ((i < 32)) {
+        pixels[i] = (i * 8);
+        i++;
+    }
+    clamp(pixels, 32, 100);
+    printf("%d %d %d\n", pixels[10], pixels[13], pixels[31]);
+    return 0;
+}
\ No newline at end of file
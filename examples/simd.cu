@@ -0,0 +1,53 @@
+# SIMD vectors hold several numbers that are operated on at once. They are
+# loaded from and stored to arrays explicitly instead of relying on gcc to
+# vectorize a loop.
+
+def dot(a: float*, b: float*, n: int) -> float:
+    acc = float32x4_splat(0.0)
+    i = 0
+    while i + 4 <= n:
+        acc = acc + float32x4_load(a + i) * float32x4_load(b + i)
+        i = i + 4
+    total = float32x4_sum(acc)
+    while i < n:
+        total = total + a[i] * b[i]
+        i++
+    return total
+
+
+def clamp(pixels: uchar*, n: int, limit: uchar):
+    # Comparisons give -1 in the lanes where they are true
+    lim = uint8x16_splat(limit)
+    i = 0
+    while i + 16 <= n:
+        v = uint8x16_load(pixels + i)
+        over = v > lim
+        v = (v & ~<uint8x16>over) | (lim & <uint8x16>over)
+        uint8x16_store(pixels + i, v)
+        i = i + 16
+
+
+def main():
+    a: float[10]
+    b: float[10]
+    i = 0
+    while i < 10:
+        a[i] = <float>i
+        b[i] = 2.0
+        i++
+    printf("%g\n", dot(a, b, 10))
+
+    v: int32x4 = [1, 2, 3, 4]
+    w = v * 10 + 1
+    reverse: int32x4 = [3, 2, 1, 0]
+    r = int32x4_shuffle(w, reverse)
+    printf("%d %d %d %d\n", r[0], r[1], r[2], r[3])
+
+    pixels: uchar[32]
+    i = 0
+    while i < 32:
+        pixels[i] = i * 8
+        i++
+    clamp(pixels, 32, 100)
+    printf("%d %d %d\n", pixels[10], pixels[13], pixels[31])
+    return 0
@@ -0,0 +1,43 @@
+#include <stdio.h>
+#include <stdlib.h>
+#define N 1000
+typedef struct Particle Particle;
+struct Particle {float x; float y; float vx; float vy; int id;};
+typedef struct Particle_soa0 Particle_soa0;
+struct Particle_soa0 {float x[1000]; float y[1000]; float vx[1000]; float vy[1000]; int id[1000];};
+Particle_soa0 particles;
+int step(float dt){
+    int i = 0;
+    while ((i < 1000)) {
+        particles.x[i] = (particles.x[i] + (particles.vx[i] * dt));
+        particles.y[i] = (particles.y[i] + (particles.vy[i] * dt));
+        i++;
+    }
+}
+int main(){
+    int i = 0;
+    while ((i < 1000)) {
+        particles.x[i] = 0.0;
+        particles.y[i] = 0.0;
+        particles.vx[i] = 1.0;
+        particles.vy[i] = 2.0;
+        particles.id[i] = i;
+        i++;
+    }
+    int s = 0;
+    while ((s < 10)) {
+        step(0.5);
+        s++;
+    }
+    float *xs = particles.x;
+    float sum_x = 0.0;
+    float sum_y = 0.0;
+    i = 0;
+    while ((i < 1000)) {
+        sum_x = (sum_x + xs[i]);
+        sum_y = (sum_y + particles.y[i]);
+        i++;
+    }
+    printf("%d %d %d\n", ((int)sum_x), ((int)sum_y), particles.id[999]);
+    return 0;
+}
\ No newline at end of file
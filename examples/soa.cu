@@ -0,0 +1,52 @@
+# The particles are stored as one array per member instead of an array of
+# structs, so the loops below that only touch the positions read contiguous
+# memory and can be vectorized.
+
+define N 1000
+
+struct Particle {
+    x: float,
+    y: float,
+    vx: float,
+    vy: float,
+    id: int,
+}
+
+@soa particles: Particle[N]
+
+
+def step(dt: float):
+    i = 0
+    while i < N:
+        particles[i].x = particles[i].x + particles[i].vx * dt
+        particles[i].y = particles[i].y + particles[i].vy * dt
+        i++
+
+
+def main():
+    i = 0
+    while i < N:
+        particles[i].x = 0.0
+        particles[i].y = 0.0
+        particles[i].vx = 1.0
+        particles[i].vy = 2.0
+        particles[i].id = i
+        i++
+
+    s = 0
+    while s < 10:
+        step(0.5)
+        s++
+
+    # A single member can also be used as an array
+    xs = particles.x
+
+    sum_x = 0.0
+    sum_y = 0.0
+    i = 0
+    while i < N:
+        sum_x = sum_x + xs[i]
+        sum_y = sum_y + particles[i].y
+        i++
+    printf("%d %d %d\n", <int>sum_x, <int>sum_y, particles[N - 1].id)
+    return 0
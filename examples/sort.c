@@ -0,0 +1,645 @@
+#include <stdio.h>
+#include <assert.h>
+#include <stdlib.h>
+typedef struct Point Point;
+struct Point {int x; int y;};
+int by_y(Point *p){
+    return p->y;
+}
+int descending(int a, int b){
+    return (a > b);
+}
+#ifndef _LANG_SPEC_Span_int
+#define _LANG_SPEC_Span_int
+typedef struct Span_int Span_int;
+struct Span_int {int *data; size_t length;};
+static Span_int Span_int_slice(int *data, size_t length, size_t start, size_t end){
+    assert(((start <= end) && (end <= length)));
+    Span_int s;
+    s.data = (data + start);
+    s.length = (end - start);
+    return s;
+}
+static int* Span_int_at(Span_int s, size_t i){
+    assert((i < s.length));
+    return (s.data + i);
+}
+static Span_int Span_int_subspan(Span_int s, size_t start, size_t end){
+    return Span_int_slice(s.data, s.length, start, end);
+}
+static Span_int Span_int_suffix(Span_int s, size_t start){
+    return Span_int_slice(s.data, s.length, start, s.length);
+}
+#endif
+#ifndef _LANG_SPEC_lang_sort_int
+#define _LANG_SPEC_lang_sort_int
+static int lang_less_int(int *a, int *b){
+    return ((*a) < (*b));
+}
+static void lang_swap_int(int *a, int *b){
+    int tmp = (*a);
+    (*a) = (*b);
+    (*b) = tmp;
+}
+static void lang_insertion_sort_int(int *arr, size_t lo, size_t hi){
+    size_t i = (lo + 1);
+    while ((i < hi)) {
+        int x = (*(arr + i));
+        size_t j = i;
+        while (((j > lo) && lang_less_int(&(x), ((arr + j) - 1)))) {
+            (*(arr + j)) = (*((arr + j) - 1));
+            j--;
+        }
+        (*(arr + j)) = x;
+        i++;
+    }
+}
+static void lang_sift_down_int(int *arr, size_t root, size_t n){
+    while (1) {
+        size_t child = ((root * 2) + 1);
+        if ((child >= n)) {
+            break;
+        }
+        if ((((child + 1) < n) && lang_less_int((arr + child), ((arr + child) + 1)))) {
+            child++;
+        }
+        if (!lang_less_int((arr + root), (arr + child))) {
+            break;
+        }
+        lang_swap_int((arr + root), (arr + child));
+        root = child;
+    }
+}
+static void lang_heap_sort_int(int *arr, size_t n){
+    size_t i = (n / 2);
+    while ((i > 0)) {
+        i--;
+        lang_sift_down_int(arr, i, n);
+    }
+    while ((n > 1)) {
+        n--;
+        lang_swap_int(arr, (arr + n));
+        lang_sift_down_int(arr, 0, n);
+    }
+}
+static size_t lang_partition_int(int *arr, size_t lo, size_t hi){
+    size_t mid = (lo + ((hi - lo) / 2));
+    size_t last = (hi - 1);
+    if (lang_less_int((arr + mid), (arr + lo))) {
+        lang_swap_int((arr + mid), (arr + lo));
+    }
+    if (lang_less_int((arr + last), (arr + mid))) {
+        lang_swap_int((arr + last), (arr + mid));
+        if (lang_less_int((arr + mid), (arr + lo))) {
+            lang_swap_int((arr + mid), (arr + lo));
+        }
+    }
+    lang_swap_int((arr + lo), (arr + mid));
+    size_t i = lo;
+    size_t j = hi;
+    while (1) {
+        i++;
+        while (lang_less_int((arr + i), (arr + lo))) {
+            i++;
+        }
+        j--;
+        while (lang_less_int((arr + lo), (arr + j))) {
+            j--;
+        }
+        if ((i >= j)) {
+            break;
+        }
+        lang_swap_int((arr + i), (arr + j));
+    }
+    lang_swap_int((arr + lo), (arr + j));
+    return j;
+}
+static void lang_intro_sort_int(int *arr, size_t lo, size_t hi, int depth){
+    while (((hi - lo) > 16)) {
+        if ((depth == 0)) {
+            lang_heap_sort_int((arr + lo), (hi - lo));
+            hi = lo;
+        }
+        else {
+            depth--;
+            size_t p = lang_partition_int(arr, lo, hi);
+            if (((p - lo) < (hi - p))) {
+                lang_intro_sort_int(arr, lo, p, depth);
+                lo = ((size_t)(p + 1));
+            }
+            else {
+                lang_intro_sort_int(arr, (p + 1), hi, depth);
+                hi = p;
+            }
+        }
+    }
+    lang_insertion_sort_int(arr, lo, hi);
+}
+static void lang_sort_int(int *arr, size_t n){
+    int depth = 0;
+    size_t m = n;
+    while ((m > 1)) {
+        depth = (depth + 2);
+        m = ((size_t)(m / 2));
+    }
+    lang_intro_sort_int(arr, 0, n, depth);
+}
+static size_t lang_bisect_left_int(int *arr, size_t n, int x){
+    size_t lo = 0;
+    size_t hi = n;
+    while ((lo < hi)) {
+        size_t mid = (lo + ((hi - lo) / 2));
+        if (lang_less_int((arr + mid), &(x))) {
+            lo = ((size_t)(mid + 1));
+        }
+        else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+static size_t lang_bisect_right_int(int *arr, size_t n, int x){
+    size_t lo = 0;
+    size_t hi = n;
+    while ((lo < hi)) {
+        size_t mid = (lo + ((hi - lo) / 2));
+        if (lang_less_int(&(x), (arr + mid))) {
+            hi = mid;
+        }
+        else {
+            lo = ((size_t)(mid + 1));
+        }
+    }
+    return lo;
+}
+static void lang_sort_span_int(Span_int s){
+    lang_sort_int(s.data, s.length);
+}
+static size_t lang_bisect_left_span_int(Span_int s, int x){
+    return lang_bisect_left_int(s.data, s.length, x);
+}
+static size_t lang_bisect_right_span_int(Span_int s, int x){
+    return lang_bisect_right_int(s.data, s.length, x);
+}
+#endif
+#ifndef _LANG_SPEC_lang_sort_int_by_descending
+#define _LANG_SPEC_lang_sort_int_by_descending
+static int lang_less_int_by_descending(int *a, int *b){
+    return descending((*a), (*b));
+}
+static void lang_swap_int_by_descending(int *a, int *b){
+    int tmp = (*a);
+    (*a) = (*b);
+    (*b) = tmp;
+}
+static void lang_insertion_sort_int_by_descending(int *arr, size_t lo, size_t hi){
+    size_t i = (lo + 1);
+    while ((i < hi)) {
+        int x = (*(arr + i));
+        size_t j = i;
+        while (((j > lo) && lang_less_int_by_descending(&(x), ((arr + j) - 1)))) {
+            (*(arr + j)) = (*((arr + j) - 1));
+            j--;
+        }
+        (*(arr + j)) = x;
+        i++;
+    }
+}
+static void lang_sift_down_int_by_descending(int *arr, size_t root, size_t n){
+    while (1) {
+        size_t child = ((root * 2) + 1);
+        if ((child >= n)) {
+            break;
+        }
+        if ((((child + 1) < n) && lang_less_int_by_descending((arr + child), ((arr + child) + 1)))) {
+            child++;
+        }
+        if (!lang_less_int_by_descending((arr + root), (arr + child))) {
+            break;
+        }
+        lang_swap_int_by_descending((arr + root), (arr + child));
+        root = child;
+    }
+}
+static void lang_heap_sort_int_by_descending(int *arr, size_t n){
+    size_t i = (n / 2);
+    while ((i > 0)) {
+        i--;
+        lang_sift_down_int_by_descending(arr, i, n);
+    }
+    while ((n > 1)) {
+        n--;
+        lang_swap_int_by_descending(arr, (arr + n));
+        lang_sift_down_int_by_descending(arr, 0, n);
+    }
+}
+static size_t lang_partition_int_by_descending(int *arr, size_t lo, size_t hi){
+    size_t mid = (lo + ((hi - lo) / 2));
+    size_t last = (hi - 1);
+    if (lang_less_int_by_descending((arr + mid), (arr + lo))) {
+        lang_swap_int_by_descending((arr + mid), (arr + lo));
+    }
+    if (lang_less_int_by_descending((arr + last), (arr + mid))) {
+        lang_swap_int_by_descending((arr + last), (arr + mid));
+        if (lang_less_int_by_descending((arr + mid), (arr + lo))) {
+            lang_swap_int_by_descending((arr + mid), (arr + lo));
+        }
+    }
+    lang_swap_int_by_descending((arr + lo), (arr + mid));
+    size_t i = lo;
+    size_t j = hi;
+    while (1) {
+        i++;
+        while (lang_less_int_by_descending((arr + i), (arr + lo))) {
+            i++;
+        }
+        j--;
+        while (lang_less_int_by_descending((arr + lo), (arr + j))) {
+            j--;
+        }
+        if ((i >= j)) {
+            break;
+        }
+        lang_swap_int_by_descending((arr + i), (arr + j));
+    }
+    lang_swap_int_by_descending((arr + lo), (arr + j));
+    return j;
+}
+static void lang_intro_sort_int_by_descending(int *arr, size_t lo, size_t hi, int depth){
+    while (((hi - lo) > 16)) {
+        if ((depth == 0)) {
+            lang_heap_sort_int_by_descending((arr + lo), (hi - lo));
+            hi = lo;
+        }
+        else {
+            depth--;
+            size_t p = lang_partition_int_by_descending(arr, lo, hi);
+            if (((p - lo) < (hi - p))) {
+                lang_intro_sort_int_by_descending(arr, lo, p, depth);
+                lo = ((size_t)(p + 1));
+            }
+            else {
+                lang_intro_sort_int_by_descending(arr, (p + 1), hi, depth);
+                hi = p;
+            }
+        }
+    }
+    lang_insertion_sort_int_by_descending(arr, lo, hi);
+}
+static void lang_sort_int_by_descending(int *arr, size_t n){
+    int depth = 0;
+    size_t m = n;
+    while ((m > 1)) {
+        depth = (depth + 2);
+        m = ((size_t)(m / 2));
+    }
+    lang_intro_sort_int_by_descending(arr, 0, n, depth);
+}
+static size_t lang_bisect_left_int_by_descending(int *arr, size_t n, int x){
+    size_t lo = 0;
+    size_t hi = n;
+    while ((lo < hi)) {
+        size_t mid = (lo + ((hi - lo) / 2));
+        if (lang_less_int_by_descending((arr + mid), &(x))) {
+            lo = ((size_t)(mid + 1));
+        }
+        else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+static size_t lang_bisect_right_int_by_descending(int *arr, size_t n, int x){
+    size_t lo = 0;
+    size_t hi = n;
+    while ((lo < hi)) {
+        size_t mid = (lo + ((hi - lo) / 2));
+        if (lang_less_int_by_descending(&(x), (arr + mid))) {
+            hi = mid;
+        }
+        else {
+            lo = ((size_t)(mid + 1));
+        }
+    }
+    return lo;
+}
+static void lang_sort_span_int_by_descending(Span_int s){
+    lang_sort_int_by_descending(s.data, s.length);
+}
+static size_t lang_bisect_left_span_int_by_descending(Span_int s, int x){
+    return lang_bisect_left_int_by_descending(s.data, s.length, x);
+}
+static size_t lang_bisect_right_span_int_by_descending(Span_int s, int x){
+    return lang_bisect_right_int_by_descending(s.data, s.length, x);
+}
+#endif
+#ifndef _LANG_SPEC_Span_Point
+#define _LANG_SPEC_Span_Point
+typedef struct Span_Point Span_Point;
+struct Span_Point {Point *data; size_t length;};
+static Span_Point Span_Point_slice(Point *data, size_t length, size_t start, size_t end){
+    assert(((start <= end) && (end <= length)));
+    Span_Point s;
+    s.data = (data + start);
+    s.length = (end - start);
+    return s;
+}
+static Point* Span_Point_at(Span_Point s, size_t i){
+    assert((i < s.length));
+    return (s.data + i);
+}
+static Span_Point Span_Point_subspan(Span_Point s, size_t start, size_t end){
+    return Span_Point_slice(s.data, s.length, start, end);
+}
+static Span_Point Span_Point_suffix(Span_Point s, size_t start){
+    return Span_Point_slice(s.data, s.length, start, s.length);
+}
+#endif
+#ifndef _LANG_SPEC_lang_sort_Point_by_by_y
+#define _LANG_SPEC_lang_sort_Point_by_by_y
+static int lang_less_Point_by_by_y(Point *a, Point *b){
+    return (by_y(a) < by_y(b));
+}
+static void lang_swap_Point_by_by_y(Point *a, Point *b){
+    Point tmp = (*a);
+    (*a) = (*b);
+    (*b) = tmp;
+}
+static void lang_insertion_sort_Point_by_by_y(Point *arr, size_t lo, size_t hi){
+    size_t i = (lo + 1);
+    while ((i < hi)) {
+        Point x = (*(arr + i));
+        size_t j = i;
+        while (((j > lo) && lang_less_Point_by_by_y(&(x), ((arr + j) - 1)))) {
+            (*(arr + j)) = (*((arr + j) - 1));
+            j--;
+        }
+        (*(arr + j)) = x;
+        i++;
+    }
+}
+static void lang_sift_down_Point_by_by_y(Point *arr, size_t root, size_t n){
+    while (1) {
+        size_t child = ((root * 2) + 1);
+        if ((child >= n)) {
+            break;
+        }
+        if ((((child + 1) < n) && lang_less_Point_by_by_y((arr + child), ((arr + child) + 1)))) {
+            child++;
+        }
+        if (!lang_less_Point_by_by_y((arr + root), (arr + child))) {
+            break;
+        }
+        lang_swap_Point_by_by_y((arr + root), (arr + child));
+        root = child;
+    }
+}
+static void lang_heap_sort_Point_by_by_y(Point *arr, size_t n){
+    size_t i = (n / 2);
+    while ((i > 0)) {
+        i--;
+        lang_sift_down_Point_by_by_y(arr, i, n);
+    }
+    while ((n > 1)) {
+        n--;
+        lang_swap_Point_by_by_y(arr, (arr + n));
+        lang_sift_down_Point_by_by_y(arr, 0, n);
+    }
+}
+static size_t lang_partition_Point_by_by_y(Point *arr, size_t lo, size_t hi){
+    size_t mid = (lo + ((hi - lo) / 2));
+    size_t last = (hi - 1);
+    if (lang_less_Point_by_by_y((arr + mid), (arr + lo))) {
+        lang_swap_Point_by_by_y((arr + mid), (arr + lo));
+    }
+    if (lang_less_Point_by_by_y((arr + last), (arr + mid))) {
+        lang_swap_Point_by_by_y((arr + last), (arr + mid));
+        if (lang_less_Point_by_by_y((arr + mid), (arr + lo))) {
+            lang_swap_Point_by_by_y((arr + mid), (arr + lo));
+        }
+    }
+    lang_swap_Point_by_by_y((arr + lo), (arr + mid));
+    size_t i = lo;
+    size_t j = hi;
+    while (1) {
+        i++;
+        while (lang_less_Point_by_by_y((arr + i), (arr + lo))) {
+            i++;
+        }
+        j--;
+        while (lang_less_Point_by_by_y((arr + lo), (arr + j))) {
+            j--;
+        }
+        if ((i >= j)) {
+            break;
+        }
+        lang_swap_Point_by_by_y((arr + i), (arr + j));
+    }
+    lang_swap_Point_by_by_y((arr + lo), (arr + j));
+    return j;
+}
+static void lang_intro_sort_Point_by_by_y(Point *arr, size_t lo, size_t hi, int depth){
+    while (((hi - lo) > 16)) {
+        if ((depth == 0)) {
+            lang_heap_sort_Point_by_by_y((arr + lo), (hi - lo));
+            hi = lo;
+        }
+        else {
+            depth--;
+            size_t p = lang_partition_Point_by_by_y(arr, lo, hi);
+            if (((p - lo) < (hi - p))) {
+                lang_intro_sort_Point_by_by_y(arr, lo, p, depth);
+                lo = ((size_t)(p + 1));
+            }
+            else {
+                lang_intro_sort_Point_by_by_y(arr, (p + 1), hi, depth);
+                hi = p;
+            }
+        }
+    }
+    lang_insertion_sort_Point_by_by_y(arr, lo, hi);
+}
+static void lang_sort_Point_by_by_y(Point *arr, size_t n){
+    int depth = 0;
+    size_t m = n;
+    while ((m > 1)) {
+        depth = (depth + 2);
+        m = ((size_t)(m / 2));
+    }
+    lang_intro_sort_Point_by_by_y(arr, 0, n, depth);
+}
+static size_t lang_bisect_left_Point_by_by_y(Point *arr, size_t n, Point x){
+    size_t lo = 0;
+    size_t hi = n;
+    while ((lo < hi)) {
+        size_t mid = (lo + ((hi - lo) / 2));
+        if (lang_less_Point_by_by_y((arr + mid), &(x))) {
+            lo = ((size_t)(mid + 1));
+        }
+        else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+static size_t lang_bisect_right_Point_by_by_y(Point *arr, size_t n, Point x){
+    size_t lo = 0;
+    size_t hi = n;
+    while ((lo < hi)) {
+        size_t mid = (lo + ((hi - lo) / 2));
+        if (lang_less_Point_by_by_y(&(x), (arr + mid))) {
+            hi = mid;
+        }
+        else {
+            lo = ((size_t)(mid + 1));
+        }
+    }
+    return lo;
+}
+static void lang_sort_span_Point_by_by_y(Span_Point s){
+    lang_sort_Point_by_by_y(s.data, s.length);
+}
+static size_t lang_bisect_left_span_Point_by_by_y(Span_Point s, Point x){
+    return lang_bisect_left_Point_by_by_y(s.data, s.length, x);
+}
+static size_t lang_bisect_right_span_Point_by_by_y(Span_Point s, Point x){
+    return lang_bisect_right_Point_by_by_y(s.data, s.length, x);
+}
+#endif
+#ifndef _LANG_SPEC_List_int
+#define _LANG_SPEC_List_int
+typedef struct List_int List_int;
+struct List_int {int *data; size_t length; size_t capacity; void (*__init__)(List_int*); void (*reserve)(List_int*, size_t); void (*shrink)(List_int*); void (*append)(List_int*, int); int (*pop)(List_int*); void (*clear)(List_int*); int* (*__getitem__)(List_int*, size_t); void (*__del__)(List_int*);};
+static void List_int___init__(List_int *self){
+    self->data = NULL;
+    self->length = 0;
+    self->capacity = 0;
+}
+static void List_int_reserve(List_int *self, size_t capacity){
+    if ((capacity > self->capacity)) {
+        self->data = ((int*)realloc(self->data, (sizeof(int) * capacity)));
+        self->capacity = capacity;
+    }
+}
+static void List_int_shrink(List_int *self){
+    if ((self->length == 0)) {
+        free(self->data);
+        self->data = NULL;
+    }
+    else if ((self->length < self->capacity)) {
+        self->data = ((int*)realloc(self->data, (sizeof(int) * self->length)));
+    }
+    self->capacity = self->length;
+}
+static void List_int_append(List_int *self, int x){
+    if ((self->length == self->capacity)) {
+        if (self->capacity) {
+            List_int_reserve(self, (self->capacity * 2));
+        }
+        else {
+            List_int_reserve(self, 8);
+        }
+    }
+    self->data[self->length] = x;
+    self->length++;
+}
+static int List_int_pop(List_int *self){
+    assert((self->length > 0));
+    self->length--;
+    return self->data[self->length];
+}
+static void List_int_clear(List_int *self){
+    self->length = 0;
+}
+static int* List_int___getitem__(List_int *self, size_t i){
+    assert((i < self->length));
+    return &(self->data[i]);
+}
+static void List_int___del__(List_int *self){
+    free(self->data);
+}
+static List_int* init_List_int(List_int *obj){
+    obj->__init__ = List_int___init__;
+    obj->reserve = List_int_reserve;
+    obj->shrink = List_int_shrink;
+    obj->append = List_int_append;
+    obj->pop = List_int_pop;
+    obj->clear = List_int_clear;
+    obj->__getitem__ = List_int___getitem__;
+    obj->__del__ = List_int___del__;
+    List_int___init__(obj);
+    return obj;
+}
+static List_int* new_List_int(){
+    return init_List_int(((List_int*)malloc(sizeof(List_int))));
+}
+static void del_List_int(List_int *self){
+    List_int___del__(self);
+    free(self);
+}
+static List_int* init_List_int_array(List_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_List_int((lang_objs + lang_idx));
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static List_int* new_List_int_array(size_t lang_count){
+    return init_List_int_array(((List_int*)malloc((sizeof(List_int) * lang_count))), lang_count);
+}
+static void fini_List_int_array(List_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        List_int___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_List_int_array(List_int *lang_objs, size_t lang_count){
+    fini_List_int_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+int main(){
+    int n = 100000;
+    int *nums = ((int*)malloc((sizeof(int) * n)));
+    unsigned int seed = 12345;
+    int i = 0;
+    while ((i < n)) {
+        seed = ((seed * 1103515245) + 12345);
+        nums[i] = ((int)(seed % 1000));
+        i++;
+    }
+    lang_sort_int(nums, n);
+    int is_sorted = 1;
+    i = 1;
+    while ((i < n)) {
+        if ((nums[(i - 1)] > nums[i])) {
+            is_sorted = 0;
+        }
+        i++;
+    }
+    size_t count_500 = (lang_bisect_right_int(nums, n, 500) - lang_bisect_left_int(nums, n, 500));
+    printf("%d %d %d\n", is_sorted, nums[(n - 1)], ((int)count_500));
+    lang_sort_int_by_descending(nums, n);
+    printf("%d %d\n", nums[0], nums[(n - 1)]);
+    Point points[4];
+    int ys[4] = {9, 3, 7, 1};
+    i = 0;
+    while ((i < 4)) {
+        points[i].x = (i + 1);
+        points[i].y = ys[i];
+        i++;
+    }
+    lang_sort_Point_by_by_y(points, 4);
+    printf("%d %d %d %d\n", points[0].x, points[1].x, points[2].x, points[3].x);
+    List_int *lst = new_List_int();
+    lst->append(lst, 5);
+    lst->append(lst, 2);
+    lst->append(lst, 9);
+    lang_sort_int(lst->data, lst->length);
+    printf("%d %d %d %d\n", (*List_int___getitem__(lst, 0)), (*List_int___getitem__(lst, 1)), (*List_int___getitem__(lst, 2)), ((int)lang_bisect_left_int(lst->data, lst->length, 9)));
+    del_List_int(lst);
+    free(nums);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,66 @@
+# sort() and bisect_left()/bisect_right() are specialized for the element type
+# and comparison, so the comparison is inlined instead of called through a
+# function pointer like with qsort.
+
+struct Point {
+    x: int,
+    y: int,
+}
+
+
+def by_y(p: Point*) -> int:
+    return p->y
+
+
+def descending(a: int, b: int) -> int:
+    return a > b
+
+
+def main():
+    n = 100000
+    nums = <int*>malloc(sizeof(int) * n)
+    seed: uint = 12345
+    i = 0
+    while i < n:
+        seed = seed * 1103515245 + 12345
+        nums[i] = <int>(seed % 1000)
+        i++
+
+    sort(nums, n)
+    is_sorted = 1
+    i = 1
+    while i < n:
+        if nums[i - 1] > nums[i]:
+            is_sorted = 0
+        i++
+
+    # The number of times 500 appears
+    count_500 = bisect_right(nums, n, 500) - bisect_left(nums, n, 500)
+    printf("%d %d %d\n", is_sorted, nums[n - 1], <int>count_500)
+
+    # A function taking 2 elements replaces <
+    sort(nums, n, descending)
+    printf("%d %d\n", nums[0], nums[n - 1])
+
+    # A function taking 1 element is a key to sort by
+    points: Point[4]
+    ys: int[4] = [9, 3, 7, 1]
+    i = 0
+    while i < 4:
+        points[i].x = i + 1
+        points[i].y = ys[i]
+        i++
+    sort(points, 4, by_y)
+    printf("%d %d %d %d\n", points[0].x, points[1].x, points[2].x, points[3].x)
+
+    # Lists carry their length
+    lst: List<int>* = new_List_int()
+    lst->append(5)
+    lst->append(2)
+    lst->append(9)
+    sort(lst)
+    printf("%d %d %d %d\n", (*lst)[0], (*lst)[1], (*lst)[2], <int>bisect_left(lst, 9))
+
+    del_List_int(lst)
+    free(nums)
+    return 0
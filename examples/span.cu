@@ -0,0 +1,37 @@
+# Slicing creates a Span, which points into the sliced elements instead of
+# copying them. Functions taking a Span work on arrays, Lists and parts of
+# them alike.
+
+def total(nums: Span<int>) -> int:
+    t = 0
+    i = 0
+    while i < nums.length:
+        t = t + nums[i]
+        i++
+    return t
+
+
+def main():
+    arr: int[6] = [1, 2, 3, 4, 5, 6]
+    printf("%d %d %d\n", total(arr), total(arr[2:]), total(arr[:2]))
+
+    # Pointers have no length, so the end of the slice must be given
+    p: int* = arr
+    middle = p[1:4]
+    middle[0] = 20
+    printf("%d %d %d\n", total(middle), arr[1], <int>middle.length)
+
+    # Slices of slices still point into arr
+    last = middle[1:][1:]
+    last[0] = 40
+    printf("%d %d\n", arr[3], <int>last.length)
+
+    lst: List<int>* = new_List_int()
+    lst->append(3)
+    lst->append(1)
+    lst->append(2)
+    sort(lst[1:])
+    printf("%d %d %d\n", total(lst), (*lst)[0], (*lst)[1])
+
+    del_List_int(lst)
+    return 0
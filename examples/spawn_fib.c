@@ -0,0 +1,49 @@
+#include <lang_tasks.h>
+#include <stdio.h>
+#include <stdlib.h>
+int serial_fib(int n){
+    if ((n < 2)) {
+        return n;
+    }
+    return (serial_fib((n - 1)) + serial_fib((n - 2)));
+}
+int fib(int arg0);
+typedef struct lang_future_fib lang_future_fib;
+struct lang_future_fib {
+    lang_task task;
+    int arg0;
+    int result;
+};
+static inline void lang_future_fib_run(lang_task *task) {
+    lang_future_fib *f = (lang_future_fib*)task;
+    f->result = fib(f->arg0);
+}
+static inline void lang_future_fib_spawn(lang_future_fib *f, int arg0) {
+    lang_task_wait(&f->task);
+    f->arg0 = arg0;
+    lang_task_spawn(&f->task, lang_future_fib_run);
+}
+static inline int lang_future_fib_join(lang_future_fib *f) {
+    lang_task_wait(&f->task);
+    return f->result;
+}
+static inline void lang_future_fib_sync(lang_future_fib *f) {
+    lang_task_wait(&f->task);
+}
+int fib(int n){
+    if ((n < 20)) {
+        return serial_fib(n);
+    }
+    lang_future_fib x __attribute__((cleanup(lang_future_fib_sync))) = {0};
+    lang_future_fib_spawn(&(x), (n - 1));
+    int y = fib((n - 2));
+    return (lang_future_fib_join(&(x)) + y);
+}
+int main(int argc, char **argv){
+    int n = 30;
+    if ((argc > 1)) {
+        n = atoi(argv[1]);
+    }
+    printf("fib(%d) = %d\n", n, fib(n));
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,24 @@
+# Spawned calls run on a work stealing thread pool. join waits for a call
+# and gets its result, running other spawned calls in the meantime.
+
+def serial_fib(n: int) -> int:
+    if n < 2:
+        return n
+    return serial_fib(n - 1) + serial_fib(n - 2)
+
+
+def fib(n: int) -> int:
+    # Small calls are not worth the overhead of a task
+    if n < 20:
+        return serial_fib(n)
+    x = spawn fib(n - 1)
+    y = fib(n - 2)
+    return join x + y
+
+
+def main(argc: int, argv: char**) -> int:
+    n = 30
+    if argc > 1:
+        n = atoi(argv[1])
+    printf("fib(%d) = %d\n", n, fib(n))
+    return 0
@@ -0,0 +1,93 @@
+#include <lang_tasks.h>
+#include <stdio.h>
+#include <stdlib.h>
+int merge(int *a, int *tmp, int lo, int mid, int hi){
+    int i = lo;
+    int j = mid;
+    for (int k = lo, lang_k_stop = hi; k < lang_k_stop; k++) {
+        if (((i < mid) && ((j >= hi) || (a[i] <= a[j])))) {
+            tmp[k] = a[i];
+            i++;
+        }
+        else {
+            tmp[k] = a[j];
+            j++;
+        }
+    }
+    for (int k = lo, lang_k_stop = hi; k < lang_k_stop; k++) {
+        a[k] = tmp[k];
+    }
+    return 0;
+}
+int merge_sort(int *arg0, int *arg1, int arg2, int arg3);
+typedef struct lang_future_merge_sort lang_future_merge_sort;
+struct lang_future_merge_sort {
+    lang_task task;
+    int *arg0;
+    int *arg1;
+    int arg2;
+    int arg3;
+    int result;
+};
+static inline void lang_future_merge_sort_run(lang_task *task) {
+    lang_future_merge_sort *f = (lang_future_merge_sort*)task;
+    f->result = merge_sort(f->arg0, f->arg1, f->arg2, f->arg3);
+}
+static inline void lang_future_merge_sort_spawn(lang_future_merge_sort *f, int *arg0, int *arg1, int arg2, int arg3) {
+    lang_task_wait(&f->task);
+    f->arg0 = arg0;
+    f->arg1 = arg1;
+    f->arg2 = arg2;
+    f->arg3 = arg3;
+    lang_task_spawn(&f->task, lang_future_merge_sort_run);
+}
+static inline int lang_future_merge_sort_join(lang_future_merge_sort *f) {
+    lang_task_wait(&f->task);
+    return f->result;
+}
+static inline void lang_future_merge_sort_sync(lang_future_merge_sort *f) {
+    lang_task_wait(&f->task);
+}
+int merge_sort(int *a, int *tmp, int lo, int hi){
+    if (((hi - lo) < 2)) {
+        return 0;
+    }
+    int mid = (lo + ((hi - lo) / 2));
+    if (((hi - lo) < 4096)) {
+        merge_sort(a, tmp, lo, mid);
+        merge_sort(a, tmp, mid, hi);
+    }
+    else {
+        lang_future_merge_sort lang_spawn0 __attribute__((cleanup(lang_future_merge_sort_sync))) = {0};
+        lang_future_merge_sort_spawn(&(lang_spawn0), a, tmp, lo, mid);
+        lang_future_merge_sort lang_spawn1 __attribute__((cleanup(lang_future_merge_sort_sync))) = {0};
+        lang_future_merge_sort_spawn(&(lang_spawn1), a, tmp, mid, hi);
+        lang_future_merge_sort_sync(&(lang_spawn0));
+        lang_future_merge_sort_sync(&(lang_spawn1));
+    }
+    return merge(a, tmp, lo, mid, hi);
+}
+int main(int argc, char **argv){
+    int n = 1000000;
+    if ((argc > 1)) {
+        n = atoi(argv[1]);
+    }
+    int *a = ((int*)malloc((((size_t)n) * sizeof(int))));
+    int *tmp = ((int*)malloc((((size_t)n) * sizeof(int))));
+    unsigned int x = 12345;
+    for (int i = 0, lang_i_stop = n; i < lang_i_stop; i++) {
+        x = ((x * 1103515245) + 12345);
+        a[i] = ((int)(x >> 8));
+    }
+    merge_sort(a, tmp, 0, n);
+    int unsorted = 0;
+    for (int i = 1, lang_i_stop = n; i < lang_i_stop; i++) {
+        if ((a[(i - 1)] > a[i])) {
+            unsorted++;
+        }
+    }
+    printf("sorted %d numbers, %d out of order\n", n, unsorted);
+    free(a);
+    free(tmp);
+    return 0;
+}
\ No newline at end of file
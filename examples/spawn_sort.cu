@@ -0,0 +1,55 @@
+# Merge sort that sorts the two halves of large ranges in parallel. Futures
+# that are not joined are waited for when they go out of scope, so a
+# function never returns before the calls it spawned are done.
+
+def merge(a: int*, tmp: int*, lo: int, mid: int, hi: int) -> int:
+    i = lo
+    j = mid
+    for k in range(lo, hi):
+        if i < mid and (j >= hi or a[i] <= a[j]):
+            tmp[k] = a[i]
+            i++
+        else:
+            tmp[k] = a[j]
+            j++
+    for k in range(lo, hi):
+        a[k] = tmp[k]
+    return 0
+
+
+def merge_sort(a: int*, tmp: int*, lo: int, hi: int) -> int:
+    if hi - lo < 2:
+        return 0
+    mid = lo + (hi - lo) / 2
+    if hi - lo < 4096:
+        merge_sort(a, tmp, lo, mid)
+        merge_sort(a, tmp, mid, hi)
+    else:
+        spawn merge_sort(a, tmp, lo, mid)
+        spawn merge_sort(a, tmp, mid, hi)
+        sync
+    return merge(a, tmp, lo, mid, hi)
+
+
+def main(argc: int, argv: char**) -> int:
+    n = 1000000
+    if argc > 1:
+        n = atoi(argv[1])
+    a = <int*>malloc(<size_t>n * sizeof(int))
+    tmp = <int*>malloc(<size_t>n * sizeof(int))
+
+    x: uint = 12345
+    for i in range(n):
+        x = x * 1103515245 + 12345
+        a[i] = <int>(x >> 8)
+    merge_sort(a, tmp, 0, n)
+
+    unsorted = 0
+    for i in range(1, n):
+        if a[i - 1] > a[i]:
+            unsorted++
+    printf("sorted %d numbers, %d out of order\n", n, unsorted)
+
+    free(a)
+    free(tmp)
+    return 0
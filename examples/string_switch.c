@@ -0,0 +1,63 @@
+#include <stdio.h>
+#include <string.h>
+#include <stdlib.h>
+static int lang_switch0(const char *data) {
+    size_t n = 0;
+    static const unsigned int displacements[4] = {1u, 48u, 10u, 4u};
+    static const char *const keys[8] = {"dup", "neg", "mul", "x", "add", "-", "sub", "+"};
+    static const size_t lengths[8] = {3, 3, 3, 1, 3, 1, 3, 1};
+    static const int ids[8] = {3, 4, 2, 2, 0, 1, 1, 0};
+    unsigned int h = 0u;
+    for (; data[n]; n++) {
+        h = (h ^ (unsigned char)data[n]) * 16777619u;
+    }
+    h ^= h >> 16;
+    h = ((h ^ displacements[h & 3u]) * 2654435761u) >> 29;
+    if (keys[h] && lengths[h] == n && memcmp(keys[h], data, n) == 0) {
+        return ids[h];
+    }
+    return -1;
+}
+long long run(int argc, char **argv){
+    long long stack[64];
+    int top = 0;
+    for (int i = 1, lang_i_stop = argc; i < lang_i_stop; i++) {
+        char *word = argv[i];
+        switch (lang_switch0(word)){
+            case 0:
+                top--;
+                stack[(top - 1)] = (stack[(top - 1)] + stack[top]);
+                break;
+            case 1:
+                top--;
+                stack[(top - 1)] = (stack[(top - 1)] - stack[top]);
+                break;
+            case 2:
+                top--;
+                stack[(top - 1)] = (stack[(top - 1)] * stack[top]);
+                break;
+            case 3:
+                stack[top] = stack[(top - 1)];
+                top++;
+                break;
+            case 4:
+                stack[(top - 1)] = -stack[(top - 1)];
+                break;
+            default:
+                stack[top] = ((long long)atoi(word));
+                top++;
+                break;
+        }
+    }
+    return stack[(top - 1)];
+}
+int main(int argc, char **argv){
+    if ((argc < 2)) {
+        char *example[6] = {"calc", "6", "dup", "x", "2", "-"};
+        printf("%lld\n", run(6, example));
+    }
+    else {
+        printf("%lld\n", run(argc, argv));
+    }
+    return 0;
+}
\ No newline at end of file
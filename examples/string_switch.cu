@@ -0,0 +1,44 @@
+# A calculator reading commands from its arguments. The switch on the
+# command is compiled to a perfect hash of the cases, so finding the case
+# takes one pass over the command and one memcmp however many cases there
+# are.
+
+def run(argc: int, argv: char**) -> long:
+    stack: long[64]
+    top = 0
+    for i in range(1, argc):
+        word = argv[i]
+        switch word:
+            case "add", "+":
+                top--
+                stack[top - 1] = stack[top - 1] + stack[top]
+                break
+            case "sub", "-":
+                top--
+                stack[top - 1] = stack[top - 1] - stack[top]
+                break
+            case "mul", "x":
+                top--
+                stack[top - 1] = stack[top - 1] * stack[top]
+                break
+            case "dup":
+                stack[top] = stack[top - 1]
+                top++
+                break
+            case "neg":
+                stack[top - 1] = -stack[top - 1]
+                break
+            else:
+                stack[top] = <long>atoi(word)
+                top++
+                break
+    return stack[top - 1]
+
+
+def main(argc: int, argv: char**) -> int:
+    if argc < 2:
+        example: char*[6] = ["calc", "6", "dup", "x", "2", "-"]
+        printf("%lld\n", run(6, example))
+    else:
+        printf("%lld\n", run(argc, argv))
+    return 0
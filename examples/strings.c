@@ -0,0 +1,232 @@
+#include <lang_str.h>
+#include <stdio.h>
+#include <assert.h>
+#include <string.h>
+#include <stdlib.h>
+int occurrences(str haystack, str needle){
+    int total = 0;
+    size_t i = 0;
+    while (((i + needle.length) <= haystack.length)) {
+        if (str_eq(str_slice(haystack, i, (i + needle.length)), needle)) {
+            total++;
+        }
+        i++;
+    }
+    return total;
+}
+str greeting(){
+    return ((str){"hello, world", 12});
+}
+#ifndef _LANG_SPEC_Dict_str_int
+#define _LANG_SPEC_Dict_str_int
+typedef struct Dict_str_int Dict_str_int;
+struct Dict_str_int {str *keys; int *values; unsigned int *dists; size_t length; size_t capacity; void (*__init__)(Dict_str_int*); size_t (*index)(Dict_str_int*, str); int* (*find)(Dict_str_int*, str); int (*contains)(Dict_str_int*, str); int (*get)(Dict_str_int*, str, int); void (*insert_new)(Dict_str_int*, str, int); void (*rehash)(Dict_str_int*, size_t); void (*reserve)(Dict_str_int*, size_t); void (*__setitem__)(Dict_str_int*, str, int); int* (*__getitem__)(Dict_str_int*, str); int (*remove)(Dict_str_int*, str); void (*clear)(Dict_str_int*); void (*__del__)(Dict_str_int*);};
+static void Dict_str_int___init__(Dict_str_int *self){
+    self->keys = NULL;
+    self->values = NULL;
+    self->dists = NULL;
+    self->length = 0;
+    self->capacity = 0;
+}
+static size_t Dict_str_int_index(Dict_str_int *self, str key){
+    if ((self->length == 0)) {
+        return self->capacity;
+    }
+    size_t mask = (self->capacity - 1);
+    size_t i = (str_hash(key) & mask);
+    unsigned int dist = 1;
+    while ((self->dists[i] >= dist)) {
+        if (((self->dists[i] == dist) && str_eq(self->keys[i], key))) {
+            return i;
+        }
+        i = ((size_t)((i + 1) & mask));
+        dist++;
+    }
+    return self->capacity;
+}
+static int* Dict_str_int_find(Dict_str_int *self, str key){
+    size_t i = Dict_str_int_index(self, key);
+    if ((i == self->capacity)) {
+        return NULL;
+    }
+    return &(self->values[i]);
+}
+static int Dict_str_int_contains(Dict_str_int *self, str key){
+    return (Dict_str_int_index(self, key) != self->capacity);
+}
+static int Dict_str_int_get(Dict_str_int *self, str key, int fallback){
+    size_t i = Dict_str_int_index(self, key);
+    if ((i == self->capacity)) {
+        return fallback;
+    }
+    return self->values[i];
+}
+static void Dict_str_int_insert_new(Dict_str_int *self, str key, int value){
+    size_t mask = (self->capacity - 1);
+    size_t i = (str_hash(key) & mask);
+    unsigned int dist = 1;
+    while (self->dists[i]) {
+        if ((self->dists[i] < dist)) {
+            str tmp_key = self->keys[i];
+            int tmp_value = self->values[i];
+            unsigned int tmp_dist = self->dists[i];
+            self->keys[i] = key;
+            self->values[i] = value;
+            self->dists[i] = dist;
+            key = tmp_key;
+            value = tmp_value;
+            dist = tmp_dist;
+        }
+        i = ((size_t)((i + 1) & mask));
+        dist++;
+    }
+    self->keys[i] = key;
+    self->values[i] = value;
+    self->dists[i] = dist;
+}
+static void Dict_str_int_rehash(Dict_str_int *self, size_t capacity){
+    str *old_keys = self->keys;
+    int *old_values = self->values;
+    unsigned int *old_dists = self->dists;
+    size_t old_capacity = self->capacity;
+    self->keys = ((str*)malloc((sizeof(str) * capacity)));
+    self->values = ((int*)malloc((sizeof(int) * capacity)));
+    self->dists = ((unsigned int*)calloc(capacity, sizeof(self->dists[0])));
+    self->capacity = capacity;
+    size_t i = 0;
+    while ((i < old_capacity)) {
+        if (old_dists[i]) {
+            Dict_str_int_insert_new(self, old_keys[i], old_values[i]);
+        }
+        i++;
+    }
+    free(old_keys);
+    free(old_values);
+    free(old_dists);
+}
+static void Dict_str_int_reserve(Dict_str_int *self, size_t length){
+    size_t capacity = 8;
+    if (self->capacity) {
+        capacity = self->capacity;
+    }
+    while (((length * 8) > (capacity * 7))) {
+        capacity = (capacity * 2);
+    }
+    if ((capacity != self->capacity)) {
+        Dict_str_int_rehash(self, capacity);
+    }
+}
+static void Dict_str_int___setitem__(Dict_str_int *self, str key, int value){
+    size_t i = Dict_str_int_index(self, key);
+    if ((i != self->capacity)) {
+        self->values[i] = value;
+    }
+    else {
+        Dict_str_int_reserve(self, (self->length + 1));
+        Dict_str_int_insert_new(self, key, value);
+        self->length++;
+    }
+}
+static int* Dict_str_int___getitem__(Dict_str_int *self, str key){
+    size_t i = Dict_str_int_index(self, key);
+    assert((i != self->capacity));
+    return &(self->values[i]);
+}
+static int Dict_str_int_remove(Dict_str_int *self, str key){
+    size_t i = Dict_str_int_index(self, key);
+    if ((i == self->capacity)) {
+        return 0;
+    }
+    size_t mask = (self->capacity - 1);
+    size_t j = ((i + 1) & mask);
+    while ((self->dists[j] > 1)) {
+        self->keys[i] = self->keys[j];
+        self->values[i] = self->values[j];
+        self->dists[i] = (self->dists[j] - 1);
+        i = j;
+        j = ((size_t)((j + 1) & mask));
+    }
+    self->dists[i] = 0;
+    self->length--;
+    return 1;
+}
+static void Dict_str_int_clear(Dict_str_int *self){
+    if (self->capacity) {
+        memset(self->dists, 0, (sizeof(self->dists[0]) * self->capacity));
+    }
+    self->length = 0;
+}
+static void Dict_str_int___del__(Dict_str_int *self){
+    free(self->keys);
+    free(self->values);
+    free(self->dists);
+}
+static Dict_str_int* init_Dict_str_int(Dict_str_int *obj){
+    obj->__init__ = Dict_str_int___init__;
+    obj->index = Dict_str_int_index;
+    obj->find = Dict_str_int_find;
+    obj->contains = Dict_str_int_contains;
+    obj->get = Dict_str_int_get;
+    obj->insert_new = Dict_str_int_insert_new;
+    obj->rehash = Dict_str_int_rehash;
+    obj->reserve = Dict_str_int_reserve;
+    obj->__setitem__ = Dict_str_int___setitem__;
+    obj->__getitem__ = Dict_str_int___getitem__;
+    obj->remove = Dict_str_int_remove;
+    obj->clear = Dict_str_int_clear;
+    obj->__del__ = Dict_str_int___del__;
+    Dict_str_int___init__(obj);
+    return obj;
+}
+static Dict_str_int* new_Dict_str_int(){
+    return init_Dict_str_int(((Dict_str_int*)malloc(sizeof(Dict_str_int))));
+}
+static void del_Dict_str_int(Dict_str_int *self){
+    Dict_str_int___del__(self);
+    free(self);
+}
+static Dict_str_int* init_Dict_str_int_array(Dict_str_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Dict_str_int((lang_objs + lang_idx));
+        lang_idx++;
+    }
+    return lang_objs;
+}
+static Dict_str_int* new_Dict_str_int_array(size_t lang_count){
+    return init_Dict_str_int_array(((Dict_str_int*)malloc((sizeof(Dict_str_int) * lang_count))), lang_count);
+}
+static void fini_Dict_str_int_array(Dict_str_int *lang_objs, size_t lang_count){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        Dict_str_int___del__((lang_objs + lang_idx));
+        lang_idx++;
+    }
+}
+static void del_Dict_str_int_array(Dict_str_int *lang_objs, size_t lang_count){
+    fini_Dict_str_int_array(lang_objs, lang_count);
+    free(lang_objs);
+}
+#endif
+int main(){
+    StrBuilder *b = str_builder_new();
+    int i = 0;
+    while ((i < 10000)) {
+        str_builder_append_int(b, i);
+        str_builder_append(b, ((str){", ", 2}));
+        i++;
+    }
+    str digits = str_builder_view(b);
+    printf("%d %d\n", ((int)digits.length), occurrences(digits, ((str){"99", 2})));
+    str s = greeting();
+    str world = str_slice(s, 7, 100);
+    str_print(world);
+    printf(" %d %d\n", ((int)world.length), (world.data == (s.data + 7)));
+    Dict_str_int *seen = new_Dict_str_int();
+    Dict_str_int___setitem__(seen, str_slice(s, 0, 5), 1);
+    Dict_str_int___setitem__(seen, ((str){"world", 5}), 2);
+    printf("%d %d\n", (*Dict_str_int___getitem__(seen, ((str){"hello", 5}))), seen->contains(seen, ((str){"hell", 4})));
+    del_Dict_str_int(seen);
+    str_builder_free(b);
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,44 @@
+# A str carries its length, so getting the length or slicing it does not scan
+# the string. Building a string with a StrBuilder only copies each appended
+# piece once.
+
+def occurrences(haystack: str, needle: str) -> int:
+    total = 0
+    i: size_t = 0
+    while i + needle.length <= haystack.length:
+        if str_eq(str_slice(haystack, i, i + needle.length), needle):
+            total++
+        i++
+    return total
+
+
+def greeting() -> str:
+    return "hello, world"
+
+
+def main():
+    b = str_builder_new()
+    i = 0
+    while i < 10000:
+        str_builder_append_int(b, i)
+        str_builder_append(b, ", ")
+        i++
+
+    digits = str_builder_view(b)
+    printf("%d %d\n", <int>digits.length, occurrences(digits, "99"))
+
+    # Slices point into the original string
+    s = greeting()
+    world = str_slice(s, 7, 100)
+    str_print(world)
+    printf(" %d %d\n", <int>world.length, world.data == s.data + 7)
+
+    # Strs can be dict keys
+    seen: Dict<str, int>* = new_Dict_str_int()
+    (*seen)[str_slice(s, 0, 5)] = 1
+    (*seen)["world"] = 2
+    printf("%d %d\n", (*seen)["hello"], seen->contains("hell"))
+
+    del_Dict_str_int(seen)
+    str_builder_free(b)
+    return 0
@@ -0,0 +1,51 @@
+#include <stdio.h>
+#include <stdlib.h>
+typedef struct Record Record;
+struct Record {long long id; Record *next; int count; short tag; char flag; char kind;};
+typedef struct Header Header;
+struct Header {char version; int length; char checksum;};
+typedef struct Node Node;
+struct Node {double weight; int (*__init__)(Node*, double); char visited; char color;};
+int Node___init__(Node *self, double weight){
+    self->visited = 0;
+    self->weight = weight;
+    self->color = 1;
+}
+Node* init_Node(Node *obj, double weight){
+    obj->__init__ = Node___init__;
+    Node___init__(obj, weight);
+    return obj;
+}
+Node* new_Node(double weight){
+    return init_Node(((Node*)malloc(sizeof(Node))), weight);
+}
+void del_Node(Node *self){
+    free(self);
+}
+Node* init_Node_array(Node *lang_objs, size_t lang_count, double weight){
+    size_t lang_idx = 0;
+    while ((lang_idx < lang_count)) {
+        init_Node((lang_objs + lang_idx), weight);
+        lang_idx++;
+    }
+    return lang_objs;
+}
+Node* new_Node_array(size_t lang_count, double weight){
+    return init_Node_array(((Node*)malloc((sizeof(Node) * lang_count))), lang_count, weight);
+}
+void del_Node_array(Node *lang_objs, size_t lang_count){
+    free(lang_objs);
+}
+int main(){
+    Record r;
+    r.flag = 1;
+    r.id = 2;
+    r.kind = 3;
+    r.count = 4;
+    r.tag = 5;
+    r.next = NULL;
+    printf("%d\n", ((int)((((r.flag + r.id) + r.kind) + r.count) + r.tag)));
+    printf("%d %d\n", ((int)sizeof(Record)), ((int)sizeof(Header)));
+    printf("%d\n", ((int)sizeof(Node)));
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,45 @@
+# Compile with --reorder-fields to pack the fields of these structs by
+# alignment, and use --layout-report to see how much padding is removed.
+
+struct Record {
+    flag: char,
+    id: long,
+    kind: char,
+    count: int,
+    next: Record*,
+    tag: short,
+}
+
+# The layout of this struct is shared with other programs, so it must keep the
+# declared field order.
+@pinned
+struct Header {
+    version: char,
+    length: int,
+    checksum: char,
+}
+
+class Node:
+    visited: char
+    weight: double
+    color: char
+
+    def __init__(self: Node*, weight: double):
+        self->visited = 0
+        self->weight = weight
+        self->color = 1
+
+
+def main():
+    r: Record
+    r.flag = 1
+    r.id = 2
+    r.kind = 3
+    r.count = 4
+    r.tag = 5
+    r.next = NULL
+    printf("%d\n", <int>(r.flag + r.id + r.kind + r.count + r.tag))
+
+    printf("%d %d\n", <int>sizeof(Record), <int>sizeof(Header))
+    printf("%d\n", <int>sizeof(Node))
+    return 0
@@ -0,0 +1,59 @@
+#include <stdio.h>
+#include <pthread.h>
+#include <stdlib.h>
+#include <lang_atomic.h>
+typedef struct Queue Queue;
+struct Queue {pthread_mutex_t lock; pthread_cond_t not_empty; int items[64]; int head; int tail;};
+Queue queue;
+atomic_int counted;
+atomic_long total;
+int push(int x){
+    pthread_mutex_lock(&(queue.lock));
+    queue.items[(queue.tail % 64)] = x;
+    queue.tail++;
+    pthread_cond_signal(&(queue.not_empty));
+    pthread_mutex_unlock(&(queue.lock));
+}
+int pop(){
+    pthread_mutex_lock(&(queue.lock));
+    while ((queue.head == queue.tail)) {
+        pthread_cond_wait(&(queue.not_empty), &(queue.lock));
+    }
+    int x = queue.items[(queue.head % 64)];
+    queue.head++;
+    pthread_mutex_unlock(&(queue.lock));
+    return x;
+}
+void* worker(void *arg){
+    int x = pop();
+    while (x) {
+        atomic_int_fetch_add(&(counted), 1, memory_order_relaxed);
+        atomic_long_fetch_add(&(total), x, memory_order_relaxed);
+        x = pop();
+    }
+    return NULL;
+}
+int main(){
+    pthread_mutex_init(&(queue.lock), NULL);
+    pthread_cond_init(&(queue.not_empty), NULL);
+    atomic_int_init(&(counted), 0);
+    atomic_long_init(&(total), 0);
+    pthread_t threads[4];
+    for (int i = 0; i < 4; i++) {
+        pthread_create(&(threads[i]), NULL, worker, NULL);
+    }
+    for (int i = 1; i < 51; i++) {
+        push(i);
+    }
+    for (int i = 0; i < 4; i++) {
+        push(0);
+    }
+    for (int i = 0; i < 4; i++) {
+        pthread_join(threads[i], NULL);
+    }
+    long long expected = 1275;
+    int swapped = atomic_long_compare_exchange(&(total), &(expected), -1, memory_order_seq_cst, memory_order_seq_cst);
+    printf("%d %lld %d %lld\n", atomic_int_load(&(counted), memory_order_acquire), expected, swapped, atomic_long_load(&(total), memory_order_acquire));
+    pthread_cond_destroy(&(queue.not_empty));
+    pthread_mutex_destroy(&(queue.lock));
+}
\ No newline at end of file
@@ -0,0 +1,70 @@
+# Threads sharing an atomic counter and a queue guarded by a mutex and a
+# condition variable. The producer pushes numbers to the queue and the
+# workers pop them until they get a 0.
+
+struct Queue {
+    lock: pthread_mutex_t,
+    not_empty: pthread_cond_t,
+    items: int[64],
+    head: int,
+    tail: int,
+}
+
+queue: Queue
+counted: atomic_int
+total: atomic_long
+
+
+def push(x: int):
+    pthread_mutex_lock(&queue.lock)
+    queue.items[queue.tail % 64] = x
+    queue.tail++
+    pthread_cond_signal(&queue.not_empty)
+    pthread_mutex_unlock(&queue.lock)
+
+
+def pop() -> int:
+    pthread_mutex_lock(&queue.lock)
+    while queue.head == queue.tail:
+        pthread_cond_wait(&queue.not_empty, &queue.lock)
+    x = queue.items[queue.head % 64]
+    queue.head++
+    pthread_mutex_unlock(&queue.lock)
+    return x
+
+
+def worker(arg: void*) -> void*:
+    x = pop()
+    while x:
+        atomic_int_fetch_add(&counted, 1, memory_order_relaxed)
+        atomic_long_fetch_add(&total, x, memory_order_relaxed)
+        x = pop()
+    return NULL
+
+
+def main():
+    pthread_mutex_init(&queue.lock, NULL)
+    pthread_cond_init(&queue.not_empty, NULL)
+    atomic_int_init(&counted, 0)
+    atomic_long_init(&total, 0)
+
+    threads: pthread_t[4]
+    for i in range(4):
+        pthread_create(&threads[i], NULL, worker, NULL)
+
+    # Push fewer numbers than the queue holds so it never overflows
+    for i in range(1, 51):
+        push(i)
+    for i in range(4):
+        push(0)
+    for i in range(4):
+        pthread_join(threads[i], NULL)
+
+    # Only replace the total if no other thread changed it
+    expected: long = 1275
+    swapped = atomic_long_compare_exchange(&total, &expected, -1, memory_order_seq_cst, memory_order_seq_cst)
+    printf("%d %lld %d %lld\n", atomic_int_load(&counted, memory_order_acquire),
+           expected, swapped, atomic_long_load(&total, memory_order_acquire))
+
+    pthread_cond_destroy(&queue.not_empty)
+    pthread_mutex_destroy(&queue.lock)
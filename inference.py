@@ -2,9 +2,322 @@ from lang_ast import *
 from cparse import Parser
 from lang_types import *
 
-from c_modules import C_VARS, C_TYPES
+from c_modules import (C_VARS, C_TYPES, C_TEMPLATES, C_SORT_TEMPLATE,
+                       C_SPAN_TEMPLATE, C_NDARRAY_TEMPLATE, C_IO_TEMPLATE)
 
 import os
+import re
+
+
+class TypeParamSubstituter(NodeTransformer):
+    """Replace the type parameters in the body of a generic class with the
+    types the class is specialized with."""
+
+    def __init__(self, types, names=None):
+        """
+        Args:
+            types (dict[str, TypeMixin]): Maps type parameter names to types
+            names (optional[dict[str, str]]): Maps names of functions created
+                for the generic class to the ones of the specialization
+        """
+        super().__init__()
+        self.__types = types
+        self.__names = names or {}
+
+    def visit_NameType(self, node):
+        return self.__types.get(node.id, node)
+
+    def visit_Generic(self, node):
+        return Generic(
+            node.base_type,
+            [self.visit(p) for p in node.type_params],
+            lineno=node.lineno,
+            colno=node.colno
+        )
+
+    def visit_Name(self, node):
+        # Type parameters used as values are either integer parameters or
+        # types in sizeof()
+        if node.id in self.__types:
+            t = self.__types[node.id]
+            if isinstance(t, ValueMixin):
+                return t
+            return Name(t.c_code())
+        elif node.id in self.__names:
+            return Name(self.__names[node.id])
+        return node
+
+
+class GeneratorLowerer(NodeTransformer):
+    """
+    Lower the checked body of a generator to the body of its next()
+    function. The variables of the generator are moved to its state struct
+    so they keep their values between calls, loops that declare variables
+    become while loops, and each yield saves where to resume from.
+    """
+
+    def __init__(self, params):
+        """
+        Args:
+            params (list[VarDecl]): The parameters of the generator
+        """
+        super().__init__()
+        self.__fields = {}
+        self.yields = 0
+        for param in params:
+            t = param.type
+            if isinstance(t, Array):
+                t = Pointer(t.contents)
+            self.__add_field(param.name, t)
+
+    def fields(self):
+        """The members of the state struct for the variables found."""
+        return [VarDecl(name, t) for name, t in self.__fields.items()]
+
+    def __add_field(self, name, t):
+        if name in self.__fields:
+            if self.__fields[name].c_code() != t.c_code():
+                raise TypeError("Variable '{}' of generator previously declared as {}. Found {}.".format(
+                    name, self.__fields[name], t))
+        else:
+            self.__fields[name] = t
+
+    def visit_Name(self, node):
+        if node.id in self.__fields:
+            return StructPointerDeref(Name(GENERATOR_STATE), node.id)
+        return node
+
+    def visit_VarDeclStmt(self, node):
+        decl = node.decl
+        init = self.visit(decl.init) if decl.init is not None else None
+        self.__add_field(decl.name, decl.type)
+        target = self.visit(Name(decl.name))
+
+        if init is None:
+            return Pass()
+        elif isinstance(init, ArrayLiteral):
+            return StmtGroup([Assign(Index(target, Int(i)), v)
+                              for i, v in enumerate(init.contents)])
+        return Assign(target, init)
+
+    def __hoist(self, name, t, value):
+        """Save a value evaluated once before a loop in the state."""
+        if int_literal_value(value) is not None:
+            return value, []
+        self.__add_field(name, t)
+        target = self.visit(Name(name))
+        return target, [Assign(target, value)]
+
+    def visit_ForRange(self, node):
+        if node.parallel:
+            raise RuntimeError("Parallel loops cannot be used in generators ({})".format(node.loc()))
+        start = self.visit(node.start)
+        stop = self.visit(node.stop)
+        step = self.visit(node.step)
+        self.__add_field(node.target, node.type)
+        i = self.visit(Name(node.target))
+
+        if node.down_to_zero:
+            # The unsigned index is tested before it is decremented
+            return StmtGroup([
+                Assign(i, BinOp(start, Add(), Int(1))),
+                While(BinOp(PostDec(i), Gt(), Int(0)), self.visit(node.body)),
+            ])
+
+        stmts = [Assign(i, start)]
+        stop, hoisted = self.__hoist(
+            "lang_{}_stop".format(node.target), node.type, stop)
+        stmts += hoisted
+        step, hoisted = self.__hoist(
+            "lang_{}_step".format(node.target), node.step_type or node.type,
+            step)
+        stmts += hoisted
+
+        step_n = int_literal_value(step)
+        if step_n is None:
+            test = LogicalOp(
+                LogicalOp(BinOp(step, Gt(), Int(0)), And(), BinOp(i, Lt(), stop)),
+                Or(),
+                LogicalOp(BinOp(step, Lt(), Int(0)), And(), BinOp(i, Gt(), stop)),
+            )
+        else:
+            test = BinOp(i, Lt() if step_n > 0 else Gt(), stop)
+
+        if step_n is not None and step_n < 0:
+            update = [Assign(i, BinOp(i, Sub(), Int(-step_n)))]
+            past_stop = BinOp(BinOp(i, Sub(), stop), Le(), Int(-step_n))
+        else:
+            update = [Assign(i, BinOp(i, Add(), step))]
+            past_stop = LogicalOp(
+                BinOp(step, Lt(), Int(0)), And(),
+                BinOp(BinOp(i, Sub(), stop), Le(), UnaryOp(USub(), step)))
+        if node.clamp_step:
+            # The unsigned index ends at the stop instead of going below 0
+            update = [If(past_stop, [Assign(i, stop)], update)]
+        body = self.visit(node.body) + update
+        return StmtGroup(stmts + [While(test, body)])
+
+    def visit_ForGenerator(self, node):
+        state = self.visit(node.iter)
+        self.__add_field(node.target, node.type)
+        target = self.visit(Name(node.target))
+
+        stmts = []
+        if not isinstance(node.iter, Name):
+            state, stmts = self.__hoist(
+                "lang_{}_gen".format(node.target), node.state_type, state)
+
+        stmts.append(While(
+            Call(Name(node.next), [AddressOf(state), AddressOf(target)]),
+            self.visit(node.body)
+        ))
+        return StmtGroup(stmts)
+
+    def visit_Yield(self, node):
+        self.yields += 1
+        return GeneratorYield(self.visit(node.value), self.yields)
+
+    def visit_ArenaBlock(self, node):
+        # Variables declared by the block would not be restored when
+        # resuming
+        yields = self.yields
+        node = self.visit_children(node)
+        if self.yields != yields:
+            raise RuntimeError("Cannot yield inside a with block ({})".format(node.loc()))
+        return node
+
+
+class ParallelLoopChecker(NodeVisitor):
+    """
+    Find the data races in the body of a parallel loop. Variables declared
+    outside the loop are shared by every thread, so they can only be
+    updated as reductions (x = x + e, x++, ...) that are not otherwise read
+    in the loop. Writing to them in any other way is a data race.
+    """
+
+    # Operators of the updates that can be reduced. Subtracting from a sum
+    # is a + reduction.
+    REDUCTION_OPS = {Add: "+", Sub: "+", Mult: "*", BitAnd: "&", BitOr: "|",
+                     Xor: "^"}
+
+    def __init__(self, index, shared, loc):
+        """
+        Args:
+            index (str): The loop index
+            shared (set[str]): The variables declared outside the loop
+            loc (tuple[int, int]): Where the loop is, for the nodes of the
+                checked body which are not from the source
+        """
+        super().__init__()
+        self.__index = index
+        self.__loop_loc = loc
+        self.__shared = set(shared) - {index}
+        self.__reads = set()
+        self.__loops = 0
+        self.reductions = {}
+
+    def check(self, body):
+        """Get the operator each shared variable is reduced with."""
+        self.visit(body)
+        for name in self.reductions:
+            if name in self.__reads:
+                raise RuntimeError("Shared variable '{}' is read in a parallel loop while it is reduced ({})".format(
+                    name, self.__loop_loc))
+        return self.reductions
+
+    def __loc(self, node):
+        return node.loc() if node.lineno >= 0 else self.__loop_loc
+
+    def __is_shared(self, node):
+        return isinstance(node, Name) and node.id in self.__shared
+
+    def __write(self, node, loc):
+        """Check a write to a variable that is not a reduction."""
+        if isinstance(node, Name) and node.id == self.__index:
+            raise RuntimeError("Cannot assign to the index '{}' of a parallel loop ({})".format(
+                node.id, loc))
+        elif self.__is_shared(node):
+            raise RuntimeError("Data race on shared variable '{}' in parallel loop ({})".format(
+                node.id, loc))
+
+    def __reduce(self, name, op):
+        if self.reductions.setdefault(name, op) != op:
+            raise RuntimeError("Shared variable '{}' is reduced with both {} and {} in a parallel loop ({})".format(
+                name, self.reductions[name], op, self.__loop_loc))
+
+    def visit_Name(self, node):
+        if node.id in self.__shared:
+            self.__reads.add(node.id)
+
+    def visit_VarDeclStmt(self, node):
+        self.visit(node.decl.init)
+        self.__shared.discard(node.decl.name)
+
+    def visit_Assign(self, node):
+        left = node.left
+        right = node.right
+        if self.__is_shared(left) and isinstance(right, BinOp):
+            op = self.REDUCTION_OPS.get(type(right.op))
+            name = left.id
+            if op and isinstance(right.left, Name) and right.left.id == name:
+                self.__reduce(name, op)
+                self.visit(right.right)
+                return
+            elif (op and not isinstance(right.op, Sub) and
+                    isinstance(right.right, Name) and right.right.id == name):
+                self.__reduce(name, op)
+                self.visit(right.left)
+                return
+
+        # Members of shared structs are shared too
+        target = left
+        while isinstance(target, StructMemberAccess):
+            target = target.value
+        self.__write(target, self.__loc(node))
+        self.visit(left)
+        self.visit(right)
+
+    def visit_ExprStmt(self, node):
+        value = node.value
+        if (isinstance(value, (PostInc, PreInc, PostDec, PreDec)) and
+                self.__is_shared(value.value)):
+            self.__reduce(value.value.id, "+")
+        else:
+            self.visit(value)
+
+    def __visit_incdec(self, node):
+        self.__write(node.value, self.__loc(node))
+        self.visit(node.value)
+
+    visit_PostInc = visit_PreInc = __visit_incdec
+    visit_PostDec = visit_PreDec = __visit_incdec
+
+    def visit_AddressOf(self, node):
+        # Anything could be written through the address
+        self.__write(node.value, self.__loc(node))
+        self.visit(node.value)
+
+    def __visit_loop(self, node):
+        self.__loops += 1
+        self.visit_children(node)
+        self.__loops -= 1
+
+    visit_While = visit_DoWhile = visit_Switch = __visit_loop
+
+    def visit_ForRange(self, node):
+        self.__shared.discard(node.target)
+        self.__visit_loop(node)
+
+    def visit_ForGenerator(self, node):
+        self.__shared.discard(node.target)
+        self.__visit_loop(node)
+
+    def visit_Break(self, node):
+        if not self.__loops:
+            raise RuntimeError("Cannot break out of a parallel loop ({})".format(self.__loc(node)))
+
+    def visit_Return(self, node):
+        raise RuntimeError("Cannot return from a parallel loop ({})".format(self.__loc(node)))
 
 
 class Frame:
@@ -108,7 +421,8 @@ class Inferer:
                  extra_includes=None,
                  source_file=None,
                  included_files=None,
-                 call_stack=None):
+                 call_stack=None,
+                 reorder_fields=False):
         self.__variables = init_variables or {}
         self.__global_variables = self.__variables
         self.__types = init_types or dict.fromkeys(BUILTIN_TYPES)
@@ -120,6 +434,59 @@ class Inferer:
         self.__extra_includes = extra_includes or set()
         self.__bounded_methods = set()
 
+        # Names of the arenas of the with blocks being checked. The last one
+        # is the innermost block.
+        self.__arenas = []
+        self.__arena_count = 0
+
+        # Struct fields are only reordered to minimize padding if requested
+        # since this changes the ABI of the structs.
+        self.__reorder_fields = reorder_fields
+        self.__checking_builtin_module = False
+        self.__layouts = {}
+        self.__layout_report = []
+
+        # Number of structs created for @soa arrays
+        self.__soa_count = 0
+
+        # Generic classes and the names of their specializations mapped to
+        # the class they were created from
+        self.__templates = {}
+        self.__specializations = {}
+
+        # Bodies of the C_*_TEMPLATE files once parsed
+        self.__parsed_templates = {}
+
+        # Definitions created while checking a statement that must be placed
+        # before that statement at the top of the module
+        self.__pending_defs = []
+
+        # Return types of the functions being checked. The last one is the
+        # innermost function.
+        self.__returns = []
+
+        # Types of the values yielded by the generators being checked
+        self.__yields = []
+
+        # Maps the names of the state structs of generators to the type they
+        # yield and the name of their next() function
+        self.__generators = {}
+
+        # Maps the types of the futures of spawned functions to the types
+        # the functions return
+        self.__futures = {}
+        self.__spawn_count = 0
+
+        # Number of temporaries made for f-strings
+        self.__fstring_count = 0
+
+        # Number of switches on strings, which each get a function
+        self.__switch_count = 0
+
+        # Number of slices of Lists that are not variables, which each get a
+        # function so the List is evaluated once
+        self.__slice_count = 0
+
         # The frame will change each time a new scope is entered
         self.__frames = []
 
@@ -163,6 +530,11 @@ class Inferer:
         """Returns a dict mapping all includes found to their type infered asts."""
         return self.__found_included_files
 
+    def layout_report(self):
+        """Returns lines describing the layout of each struct and class
+        checked before and after reordering their fields."""
+        return self.__layout_report
+
     def bind(self, varname, t):
         """Bind a type to a variable name.
 
@@ -202,8 +574,11 @@ class Inferer:
 
     def __type_exists(self, t, declared_types):
         assert isinstance(t, LangType)
-        if isinstance(t, (ArrayType, PointerType)):
+        if isinstance(t, (ArrayType, PointerType, VectorType, QualifiedType)):
             return self.type_exists(t.contents)
+        if isinstance(t, CallableType):
+            return (all(self.type_exists(arg) for arg in t.args) and
+                    self.type_exists(t.returns))
         return t in declared_types
 
     def type_exists(self, t):
@@ -279,8 +654,9 @@ class Inferer:
     ####### Type handling ###########
 
     def types_eq(self, t1, t2):
-        """Check if two types are equal."""
-        return self.exhaust_typedef(t1) == self.exhaust_typedef(t2)
+        """Check if two types are equal. Qualifiers are not compared."""
+        return (unqualified(self.exhaust_typedef(t1)) ==
+                unqualified(self.exhaust_typedef(t2)))
 
     def add_type(self, new_type):
         """
@@ -302,17 +678,46 @@ class Inferer:
         Given a LangType, traverse the known types until we hit a value of None,
         indicating the type used as a key is a base type.
         """
-        if isinstance(typedef_t, (PointerType, ArrayType)):
+        typedef_t = strip_qualifiers(typedef_t)
+        if isinstance(typedef_t, STRUCTURAL_TYPES):
             return typedef_t
 
         types = self.__types
         actual_t = types[typedef_t]
         while actual_t is not None:
             # Actual is another typedef
-            typedef_t = actual_t
+            typedef_t = strip_qualifiers(actual_t)
+            if isinstance(typedef_t, STRUCTURAL_TYPES):
+                return typedef_t
             actual_t = types[typedef_t]
         return typedef_t
 
+    def type_is_const(self, t):
+        """Check if a type or a typedef it comes from is const qualified."""
+        while t is not None:
+            if isinstance(t, QualifiedType):
+                if t.qualifier == "const":
+                    return True
+                t = t.contents
+            elif isinstance(t, STRUCTURAL_TYPES):
+                return False
+            else:
+                t = self.__types.get(t)
+        return False
+
+    def __check_keeps_const(self, expected_t, value_t, varname):
+        """Pointers to const cannot be assigned to pointers to non-const
+        since the contents could then be changed through them."""
+        expected_t = self.exhaust_typedef(expected_t)
+        value_t = self.exhaust_typedef(value_t)
+        if (isinstance(expected_t, PointerType) and
+                isinstance(value_t, (PointerType, ArrayType)) and
+                self.type_is_const(value_t.contents) and
+                not self.type_is_const(expected_t.contents)):
+            raise TypeError("Cannot assign {} to {} for {} since it discards the const qualifier.".format(
+                value_t, expected_t, varname
+            ))
+
     def __builtin_type_check(self, t):
         """Check if the type is a builtin one and import the proper module."""
         if t not in self.__types:
@@ -326,6 +731,41 @@ class Inferer:
 
         return t
 
+    def type_layout(self, t):
+        """
+        Get the Layout of a type, or None if it is not known.
+
+        Args:
+            t (LangType)
+
+        Returns:
+            optional[Layout]
+        """
+        if isinstance(t, QualifiedType):
+            return self.type_layout(t.contents)
+        elif isinstance(t, (PointerType, CallableType)):
+            return POINTER_LAYOUT
+        elif isinstance(t, VectorType):
+            return Layout(VECTOR_SIZE, VECTOR_SIZE)
+        elif isinstance(t, ArrayType):
+            contents = self.type_layout(t.contents)
+            if contents is None or not isinstance(t.size, Int):
+                return None
+            return Layout(contents.size * t.size.n, contents.align)
+
+        # Stop at the first known type in a typedef chain since size_t is
+        # typedef'd to a smaller type in lang space
+        while t is not None:
+            if t.name in BUILTIN_LAYOUTS:
+                return BUILTIN_LAYOUTS[t.name]
+            elif t.name in self.__layouts:
+                return self.__layouts[t.name]
+            t = self.__types.get(t)
+            if isinstance(t, (PointerType, CallableType, VectorType, ArrayType,
+                              QualifiedType)):
+                return self.type_layout(t)
+        return None
+
     ####### Converting TypeMixin nodes to LangTypes ###########
 
     def langtype_from(self, node):
@@ -367,8 +807,369 @@ class Inferer:
     def langtype_from_Ellipsis(self, node):
         return VARARG_TYPE
 
+    def langtype_from_Qualified(self, node):
+        contents = self.langtype_from(node.contents)
+        if node.qualifier == "restrict" and not self.type_is_pointer(contents):
+            raise RuntimeError("Only pointers can be restrict qualified. Found {} ({})".format(
+                node.contents, node.loc()
+            ))
+        return QualifiedType(contents, node.qualifier)
+
+    def langtype_from_Vector(self, node):
+        return VectorType(self.langtype_from(node.contents), node.lanes)
+
+    def __load_builtin_template(self, name):
+        """Parse and register one of the generic classes in c_modules."""
+        path = C_TEMPLATES[name]
+        parser = Parser(source_file=path)
+        with open(path, "r") as f:
+            self.__check_builtin_module(parser.parse(f.read()))
+
+    def __parse_template(self, path):
+        """Get the body of a template file whose nodes are substituted
+        without being registered as a generic class."""
+        if path not in self.__parsed_templates:
+            with open(path, "r") as f:
+                module = Parser(source_file=path).parse(f.read())
+            self.__parsed_templates[path] = module.body
+        return self.__parsed_templates[path]
+
     def langtype_from_Generic(self, node):
-        raise NotImplementedError
+        return LangType(self.__specialize(node))
+
+    def __specialize(self, node):
+        """
+        Create the specialization of a generic class for the type parameters
+        of a Generic type and return its name. Each specialization is only
+        created once and placed before the top level statement using it.
+        """
+        base = node.base_type
+        if (isinstance(base, NameType) and base.id == "Span" and
+                base.id not in self.__templates):
+            if len(node.type_params) != 1:
+                raise RuntimeError("Expected 1 type parameter for Span. Found {} ({})".format(
+                    len(node.type_params), node.loc()
+                ))
+            return self.__specialize_span(node.type_params[0])
+        if (isinstance(base, NameType) and base.id == "NDArray" and
+                base.id not in self.__templates):
+            params = node.type_params
+            if (len(params) != 2 or isinstance(params[0], Int) or
+                    not isinstance(params[1], Int) or params[1].n < 1):
+                raise RuntimeError("Expected an element type and a positive rank for NDArray. Found {} ({})".format(
+                    ", ".join(map(str, params)), node.loc()
+                ))
+            return self.__specialize_ndarray(params[0], params[1].n)
+        if (isinstance(base, NameType) and base.id not in self.__templates and
+                base.id in C_TEMPLATES):
+            self.__load_builtin_template(base.id)
+        if not isinstance(base, NameType) or base.id not in self.__templates:
+            raise RuntimeError("Unknown generic class '{}' ({})".format(
+                base, node.loc()
+            ))
+        template = self.__templates[base.id]
+        if len(node.type_params) != len(template.generics):
+            raise RuntimeError("Expected {} type parameters for {}. Found {} ({})".format(
+                len(template.generics), base, len(node.type_params), node.loc()
+            ))
+
+        # Specialize any generic type parameters first
+        for param in node.type_params:
+            if isinstance(param, Int):
+                raise RuntimeError("Expected a type parameter for {}. Found {} ({})".format(
+                    base, param, node.loc()
+                ))
+            self.langtype_from(param)
+
+        name = mangle_type(node)
+        if name in self.__specializations:
+            return name
+        self.__specializations[name] = base.id
+
+        # The class name refers to the specialization in its body, and so do
+        # the names of the methods of the class so they can be called
+        # directly
+        types = dict(zip(template.generics, node.type_params))
+        types[template.name] = NameType(name)
+        names = {}
+        for n in template.body:
+            if isinstance(n, FuncDef):
+                names[template.name + "_" + n.name] = name + "_" + n.name
+        cls = ClassDef(
+            name,
+            body=TypeParamSubstituter(types, names).visit(template.body),
+            decorators=template.decorators,
+        )
+        self.__add_specialization(name, cls)
+        return name
+
+    def __specialize_span(self, elem_type):
+        """Create the Span of the element type from C_SPAN_TEMPLATE and return
+        its name."""
+        self.langtype_from(elem_type)
+        name = mangle_type(Generic(NameType("Span"), [elem_type]))
+        if name in self.__specializations:
+            return name
+        self.__specializations[name] = "Span"
+
+        template = self.__parse_template(C_SPAN_TEMPLATE)
+        names = {
+            n.name: name + "_" + n.name
+            for n in template if isinstance(n, FuncDef)
+        }
+        nodes = TypeParamSubstituter(
+            {"T": elem_type, "Span": NameType(name)}, names).visit(template)
+        for n in nodes:
+            if isinstance(n, FuncDef):
+                n.name = names[n.name]
+            else:
+                n.struct.name = name
+        self.__add_specialization(name, StmtGroup(nodes))
+        return name
+
+    def __specialize_ndarray(self, elem_type, rank):
+        """
+        Create the NDArray of the element type and rank from
+        C_NDARRAY_TEMPLATE and the functions taking one argument per
+        dimension, and return its name.
+        """
+        self.langtype_from(elem_type)
+        name = mangle_type(Generic(NameType("NDArray"), [elem_type, Int(rank)]))
+        if name in self.__specializations:
+            return name
+        self.__specializations[name] = "NDArray"
+
+        template = self.__parse_template(C_NDARRAY_TEMPLATE)
+        names = {
+            n.name: name + "_" + n.name
+            for n in template if isinstance(n, FuncDef)
+        }
+        nodes = TypeParamSubstituter(
+            {"T": elem_type, "N": Int(rank), "NDArray": NameType(name)},
+            names).visit(template)
+        for n in nodes:
+            if isinstance(n, FuncDef):
+                n.name = names[n.name]
+            else:
+                n.struct.name = name
+
+        self.__add_specialization(
+            name, StmtGroup(nodes + self.__ndarray_functions(name, elem_type, rank)))
+        return name
+
+    def __ndarray_functions(self, name, elem_type, rank):
+        """
+        The functions of an NDArray taking one argument per dimension:
+        - new(d0, d1, ...) allocates a zeroed array of that shape;
+        - at(a, i0, i1, ...) is the pointer to an element;
+        - view(a, start0, end0, start1, end1, ...) is a view of the elements
+          from the starts up to the ends, where an end of (size_t)-1 is the
+          end of the dimension;
+        - free(a) frees the data of an array made by new() or alloc().
+        """
+        size_t = NameType("size_t")
+        nd_type = NameType(name)
+        a = Name("a")
+        dims = range(rank)
+
+        def member(m, i):
+            return Index(StructMemberAccess(a, m), Int(i))
+
+        def all_of(conditions):
+            cond = conditions[0]
+            for c in conditions[1:]:
+                cond = LogicalOp(cond, And(), c)
+            return cond
+
+        def offset(indices):
+            # data + i0 * strides[0] + i1 * strides[1] + ...
+            value = StructMemberAccess(a, "data")
+            for i, idx in zip(dims, indices):
+                value = BinOp(value, Add(), BinOp(idx, Mult(), member("strides", i)))
+            return value
+
+        shape_names = [Name("d{}".format(i)) for i in dims]
+        new = FuncDef(
+            name + "_new",
+            [VarDecl(n.id, size_t) for n in shape_names],
+            [
+                VarDeclStmt(VarDecl("shape", Array(size_t, Int(rank)),
+                                    ArrayLiteral(shape_names))),
+                Return(Call(Name(name + "_alloc"), [Name("shape")])),
+            ],
+            nd_type,
+        )
+
+        indices = [Name("i{}".format(i)) for i in dims]
+        at = FuncDef(
+            name + "_at",
+            [VarDecl("a", nd_type)] + [VarDecl(i.id, size_t) for i in indices],
+            [
+                ExprStmt(Call(Name("assert"), [all_of([
+                    LogicalOp(idx, Lt(), member("shape", i))
+                    for i, idx in zip(dims, indices)
+                ])])),
+                Return(offset(indices)),
+            ],
+            Pointer(elem_type),
+        )
+
+        starts = [Name("start{}".format(i)) for i in dims]
+        ends = [Name("end{}".format(i)) for i in dims]
+        params = [VarDecl("a", nd_type)]
+        body = []
+        for i, start, end in zip(dims, starts, ends):
+            params += [VarDecl(start.id, size_t), VarDecl(end.id, size_t)]
+            body.append(If(
+                LogicalOp(end, Eq(), Cast(size_t, Int(-1))),
+                [Assign(end, member("shape", i))]
+            ))
+        body.append(ExprStmt(Call(Name("assert"), [all_of([
+            LogicalOp(LogicalOp(start, Le(), end), And(),
+                      LogicalOp(end, Le(), member("shape", i)))
+            for i, start, end in zip(dims, starts, ends)
+        ])])))
+        body.append(VarDeclStmt(VarDecl("v", nd_type)))
+        v = Name("v")
+        body.append(Assign(StructMemberAccess(v, "data"), offset(starts)))
+        for i, start, end in zip(dims, starts, ends):
+            body += [
+                Assign(Index(StructMemberAccess(v, "shape"), Int(i)),
+                       BinOp(end, Sub(), start)),
+                Assign(Index(StructMemberAccess(v, "strides"), Int(i)),
+                       member("strides", i)),
+            ]
+        body.append(Return(v))
+        view = FuncDef(name + "_view", params, body, nd_type)
+
+        free = FuncDef(
+            name + "_free",
+            [VarDecl("a", nd_type)],
+            [ExprStmt(Call(Name("free"), [StructMemberAccess(a, "data")]))],
+            NameType("void"),
+        )
+        return [new, at, view, free]
+
+    def __is_ndarray_type(self, t):
+        return (isinstance(t, StructType) and
+                self.__specializations.get(t.name) == "NDArray")
+
+    def __check_ndarray_index(self, value, value_t, indices, node):
+        """
+        Lower indexing an NDArray with one index per dimension to the
+        element at that offset, and slicing every dimension to a view.
+        Slices and indices cannot be mixed since that would change the
+        rank.
+        """
+        rank = value_t.members["shape"].size.n
+        if len(indices) != rank:
+            raise RuntimeError("Expected {} indices for {} of rank {}. Found {} ({})".format(
+                rank, value, rank, len(indices), node.loc()
+            ))
+
+        slices = [isinstance(i, SliceRange) for i in indices]
+        if not any(slices):
+            return Deref(self.check(Call(Name(value_t.name + "_at"),
+                                         [value] + indices)))
+        if not all(slices):
+            raise RuntimeError("Cannot mix indices and slices when indexing {}. Use i:i + 1 to keep a dimension of length 1 ({})".format(
+                value, node.loc()
+            ))
+
+        args = [value]
+        for s in indices:
+            args.append(self.check(s.start) if s.start else Int(0))
+            args.append(self.check(s.end) if s.end else
+                        Cast(NameType("size_t"), Int(-1)))
+        return self.check(Call(Name(value_t.name + "_view"), args))
+
+    def __is_span_type(self, t):
+        return (isinstance(t, StructType) and
+                self.__specializations.get(t.name) == "Span")
+
+    def __sized_sequence(self, value):
+        """
+        Get the pointer to the elements, the length and the element type of a
+        List (or a pointer to one) or a Span. Returns None for anything else.
+        """
+        t = self.exhaust_typedef(self.infer(value))
+        if isinstance(t, PointerType):
+            t = self.exhaust_typedef(t.contents)
+            if not (isinstance(t, StructType) and
+                    self.__specializations.get(t.name) == "List"):
+                return None
+            if isinstance(value, AddressOf):
+                value = value.value
+                member = lambda m: StructMemberAccess(value, m)
+            else:
+                member = lambda m: StructPointerDeref(value, m)
+        else:
+            member = lambda m: StructMemberAccess(value, m)
+
+        if (isinstance(t, StructType) and
+                self.__specializations.get(t.name) in ("List", "Span")):
+            elem_t = self.exhaust_typedef(t.members["data"]).contents
+            return member("data"), member("length"), elem_t
+        return None
+
+    def __add_specialization(self, name, node):
+        """
+        Check the node creating a specialization in the global scope and
+        place it before the top level statement being checked.
+        """
+        group = self.__check_global(node)
+
+        # The specialization can be created by each translation unit that
+        # uses it, so the functions are kept private to each one
+        for n in group.body:
+            if isinstance(n, FuncDef):
+                n.is_static = True
+
+        guard = "_LANG_SPEC_" + name
+        self.__pending_defs.append(StmtGroup([
+            Ifndef(guard),
+            Define(guard),
+            group,
+            Endif(),
+        ]))
+
+    def __check_global(self, node):
+        """Check a node in the global scope no matter where it is first
+        used."""
+        # Specializations are global no matter where they are first used.
+        # They also should not allocate from any arena being checked.
+        saved_vars = self.__variables
+        saved_types = self.__types
+        saved_classes = self.__classes
+        saved_arenas = self.__arenas
+        global_names = (set(self.__global_variables),
+                        set(self.__global_types),
+                        set(self.__global_classes))
+        self.__variables = self.__global_variables
+        self.__types = self.__global_types
+        self.__classes = self.__global_classes
+        self.__arenas = []
+
+        group = self.check(node)
+
+        self.__variables = saved_vars
+        self.__types = saved_types
+        self.__classes = saved_classes
+        self.__arenas = saved_arenas
+        self.__share_new_globals(global_names)
+        return group
+
+    def __share_new_globals(self, global_names):
+        """Make the globals declared since global_names were taken visible in
+        every enclosing scope."""
+        frames = self.__frames + [(self.__variables, self.__types, self.__classes)]
+        for global_d, known, i in zip((self.__global_variables,
+                                       self.__global_types,
+                                       self.__global_classes),
+                                      global_names, range(3)):
+            new = {k: v for k, v in global_d.items() if k not in known}
+            for frame in frames:
+                frame[i].update(new)
 
     def langtype_to_typemixin(self, t):
         self.assert_type_exists(t)
@@ -384,6 +1185,10 @@ class Inferer:
                 is_bound=t.is_bound,
                 inst=t.inst,
             )
+        elif isinstance(t, VectorType):
+            return NameType(vector_type_name(t))
+        elif isinstance(t, QualifiedType):
+            return Qualified(self.langtype_to_typemixin(t.contents), t.qualifier)
         elif t == VARARG_TYPE:
             return Ellipsis()
         else:
@@ -443,6 +1248,14 @@ class Inferer:
 
     def infer_StructMemberAccess(self, node):
         struct_t = self.exhaust_typedef(self.infer(node.value))
+        if isinstance(struct_t, SoaArrayType):
+            # The array holding this member for every element
+            if node.member not in struct_t.members:
+                raise RuntimeError("No member '{}' in the elements of {} ({})".format(
+                    node.member, node.value, node.loc()
+                ))
+            return ArrayType(struct_t.members[node.member], struct_t.size)
+
         assert isinstance(struct_t, StructType)
         member_t = struct_t.members[node.member]
 
@@ -471,11 +1284,25 @@ class Inferer:
             return DOUBLE_TYPE
         elif t1.name == "float" or t2.name == "float":
             return FLOAT_TYPE
-        elif t1.name == "uint" or t2.name == "uint":
-            return UINT_TYPE
+
+        # 64 bit integers (including the fixed width ones typedef'd to them)
+        # are not narrowed
+        base_ts = {self.exhaust_typedef(t1), self.exhaust_typedef(t2)}
+        if ULONG_TYPE in base_ts:
+            dominant_t = ULONG_TYPE
+        elif LONG_TYPE in base_ts:
+            dominant_t = LONG_TYPE
+        elif UINT_TYPE in base_ts:
+            dominant_t = UINT_TYPE
         else:
             return INT_TYPE
 
+        # Keep the typedef of an operand, like size_t, if it is the result
+        for t in (t1, t2):
+            if self.exhaust_typedef(t) == dominant_t:
+                return t
+        return dominant_t
+
     def type_is_pointer(self, t):
         return isinstance(self.exhaust_typedef(t), PointerType)
 
@@ -488,6 +1315,16 @@ class Inferer:
         left_t = self.infer(left)
         right_t = self.infer(right)
 
+        vector_t = self.__infer_vector_op(node, left_t, right_t)
+        if vector_t:
+            return vector_t
+
+        # Arithmetic on whole arrays is done elementwise
+        left_elem_t = self.__elementwise_operand(left_t)
+        right_elem_t = self.__elementwise_operand(right_t)
+        if left_elem_t or right_elem_t:
+            return self.__infer_elementwise(node, left_t, right_t)
+
         if op == Add() or op == Sub():
             # Check for shifting pointers
             if self.type_is_pointer(right_t):
@@ -516,6 +1353,102 @@ class Inferer:
 
         return self.dominant_base_type(left_t, right_t)
 
+    def __infer_vector_op(self, node, left_t, right_t, *, integral=False):
+        """
+        Get the type of a binary operation on a SIMD vector, or None if
+        neither operand is a vector. Both operands must be the same vector
+        type, or one of them can be a number which is used for every lane.
+        """
+        left_vt = self.exhaust_typedef(left_t)
+        right_vt = self.exhaust_typedef(right_t)
+        if isinstance(left_vt, VectorType):
+            vector_t, other_t = left_t, right_vt
+        elif isinstance(right_vt, VectorType):
+            vector_t, other_t = right_t, left_vt
+        else:
+            return None
+
+        vector_vt = self.exhaust_typedef(vector_t)
+        if isinstance(other_t, VectorType):
+            if other_t != vector_vt:
+                raise TypeError("cannot perform binary operation '{}' on vectors of types '{}' and '{}' in {}".format(
+                    node.op, left_t, right_t, node
+                ))
+        elif not self.type_is_numeric(other_t):
+            raise TypeError("cannot perform binary operation '{}' on a vector and type '{}' in {}".format(
+                node.op, other_t, node
+            ))
+
+        if integral and not self.type_is_integeral(vector_vt.contents):
+            raise TypeError("Expected a vector of integral types for {}. Found {}.".format(
+                node, vector_t
+            ))
+        return vector_t
+
+    def __check_vector_operands(self, node):
+        """
+        Convert a number used with a vector in a checked binary operation to
+        the element type of the vector. gcc only broadcasts numbers that
+        convert to the element type without losing precision.
+        """
+        def _to_elem(vector_t, value):
+            elem = self.langtype_to_typemixin(vector_t.contents)
+            if isinstance(value, Cast) and value.target_type == elem:
+                # Already converted when this node was checked before
+                return value
+            return Cast(elem, value)
+
+        left_t = self.exhaust_typedef(self.infer(node.left))
+        right_t = self.exhaust_typedef(self.infer(node.right))
+        if isinstance(left_t, VectorType) and self.type_is_numeric(right_t):
+            node.right = _to_elem(left_t, node.right)
+        elif isinstance(right_t, VectorType) and self.type_is_numeric(left_t):
+            node.left = _to_elem(right_t, node.left)
+        return node
+
+    def __elementwise_operand(self, t):
+        """
+        Get the element type of a value used as a whole in an elementwise
+        expression. These are arrays of known size, Spans, Lists (not
+        pointers to them since those can be shifted) and other elementwise
+        expressions. Returns None for anything else.
+        """
+        t = self.exhaust_typedef(t)
+        if isinstance(t, ElementwiseType):
+            return t.contents
+        if (isinstance(t, ArrayType) and not isinstance(t, SoaArrayType) and
+                t.size is not None):
+            return self.exhaust_typedef(t.contents)
+        if (isinstance(t, StructType) and
+                self.__specializations.get(t.name) in ("List", "Span")):
+            return self.exhaust_typedef(
+                self.exhaust_typedef(t.members["data"]).contents)
+        return None
+
+    def __infer_elementwise(self, node, left_t, right_t):
+        elem_ts = []
+        sizes = []
+        for t in (left_t, right_t):
+            elem_t = self.__elementwise_operand(t) or self.exhaust_typedef(t)
+            if not self.type_is_numeric(elem_t):
+                raise TypeError("cannot perform elementwise operation '{}' on elements of type '{}' in {}".format(
+                    node.op, elem_t, node
+                ))
+            elem_ts.append(elem_t)
+
+            t = self.exhaust_typedef(t)
+            if isinstance(t, (ArrayType, ElementwiseType)) and t.size is not None:
+                sizes.append(t.size)
+
+        if (len(sizes) == 2 and isinstance(sizes[0], Int) and
+                isinstance(sizes[1], Int) and sizes[0].n != sizes[1].n):
+            raise TypeError("Arrays of different sizes ({} and {}) in {}".format(
+                sizes[0], sizes[1], node
+            ))
+
+        return ElementwiseType(self.dominant_base_type(*elem_ts),
+                               sizes[0] if sizes else None)
+
     def infer_BitwiseOp(self, node):
         return self.infer_IntegralOp(node)
 
@@ -526,6 +1459,11 @@ class Inferer:
         return is_numeric_type(self.exhaust_typedef(t))
 
     def infer_IntegralOp(self, node):
+        vector_t = self.__infer_vector_op(node, self.infer(node.left),
+                                          self.infer(node.right), integral=True)
+        if vector_t:
+            return vector_t
+
         left_t = self.infer(node.left)
         if not self.type_is_integeral(left_t):
             raise TypeError("Expected LHS of {} to be an integral type. Found {}.".format(
@@ -571,6 +1509,21 @@ class Inferer:
     def infer_Index(self, node):
         value = node.value
 
+        method = self.__index_method(value, "__getitem__")
+        if method:
+            return self.exhaust_typedef(self.infer(method.func)).returns.contents
+
+        value_t = self.exhaust_typedef(self.infer(value))
+        if self.__is_span_type(value_t):
+            return self.exhaust_typedef(value_t.members["data"]).contents
+        if self.__is_ndarray_type(value_t):
+            return self.infer(self.check(node))
+        if isinstance(value_t, VectorType):
+            index_t = self.infer(node.index)
+            if not self.type_is_integeral(index_t):
+                raise TypeError("Cannot index vector {} with type '{}'".format(value, index_t))
+            return value_t.contents
+
         value_t = self.infer(value)
         if not self.type_is_container(value_t):
             raise TypeError("Could not index {} b/c it is not an array or pointer. Found {}.".format(value, value_t))
@@ -581,9 +1534,12 @@ class Inferer:
 
         return self.exhaust_typedef(value_t).contents
 
+    def infer_StrLiteral(self, node):
+        return self.langtype_from(NameType("str"))
+
     def infer_Str(self, node):
         if isinstance(node, Str):
-            return ArrayType(CHAR_TYPE, Int(len(node.s) + 1))  # +1 for the null char
+            return ArrayType(CHAR_TYPE, Int(node.c_size() + 1))  # +1 for the null char
         else:
             return PointerType(CHAR_TYPE)
 
@@ -591,13 +1547,37 @@ class Inferer:
         return PointerType(self.infer(node.value))
 
     def infer_LogicalOp(self, node):
+        # Comparing vectors gives the mask of the lanes where the comparison
+        # is true
+        vector_t = self.__infer_vector_op(node, self.infer(node.left),
+                                          self.infer(node.right))
+        if vector_t:
+            if isinstance(node.op, (And, Or)):
+                raise TypeError("Cannot use '{}' on vectors in {}. Use & or | to combine the masks of vector comparisons.".format(
+                    node.op, node
+                ))
+            return vector_mask_type(self.exhaust_typedef(vector_t))
         return INT_TYPE
 
     def infer_UnaryOp(self, node):
         op = node.op
         node_t = self.infer(node.value)
 
+        vector_t = self.exhaust_typedef(node_t)
+        if isinstance(vector_t, VectorType):
+            if isinstance(op, Not) or (isinstance(op, Invert) and
+                                       not self.type_is_integeral(vector_t.contents)):
+                raise TypeError("Cannot perform unary operation '{}' on vector {} of type '{}'".format(
+                    op, node.value, node_t
+                ))
+            return node_t
+
         if isinstance(op, (UAdd, USub)):
+            # Negating a whole array is done elementwise
+            elem_t = self.__elementwise_operand(node_t)
+            if elem_t and not isinstance(self.exhaust_typedef(node_t), ElementwiseType):
+                size = getattr(self.exhaust_typedef(node_t), "size", None)
+                return ElementwiseType(elem_t, size)
             return node_t
 
         if isinstance(op, Invert) and not self.type_is_integeral(node_t):
@@ -632,20 +1612,111 @@ class Inferer:
             node.value,
         )
 
+    def __check_alignment(self, decorator):
+        """Get the alignment requested by an @align(N) decorator."""
+        args = decorator.args
+        if (len(args) != 1 or not isinstance(args[0], Int) or
+                args[0].n <= 0 or args[0].n & (args[0].n - 1)):
+            raise RuntimeError("Expected a power of 2 alignment for '{}' ({})".format(
+                decorator, decorator.loc()
+            ))
+        return args[0].n
+
+    def __check_var_decorators(self, node):
+        """Check the decorators of a variable declaration and return the
+        alignment requested, if any."""
+        align = None
+        for decorator in node.decorators:
+            if decorator.name == "align":
+                align = self.__check_alignment(decorator)
+            else:
+                raise RuntimeError("Unknown variable decorator '{}' ({})".format(
+                    decorator, decorator.loc()
+                ))
+        return align
+
     def check_StructDecl(self, node):
+        pinned = False
+        packed = False
+        align = 1
+        for decorator in node.decorators:
+            if decorator.name == "pinned" and not decorator.args:
+                pinned = True
+            elif decorator.name == "packed" and not decorator.args:
+                packed = True
+            elif decorator.name == "align":
+                align = self.__check_alignment(decorator)
+            else:
+                raise RuntimeError("Unknown struct decorator '{}' ({})".format(
+                    decorator, decorator.loc()
+                ))
+
         # Check struct members
-        struct_t = StructType(node.struct.name)
+        name = node.struct.name
+        struct_t = StructType(name)
 
         self.add_type(struct_t)
-        self.bind_typedef(LangType(node.struct.name), struct_t)
+        self.bind_typedef(LangType(name), struct_t)
         struct_t.members = {d.name: self.langtype_from(d.type) for d in node.struct.decls}
 
         for t in struct_t.members.values():
             if isinstance(t, CallableType) and not self.type_exists(t):
                 self.add_type(t)
             self.assert_type_exists(t)
+
+        # Packing removes the natural alignment of each field, but fields
+        # explicitly aligned keep their alignment
+        field_layouts = []
+        for decl, t in zip(node.struct.decls, struct_t.members.values()):
+            field_align = self.__check_var_decorators(decl)
+            layout = self.type_layout(t)
+            if layout is not None:
+                layout = Layout(
+                    layout.size,
+                    max(1 if packed else layout.align, field_align or 1)
+                )
+            field_layouts.append(layout)
+
+        # Structs from builtin modules mirror C headers, so their fields
+        # cannot be moved
+        if not self.__checking_builtin_module:
+            node = self.__layout_struct(node, struct_t, field_layouts, align,
+                                        pinned)
         return node
 
+    def __layout_struct(self, node, struct_t, field_layouts, align, pinned):
+        """Record the layout of a struct and reorder its fields to minimize
+        padding if enabled."""
+        name = node.struct.name
+        decls = node.struct.decls
+        if not decls or None in field_layouts:
+            return node
+
+        declared = struct_layout(field_layouts, align=align)
+        order = min_padding_order(field_layouts)
+        optimal = struct_layout([field_layouts[i] for i in order], align=align)
+
+        if pinned:
+            optimal = declared
+
+        kind = "class" if name in self.__classes else "struct"
+        report = "{} {}: {} -> {}".format(kind, name, declared, optimal)
+        if pinned:
+            report += " (pinned)"
+        self.__layout_report.append(report)
+
+        if not self.__reorder_fields or pinned:
+            self.__layouts[name] = declared
+            return node
+
+        self.__layouts[name] = optimal
+        decls = [decls[i] for i in order]
+        struct_t.members = {d.name: struct_t.members[d.name] for d in decls}
+        return StructDecl(
+            Struct(name, decls),
+            node.decorators,
+        )
+
     def check_Ellipsis(self, node):
         return node
 
@@ -723,6 +1794,10 @@ class Inferer:
             assert isinstance(param, (VarDecl, Ellipsis))
 
     def check_FuncDef(self, node):
+        # Functions that yield are generators
+        if contains_node(node.body, lambda n: isinstance(n, Yield)):
+            return self.__check_generator(node)
+
         # Check for main function
         if node.name == "main":
             node = self._check_and_create_main(node)
@@ -764,8 +1839,8 @@ class Inferer:
                     new_node_params.append(
                         VarDecl(param, self.langtype_to_typemixin(expected_param_t))
                     )
-                elif param.type != expected_func_t.params[i]:
-                    raise RuntimeError("Expected {} to be of type {} from previous declaration".format(param.name))
+                elif not self.types_eq(self.langtype_from(param.type), expected_param_t):
+                    raise RuntimeError("Expected {} to be of type {} from previous declaration".format(param.name, expected_param_t))
                 else:
                     new_node_params.append(param)
             node_params = new_node_params
@@ -804,7 +1879,9 @@ class Inferer:
         for param in node_params:
             param_t = self.langtype_from(param.type)
             self.bind(param.name, param_t)
+        self.__returns.append(self.langtype_from(returns))
         body = [self.check(n) for n in node.body]
+        self.__returns.pop()
         self.exit_scope()
 
         # Check the body
@@ -815,6 +1892,193 @@ class Inferer:
             returns
         )
 
+    def __check_generator(self, node):
+        """
+        Compile a function that yields to a state machine. The function
+        returns a struct holding the state of the generator, which is passed
+        to the next() function of the generator to run it until the next
+        yield. Nothing is allocated, so the state lives wherever the caller
+        keeps it.
+
+        def count(n: int) -> int:
+            ...
+
+        becomes
+
+        typedef struct count_state count_state;
+        struct count_state {int lang_state; int n; ...};
+        count_state count(int n){...}
+        int count_next(count_state *lang_gen, int *lang_out){...}
+        """
+        name = node.name
+        self._assert_args_as_vardecls(node.params)
+        if self.var_exists(name):
+            raise RuntimeError("Generator '{}' was previously declared ({})".format(name, node.loc()))
+
+        # The return type of a generator is the type it yields
+        yield_t = self.langtype_from(node.returns or NameType("int"))
+        yield_type = self.langtype_to_typemixin(yield_t)
+
+        self.enter_scope()
+        for param in node.params:
+            self.bind(param.name, self.langtype_from(param.type))
+        self.__yields.append(yield_t)
+        body = [self.check(n) for n in node.body]
+        self.__yields.pop()
+        self.exit_scope()
+
+        lowerer = GeneratorLowerer(node.params)
+        body = lowerer.visit(body)
+
+        state_name = name + "_state"
+        state_type = NameType(state_name)
+        state_decl = self.check(StructDecl(Struct(
+            state_name,
+            [VarDecl("lang_state", NameType("int"))] + lowerer.fields()
+        )))
+
+        # Creating the generator only stores its arguments
+        state = Name(GENERATOR_STATE)
+        init = self.check(FuncDef(
+            name,
+            node.params,
+            [VarDeclStmt(VarDecl(GENERATOR_STATE, state_type)),
+             Assign(StructMemberAccess(state, "lang_state"), Int(0))] +
+            [Assign(StructMemberAccess(state, p.name), Name(p.name))
+             for p in node.params] +
+            [Return(state)],
+            state_type
+        ))
+
+        next_name = name + "_next"
+        next_params = [VarDecl(GENERATOR_STATE, Pointer(state_type)),
+                       VarDecl(GENERATOR_OUT, Pointer(yield_type))]
+        self.check(FuncDecl(next_name, next_params, NameType("int")))
+        next_def = FuncDef(
+            next_name,
+            next_params,
+            [GeneratorResume(lowerer.yields)] + body + [
+                Assign(StructPointerDeref(state, "lang_state"),
+                       UnaryOp(USub(), Int(1))),
+                Return(Int(0)),
+            ],
+            NameType("int")
+        )
+
+        self.__generators[state_name] = (yield_t, next_name)
+        return StmtGroup([state_decl, init, next_def])
+
+    def check_Yield(self, node):
+        if not self.__yields:
+            raise RuntimeError("yield can only be used in a function ({})".format(node.loc()))
+        yield_t = self.__yields[-1]
+        value = self.__coerce(yield_t, self.check(node.value))
+        self.__check_assignable(yield_t, self.infer(value), value, "yield")
+        return Yield(value)
+
+    def __future_type(self, func):
+        """
+        Get the type of the future of a function, creating the future the
+        first time the function is spawned.
+
+        Args:
+            func (str): Name of the function
+        """
+        func_t = self.exhaust_typedef(self.lookup(func))
+        if (not isinstance(func_t, CallableType) or func_t.is_bound or
+                any(arg == VARARG_TYPE for arg in func_t.args)):
+            raise RuntimeError("Only functions with a fixed number of arguments can be spawned. Found {} of type {}.".format(
+                func, func_t))
+
+        future_t = StructType("lang_future_" + func)
+        if future_t in self.__futures:
+            return future_t
+
+        if "lang_tasks.h" not in self.__extra_includes:
+            self.add_extra_c_header("lang_tasks.h")
+
+        params = []
+        for arg_t in func_t.args:
+            arg_t = self.exhaust_typedef(arg_t)
+            if isinstance(arg_t, ArrayType):
+                arg_t = PointerType(arg_t.contents)
+            params.append(self.langtype_to_typemixin(arg_t))
+
+        # The future can be used in any function
+        global_names = (set(self.__global_variables),
+                        set(self.__global_types),
+                        set(self.__global_classes))
+        self.__global_types[future_t] = None
+        self.__share_new_globals(global_names)
+
+        self.__futures[future_t] = func_t.returns
+        self.__pending_defs.append(FutureDef(
+            future_t.name,
+            func,
+            params,
+            self.langtype_to_typemixin(func_t.returns)
+        ))
+        return future_t
+
+    def __check_spawn(self, node, target=None):
+        """
+        Check a spawn whose future is stored in the target variable. A
+        spawned call whose result is not stored gets a hidden variable, so
+        it is still waited for.
+        """
+        call = node.value
+        if not isinstance(call, Call) or not isinstance(call.func, Name):
+            raise RuntimeError("Only function calls can be spawned ({})".format(node.loc()))
+        if not self.__returns:
+            raise RuntimeError("Calls can only be spawned in functions ({})".format(node.loc()))
+        if self.__yields:
+            raise RuntimeError("Calls cannot be spawned in generators ({})".format(node.loc()))
+
+        call = self.check(call)
+        future_t = self.__future_type(call.func.id)
+
+        if target is None:
+            target = "lang_spawn{}".format(self.__spawn_count)
+            self.__spawn_count += 1
+
+        declare = not self.var_exists(target)
+        if declare:
+            self.bind(target, future_t)
+        elif self.lookup(target) != future_t:
+            raise TypeError("Expected type {} for {}. Found {} ({}).".format(
+                self.lookup(target), target, future_t, node.loc()))
+
+        return SpawnStmt(target, call, future_t.name, declare)
+
+    def check_Spawn(self, node):
+        raise RuntimeError("A spawned call can only be assigned to a variable ({})".format(node.loc()))
+
+    def infer_Spawn(self, node):
+        raise RuntimeError("A spawned call can only be assigned to a variable ({})".format(node.loc()))
+
+    def check_Join(self, node):
+        value = self.check(node.value)
+        future_t = strip_qualifiers(self.infer(value))
+        if future_t not in self.__futures:
+            raise TypeError("Only the futures of spawned calls can be joined. Found {} ({})".format(
+                future_t, node.loc()))
+        return Join(value, future_t.name)
+
+    def infer_Join(self, node):
+        future_t = strip_qualifiers(self.infer(node.value))
+        if future_t not in self.__futures:
+            raise TypeError("Only the futures of spawned calls can be joined. Found {} ({})".format(
+                future_t, node.loc()))
+        return self.__futures[future_t]
+
+    def check_Sync(self, node):
+        """Wait for every future in scope."""
+        return StmtGroup([
+            ExprStmt(Call(Name(t.name + "_sync"), [AddressOf(Name(name))]))
+            for name, t in self.__variables.items()
+            if t in self.__futures
+        ])
+
     def checkassign_Name(self, node):
         right = node.right
         right_t = self.infer(right)
@@ -822,8 +2086,12 @@ class Inferer:
         name = node.left.id
         if self.var_exists(name):
             expected_t = self.lookup(name)
+            if self.type_is_const(expected_t):
+                raise TypeError("Cannot assign to {} since it is of const type {} ({})".format(
+                    name, expected_t, node.left.loc()))
             if not self.types_eq(expected_t, right_t):
                 raise TypeError("Expected type {} for {}. Found {} at {}.".format(expected_t, name, right_t, right.loc()))
+            self.__check_keeps_const(expected_t, right_t, name)
 
             expected_t = self.exhaust_typedef(expected_t)
             right_t = self.exhaust_typedef(right_t)
@@ -836,8 +2104,9 @@ class Inferer:
         else:
             # First instance of this variable. Change to a VarDecl.
             # The default type for the vardecl will be the type of the RHS
-            # Apply any necessary changes
-            assign_t = right_t
+            # Apply any necessary changes. The variable is a copy of the RHS,
+            # so it does not keep its qualifiers.
+            assign_t = strip_qualifiers(right_t)
 
             if (isinstance(right_t, ArrayType) and
                     not isinstance(right, ArrayLiteral) and
@@ -861,6 +2130,9 @@ class Inferer:
 
         # Get the pointer value
         left_t = self.infer(left)
+        if self.type_is_const(left_t):
+            raise TypeError("Cannot assign to {} since it is of const type {}".format(
+                left, left_t))
         expected_t = self.exhaust_typedef(left_t)
         self.__check_assignable(
             expected_t, right_t, right,
@@ -934,9 +2206,23 @@ class Inferer:
         c1.is_bound = c2.is_bound
         c1.inst = c2.inst
 
+    def checkassign_MultiIndex(self, node):
+        return self.checkassign_Deref(Assign(self.check(node.left), node.right))
+
     def checkassign_Index(self, node):
         left = node.left
         right = node.right
+
+        # Classes that define __setitem__ handle the assignment themselves
+        method = self.__index_method(left.value, "__setitem__")
+        if method:
+            method.args += [left.index, right]
+            return ExprStmt(self.check(method))
+
+        left = self.__check_checked_index(left)
+        if not isinstance(left, Index):
+            return self.checkassign_Deref(Assign(left, right))
+
         right_t = self.infer(right)
 
         # Get the array and check the contents
@@ -944,6 +2230,9 @@ class Inferer:
 
         value_t = self.infer(value)
         container_t = self.exhaust_typedef(value_t)  # Pointer/Array
+        if self.type_is_const(container_t.contents):
+            raise TypeError("Cannot assign to the contents of {} since they are of const type {}".format(
+                value, container_t.contents))
         expected_t = self.exhaust_typedef(container_t.contents)
 
         # See if can assign
@@ -960,16 +2249,64 @@ class Inferer:
         return node
 
     def check_Assign(self, node):
-        node = Assign(
-            self.check(node.left),
-            self.check(node.right)
-        )
+        left = node.left
+        if isinstance(node.right, Spawn):
+            if not isinstance(left, Name):
+                raise RuntimeError("A spawned call can only be assigned to a variable ({})".format(node.loc()))
+            return self.__check_spawn(node.right, left.id)
+        right = self.check(node.right)
+        if isinstance(self.exhaust_typedef(self.infer(right)), ElementwiseType):
+            return self.__check_elementwise_assign(self.check(left), right)
+        if isinstance(left, Index):
+            # Indexing is lowered by checkassign_Index since assigning to
+            # an index can call a method other than __getitem__
+            left = Index(self.check(left.value), self.check(left.index))
+            if not self.__index_method(left.value, "__setitem__"):
+                right = self.__coerce(self.infer(left), right)
+        else:
+            left = self.check(left)
+            if not isinstance(left, Name) or self.var_exists(left.id):
+                right = self.__coerce(self.infer(left), right)
+        node = Assign(left, right)
 
         left_node_name = type(node.left).__name__
         return getattr(self, "checkassign_" + left_node_name)(node)
 
     def check_Return(self, node):
-        return Return(self.check(node.value))
+        if self.__yields:
+            raise RuntimeError("Generators cannot return a value ({})".format(node.loc()))
+        value = self.check(node.value)
+        if self.__returns:
+            value = self.__coerce(self.__returns[-1], value)
+        return Return(value)
+
+    def __coerce(self, expected_t, value):
+        """
+        Convert values to the type expected where they are used:
+        - string literals used where a str is expected become a str whose
+          length is computed at compile time;
+        - arrays of known size, Lists and pointers to Lists used where a
+          Span is expected become a Span of all their elements.
+        """
+        expected_t = self.exhaust_typedef(expected_t)
+        if (isinstance(expected_t, (PointerType, ArrayType)) and
+                not isinstance(expected_t, SoaArrayType) and
+                isinstance(self.exhaust_typedef(self.infer(value)), SoaArrayType)):
+            raise TypeError("The @soa array {} cannot be used as {} since its elements are not stored contiguously ({})".format(
+                value, expected_t, value.loc()
+            ))
+
+        if (isinstance(value, Str) and isinstance(expected_t, StructType) and
+                expected_t.name == "str"):
+            return StrLiteral(value)
+
+        if self.__is_span_type(expected_t):
+            value_t = self.exhaust_typedef(self.infer(value))
+            if (not self.__is_span_type(value_t) and
+                    (self.__sized_sequence(value) or
+                     (isinstance(value_t, ArrayType) and value_t.size is not None))):
+                return self.check(Slice(value))
+        return value
 
     def check_Ifndef(self, node):
         return node
@@ -989,11 +2326,11 @@ class Inferer:
         return node
 
     def check_BinOp(self, node):
-        return BinOp(
+        return self.__check_vector_operands(BinOp(
             self.check(node.left),
             node.op,
             self.check(node.right),
-        )
+        ))
 
     def check_UnaryOp(self, node):
         return UnaryOp(
@@ -1015,12 +2352,28 @@ class Inferer:
         return node
 
     def check_StructPointerDeref(self, node):
-        return node
+        return StructPointerDeref(
+            self.check(node.value),
+            node.member
+        )
 
     def check_Call(self, node):
+        func = node.func
+        if (isinstance(func, Name) and func.id in ("hash", "hash_eq") and
+                not self.var_exists(func.id)):
+            return self.__check_hash_call(node)
+        if (isinstance(func, Name) and
+                func.id in ("sort", "bisect_left", "bisect_right") and
+                not self.var_exists(func.id)):
+            return self.__check_sort_call(node)
+        if (isinstance(func, Name) and func.id in ("map_file", "unmap_file") and
+                not self.var_exists(func.id)):
+            self.__add_io_functions()
+
         node = Call(
             self.check(node.func),
-            [self.check(a) for a in node.args]
+            [self.check(a) for a in node.args],
+            inst_passed=node.inst_passed
         )
 
         func = node.func
@@ -1030,18 +2383,478 @@ class Inferer:
             # The contents of sizeof do not get evaluated
             return node
 
+        if self.__arenas and isinstance(func, Name):
+            arena_node = self.__arena_call(node)
+            if arena_node is not node:
+                # The redirected call was already checked
+                return arena_node
+
+        # The instance is already passed if this call was checked before
         func_t = self.exhaust_typedef(self.infer(func))
-        if func_t.is_bound:
+        if func_t.is_bound and not node.inst_passed:
+            if len(args) + 1 != len(func_t.args):
+                raise TypeError("Expected {} arguments for method {}. Found {} ({})".format(
+                    len(func_t.args) - 1, func, len(args), func.loc()
+                ))
             args.insert(0, func_t.inst)
+            node.inst_passed = True
+
+        for i, arg_t in enumerate(func_t.args[:len(args)]):
+            args[i] = self.__coerce(arg_t, args[i])
 
         return node
 
-    # TODO: Check for class types in these later
+    def __check_hash_call(self, node):
+        """
+        Lower hash(x) and hash_eq(a, b) to the hash function or comparison
+        for the type of x or a. Integers and pointers are hashed by value and
+        strings (char pointers) by their contents. Classes can be hashed by
+        defining __hash__ and __eq__ methods which are given pointers to
+        them.
+        """
+        func = node.func.id
+        args = [self.check(a) for a in node.args]
+        expected = 1 if func == "hash" else 2
+        if len(args) != expected:
+            raise RuntimeError("{}() takes {} arguments. Found {} ({})".format(
+                func, expected, len(args), node.loc()
+            ))
+
+        t = self.exhaust_typedef(self.infer(args[0]))
+        if isinstance(t, ArrayType):
+            t = PointerType(t.contents)
+        if isinstance(t, StructType) and t.name == "str":
+            func = "str_hash" if func == "hash" else "str_eq"
+            return self.check(Call(Name(func), args))
+        if isinstance(t, PointerType):
+            contents_t = self.exhaust_typedef(t.contents)
+            method = "__hash__" if func == "hash" else "__eq__"
+            if (isinstance(contents_t, StructType) and
+                    contents_t.name in self.__classes and
+                    method in contents_t.members):
+                return self.check(Call(
+                    Name(contents_t.name + "_" + method), args))
+
+        if func == "hash_eq":
+            if t == PointerType(CHAR_TYPE):
+                return self.check(Call(Name("lang_eq_str"), args))
+            if is_integral_type(t) or isinstance(t, PointerType):
+                return LogicalOp(args[0], Eq(), args[1])
+        else:
+            if t == PointerType(CHAR_TYPE):
+                return self.check(Call(Name("lang_hash_str"), args))
+            if isinstance(t, PointerType):
+                return self.check(Call(Name("lang_hash_ptr"), args))
+            if is_integral_type(t):
+                return self.check(Call(Name("lang_hash_int"), args))
+
+        raise RuntimeError("Cannot hash values of type {} ({})".format(
+            t, node.loc()))
+
+    def __check_sort_call(self, node):
+        """
+        Lower sort() and bisect_left()/bisect_right() to the functions in
+        C_SORT_TEMPLATE specialized for the element type and comparison.
+
+        sort(arr, n) or sort(seq) sorts in ascending order with <.
+        bisect_left(arr, n, x) or bisect_left(seq, x) searches a sorted array.
+        seq can be a List or a Span.
+
+        Both take the name of a function as an optional last argument. A
+        function taking 2 elements (or pointers to them) is used instead of
+        <. A function taking 1 element (or a pointer to it) is a key the
+        elements are compared by.
+        """
+        func = entry = node.func.id
+        args = [self.check(a) for a in node.args]
+        if not args:
+            raise RuntimeError("{}() expects an array, List or Span ({})".format(
+                func, node.loc()))
+
+        # Arrays and pointers are passed with their length while Lists and
+        # Spans carry theirs
+        sequence = self.__sized_sequence(args[0])
+        if sequence and not self.__is_variable(args[0]):
+            # The List is evaluated once by making it a Span
+            args[0] = self.check(Slice(args[0]))
+            sequence = None
+        container_t = self.exhaust_typedef(self.infer(args[0]))
+        if self.__is_span_type(container_t):
+            elem_t = self.exhaust_typedef(container_t.members["data"]).contents
+            call_args = args[:1]
+            args = args[1:]
+            entry += "_span"
+        elif sequence:
+            data, length, elem_t = sequence
+            call_args = [data, length]
+            args = args[1:]
+        elif isinstance(container_t, (ArrayType, PointerType)) and len(args) > 1:
+            elem_t = container_t.contents
+            call_args = args[:2]
+            args = args[2:]
+        else:
+            raise RuntimeError("{}() expects an array and its length, a List or a Span ({})".format(
+                func, node.loc()))
+
+        if func != "sort":
+            if not args:
+                raise RuntimeError("{}() expects a value to search for ({})".format(
+                    func, node.loc()))
+            call_args.append(args.pop(0))
+        if len(args) > 1:
+            raise RuntimeError("Too many arguments for {}() ({})".format(
+                func, node.loc()))
+        compare = args[0] if args else None
+
+        elem_type = self.langtype_to_typemixin(elem_t)
+        suffix = mangle_type(elem_type)
+        if compare is not None:
+            if not isinstance(compare, Name):
+                raise RuntimeError("The comparison for {}() must be the name of a function ({})".format(
+                    func, node.loc()))
+            suffix += "_by_" + compare.id
+
+        if "lang_sort_" + suffix not in self.__specializations:
+            self.__specializations["lang_sort_" + suffix] = "sort"
+            self.__add_specialization(
+                "lang_sort_" + suffix,
+                StmtGroup(self.__sort_functions(elem_t, elem_type, compare, suffix))
+            )
+
+        return self.check(Call(Name("lang_{}_{}".format(entry, suffix)), call_args))
+
+    def __add_io_functions(self):
+        """Add map_file() and unmap_file() from C_IO_TEMPLATE."""
+        if "lang_io" not in self.__specializations:
+            self.__specializations["lang_io"] = "io"
+            self.__add_specialization(
+                "lang_io", StmtGroup(self.__parse_template(C_IO_TEMPLATE)))
+
+    def __sort_functions(self, elem_t, elem_type, compare, suffix):
+        """The functions of C_SORT_TEMPLATE specialized for the element type
+        and comparison."""
+        template = self.__parse_template(C_SORT_TEMPLATE)
+        a = Name("a")
+        b = Name("b")
+        if compare is None:
+            if not (self.type_is_numeric(elem_t) or self.type_is_pointer(elem_t)):
+                raise RuntimeError("Elements of type {} can only be sorted with a comparison function".format(
+                    elem_t))
+            less = LogicalOp(Deref(a), Lt(), Deref(b))
+        else:
+            compare_t = self.exhaust_typedef(self.infer(compare))
+            if (not isinstance(compare_t, CallableType) or
+                    len(compare_t.args) not in (1, 2)):
+                raise RuntimeError("Expected {} to be a function taking 1 or 2 arguments ({})".format(
+                    compare, compare.loc()))
+
+            # Elements are passed by pointer unless the function takes them
+            # by value
+            if not self.type_is_pointer(compare_t.args[0]):
+                a = Deref(a)
+                b = Deref(b)
+            if len(compare_t.args) == 2:
+                less = Call(compare, [a, b])
+            else:
+                less = LogicalOp(Call(compare, [a]), Lt(), Call(compare, [b]))
+
+        names = {
+            n.name: "lang_{}_{}".format(n.name, suffix)
+            for n in template
+        }
+        names["less"] = "lang_less_" + suffix
+        less_def = FuncDef(
+            names["less"],
+            [VarDecl("a", Pointer(elem_type)), VarDecl("b", Pointer(elem_type))],
+            [Return(less)],
+            NameType("int"),
+        )
+        funcs = TypeParamSubstituter(
+            {"T": elem_type}, names).visit(template)
+        for n in funcs:
+            n.name = names[n.name]
+        return [less_def] + funcs
+
+    def __arena_call(self, node):
+        """
+        Redirect heap allocations made inside a with arena block to the
+        innermost arena. Class constructors (including the array
+        constructors) are replaced with the class initializer called on
+        memory taken from the arena.
+
+        Memory from the arena of the block, or of any block around it, is
+        owned by that arena, so free() leaves it to the arena and realloc()
+        moves it within the arena. Pointers that did not come from an arena,
+        like ones allocated before the block, are still freed and
+        reallocated on the heap. Class destructors only run __del__ on
+        objects owned by an arena.
+        """
+        func_name = node.func.id
+        arena = Name(self.__arenas[-1])
+        args = node.args
+
+        if func_name == "malloc":
+            return self.check(Call(Name("arena_alloc"), [arena] + args))
+        elif func_name == "calloc":
+            return self.check(Call(Name("arena_calloc"), [arena] + args))
+        elif func_name == "realloc":
+            return self.check(Call(Name("arena_realloc"), [arena] + args))
+        elif func_name == "aligned_alloc" and len(args) == 2:
+            return self.check(Call(Name("arena_alloc_aligned"),
+                                   [arena, args[1], args[0]]))
+        elif func_name == "free":
+            return self.check(Call(Name("arena_release"), [arena] + args))
+
+        cls_name = func_name[len("del_"):]
+        is_array = cls_name.endswith("_array")
+        if is_array:
+            cls_name = cls_name[:-len("_array")]
+        if func_name.startswith("del_") and cls_name in self.__classes:
+            return self.check(Call(
+                Name(self.__arena_destructor(cls_name, is_array)),
+                [arena] + args
+            ))
+
+        def allocate(cls_name, size):
+            # Classes aligned past what arena_alloc guarantees are allocated
+            # like with aligned_alloc
+            layout = self.type_layout(LangType(cls_name))
+            if layout and layout.align > MAX_BUILTIN_ALIGN:
+                return Call(Name("arena_alloc_aligned"),
+                            [arena, size, Int(layout.align)])
+            return Call(Name("arena_alloc"), [arena, size])
+
+        cls_name = func_name[len("new_"):]
+        if func_name.startswith("new_") and cls_name in self.__classes:
+            cls_ptr_type = Pointer(NameType(cls_name))
+            obj = Cast(
+                cls_ptr_type,
+                allocate(cls_name, Call(Name("sizeof"), [Name(cls_name)]))
+            )
+            return self.check(Call(Name("init_" + cls_name), [obj] + node.args))
+
+        cls_name = cls_name[:-len("_array")]
+        if (func_name.startswith("new_") and func_name.endswith("_array") and
+                cls_name in self.__classes):
+            cls_ptr_type = Pointer(NameType(cls_name))
+            count = node.args[0]
+            objs = Cast(
+                cls_ptr_type,
+                allocate(cls_name, BinOp(
+                    Call(Name("sizeof"), [Name(cls_name)]),
+                    Mult(),
+                    count
+                ))
+            )
+            return self.check(Call(
+                Name("init_" + cls_name + "_array"),
+                [objs] + node.args
+            ))
+
+        return node
+
+    def __arena_destructor(self, cls_name, is_array):
+        """
+        Create the function destroying an object (or array of objects) of a
+        class inside an arena block and return its name. Objects owned by an
+        arena only have __del__ run on them, while others are destroyed and
+        freed as usual.
+        """
+        del_name = "del_" + cls_name + ("_array" if is_array else "")
+        name = "lang_arena_" + del_name
+        if name in self.__specializations:
+            return name
+        self.__specializations[name] = "arena_del"
+
+        params = [VarDecl("arena", Pointer(NameType("Arena"))),
+                  VarDecl("self", Pointer(NameType(cls_name)))]
+        args = [Name("self")]
+        if is_array:
+            params.append(VarDecl("count", NameType("size_t")))
+            args.append(Name("count"))
+
+        owned = Call(Name("arena_owns"), [Name("arena"), Name("self")])
+        destroy = [ExprStmt(Call(Name(del_name), args))]
+        if self.var_exists(cls_name + "___del__"):
+            fini_name = ("fini_" + cls_name + "_array" if is_array
+                         else cls_name + "___del__")
+            body = [If(owned, [ExprStmt(Call(Name(fini_name), args))], destroy)]
+        else:
+            body = [If(UnaryOp(Not(), owned), destroy)]
+
+        self.__add_specialization(name, StmtGroup([
+            FuncDef(name, params, body, NameType("void"))]))
+        return name
+
     def check_Index(self, node):
-        return Index(
+        return self.__check_checked_index(Index(
             self.check(node.value),
             self.check(node.index)
-        )
+        ))
+
+    def __check_checked_index(self, node):
+        """Check an Index whose value and index were already checked."""
+        value_t = self.exhaust_typedef(self.infer(node.value))
+        if isinstance(value_t, SoaArrayType):
+            raise RuntimeError("Elements of the @soa array {} can only be used through their members ({})".format(
+                node.value, node.loc()
+            ))
+
+        # Spans are bounds checked like Lists
+        if self.__is_span_type(value_t):
+            return Deref(self.check(Call(
+                Name(value_t.name + "_at"), [node.value, node.index])))
+        if self.__is_ndarray_type(value_t):
+            return self.__check_ndarray_index(node.value, value_t,
+                                              [node.index], node)
+
+        # Classes that define __getitem__ are indexed through the pointer it
+        # returns
+        method = self.__index_method(node.value, "__getitem__")
+        if method:
+            method.args.append(node.index)
+            return Deref(self.check(method))
+
+        return node
+
+    def __index_method(self, value, method):
+        """
+        Get a call to the method of the class of the value being indexed
+        with the instance as the only argument. Returns None if the value is
+        not a class that defines the method. Pointers to objects, including
+        Lists and Dicts, are indexed as arrays, so they must be dereferenced
+        to index the object they point to.
+        """
+        value_t = self.exhaust_typedef(self.infer(value))
+        if isinstance(value, Deref):
+            inst = value.value
+        else:
+            inst = AddressOf(value)
+        if not (isinstance(value_t, StructType) and
+                value_t.name in self.__classes and
+                method in value_t.members):
+            return None
+
+        func = Name(value_t.name + "_" + method)
+        if method == "__getitem__":
+            returns = self.exhaust_typedef(self.infer(func)).returns
+            if not isinstance(self.exhaust_typedef(returns), PointerType):
+                raise TypeError("{} must return a pointer to the element to be indexed. Found {} ({})".format(
+                    func.id, returns, value.loc()
+                ))
+        return Call(func, [inst])
+
+    def check_MultiIndex(self, node):
+        value = self.check(node.value)
+        value_t = self.exhaust_typedef(self.infer(value))
+        if not self.__is_ndarray_type(value_t):
+            raise RuntimeError("Only NDArrays can be indexed with multiple indices. Found {} of type {} ({})".format(
+                value, value_t, node.loc()
+            ))
+        indices = [i if isinstance(i, SliceRange) else self.check(i)
+                   for i in node.indices]
+        return self.__check_ndarray_index(value, value_t, indices, node)
+
+    def check_Slice(self, node):
+        """
+        Lower arr[start:end] to the Span of the elements from start up to
+        end. The start defaults to 0 and the end to the length of arr, which
+        must be given when slicing a pointer.
+        """
+        value = self.check(node.value)
+        value_t = self.exhaust_typedef(self.infer(value))
+        if self.__is_ndarray_type(value_t):
+            return self.__check_ndarray_index(
+                value, value_t, [SliceRange(node.start, node.end)], node)
+
+        start = self.check(node.start) if node.start else Int(0)
+        end = self.check(node.end) if node.end else None
+        if self.__is_span_type(value_t):
+            if end is None:
+                return self.check(Call(Name(value_t.name + "_suffix"),
+                                       [value, start]))
+            return self.check(Call(Name(value_t.name + "_subspan"),
+                                   [value, start, end]))
+
+        sequence = self.__sized_sequence(value)
+        if sequence and not self.__is_variable(value):
+            return self.__check_list_slice(value, sequence[2], start, end)
+        elif sequence:
+            data, length, elem_t = sequence
+        elif isinstance(value_t, ArrayType) and value_t.size is not None:
+            data = value
+            length = value_t.size
+            elem_t = value_t.contents
+        elif isinstance(value_t, (ArrayType, PointerType)):
+            if end is None:
+                raise RuntimeError("The end of the slice of {} must be given since its length is not known ({})".format(
+                    value, node.loc()
+                ))
+            data = value
+
+            # There is no length to check the end against
+            length = Cast(NameType("size_t"), Int(-1))
+            elem_t = value_t.contents
+        else:
+            raise RuntimeError("Cannot slice {} of type {} ({})".format(
+                value, value_t, node.loc()
+            ))
+
+        span = self.__specialize_span(self.langtype_to_typemixin(elem_t))
+        return self.check(Call(
+            Name(span + "_slice"),
+            [data, length, start, end if end is not None else length]
+        ))
+
+    def __is_variable(self, node):
+        """Check if a node only accesses a variable, so evaluating it more than
+        once has no side effects."""
+        while isinstance(node, (StructMemberAccess, StructPointerDeref, Deref,
+                                AddressOf, Index)):
+            if isinstance(node, Index) and not (
+                    isinstance(node.index, Int) or
+                    self.__is_variable(node.index)):
+                return False
+            node = node.value
+        return isinstance(node, Name)
+
+    def __check_list_slice(self, value, elem_t, start, end):
+        """
+        Lower a slice of a List that is not a variable to a call to a
+        function created for the slice. The List (or pointer to it) is its
+        argument, so it is evaluated once for both its data and length.
+        """
+        name = "lang_slice{}".format(self.__slice_count)
+        self.__slice_count += 1
+
+        span = self.__specialize_span(self.langtype_to_typemixin(elem_t))
+        value_t = self.infer(value)
+        lst = Name("lang_list")
+        if isinstance(self.exhaust_typedef(value_t), PointerType):
+            member = lambda m: StructPointerDeref(lst, m)
+        else:
+            member = lambda m: StructMemberAccess(lst, m)
+
+        params = [VarDecl(lst.id, self.langtype_to_typemixin(value_t)),
+                  VarDecl("lang_start", NameType("size_t"))]
+        args = [value, start]
+        if end is not None:
+            params.append(VarDecl("lang_end", NameType("size_t")))
+            args.append(end)
+        func = self.__check_global(FuncDef(
+            name,
+            params,
+            [Return(Call(Name(span + "_slice"), [
+                member("data"),
+                member("length"),
+                Name("lang_start"),
+                Name("lang_end") if end is not None else member("length"),
+            ]))],
+            NameType(span),
+        ))
+        func.is_static = True
+        self.__pending_defs.append(func)
+        return self.check(Call(Name(name), args))
 
     def check_PostInc(self, node):
         return PostInc(self.check(node.value))
@@ -1056,25 +2869,25 @@ class Inferer:
         return PreDec(self.check(node.value))
 
     def check_LogicalOp(self, node):
-        return LogicalOp(
+        return self.__check_vector_operands(LogicalOp(
             self.check(node.left),
             node.op,
             self.check(node.right),
-        )
+        ))
 
     def check_IntegralOp(self, node):
-        return IntegralOp(
+        return self.__check_vector_operands(IntegralOp(
             self.check(node.left),
             node.op,
             self.check(node.right),
-        )
+        ))
 
     def check_BitwiseOp(self, node):
-        return BitwiseOp(
+        return self.__check_vector_operands(BitwiseOp(
             self.check(node.left),
             node.op,
             self.check(node.right),
-        )
+        ))
 
     def check_Null(self, node):
         return node
@@ -1083,16 +2896,177 @@ class Inferer:
         if isinstance(node.value, Str):
             # String comment
             return Pass()
+        elif isinstance(node.value, Spawn):
+            return self.__check_spawn(node.value)
+        elif (isinstance(node.value, Call) and
+                any(isinstance(arg, FString) for arg in node.value.args)):
+            return self.__check_fstring_call(node.value)
         return ExprStmt(self.check(node.value))
 
+    def check_FString(self, node):
+        raise RuntimeError("f-strings can only be passed to printf(), write_str() or str_builder_append() ({})".format(
+            node.loc()))
+
+    def infer_FString(self, node):
+        return self.check_FString(node)
+
+    # printf flags, width and precision of an f-string field
+    __PRINTF_SPEC = re.compile(r"[-+ #0]*\d*(\.\d+)?$")
+
+    def __check_fstring_call(self, node):
+        """
+        Lower printf(f"..."), write_str(f"...") and
+        str_builder_append(b, f"...") using the types of the values in the
+        f-string.
+
+        printf() gets a format string with the conversion matching each
+        type. write_str() and str_builder_append() become one call for each
+        part of the f-string to the writer for its type, so no format string
+        is parsed at runtime.
+        """
+        func = node.func.id if isinstance(node.func, Name) else None
+        if func == "printf" and len(node.args) == 1:
+            return ExprStmt(self.check(self.__fstring_printf(node.args[0])))
+
+        if func == "write_str" and len(node.args) == 1:
+            prefix = "write_"
+            target = []
+            body = []
+        elif (func == "str_builder_append" and len(node.args) == 2 and
+                not isinstance(node.args[0], FString)):
+            # The builder is only evaluated once
+            prefix = "str_builder_append_"
+            builder = self.check(node.args[0])
+            body = []
+            if not isinstance(builder, Name):
+                name = "lang_fmt{}".format(self.__fstring_count)
+                self.__fstring_count += 1
+                body.append(self.check(VarDeclStmt(
+                    VarDecl(name, Pointer(NameType("StrBuilder")), builder))))
+                builder = Name(name)
+            target = [builder]
+        else:
+            return self.check_FString(
+                next(arg for arg in node.args if isinstance(arg, FString)))
+
+        for part in node.args[-1].parts:
+            if isinstance(part, Str):
+                call = Call(Name(func), target + [part])
+            else:
+                kind, value = self.__fstring_kind(part.value)
+                precision = self.__fstring_precision(part, kind)
+                if kind in ("char", "int", "uint", "float"):
+                    args = [value] + ([Int(precision)] if kind == "float" else [])
+                    call = Call(Name(prefix + kind), target + args)
+                elif kind == "cstr":
+                    if target:
+                        value = Call(Name("str_from"), [value])
+                    call = Call(Name(func), target + [value])
+                elif kind == "str" and target:
+                    call = Call(Name(func), target + [value])
+                else:
+                    raise TypeError("Cannot write {} of type {} with {}(). Use printf() ({})".format(
+                        part.value, self.infer(value), func, part.loc()))
+            body.append(ExprStmt(self.check(call)))
+        return StmtGroup(body)
+
+    def __fstring_kind(self, value):
+        """The kind of formatting for a value in an f-string and the checked
+        value."""
+        value = self.check(value)
+
+        # Only plain chars are characters. Typedefs of them, like int8, are
+        # small integers.
+        if unqualified(self.infer(value)) == CHAR_TYPE:
+            return "char", value
+
+        t = unqualified(self.exhaust_typedef(self.infer(value)))
+        if t in (UCHAR_TYPE, USHORT_TYPE, UINT_TYPE, ULONG_TYPE):
+            return "uint", value
+        elif is_integral_type(t):
+            return "int", value
+        elif is_floating_point_type(t):
+            return "float", value
+        elif isinstance(t, (PointerType, ArrayType)) and self.exhaust_typedef(t.contents) == CHAR_TYPE:
+            return "cstr", value
+        elif isinstance(t, (PointerType, ArrayType)):
+            return "pointer", value
+        elif isinstance(t, StructType) and t.name == "str":
+            return "str", value
+        raise TypeError("Cannot format {} of type {} in an f-string ({})".format(
+            value, t, value.loc()))
+
+    def __fstring_precision(self, part, kind):
+        """The precision of a float written without printf. Other specs can
+        only be given to printf."""
+        if part.spec is None:
+            return 6
+        if kind == "float" and re.match(r"\.\d+$", part.spec):
+            return int(part.spec[1:])
+        raise RuntimeError("Format spec '{}' of {} is only supported by printf() ({})".format(
+            part.spec, part.value, part.loc()))
+
+    def __fstring_printf(self, fstring):
+        """printf() with the format of an f-string and its values."""
+        conversions = {
+            "char": ("c", None),
+            "int": ("lld", LONG_TYPE),
+            "uint": ("lu", ULONG_TYPE),
+            "float": ("f", None),
+            "cstr": ("s", None),
+            "pointer": ("p", VOID_TYPE),
+        }
+        fmt = ""
+        args = []
+        for part in fstring.parts:
+            if isinstance(part, Str):
+                fmt += part.s.replace("%", "%%")
+                continue
+
+            spec = part.spec or ""
+            if not self.__PRINTF_SPEC.match(spec):
+                raise RuntimeError("Invalid format spec '{}' for {} ({})".format(
+                    spec, part.value, part.loc()))
+
+            kind, value = self.__fstring_kind(part.value)
+            if kind == "str":
+                if "." in spec:
+                    raise RuntimeError("strs cannot be formatted with a precision ({})".format(
+                        part.loc()))
+                if contains_node(value, lambda n: isinstance(n, Call)):
+                    raise RuntimeError("Assign {} to a variable before formatting it, since it is used twice ({})".format(
+                        part.value, part.loc()))
+                fmt += "%" + spec + ".*s"
+                args += [Cast(NameType("int"), StructMemberAccess(value, "length")),
+                         StructMemberAccess(value, "data")]
+                continue
+
+            # Integers are passed as the widest type of their sign so the
+            # conversion matches however they are typedef'd in C
+            conversion, cast_t = conversions[kind]
+            fmt += "%" + spec + conversion
+            if cast_t == VOID_TYPE:
+                value = Cast(Pointer(NameType("void")), value)
+            elif cast_t:
+                value = Cast(NameType(cast_t.name), value)
+            args.append(value)
+        return Call(Name("printf"), [Str(fmt)] + args)
+
     def __check_assignable(self, expected_t, value_t, value_node, varname):
-        expected_t = self.exhaust_typedef(expected_t)
-        value_t = self.exhaust_typedef(value_t)
+        self.__check_keeps_const(expected_t, value_t, varname)
+        expected_t = unqualified(self.exhaust_typedef(expected_t))
+        value_t = unqualified(self.exhaust_typedef(value_t))
 
         # Array literals to arrays of anything
         if isinstance(value_node, ArrayLiteral) and isinstance(expected_t, ArrayType):
             return
 
+        # Array literals to vectors with at least as many lanes
+        if (isinstance(value_node, ArrayLiteral) and
+                isinstance(expected_t, VectorType) and
+                len(value_node.contents) <= expected_t.lanes):
+            return
+
         if isinstance(value_t, ArrayType) and isinstance(expected_t, PointerType):
             return
 
@@ -1115,14 +3089,25 @@ class Inferer:
         # TODO: Make size_t a builtin type to avoid having to do this check
         if target_t == SIZE_TYPE or value_t == SIZE_TYPE:
             self.__builtin_type_check(SIZE_TYPE)
-        return can_implicit_assign(
-            self.exhaust_typedef(target_t),
-            self.exhaust_typedef(value_t),
-        )
+        target_t = self.exhaust_typedef(target_t)
+        value_t = self.exhaust_typedef(value_t)
+        if target_t not in BUILTIN_TYPES or value_t not in BUILTIN_TYPES:
+            return False
+        return can_implicit_assign(target_t, value_t)
 
     def check_NameType(self, node):
         return node
 
+    def check_Generic(self, node):
+        self.langtype_from(node)
+        return node
+
+    def check_Vector(self, node):
+        return node
+
+    def check_Qualified(self, node):
+        return Qualified(self.check(node.contents), node.qualifier)
+
     def check_Array(self, node):
         return Array(
             self.check(node.contents),
@@ -1132,6 +3117,9 @@ class Inferer:
     def check_Str(self, node):
         return node
 
+    def check_StrLiteral(self, node):
+        return node
+
     def check_Pointer(self, node):
         return Pointer(self.check(node.contents))
 
@@ -1156,10 +3144,21 @@ class Inferer:
         return Deref(self.check(node.value))
 
     def check_StructMemberAccess(self, node):
-        return StructMemberAccess(
-            self.check(node.value),
-            node.member
-        )
+        value = node.value
+        if isinstance(value, Index):
+            # arr[i].member of an @soa array becomes arr.member[i]
+            arr = self.check(value.value)
+            if isinstance(self.exhaust_typedef(self.infer(arr)), SoaArrayType):
+                return Index(
+                    StructMemberAccess(arr, node.member),
+                    self.check(value.index)
+                )
+            value = self.__check_checked_index(
+                Index(arr, self.check(value.index)))
+        else:
+            value = self.check(value)
+
+        return StructMemberAccess(value, node.member)
 
     def check_Char(self, node):
         return node
@@ -1168,10 +3167,12 @@ class Inferer:
         return node
 
     def check_VarDecl(self, node):
+        self.__check_var_decorators(node)
         node = VarDecl(
             node.name,
             self.check(node.type),
-            self.check(node.init) if node.init else node.init
+            self.check(node.init) if node.init else node.init,
+            node.decorators
         )
 
         node_t = self.langtype_from(node.type)
@@ -1179,6 +3180,8 @@ class Inferer:
         self.assert_type_exists(node_t)
         name = node.name
         init = node.init
+        if init:
+            init = node.init = self.__coerce(node_t, init)
 
         # Make sure the variable is not declared in the same scope
         if self.var_exists(name):
@@ -1189,21 +3192,232 @@ class Inferer:
             init_t = self.infer(init)
             self.__check_assignable(node_t, init_t, init, name)
 
-            node_t = self.exhaust_typedef(node_t)
-            init_t = self.exhaust_typedef(init_t)
-
             # Pass any bounded instances
-            if isinstance(node_t, CallableType):
-                node_t.is_bound = init_t.is_bound
-                node_t.inst = init_t.inst
+            callable_t = self.exhaust_typedef(node_t)
+            init_t = self.exhaust_typedef(init_t)
+            if isinstance(callable_t, CallableType):
+                callable_t.is_bound = init_t.is_bound
+                callable_t.inst = init_t.inst
 
         # Add variable
         self.bind(name, node_t)
         return node
 
     def check_VarDeclStmt(self, node):
+        if any(d.name == "soa" for d in node.decl.decorators):
+            return self.__check_soa_decl(node.decl)
+
+        # Elementwise expressions are assigned after the declaration
+        decl = node.decl
+        if isinstance(decl.init, (BinOp, UnaryOp)):
+            self.check(decl.type)
+            init = self.check(decl.init)
+            if isinstance(self.exhaust_typedef(self.infer(init)), ElementwiseType):
+                return StmtGroup([
+                    self.check(VarDeclStmt(VarDecl(
+                        decl.name, decl.type, decorators=decl.decorators))),
+                    self.__check_elementwise_assign(Name(decl.name), init),
+                ])
+
         return VarDeclStmt(self.check(node.decl))
 
+    def __check_elementwise_assign(self, target, expr):
+        """
+        Lower the assignment of an elementwise expression to a fused loop
+        writing each element of the target. Assigning to a new variable
+        declares it as an array if the size of the expression is known.
+
+        c = a * b + 1
+
+        becomes
+
+        {
+            Span_int lang_ew0 = Span_int_slice(c, 4, 0, 4);
+            Span_int lang_ew1 = Span_int_slice(a, 4, 0, 4);
+            ...
+            assert(lang_ew1.length == lang_ew0.length);
+            #pragma omp simd
+            for (size_t lang_i = 0; lang_i < lang_ew0.length; lang_i++) {
+                lang_ew0.data[lang_i] = lang_ew1.data[lang_i] * lang_ew2.data[lang_i] + 1;
+            }
+        }
+
+        Operands that are other parts of the variable assigned to
+        (a[1:] = a[:3] + 1) can overlap the target, so the result is written
+        to a copy that is copied to the target after the loop. Overlaps of
+        different variables, like two Spans of the same array, are not
+        detected.
+        """
+        expr_t = self.exhaust_typedef(self.infer(expr))
+        stmts = []
+        if isinstance(target, Name) and not self.var_exists(target.id):
+            if expr_t.size is None:
+                raise RuntimeError("The size of {} is not known. Declare {} before assigning to it ({}).".format(
+                    expr, target, expr.loc()
+                ))
+            stmts.append(self.check(VarDeclStmt(VarDecl(
+                target.id,
+                Array(self.langtype_to_typemixin(expr_t.contents), expr_t.size)
+            ))))
+
+        target_t = self.exhaust_typedef(self.infer(target))
+        if not (self.__elementwise_operand(target_t) or
+                self.__sized_sequence(target)):
+            raise TypeError("Cannot assign elementwise expression {} to {} of type {}".format(
+                expr, target, target_t
+            ))
+
+        setup = []
+        checks = []
+        index = Name("lang_i")
+
+        def operand_span(value):
+            # Every operand becomes a Span evaluated once before the loop
+            elem_t = self.__elementwise_operand(self.infer(value))
+            if elem_t is None:
+                elem_t = self.__sized_sequence(value)[2]
+            span = self.__specialize_span(self.langtype_to_typemixin(elem_t))
+            name = Name("lang_ew{}".format(len(setup)))
+            setup.append(VarDeclStmt(VarDecl(
+                name.id,
+                NameType(span),
+                self.__coerce(self.langtype_from(NameType(span)), value)
+            )))
+            return name
+
+        out = operand_span(target)
+        length = StructMemberAccess(out, "length")
+        target_base = self.__elementwise_base(target)
+        overlaps = False
+
+        def lower(node):
+            nonlocal overlaps
+            if isinstance(node, BinOp):
+                return BinOp(lower(node.left), node.op, lower(node.right))
+            if isinstance(node, UnaryOp):
+                return UnaryOp(node.op, lower(node.value))
+
+            node_t = self.infer(node)
+            if self.__elementwise_operand(node_t):
+                if (target_base is not None and
+                        self.__elementwise_base(node) == target_base and
+                        node.c_code() != target.c_code()):
+                    overlaps = True
+                name = operand_span(node)
+                checks.append(ExprStmt(Call(Name("assert"), [
+                    LogicalOp(StructMemberAccess(name, "length"), Eq(), length)
+                ])))
+                return Index(StructMemberAccess(name, "data"), index)
+            if isinstance(node, (Int, Float, Char, Name)):
+                return node
+
+            # Anything else is only computed once
+            name = Name("lang_ew{}".format(len(setup)))
+            setup.append(VarDeclStmt(VarDecl(
+                name.id, self.langtype_to_typemixin(node_t), node)))
+            return name
+
+        value = lower(expr)
+        out_data = StructMemberAccess(out, "data")
+        finish = []
+        if overlaps:
+            # Elements of the target could be written before they are read
+            elem_t = self.langtype_to_typemixin(
+                self.__elementwise_operand(self.infer(target)) or
+                self.__sized_sequence(target)[2])
+            size = BinOp(Call(Name("sizeof"), [Deref(out_data)]), Mult(), length)
+            copy = Name("lang_ew{}".format(len(setup)))
+            checks.append(VarDeclStmt(VarDecl(
+                copy.id,
+                Pointer(elem_t),
+                Cast(Pointer(elem_t), Call(Name("malloc"), [size]))
+            )))
+            finish = [
+                ExprStmt(Call(Name("memcpy"), [out_data, copy, size])),
+                ExprStmt(Call(Name("free"), [copy])),
+            ]
+            for func in ("malloc", "memcpy", "free"):
+                self.check(Name(func))
+            out_data = copy
+
+        body = Assign(Index(out_data, index), value)
+        self.check(Name("assert"))
+        stmts.append(ElementwiseLoop(setup + checks, index.id, length, [body],
+                                     finish))
+        return StmtGroup(stmts)
+
+    def __elementwise_base(self, node):
+        """
+        Get the name of the variable an operand of an elementwise expression
+        is part of, or None if it is not known. Slices are calls taking what
+        they slice first.
+        """
+        while True:
+            if isinstance(node, Call) and node.args and self.__is_span_type(
+                    self.exhaust_typedef(self.infer(node))):
+                node = node.args[0]
+            elif isinstance(node, (StructMemberAccess, StructPointerDeref,
+                                   Index, Deref, AddressOf)):
+                node = node.value
+            elif isinstance(node, Name):
+                return node.id
+            else:
+                return None
+
+    def __check_soa_decl(self, node):
+        """
+        Lower an array of structs decorated with @soa to a struct containing
+        an array for each member of the struct.
+
+        @soa particles: Particle[100]
+
+        becomes
+
+        struct Particle_soa0 {x: float[100], y: float[100]}
+        particles: Particle_soa0
+        """
+        for decorator in node.decorators:
+            if decorator.name != "soa" or decorator.args:
+                raise RuntimeError("Unexpected decorator '{}' on @soa array ({})".format(
+                    decorator, decorator.loc()
+                ))
+        if not isinstance(node.type, Array) or node.init:
+            raise RuntimeError("Expected an uninitialized array for @soa array '{}' ({})".format(
+                node.name, node.loc()
+            ))
+        if self.var_exists(node.name):
+            raise RuntimeError("Cannot declare variable '{}' again in same scope".format(node.name))
+
+        arr_t = self.langtype_from(node.type)
+        struct_t = self.exhaust_typedef(arr_t.contents)
+        if not isinstance(struct_t, StructType):
+            raise RuntimeError("Expected an array of structs for @soa array '{}'. Found {} ({})".format(
+                node.name, arr_t, node.loc()
+            ))
+
+        # Methods are shared by all instances of a class, so they are not
+        # stored per element
+        is_class = struct_t.name in self.__classes
+        members = {
+            name: t for name, t in struct_t.members.items()
+            if not (is_class and isinstance(t, CallableType))
+        }
+
+        soa_name = "{}_soa{}".format(struct_t.name, self.__soa_count)
+        self.__soa_count += 1
+
+        size = self.check(node.type.size)
+        struct_decl = self.check(StructDecl(Struct(soa_name, [
+            VarDecl(name, Array(self.langtype_to_typemixin(t), size))
+            for name, t in members.items()
+        ])))
+        self.bind(node.name, SoaArrayType(arr_t.contents, size, members))
+
+        return StmtGroup([
+            struct_decl,
+            VarDeclStmt(VarDecl(node.name, NameType(soa_name))),
+        ])
+
     def check_While(self, node):
         return While(
             self.check(node.test),
@@ -1211,6 +3425,146 @@ class Inferer:
             [self.check(n) for n in node.orelse],
         )
 
+    def check_For(self, node):
+        parallel = False
+        for decorator in node.decorators:
+            if decorator.name == "parallel" and not decorator.args:
+                parallel = True
+            else:
+                raise RuntimeError("Unknown for loop decorator {} ({})".format(
+                    decorator, node.loc()))
+
+        iter_node = node.iter
+        if (not isinstance(iter_node, Call) or
+                not isinstance(iter_node.func, Name) or
+                iter_node.func.id != "range" or
+                self.var_exists("range")):
+            if parallel:
+                raise RuntimeError("Only loops over range() can be parallel ({})".format(node.loc()))
+            return self.__check_for_generator(node)
+
+        args = iter_node.args
+        if not 1 <= len(args) <= 3:
+            raise RuntimeError("range() expects 1 to 3 arguments. Found {} ({})".format(
+                len(args), iter_node.loc()))
+        if len(args) == 1:
+            args = [Int(0)] + args
+        if len(args) == 2:
+            args = args + [Int(1)]
+        start, stop, step = [self.check(arg) for arg in args]
+        if int_literal_value(step) == 0:
+            raise RuntimeError("range() step cannot be zero ({})".format(iter_node.loc()))
+
+        # The index has the type of the non literal bounds, so looping up to a
+        # size_t gives a size_t index
+        index_t = None
+        for arg in (start, stop, step):
+            if int_literal_value(arg) is not None:
+                continue
+            arg_t = strip_qualifiers(self.infer(arg))
+            if not is_integral_type(self.exhaust_typedef(arg_t)):
+                raise TypeError("range() expects integral arguments. Found {} ({})".format(
+                    arg_t, arg.loc()))
+            if index_t is None or self.types_eq(index_t, arg_t):
+                index_t = index_t or arg_t
+            else:
+                index_t = self.dominant_base_type(index_t, arg_t)
+        index_t = index_t or INT_TYPE
+
+        # Unsigned indices cannot hold negative bounds. The only loop past 0
+        # they can make is counting down to it, which is tested before the
+        # index is decremented.
+        down_to_zero = False
+        if is_unsigned_type(self.exhaust_typedef(index_t)):
+            start_n = int_literal_value(start)
+            stop_n = int_literal_value(stop)
+            if stop_n == -1 and int_literal_value(step) == -1 and not parallel:
+                down_to_zero = True
+            elif (start_n is not None and start_n < 0 or
+                    stop_n is not None and stop_n < 0):
+                raise TypeError("range() with a negative bound cannot have an index of unsigned type {} ({})".format(
+                    index_t, iter_node.loc()))
+
+        # A signed step keeps its type so it can still be negative, and a
+        # negative step stops at the stop instead of wrapping the index
+        # around below 0. OpenMP computes the iterations of parallel loops
+        # itself.
+        step_t = None
+        clamp_step = False
+        if (is_unsigned_type(self.exhaust_typedef(index_t)) and
+                not parallel and not down_to_zero):
+            step_n = int_literal_value(step)
+            if step_n is None:
+                arg_t = strip_qualifiers(self.infer(step))
+                if not is_unsigned_type(self.exhaust_typedef(arg_t)):
+                    step_t = self.langtype_to_typemixin(arg_t)
+                    clamp_step = True
+            elif step_n < -1:
+                clamp_step = True
+
+        # The index is only visible in the loop, where it can shadow another
+        # variable
+        shared = {name for name, t in self.__variables.items()
+                  if not isinstance(t, CallableType)}
+        self.enter_scope()
+        self.__variables[node.target] = index_t
+        body = [self.check(n) for n in node.body]
+        self.exit_scope()
+
+        reductions = {}
+        if parallel:
+            # OpenMP needs to know the direction of the loop
+            if int_literal_value(step) is None:
+                raise RuntimeError("The step of a parallel loop must be a constant ({})".format(
+                    iter_node.loc()))
+
+            found = ParallelLoopChecker(node.target, shared, node.loc()).check(body)
+            for name, op in sorted(found.items()):
+                var_t = self.exhaust_typedef(self.lookup(name))
+                if not is_numeric_type(var_t):
+                    raise TypeError("Cannot reduce {} of type {} in a parallel loop ({})".format(
+                        name, var_t, node.loc()))
+                reductions.setdefault(op, []).append(name)
+
+        return ForRange(
+            node.target,
+            self.langtype_to_typemixin(index_t),
+            start,
+            stop,
+            step,
+            body,
+            parallel,
+            reductions,
+            down_to_zero,
+            step_t,
+            clamp_step
+        )
+
+    def __check_for_generator(self, node):
+        iter_node = self.check(node.iter)
+        state_t = strip_qualifiers(self.infer(iter_node))
+        if state_t.name not in self.__generators:
+            raise RuntimeError("Only range() and generators can be iterated over in a for loop. Found {} ({})".format(
+                state_t, node.iter.loc()))
+        if isinstance(iter_node, Name) and self.type_is_const(self.infer(iter_node)):
+            raise TypeError("Cannot advance generator {} since it is of const type ({})".format(
+                iter_node.id, node.iter.loc()))
+        yield_t, next_name = self.__generators[state_t.name]
+
+        self.enter_scope()
+        self.__variables[node.target] = yield_t
+        body = [self.check(n) for n in node.body]
+        self.exit_scope()
+
+        return ForGenerator(
+            node.target,
+            self.langtype_to_typemixin(yield_t),
+            iter_node,
+            self.langtype_to_typemixin(state_t),
+            next_name,
+            body
+        )
+
     def check_DoWhile(self, node):
         return DoWhile(
             self.check(node.test),
@@ -1228,6 +3582,7 @@ class Inferer:
         # Create an enum type
         enum_t = LangType(node.enum.name)
         self.add_type(enum_t)
+        self.__layouts[node.enum.name] = ENUM_LAYOUT
 
         for member in node.enum.members:
             self.bind(member, enum_t)
@@ -1235,11 +3590,57 @@ class Inferer:
         return node
 
     def check_Switch(self, node):
+        test = self.check(node.test)
+        test_t = unqualified(self.exhaust_typedef(self.infer(test)))
+        if (isinstance(test_t, (PointerType, ArrayType)) and
+                self.exhaust_typedef(test_t.contents) == CHAR_TYPE):
+            return self.__check_string_switch(node, test, is_str=False)
+        elif isinstance(test_t, StructType) and test_t.name == "str":
+            return self.__check_string_switch(node, test, is_str=True)
+
         return Switch(
-            self.check(node.test),
+            test,
             [self.check(n) for n in node.cases]
         )
 
+    def __check_string_switch(self, node, test, *, is_str):
+        """
+        Lower a switch on a string (char* or str) with string literal cases
+        to a switch on the id of the matching case. The id is found by a
+        function created for the switch, which looks the string up in a
+        perfect hash table of the cases and compares it to the one case in
+        its slot.
+        """
+        name = "lang_switch{}".format(self.__switch_count)
+        self.__switch_count += 1
+
+        keys = []
+        ids = []
+        seen = set()
+        cases = []
+        for case in node.cases:
+            if isinstance(case, Default):
+                cases.append(self.check(case))
+                continue
+
+            case_id = len(cases)
+            for t in case.tests:
+                if not isinstance(t, Str):
+                    raise TypeError("The cases of a switch on a string must be string literals. Found {} ({})".format(
+                        t, t.loc()))
+                data = c_string_bytes(t.s)
+                if data in seen:
+                    raise RuntimeError("Duplicate case {} ({})".format(t, t.loc()))
+                seen.add(data)
+                keys.append(t.s)
+                ids.append(case_id)
+            cases.append(Case([Int(case_id)], [self.check(n) for n in case.body]))
+
+        # Strings are compared with memcmp
+        self.check(Name("memcmp"))
+        self.__pending_defs.append(StrSwitchDef(name, keys, ids, is_str))
+        return Switch(Call(Name(name), [test]), cases)
+
     def check_Case(self, node):
         return Case(
             [self.check(t) for t in node.tests],
@@ -1255,6 +3656,41 @@ class Inferer:
     def check_Pass(self, node):
         return node
 
+    def check_With(self, node):
+        context = node.context
+        if not (isinstance(context, Call) and isinstance(context.func, Name) and
+                context.func.id == "arena"):
+            raise RuntimeError("Expected arena(size) as the context of the with statement at {}".format(
+                node.loc()
+            ))
+        if len(context.args) != 1:
+            raise RuntimeError("Expected 1 argument for arena() at {}. Found {}.".format(
+                context.loc(), len(context.args)
+            ))
+
+        size = self.check(context.args[0])
+        size_t = self.infer(size)
+        if not self.__can_implicit_cast(SIZE_TYPE, size_t):
+            raise TypeError("Cannot use type '{}' for arena size ({}).".format(size_t, size))
+
+        name = node.name
+        if name is None:
+            name = "__arena_{}".format(self.__arena_count)
+            self.__arena_count += 1
+
+        # Arenas know the arenas of the blocks around them so memory from
+        # those is not freed by the inner block
+        parent = self.__arenas[-1] if self.__arenas else None
+
+        self.enter_scope()
+        self.bind(name, self.langtype_from(Pointer(NameType("Arena"))))
+        self.__arenas.append(name)
+        body = [self.check(n) for n in node.body]
+        self.__arenas.pop()
+        self.exit_scope()
+
+        return ArenaBlock(name, size, body, parent)
+
     def check_Default(self, node):
         return Default(
             [self.check(n) for n in node.body]
@@ -1263,11 +3699,14 @@ class Inferer:
     def check_ClassDef(self, node):
         name = node.name
         func_typename = node.name
-        self.__classes[name] = None
 
         generics = node.generics
         if generics:
-            raise NotImplementedError("No logic yet implemented for generic types.")
+            # Generic classes are only created when specialized
+            self.__templates[name] = node
+            return StmtGroup([])
+
+        self.__classes[name] = None
 
         parents = node.parents
         if parents:
@@ -1322,9 +3761,10 @@ class Inferer:
             func_typename,
 
             # Remove any inits
-            [VarDecl(p.name, p.type) for p in attrs.values()] +
+            [VarDecl(p.name, p.type, decorators=p.decorators)
+             for p in attrs.values()] +
             [VarDecl(f.name, f.as_func_type()) for f in funcdecls.values()]
-        )))
+        ), node.decorators))
 
         # Create the methods
         methods = []
@@ -1340,48 +3780,69 @@ class Inferer:
         init_args = [Name(p.name) for p in init_params]
 
         cls_ptr_type = Pointer(NameType(func_typename))
-        constr_func_body = [
-            # Create the object
-            VarDeclStmt(VarDecl(
-                "obj",
-                cls_ptr_type,
-                Cast(
-                    cls_ptr_type,
-                    Call(
-                        Name("malloc"),
-                        [Call(Name("sizeof"), [Name(func_typename)])]
-                    )
-                )
-            ))
-        ]
+
+        # malloc only guarantees the alignment of the builtin types, so
+        # classes aligned past that are allocated with aligned_alloc
+        layout = self.type_layout(LangType(func_typename))
+
+        def allocate(size):
+            if layout and layout.align > MAX_BUILTIN_ALIGN:
+                return Call(Name("aligned_alloc"), [Int(layout.align), size])
+            return Call(Name("malloc"), [size])
+
+        # Create the initializer which sets up an already allocated object.
+        # This is what allocators other than malloc (ie. arenas) construct
+        # objects with.
+        init_func_body = []
 
         # Set any default values
         for name, vardecl in attrs.items():
             init = vardecl.init
             if init:
-                constr_func_body.append(Assign(
+                init_func_body.append(Assign(
                     StructPointerDeref(Name("obj"), name),
                     init
                 ))
 
         for name, funcdecl in funcdecls.items():
-            constr_func_body.append(Assign(
+            init_func_body.append(Assign(
                 StructPointerDeref(Name("obj"), name),
                 Name(node.name + "_" + name)
             ))
 
         if "__init__" in funcdecls:
-            constr_func_body += [
+            init_func_body += [
                 # Initialize
                 ExprStmt(Call(Name(node.name + "___init__"),
                               [Name("obj")] + init_args)),
                 ]
 
-        constr_func_body += [
+        init_func_body += [
             # Return it
             Return(Name("obj")),
         ]
 
+        init_func = self.check(FuncDef(
+            "init_" + node.name,
+            [VarDecl("obj", cls_ptr_type)] + init_params,
+            init_func_body,
+            cls_ptr_type
+        ))
+
+        # Create the constructor function
+        constr_func_body = [
+            # Create and initialize the object
+            Return(Call(
+                Name("init_" + node.name),
+                [
+                    Cast(
+                        cls_ptr_type,
+                        allocate(Call(Name("sizeof"), [Name(func_typename)]))
+                    )
+                ] + init_args
+            ))
+        ]
+
         constr_func = self.check(FuncDef(
             "new_" + node.name,
             init_params,
@@ -1410,8 +3871,89 @@ class Inferer:
             NameType("void"),
         ))
 
+        # Create the array functions which construct and destroy n objects
+        # stored contiguously in one allocation
+        size_t_type = NameType("size_t")
+        each_obj = BinOp(Name("lang_objs"), Add(), Name("lang_idx"))
+
+        def each_obj_loop(stmt):
+            return [
+                VarDeclStmt(VarDecl("lang_idx", size_t_type, Int(0))),
+                While(LogicalOp(Name("lang_idx"), Lt(),
+                                Name("lang_count")), [
+                    stmt,
+                    ExprStmt(PostInc(Name("lang_idx"))),
+                ]),
+            ]
+
+        init_array_func = self.check(FuncDef(
+            "init_" + node.name + "_array",
+            [VarDecl("lang_objs", cls_ptr_type),
+             VarDecl("lang_count", size_t_type)] + init_params,
+            each_obj_loop(ExprStmt(Call(
+                Name("init_" + node.name),
+                [each_obj] + init_args
+            ))) + [Return(Name("lang_objs"))],
+            cls_ptr_type
+        ))
+
+        constr_array_func = self.check(FuncDef(
+            "new_" + node.name + "_array",
+            [VarDecl("lang_count", size_t_type)] + init_params,
+            [Return(Call(
+                Name("init_" + node.name + "_array"),
+                [
+                    Cast(
+                        cls_ptr_type,
+                        allocate(BinOp(
+                            Call(Name("sizeof"), [Name(func_typename)]),
+                            Mult(),
+                            Name("lang_count")
+                        ))
+                    ),
+                    Name("lang_count")
+                ] + init_args
+            ))],
+            cls_ptr_type
+        ))
+
+        # Objects in arenas are destroyed without freeing their memory
+        if "__del__" in funcdecls:
+            fini_array_func = self.check(FuncDef(
+                "fini_" + node.name + "_array",
+                [VarDecl("lang_objs", cls_ptr_type),
+                 VarDecl("lang_count", size_t_type)],
+                each_obj_loop(ExprStmt(Call(
+                    Name(node.name + "___del__"),
+                    [each_obj]
+                ))),
+                NameType("void"),
+            ))
+            fini_array_funcs = [fini_array_func]
+            dtor_array_body = [ExprStmt(Call(
+                Name("fini_" + node.name + "_array"),
+                [Name("lang_objs"), Name("lang_count")]
+            ))]
+        else:
+            fini_array_funcs = []
+            dtor_array_body = []
+        dtor_array_body += [
+            ExprStmt(Call(Name("free"), [Name("lang_objs")]))
+        ]
+
+        dtor_array_func = self.check(FuncDef(
+            "del_" + node.name + "_array",
+            [VarDecl("lang_objs", cls_ptr_type),
+             VarDecl("lang_count", size_t_type)],
+            dtor_array_body,
+            NameType("void"),
+        ))
+
         # Finalize the group
-        body = [struct_decl] + methods + [constr_func, dtor_func]
+        body = [struct_decl] + methods + [
+            init_func, constr_func, dtor_func,
+            init_array_func, constr_array_func
+        ] + fini_array_funcs + [dtor_array_func]
         group = StmtGroup(body)
 
         # If the source file for this inferer was provided, dump the C code of
@@ -1429,7 +3971,17 @@ class Inferer:
         if is_base_module and node.filename:
             self.__init_src_file(node.filename)
 
-        checked_body = [self.check(n) for n in node.body]
+        # Place the definitions created while checking each statement before
+        # it
+        saved_pending_defs = self.__pending_defs
+        self.__pending_defs = []
+        checked_body = []
+        for n in node.body:
+            checked = self.check(n)
+            checked_body += self.__pending_defs
+            self.__pending_defs = []
+            checked_body.append(checked)
+        self.__pending_defs = saved_pending_defs
 
         # Add extra includes
         if is_base_module:
@@ -1443,24 +3995,25 @@ class Inferer:
         saved_vars = self.__variables
         saved_types = self.__types
         saved_classes = self.__classes
+        saved_checking_builtin = self.__checking_builtin_module
+        global_names = (set(self.__global_variables),
+                        set(self.__global_types),
+                        set(self.__global_classes))
         self.__variables = self.__global_variables
         self.__types = self.__global_types
         self.__classes = self.__global_classes
+        self.__checking_builtin_module = True
 
         # Check normally
         self.__check_module(node)
+        self.__checking_builtin_module = saved_checking_builtin
 
         # Switch back to the local one
         self.__variables = saved_vars
         self.__types = saved_types
         self.__classes = saved_classes
 
-        # Merge new variables from global into local
-        # TODO: This only accounts for 1 layer down. Need to update for more
-        # nested functions.
-        self.__variables.update(self.__global_variables)
-        self.__types.update(self.__global_types)
-        self.__classes.update(self.__global_classes)
+        self.__share_new_globals(global_names)
 
     def check_Module(self, node):
         return self.__check_module(node, is_base_module=True)
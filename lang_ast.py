@@ -1,4 +1,6 @@
+import codecs
 import inspect
+import re
 import sys
 
 from file_conversion import to_c_file
@@ -184,6 +186,16 @@ class NameType(Node, TypeMixin):
         "ushort": "unsigned short",
         "uint": "unsigned int",
         "ulong": "unsigned long",
+
+        # Fixed width integers from stdint.h
+        "int8": "int8_t",
+        "int16": "int16_t",
+        "int32": "int32_t",
+        "int64": "int64_t",
+        "uint8": "uint8_t",
+        "uint16": "uint16_t",
+        "uint32": "uint32_t",
+        "uint64": "uint64_t",
     }
 
     def lines(self):
@@ -194,23 +206,53 @@ class NameType(Node, TypeMixin):
         yield self.TYPE_NAME_CONVERSIONS.get(self.id, self.id)
 
 
+class Decorator(Node):
+    __attrs__ = ("name", "args")
+    __types__ = {
+        "name": str,
+        "args": [ValueMixin],
+    }
+    __defaults__ = {"args": []}
+
+    def lines(self):
+        if self.args:
+            yield "@{}({})".format(self.name, ", ".join(map(str, self.args)))
+        else:
+            yield "@{}".format(self.name)
+
+    # c_lines() is not implemented b/c the decorated node emits what the
+    # decorator lowers to
+
+
 class VarDecl(Node, StmtMixin):
-    __attrs__ = ("name", "type", "init")
+    __attrs__ = ("name", "type", "init", "decorators")
     __types__ = {
         "name": str,
         "type": TypeMixin,
         "init": optional(ValueMixin),
+        "decorators": [Decorator],
     }
-    __defaults__ = {"init": None}
+    __defaults__ = {
+        "init": None,
+        "decorators": [],
+    }
+
+    def alignment(self):
+        """The alignment requested with @align(N), if any."""
+        for decorator in self.decorators:
+            if decorator.name == "align":
+                return decorator.args[0]
+        return None
 
     def lines(self):
         if self.init:
-            yield "{}: {} = {}".format(self.name, self.type, self.init)
+            line = "{}: {} = {}".format(self.name, self.type, self.init)
         else:
-            yield "{}: {}".format(self.name, self.type)
+            line = "{}: {}".format(self.name, self.type)
+        yield " ".join([str(d) for d in self.decorators] + [line])
 
     def c_lines(self):
-        line = _format_c_decl(self.name, self.type)
+        line = _format_c_decl(self.name, self.type, align=self.alignment())
         if self.init:
             line += " = {}".format(self.init.c_code())
         yield line
@@ -237,13 +279,18 @@ class VarDeclStmt(Node, StmtMixin):
 
 class FuncDef(Node, StmtMixin):
     __attrs__ = ("name", "params", "body", "returns")
+    __extra_attrs__ = {"is_static"}
     __types__ = {
         "name": str,
         "params": [(str, VarDecl, Ellipsis)],
         "body": [StmtMixin],
-        "returns": optional(TypeMixin)
+        "returns": optional(TypeMixin),
+        "is_static": bool,
+    }
+    __defaults__ = {
+        "returns": None,
+        "is_static": False,
     }
-    __defaults__ = {"returns": None}
 
     def lines(self):
         line1 = "def {}({})".format(
@@ -269,7 +316,8 @@ class FuncDef(Node, StmtMixin):
         else:
             return_s = self.returns.c_code()
 
-        yield "{} {}({}){{".format(
+        yield "{}{} {}({}){{".format(
+            "static " if self.is_static else "",
             return_s,
             self.name,
             ", ".join(p.c_code() for p in self.params)
@@ -354,18 +402,21 @@ class FuncType(Node, TypeMixin):
         ))
 
 
-def _format_c_decl(name, t):
+def _format_c_decl(name, t, *, align=None):
     """
     Format type declaration to C code
 
     Args:
         name (str): Name of the variable
         t (Node): The type of the variable
+        align (optional[Node]): Alignment requested for the variable
     """
     assert isinstance(t, TypeMixin)
     assert isinstance(name, str)
 
-    if isinstance(t, Pointer):
+    if align is not None:
+        return "_Alignas({}) {}".format(align.c_code(), _format_c_decl(name, t))
+    elif isinstance(t, Pointer):
         return _format_c_decl(
             "*" + name,
             t.contents
@@ -375,7 +426,13 @@ def _format_c_decl(name, t):
             name + "[{}]".format(t.size),
             t.contents
         )
-    elif isinstance(t, NameType):
+    elif isinstance(t, Qualified):
+        # char const *p, float *restrict p
+        return _format_c_decl(
+            "{} {}".format(t.qualifier, name),
+            t.contents
+        )
+    elif isinstance(t, (NameType, Generic)):
         return "{} {}".format(t.c_code(), name)
     elif isinstance(t, FuncType):
         params = t.params
@@ -455,6 +512,46 @@ class Pointer(Node, TypeMixin):
         return hash(self.contents)
 
 
+class Qualified(Node, TypeMixin):
+    """
+    A type with a const or restrict qualifier, which applies to the type
+    before it.
+
+    char const* is a pointer to chars that cannot be changed through it
+    float* restrict is a pointer that is the only way its data is accessed
+    """
+    __attrs__ = ("contents", "qualifier")
+    __types__ = {
+        "contents": TypeMixin,
+        "qualifier": str,
+    }
+
+    def lines(self):
+        yield "{} {}".format(self.contents, self.qualifier)
+
+    def c_lines(self):
+        yield "{} {}".format(self.contents.c_code(), self.qualifier)
+
+
+class Vector(Node, TypeMixin):
+    """
+    SIMD vector of lanes elements of the contents type. This is only used
+    for declaring the builtin vector types, which are referred to by name.
+    """
+    __attrs__ = ("contents", "lanes")
+    __types__ = {
+        "contents": TypeMixin,
+        "lanes": int,
+    }
+
+    def lines(self):
+        yield "vector<{}, {}>".format(self.contents, self.lanes)
+
+    def c_lines(self):
+        yield "{0} __attribute__((vector_size({1} * sizeof({0}))))".format(
+            self.contents.c_code(), self.lanes)
+
+
 class Deref(Node, AssignableMixin):
     __attrs__ = ("value", )
     __types__ = {"value": ValueMixin}
@@ -562,7 +659,7 @@ class Return(Node, StmtMixin):
             yield INDENT + line
 
     def c_lines(self):
-        yield "return {};".format(self.value)
+        yield "return {};".format(self.value.c_code())
 
 
 class Pass(Node, StmtMixin):
@@ -650,6 +747,412 @@ while (1){
             yield "}"
 
 
+class For(Node, StmtMixin):
+    """
+    for target in iter:
+        body
+
+    Ranges and generators can be iterated over, which the inferer lowers to
+    a ForRange or a ForGenerator.
+    """
+    __attrs__ = ("target", "iter", "body", "decorators")
+    __types__ = {
+        "target": str,
+        "iter": ValueMixin,
+        "body": [StmtMixin],
+        "decorators": [Decorator],
+    }
+    __defaults__ = {"decorators": []}
+
+    def lines(self):
+        for decorator in self.decorators:
+            yield from decorator.lines()
+        yield "for {} in {}:".format(self.target, self.iter)
+        yield from iter_indent_seq(self.body)
+
+
+def int_literal_value(node):
+    """Get the value of an integer literal, which may be negated, or None if
+    the node is not one."""
+    if isinstance(node, Int):
+        return node.n
+    elif isinstance(node, UnaryOp) and isinstance(node.op, USub):
+        n = int_literal_value(node.value)
+        return None if n is None else -n
+    return None
+
+
+class ForRange(Node, StmtMixin):
+    """
+    Loop over range(start, stop, step) as a C for loop. The stop and step are
+    only evaluated once, like in python, and no range object is created.
+
+    for (int i = start, lang_i_stop = stop; i < lang_i_stop; i += step) {
+        // body
+    }
+
+    The iterations of a parallel loop are split between threads with
+    OpenMP. Variables reduced by the loop map each operator to the names
+    reduced with it. OpenMP only accepts loops declaring just the index, so
+    the stop is saved in a block around the loop.
+
+    {
+        int lang_i_stop = stop;
+        #pragma omp parallel for reduction(+:total)
+        for (int i = start; i < lang_i_stop; i += step) {
+            // body
+        }
+    }
+
+    An unsigned index counting down to 0 (range(start, -1, -1)) cannot be
+    compared to -1, so it is tested before being decremented.
+
+    for (size_t i = start + 1; i-- > 0; ) {
+        // body
+    }
+
+    A signed step of an unsigned index keeps its own type, so it is declared
+    before the loop. Since an unsigned index cannot go below 0, a negative
+    step that would take it past the stop ends the loop at the stop instead.
+
+    {
+        int lang_i_step = step;
+        for (size_t i = start, lang_i_stop = stop; ...;
+             i = (lang_i_step < 0 && i - lang_i_stop <= -lang_i_step) ?
+                 lang_i_stop : i + lang_i_step) {
+            // body
+        }
+    }
+    """
+    __attrs__ = ("target", "type", "start", "stop", "step", "body",
+                 "parallel", "reductions", "down_to_zero", "step_type",
+                 "clamp_step")
+    __types__ = {
+        "target": str,
+        "type": TypeMixin,
+        "start": ValueMixin,
+        "stop": ValueMixin,
+        "step": ValueMixin,
+        "body": [StmtMixin],
+        "parallel": bool,
+        "reductions": {str: [str]},
+        "down_to_zero": bool,
+        "step_type": optional(TypeMixin),
+        "clamp_step": bool,
+    }
+    __defaults__ = {
+        "parallel": False,
+        "reductions": {},
+        "down_to_zero": False,
+        "step_type": None,
+        "clamp_step": False,
+    }
+
+    def lines(self):
+        if self.parallel:
+            yield "@parallel"
+        yield "for {} in range({}, {}, {}):".format(
+            self.target, self.start, self.stop, self.step)
+        yield from iter_indent_seq(self.body)
+
+    def c_lines(self):
+        target = self.target
+        inits = ["{} = {}".format(target, self.start.c_code())]
+
+        # Literals do not need to be saved before the loop
+        stop = self.stop.c_code()
+        hoisted = int_literal_value(self.stop) is None
+        decls = []
+        if hoisted and self.parallel:
+            decls.append("{} = {};".format(
+                _format_c_decl("lang_{}_stop".format(target), self.type), stop))
+            stop = "lang_{}_stop".format(target)
+        elif hoisted:
+            inits.append("lang_{}_stop = {}".format(target, stop))
+            stop = "lang_{}_stop".format(target)
+        if self.step_type is not None:
+            decls.append("{} = {};".format(
+                _format_c_decl("lang_{}_step".format(target), self.step_type),
+                self.step.c_code()))
+
+        if decls:
+            yield "{"
+            for line in decls + list(self.__for_lines(inits, stop)):
+                yield INDENT + line
+            yield "}"
+        else:
+            yield from self.__for_lines(inits, stop)
+
+    def __for_lines(self, inits, stop):
+        target = self.target
+        if self.parallel:
+            pragma = "#pragma omp parallel for"
+            for op, names in sorted(self.reductions.items()):
+                pragma += " reduction({}:{})".format(op, ", ".join(names))
+            yield pragma
+
+        step_n = int_literal_value(self.step)
+        if self.down_to_zero:
+            inits[0] = "{} = {} + 1".format(target, self.start.c_code())
+            test = "{}-- > 0".format(target)
+            update = ""
+        elif step_n is None:
+            step = "lang_{}_step".format(target)
+            if self.step_type is None:
+                inits.append("{} = {}".format(step, self.step.c_code()))
+            test = "({step} > 0 ? {i} < {stop} : {i} > {stop})".format(
+                step=step, i=target, stop=stop)
+            if self.clamp_step:
+                update = "{i} = ({step} < 0 && {i} - {stop} <= -{step}) ? {stop} : {i} + {step}".format(
+                    step=step, i=target, stop=stop)
+            else:
+                update = "{} += {}".format(target, step)
+        else:
+            test = "{} {} {}".format(target, "<" if step_n > 0 else ">", stop)
+            if self.clamp_step:
+                update = "{i} = ({i} - {stop} > {n}) ? {i} - {n} : {stop}".format(
+                    i=target, stop=stop, n=-step_n)
+            elif step_n == 1:
+                update = "{}++".format(target)
+            elif step_n == -1:
+                update = "{}--".format(target)
+            elif step_n > 0:
+                update = "{} += {}".format(target, step_n)
+            else:
+                update = "{} -= {}".format(target, -step_n)
+
+        yield "for ({}; {}; {}) {{".format(
+            _format_c_decl(", ".join(inits), self.type), test, update)
+        yield from iter_indent_seq(self.body, c_code=True)
+        yield "}"
+
+
+class Yield(Node, StmtMixin):
+    __attrs__ = ("value", )
+    __types__ = {"value": ValueMixin}
+
+    def lines(self):
+        yield "yield {}".format(self.value)
+
+
+class ForGenerator(Node, StmtMixin):
+    """
+    Loop over the values of a generator by calling its next() function until
+    it is exhausted. The state of a generator created in the loop is kept on
+    the stack, and a generator stored in a variable is advanced in place.
+
+    {
+        gen_state lang_x_gen = gen(args);
+        int x;
+        while (gen_next(&(lang_x_gen), &(x))) {
+            // body
+        }
+    }
+    """
+    __attrs__ = ("target", "type", "iter", "state_type", "next", "body")
+    __types__ = {
+        "target": str,
+        "type": TypeMixin,
+        "iter": ValueMixin,
+        "state_type": TypeMixin,
+        "next": str,
+        "body": [StmtMixin],
+    }
+
+    def lines(self):
+        yield "for {} in {}:".format(self.target, self.iter)
+        yield from iter_indent_seq(self.body)
+
+    def c_lines(self):
+        yield "{"
+        state = self.iter
+        if not isinstance(state, Name):
+            state = Name("lang_{}_gen".format(self.target))
+            yield INDENT + "{} = {};".format(
+                _format_c_decl(state.id, self.state_type), self.iter.c_code())
+        yield INDENT + _format_c_decl(self.target, self.type) + ";"
+        yield INDENT + "while ({}) {{".format(Call(
+            Name(self.next),
+            [AddressOf(state), AddressOf(Name(self.target))]
+        ).c_code())
+        for line in iter_indent_seq(self.body, c_code=True):
+            yield INDENT + line
+        yield INDENT + "}"
+        yield "}"
+
+
+"""
+The next() function of a generator takes a pointer to the state of the
+generator and a pointer to where the next value is written. It returns 1 if a
+value was yielded and 0 once the generator is exhausted.
+"""
+GENERATOR_STATE = "lang_gen"
+GENERATOR_OUT = "lang_out"
+
+
+class GeneratorResume(Node, StmtMixin):
+    """
+    Jump to where a generator last yielded. State 0 starts the generator,
+    state N resumes after the Nth yield, and state -1 means it is
+    exhausted.
+    """
+    __attrs__ = ("yields", )
+    __types__ = {"yields": int}
+
+    def c_lines(self):
+        yield "switch ({}->lang_state) {{".format(GENERATOR_STATE)
+        yield INDENT + "case 0:"
+        yield INDENT * 2 + "break;"
+        for i in range(1, self.yields + 1):
+            yield INDENT + "case {}:".format(i)
+            yield INDENT * 2 + "goto lang_resume_{};".format(i)
+        yield INDENT + "default:"
+        yield INDENT * 2 + "return 0;"
+        yield "}"
+
+
+class GeneratorYield(Node, StmtMixin):
+    """Yield a value from the next() function of a generator and save where
+    to resume from."""
+    __attrs__ = ("value", "state")
+    __types__ = {
+        "value": ValueMixin,
+        "state": int,
+    }
+
+    def c_lines(self):
+        yield "*{} = {};".format(GENERATOR_OUT, self.value.c_code())
+        yield "{}->lang_state = {};".format(GENERATOR_STATE, self.state)
+        yield "return 1;"
+        yield "lang_resume_{}:;".format(self.state)
+
+
+class Spawn(Node, ValueMixin):
+    """Start a call on the thread pool. This can only be assigned to a
+    variable, which holds the future of the call."""
+    __attrs__ = ("value", )
+    __types__ = {"value": ValueMixin}
+
+    def lines(self):
+        yield "spawn {}".format(self.value)
+
+
+class Join(Node, ValueMixin):
+    """Wait for a spawned call and get its result. The inferer fills in the
+    name of the future struct of the spawned function."""
+    __attrs__ = ("value", "future")
+    __types__ = {
+        "value": ValueMixin,
+        "future": optional(str),
+    }
+    __defaults__ = {"future": None}
+
+    def lines(self):
+        yield "join {}".format(self.value)
+
+    def c_lines(self):
+        yield "{}_join(&({}))".format(self.future, self.value.c_code())
+
+
+class Sync(Node, StmtMixin):
+    """Wait for every call spawned in the function so far."""
+
+    def lines(self):
+        yield "sync"
+
+
+class SpawnStmt(Node, StmtMixin):
+    """
+    Start a call on the thread pool and store its future in a variable. A
+    declared future is waited for when it goes out of scope, so a function
+    never returns while the calls it spawned are still running.
+
+    lang_future_fib x __attribute__((cleanup(lang_future_fib_sync))) = {0};
+    lang_future_fib_spawn(&(x), n - 1);
+    """
+    __attrs__ = ("target", "value", "future", "declare")
+    __types__ = {
+        "target": str,
+        "value": ValueMixin,
+        "future": str,
+        "declare": bool,
+    }
+
+    def lines(self):
+        yield "{} = spawn {}".format(self.target, self.value)
+
+    def c_lines(self):
+        future = self.future
+        if self.declare:
+            yield "{} {} __attribute__((cleanup({}_sync))) = {{0}};".format(
+                future, self.target, future)
+        yield "{}_spawn({});".format(future, ", ".join(
+            ["&({})".format(self.target)] +
+            [arg.c_code() for arg in self.value.args]))
+
+
+class FutureDef(Node, StmtMixin):
+    """
+    The future of a function that is spawned. It embeds the task queued on
+    the thread pool, which calls the function with the arguments stored in
+    the future and keeps the result.
+    """
+    __attrs__ = ("name", "func", "params", "returns")
+    __types__ = {
+        "name": str,
+        "func": str,
+        "params": [TypeMixin],
+        "returns": TypeMixin,
+    }
+
+    def c_lines(self):
+        name = self.name
+        params = [VarDecl("arg{}".format(i), t)
+                  for i, t in enumerate(self.params)]
+        has_result = self.returns.c_code() != "void"
+
+        # The function can be spawned from its own body
+        yield from FuncDecl(self.func, params, self.returns).c_lines()
+
+        yield "typedef struct {} {};".format(name, name)
+        yield "struct {} {{".format(name)
+        yield INDENT + "lang_task task;"
+        for param in params:
+            yield INDENT + param.c_code() + ";"
+        if has_result:
+            yield INDENT + _format_c_decl("result", self.returns) + ";"
+        yield "};"
+
+        call = "{}({})".format(
+            self.func, ", ".join("f->" + p.name for p in params))
+        yield "static inline void {}_run(lang_task *task) {{".format(name)
+        yield INDENT + "{} *f = ({}*)task;".format(name, name)
+        if has_result:
+            yield INDENT + "f->result = {};".format(call)
+        else:
+            yield INDENT + call + ";"
+        yield "}"
+
+        yield "static inline void {}_spawn({}) {{".format(
+            name, ", ".join(["{} *f".format(name)] + [p.c_code() for p in params]))
+        yield INDENT + "lang_task_wait(&f->task);"
+        for param in params:
+            yield INDENT + "f->{} = {};".format(param.name, param.name)
+        yield INDENT + "lang_task_spawn(&f->task, {}_run);".format(name)
+        yield "}"
+
+        yield "static inline {} {}_join({} *f) {{".format(
+            self.returns.c_code(), name, name)
+        yield INDENT + "lang_task_wait(&f->task);"
+        if has_result:
+            yield INDENT + "return f->result;"
+        yield "}"
+
+        yield "static inline void {}_sync({} *f) {{".format(name, name)
+        yield INDENT + "lang_task_wait(&f->task);"
+        yield "}"
+
+
 class If(Node, StmtMixin):
     __attrs__ = ("test", "body", "orelse")
     __types__ = {
@@ -752,6 +1255,240 @@ class Switch(Node, StmtMixin):
         yield "}"
 
 
+def c_string_bytes(s):
+    """The bytes of the C string literal with the contents s."""
+    return codecs.escape_decode(s.encode("utf-8"))[0]
+
+
+# FNV-1a with the offset basis replaced by a seed, on 32 bit unsigned ints.
+# The low bits of FNV-1a only depend on the low bits of the bytes, so the
+# high bits are mixed into them before they are used to pick a bucket.
+FNV_PRIME = 16777619
+
+# Multiplier of the second level of perfect hashes (Fibonacci hashing)
+SLOT_MULTIPLIER = 2654435761
+
+
+def string_hash(data, seed):
+    h = seed
+    for b in data:
+        h = ((h ^ b) * FNV_PRIME) & 0xffffffff
+    return h ^ (h >> 16)
+
+
+def _perfect_hash_slot(h, displacement, bits):
+    return (((h ^ displacement) * SLOT_MULTIPLIER) & 0xffffffff) >> (32 - bits)
+
+
+def _displacements(hashes, size, tries):
+    """Find the displacement of each bucket that places its hashes in free
+    slots, starting from the largest buckets. Returns None if a bucket
+    cannot be placed."""
+    bits = size.bit_length() - 1
+    buckets = [[] for _ in range(size // 2)]
+    for h in hashes:
+        buckets[h & (len(buckets) - 1)].append(h)
+
+    taken = set()
+    displacements = [0] * len(buckets)
+    for i in sorted(range(len(buckets)), key=lambda i: -len(buckets[i])):
+        for d in range(tries):
+            slots = {_perfect_hash_slot(h, d, bits) for h in buckets[i]}
+            if len(slots) == len(buckets[i]) and not slots & taken:
+                taken |= slots
+                displacements[i] = d
+                break
+        else:
+            return None
+    return displacements
+
+
+def perfect_hash(keys, *, tries=4096):
+    """
+    Find a perfect hash of the keys (bytes) with hash and displace.
+
+    Each key is hashed once with string_hash(). Its low bits select a bucket,
+    and the hash xored with the displacement of its bucket is multiplied and
+    shifted down to a slot of a table whose size is the smallest power of 2
+    that holds the keys. Displacements are searched so that every key gets
+    its own slot. The table is only doubled if none are found.
+
+    Returns the seed, the table size and the displacements.
+    """
+    size = 2
+    while size < len(keys):
+        size *= 2
+    while True:
+        for seed in range(16):
+            hashes = [string_hash(key, seed) for key in keys]
+            if len(set(hashes)) < len(hashes):
+                continue
+            displacements = _displacements(hashes, size, tries)
+            if displacements is not None:
+                return seed, size, displacements
+        size *= 2
+
+
+def perfect_hash_slot(key, seed, size, displacements):
+    """The slot of a key (bytes) in a table made by perfect_hash()."""
+    h = string_hash(key, seed)
+    return _perfect_hash_slot(h, displacements[h & (len(displacements) - 1)],
+                              size.bit_length() - 1)
+
+
+class StrSwitchDef(Node, StmtMixin):
+    """
+    Function that finds the case of a switch on strings. The keys are the
+    string literals of the cases, placed in a table at the slot of their
+    perfect hash, so the string is only compared to the one key in its slot.
+    It returns the id of the matching case or -1.
+    """
+    __attrs__ = ("name", "keys", "ids", "is_str")
+    __types__ = {
+        "name": str,
+        "keys": [str],
+        "ids": [int],
+        "is_str": bool,
+    }
+
+    def c_lines(self):
+        keys = [c_string_bytes(key) for key in self.keys]
+        seed, size, displacements = perfect_hash(keys)
+        table = [None] * size
+        for key, data, i in zip(self.keys, keys, self.ids):
+            table[perfect_hash_slot(data, seed, size, displacements)] = (key, len(data), i)
+
+        if self.is_str:
+            yield "static int {}(str s) {{".format(self.name)
+            yield INDENT + "const char *data = s.data;"
+            yield INDENT + "size_t n = s.length;"
+        else:
+            yield "static int {}(const char *data) {{".format(self.name)
+            yield INDENT + "size_t n = 0;"
+
+        yield INDENT + "static const unsigned int displacements[{}] = {{{}}};".format(
+            len(displacements), ", ".join("{}u".format(d) for d in displacements))
+        yield INDENT + "static const char *const keys[{}] = {{{}}};".format(
+            size, ", ".join('"{}"'.format(e[0]) if e else "0" for e in table))
+        yield INDENT + "static const size_t lengths[{}] = {{{}}};".format(
+            size, ", ".join(str(e[1]) if e else "0" for e in table))
+        yield INDENT + "static const int ids[{}] = {{{}}};".format(
+            size, ", ".join(str(e[2]) if e else "-1" for e in table))
+        yield INDENT + "unsigned int h = {}u;".format(seed)
+
+        if self.is_str:
+            yield INDENT + "for (size_t i = 0; i < n; i++) {"
+            yield INDENT * 2 + "h = (h ^ (unsigned char)data[i]) * {}u;".format(FNV_PRIME)
+        else:
+            yield INDENT + "for (; data[n]; n++) {"
+            yield INDENT * 2 + "h = (h ^ (unsigned char)data[n]) * {}u;".format(FNV_PRIME)
+        yield INDENT + "}"
+
+        yield INDENT + "h ^= h >> 16;"
+        yield INDENT + "h = ((h ^ displacements[h & {}u]) * {}u) >> {};".format(
+            len(displacements) - 1, SLOT_MULTIPLIER, 32 - (size.bit_length() - 1))
+        yield INDENT + "if (keys[h] && lengths[h] == n && memcmp(keys[h], data, n) == 0) {"
+        yield INDENT * 2 + "return ids[h];"
+        yield INDENT + "}"
+        yield INDENT + "return -1;"
+        yield "}"
+
+
+class With(Node, StmtMixin):
+    __attrs__ = ("context", "body", "name")
+    __types__ = {
+        "context": ValueMixin,
+        "body": [StmtMixin],
+        "name": optional(str),
+    }
+    __defaults__ = {"name": None}
+
+    def lines(self):
+        if self.name:
+            yield "with {} as {}:".format(self.context, self.name)
+        else:
+            yield "with {}:".format(self.context)
+        yield from iter_indent_seq(self.body)
+
+    # c_lines() is not implemented b/c the C code depends on the context
+    # manager. The inferer replaces this node with the node for the specific
+    # context (ie. ArenaBlock).
+
+
+class ArenaBlock(Node, StmtMixin):
+    """
+    Block where every allocation is bump allocated from an arena that is
+    freed in one shot when the block exits. The gcc cleanup attribute also
+    frees the arena when leaving the block early through a return or break.
+    The parent is the arena of the block this one is nested in.
+    """
+    __attrs__ = ("name", "size", "body", "parent")
+    __types__ = {
+        "name": str,
+        "size": ValueMixin,
+        "body": [StmtMixin],
+        "parent": optional(str),
+    }
+    __defaults__ = {"parent": None}
+
+    def lines(self):
+        yield "with arena({}) as {}:".format(self.size, self.name)
+        yield from iter_indent_seq(self.body)
+
+    def c_lines(self):
+        if self.parent is None:
+            create = "arena_new({})".format(self.size.c_code())
+        else:
+            create = "arena_new_nested({}, {})".format(self.size.c_code(),
+                                                       self.parent)
+        yield "{"
+        yield INDENT + "Arena *{} __attribute__((cleanup(arena_cleanup))) = {};".format(
+            self.name, create)
+        yield from iter_indent_seq(self.body, c_code=True)
+        yield "}"
+
+
+class ElementwiseLoop(Node, StmtMixin):
+    """
+    Loop computing an elementwise expression over whole arrays one element at
+    a time. The setup evaluates the operands once before the loop. Iterations
+    do not depend on each other, so the loop is marked for gcc to vectorize.
+    The finish runs after the loop.
+    """
+    __attrs__ = ("setup", "index", "length", "body", "finish")
+    __types__ = {
+        "setup": [StmtMixin],
+        "index": str,
+        "length": ValueMixin,
+        "body": [StmtMixin],
+        "finish": [StmtMixin],
+    }
+    __defaults__ = {"finish": []}
+
+    def lines(self):
+        yield from iter_indent_seq(self.setup)
+        yield "{}: size_t = 0".format(self.index)
+        yield "while {} < {}:".format(self.index, self.length)
+        yield from iter_indent_seq(self.body)
+        yield INDENT + "{}++".format(self.index)
+        yield from iter_indent_seq(self.finish)
+
+    def c_lines(self):
+        yield "{"
+        yield from iter_indent_seq(self.setup, c_code=True)
+        yield INDENT + "#pragma omp simd"
+        yield INDENT + "for (size_t {i} = 0; {i} < {n}; {i}++) {{".format(
+            i=self.index,
+            n=self.length.c_code()
+        )
+        for stmt in self.body:
+            for line in stmt.c_lines():
+                yield INDENT * 2 + line
+        yield INDENT + "}"
+        yield from iter_indent_seq(self.finish, c_code=True)
+        yield "}"
+
+
 class BinaryOperator(Node):
     pass
 
@@ -1028,12 +1765,19 @@ class PreDec(Node, ValueMixin):
 
 
 class Call(Node, ValueMixin):
+    # inst_passed is set once the instance of a bound method call is added
+    # to the arguments
     __attrs__ = ("func", "args")
+    __extra_attrs__ = {"inst_passed"}
     __types__ = {
         "func": ValueMixin,
-        "args": [ValueMixin]
+        "args": [ValueMixin],
+        "inst_passed": bool,
+    }
+    __defaults__ = {
+        "args": [],
+        "inst_passed": False,
     }
-    __defaults__ = {"args": []}
 
     def lines(self):
         yield "{}({})".format(self.func, ", ".join(map(str, self.args)))
@@ -1056,6 +1800,58 @@ class Index(Node, AssignableMixin):
         yield "{}[{}]".format(self.value.c_code(), self.index.c_code())
 
 
+class Slice(Node, ValueMixin):
+    """arr[start:end]. Either bound can be left out."""
+    __attrs__ = ("value", "start", "end")
+    __types__ = {
+        "value": ValueMixin,
+        "start": optional(ValueMixin),
+        "end": optional(ValueMixin),
+    }
+    __defaults__ = {"start": None, "end": None}
+
+    def lines(self):
+        yield "{}[{}:{}]".format(
+            self.value,
+            "" if self.start is None else self.start,
+            "" if self.end is None else self.end,
+        )
+
+    # c_lines() is not implemented b/c the inferer lowers slices to the Span
+    # of the type being sliced
+
+
+class SliceRange(Node, ValueMixin):
+    """start:end as one of the indices of a MultiIndex."""
+    __attrs__ = ("start", "end")
+    __types__ = {
+        "start": optional(ValueMixin),
+        "end": optional(ValueMixin),
+    }
+    __defaults__ = {"start": None, "end": None}
+
+    def lines(self):
+        yield "{}:{}".format(
+            "" if self.start is None else self.start,
+            "" if self.end is None else self.end,
+        )
+
+
+class MultiIndex(Node, AssignableMixin):
+    """arr[i, j, start:end]. Each index is either a value or a SliceRange."""
+    __attrs__ = ("value", "indices")
+    __types__ = {
+        "value": ValueMixin,
+        "indices": [ValueMixin],
+    }
+
+    def lines(self):
+        yield "{}[{}]".format(self.value, ", ".join(map(str, self.indices)))
+
+    # c_lines() is not implemented b/c the inferer lowers these to the offset
+    # into the NDArray being indexed
+
+
 class AddressOf(Node, ValueMixin):
     __attrs__ = ("value", )
     __types__ = {"value": ValueMixin}
@@ -1124,6 +1920,66 @@ class Str(Node, ValueMixin):
             self.s.replace('"', r'\"').replace("\n", "\\n")
         )
 
+    # An escape sequence or a single character of a literal
+    __C_CHAR = re.compile(r"\\(?:[0-7]{1,3}|x[0-9a-fA-F]+|.)|.", re.DOTALL)
+
+    def c_size(self):
+        """Number of bytes in the literal once compiled, not including the
+        null terminator."""
+        return sum(
+            1 if m.group().startswith("\\") else len(m.group().encode("utf-8"))
+            for m in self.__C_CHAR.finditer(self.s)
+        )
+
+
+class FormattedValue(Node, ValueMixin):
+    """An expression in an f-string and its printf flags, width and
+    precision (spec), without the conversion which comes from its type."""
+    __attrs__ = ("value", "spec")
+    __types__ = {
+        "value": ValueMixin,
+        "spec": optional(str),
+    }
+    __defaults__ = {"spec": None}
+
+    def lines(self):
+        if self.spec is None:
+            yield "{{{}}}".format(self.value)
+        else:
+            yield "{{{}:{}}}".format(self.value, self.spec)
+
+
+class FString(Node, ValueMixin):
+    """
+    f"x = {x}". The parts are Strs and FormattedValues. The format is
+    resolved from the types of the values when checked, so f-strings are
+    only passed to the functions that write them, which are lowered to calls
+    specific to each type.
+    """
+    __attrs__ = ("parts", )
+    __types__ = {"parts": [ValueMixin]}
+
+    def lines(self):
+        yield 'f"{}"'.format("".join(
+            part.s.replace("{", "{{").replace("}", "}}").replace('"', r'\"').replace("\n", "\\n")
+            if isinstance(part, Str) else str(part)
+            for part in self.parts
+        ))
+
+
+class StrLiteral(Node, ValueMixin):
+    """A string literal used as a str. Its length is known at compile
+    time."""
+    __attrs__ = ("value", )
+    __types__ = {"value": Str}
+
+    def lines(self):
+        yield from self.value.lines()
+
+    def c_lines(self):
+        yield "((str){{{}, {}}})".format(self.value.c_code(),
+                                         self.value.c_size())
+
 
 class Char(Node, ValueMixin):
     __attrs__ = ("c", )
@@ -1209,10 +2065,16 @@ class Struct(Node):
 
 
 class StructDecl(Node, StmtMixin):
-    __attrs__ = ("struct", )
-    __types__ = {"struct": Struct}
+    __attrs__ = ("struct", "decorators")
+    __types__ = {
+        "struct": Struct,
+        "decorators": [Decorator],
+    }
+    __defaults__ = {"decorators": []}
 
     def lines(self):
+        for decorator in self.decorators:
+            yield from decorator.lines()
         yield from self.struct.lines()
 
     def c_lines(self):
@@ -1220,7 +2082,21 @@ class StructDecl(Node, StmtMixin):
             self.struct.name,
             self.struct.name
         )
-        yield self.struct.c_code() + ";"
+
+        attrs = []
+        for decorator in self.decorators:
+            if decorator.name == "packed":
+                attrs.append("packed")
+            elif decorator.name == "align":
+                attrs.append("aligned({})".format(decorator.args[0].c_code()))
+
+        if attrs:
+            yield "{} __attribute__(({}));".format(
+                self.struct.c_code(),
+                ", ".join(attrs)
+            )
+        else:
+            yield self.struct.c_code() + ";"
 
 
 class StmtGroup(Node, StmtMixin):
@@ -1239,23 +2115,28 @@ class StmtGroup(Node, StmtMixin):
 ALLOWED_CLASS_NODES = (VarDeclStmt, Assign, FuncDef, FuncDecl, Pass)
 
 class ClassDef(Node, StmtMixin):
-    __attrs__ = ("name", "generics", "parents", "body")
+    __attrs__ = ("name", "generics", "parents", "body", "decorators")
     __types__ = {
         "name": str,
         "parents": [TypeMixin],
         "generics": [str],
         "body": [StmtMixin],
+        "decorators": [Decorator],
     }
     __defaults__ = {
         "parents": [],
         "generics": [],
         "body": [],
+        "decorators": [],
     }
 
     def lines(self):
+        for decorator in self.decorators:
+            yield from decorator.lines()
+
         line1 = "class {}".format(self.name)
         if self.generics:
-            line1 += "[{}]".format(", ".join(map(str, self.generics)))
+            line1 += "<{}>".format(", ".join(map(str, self.generics)))
         if self.parents:
             line1 += "({})".format(", ".join(map(str, self.parents)))
         yield line1 + ":"
@@ -1273,7 +2154,7 @@ class Generic(Node, TypeMixin):
     __attrs__ = ("base_type", "type_params")
     __types__ = {
         "base_type": TypeMixin,
-        "type_params": [TypeMixin]
+        "type_params": [(TypeMixin, Int)]
     }
 
     def lines(self):
@@ -1282,7 +2163,34 @@ class Generic(Node, TypeMixin):
             ", ".join(map(str, self.type_params))
         )
 
-    # c_lines() will also not be implemented b/c this does not exist in C
+    def c_lines(self):
+        # Each generic type is monomorphized into a struct of this name
+        yield mangle_type(self)
+
+
+def mangle_type(t):
+    """
+    Get the name used in C for a type. This is used for naming the
+    specializations of generic classes.
+
+    List<int*> -> List_int_ptr
+    NDArray<float, 2> -> NDArray_float_2
+    """
+    if isinstance(t, NameType):
+        return t.id
+    elif isinstance(t, Int):
+        return str(t.n)
+    elif isinstance(t, Pointer):
+        return mangle_type(t.contents) + "_ptr"
+    elif isinstance(t, Array):
+        return "{}_arr{}".format(mangle_type(t.contents), t.size)
+    elif isinstance(t, Generic):
+        return "_".join([mangle_type(t.base_type)] +
+                        [mangle_type(p) for p in t.type_params])
+    else:
+        raise TypeError("Cannot use type '{}' as a generic type parameter ({})".format(
+            t, t.loc()
+        ))
 
 
 ##### Macros ######
@@ -1376,7 +2284,7 @@ class NodeVisitor:
                 method_name
             ))
         else:
-            self.visit_children(node)
+            return self.visit_children(node)
 
     def visit_children(self, node):
         if isinstance(node, Node):
@@ -1392,6 +2300,48 @@ class NodeVisitor:
         return {k: self.visit(v) for k, v in d.items()}
 
 
+class NodeTransformer(NodeVisitor):
+    """
+    NodeVisitor that returns a new tree. Nodes without a visit method are
+    copied with their children replaced by the result of visiting them.
+    """
+
+    def visit_children(self, node):
+        if not isinstance(node, Node):
+            return node
+
+        kwargs = {attr: getattr(node, attr) for attr in node.all_attrs()}
+        for attr in node.__attrs__:
+            val = kwargs[attr]
+            if isinstance(val, (Node, list, dict)):
+                kwargs[attr] = self.visit(val)
+        return type(node)(**kwargs)
+
+
+class NodeFinder(NodeVisitor):
+    """Find if a tree has a node matching a predicate."""
+
+    def __init__(self, predicate):
+        super().__init__()
+        self.__predicate = predicate
+        self.found = False
+
+    def visit(self, node):
+        if self.found:
+            return
+        if isinstance(node, Node) and self.__predicate(node):
+            self.found = True
+            return
+        return super().visit(node)
+
+
+def contains_node(tree, predicate):
+    """Check if a node, or a list of them, has a node matching a predicate."""
+    finder = NodeFinder(predicate)
+    finder.visit(tree)
+    return finder.found
+
+
 # Get all nodes of specific mixins
 def is_typemixin(obj):
     return (inspect.isclass(obj) and issubclass(obj, TypeMixin) and
@@ -51,7 +51,10 @@ class ArrayType(LangType):
 
     def __eq__(self, other):
         if isinstance(other, ArrayType):
-            return self.contents == other.contents
+            # Arrays of structs are not @soa arrays of them
+            return (isinstance(self, SoaArrayType) ==
+                    isinstance(other, SoaArrayType) and
+                    self.contents == other.contents)
 
         return super().__eq__(other)
 
@@ -59,6 +62,105 @@ class ArrayType(LangType):
         return "array[{}]".format(self.contents)
 
 
+class SoaArrayType(ArrayType):
+    """
+    An array of structs stored as a struct containing one array per member of
+    the struct. The elements can only be accessed through their members.
+    """
+    __attrs__ = ("members", )
+    __types__ = {
+        "members": {str: LangType}
+    }
+
+    def __eq__(self, other):
+        if isinstance(other, SoaArrayType):
+            return self.contents == other.contents
+
+        return False
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __str__(self):
+        return "soa_array[{}]".format(self.contents)
+
+
+class ElementwiseType(LangType):
+    """
+    Type of arithmetic on whole arrays, Spans or Lists (a * b + 1). It has no
+    storage of its own, so it can only be assigned to an array, Span or List,
+    which computes it one element at a time. The size is only known when one
+    of the operands is an array of known size.
+    """
+    __attrs__ = ("contents", "size")
+    __types__ = {
+        "contents": LangType,
+        "size": optional(ValueMixin),
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__("elementwise", *args, **kwargs)
+
+    def __str__(self):
+        return "elementwise[{}]".format(self.contents)
+
+
+class VectorType(LangType):
+    """
+    SIMD vector of a fixed number of numeric elements (lanes). Operators on
+    vectors are applied to every lane at once. The builtin vector types in
+    VECTOR_TYPES are typedefs of these.
+    """
+    __attrs__ = ("contents", "lanes")
+    __types__ = {
+        "contents": LangType,
+        "lanes": int,
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__("vector", *args, **kwargs)
+
+    def __str__(self):
+        return "vector[{} x {}]".format(self.contents, self.lanes)
+
+
+class QualifiedType(LangType):
+    """
+    A const or restrict qualified type. Qualifiers do not change how a value
+    is used, so they are skipped when looking up the actual type, but
+    values cannot be assigned through a const type.
+    """
+    __attrs__ = ("contents", "qualifier")
+    __types__ = {
+        "contents": LangType,
+        "qualifier": str,
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__("qualified", *args, **kwargs)
+
+    def __str__(self):
+        return "{} {}".format(self.contents, self.qualifier)
+
+
+def strip_qualifiers(t):
+    """Get the type without the qualifiers of the type itself."""
+    while isinstance(t, QualifiedType):
+        t = t.contents
+    return t
+
+
+def unqualified(t):
+    """Get the type without any qualifiers, including the ones of the
+    contents of pointers and arrays."""
+    t = strip_qualifiers(t)
+    if type(t) is PointerType:
+        return PointerType(unqualified(t.contents))
+    elif type(t) is ArrayType:
+        return ArrayType(unqualified(t.contents), t.size)
+    return t
+
+
 class StructType(LangType):
     __attrs__ = ("members", )
     __types__ = {
@@ -124,6 +226,12 @@ class CallableType(LangType):
             )
 
 
+# Types made of other types that are used as is instead of being looked up by
+# name in the declared types
+STRUCTURAL_TYPES = (PointerType, ArrayType, ElementwiseType, VectorType,
+                    CallableType)
+
+
 # Initialize some base types since these will pretty much not change at all
 CHAR_TYPE = LangType("char")
 SHORT_TYPE = LangType("short")
@@ -171,9 +279,49 @@ BUILTIN_TYPES = frozenset((
 ))
 
 
+"""
+Builtin SIMD vector types declared in lang_simd.h. They are named after the
+width in bits and the number of their elements and are all VECTOR_SIZE bytes,
+which is the size of an SSE or NEON register.
+"""
+VECTOR_SIZE = 16
+
+VECTOR_TYPES = {
+    "int8x16": VectorType(CHAR_TYPE, 16),
+    "uint8x16": VectorType(UCHAR_TYPE, 16),
+    "int16x8": VectorType(SHORT_TYPE, 8),
+    "uint16x8": VectorType(USHORT_TYPE, 8),
+    "int32x4": VectorType(INT_TYPE, 4),
+    "uint32x4": VectorType(UINT_TYPE, 4),
+    "int64x2": VectorType(LONG_TYPE, 2),
+    "uint64x2": VectorType(ULONG_TYPE, 2),
+    "float32x4": VectorType(FLOAT_TYPE, 4),
+    "float64x2": VectorType(DOUBLE_TYPE, 2),
+}
+
+
+def vector_type_name(t):
+    """Get the name of the builtin vector type of a VectorType."""
+    for name, vector_t in VECTOR_TYPES.items():
+        if vector_t == t:
+            return name
+    raise KeyError("No builtin vector type for {}".format(t))
+
+
+def vector_mask_type(t):
+    """
+    Get the type of comparing two vectors of type t. Each lane of the result
+    is a signed integer of the same width as the elements of t, which is -1
+    where the comparison is true and 0 where it is false.
+    """
+    return VECTOR_TYPES["int{}x{}".format(VECTOR_SIZE * 8 // t.lanes, t.lanes)]
+
+
 INTEGRAL_TYPES = frozenset({CHAR_TYPE, SHORT_TYPE, INT_TYPE, LONG_TYPE,
                             UCHAR_TYPE, USHORT_TYPE, UINT_TYPE, ULONG_TYPE})
 
+UNSIGNED_TYPES = frozenset({UCHAR_TYPE, USHORT_TYPE, UINT_TYPE, ULONG_TYPE})
+
 FLOATING_POINT_TYPES = frozenset({FLOAT_TYPE, DOUBLE_TYPE})
 
 NUMERIC_TYPES = INTEGRAL_TYPES | FLOATING_POINT_TYPES
@@ -183,6 +331,10 @@ def is_integral_type(t):
     return t in INTEGRAL_TYPES
 
 
+def is_unsigned_type(t):
+    return t in UNSIGNED_TYPES
+
+
 def is_floating_point_type(t):
     return t in FLOATING_POINT_TYPES
 
@@ -220,3 +372,80 @@ def can_implicit_assign(target_t, value_t):
         return True
 
     return False
+
+
+######## Memory layout ###########
+
+"""
+Sizes and alignments (in bytes) of types on the LP64 targets we compile for
+with gcc. These are only used for computing struct layouts, so types whose
+layout is not known (ie. opaque structs) are just skipped.
+"""
+
+class Layout(SlottedClass):
+    __attrs__ = ("size", "align", "padding")
+    __types__ = {
+        "size": int,
+        "align": int,
+        "padding": int,
+    }
+    __defaults__ = {"padding": 0}
+
+    def __str__(self):
+        return "size {}, align {}, padding {}".format(
+            self.size, self.align, self.padding
+        )
+
+
+BUILTIN_LAYOUTS = {
+    "char": Layout(1, 1),
+    "uchar": Layout(1, 1),
+    "short": Layout(2, 2),
+    "ushort": Layout(2, 2),
+    "int": Layout(4, 4),
+    "uint": Layout(4, 4),
+    "long": Layout(8, 8),
+    "ulong": Layout(8, 8),
+    "float": Layout(4, 4),
+    "double": Layout(8, 8),
+
+    # size_t is typedef'd to uint in lang space, but is 64 bits in C
+    "size_t": Layout(8, 8),
+}
+
+POINTER_LAYOUT = Layout(8, 8)
+ENUM_LAYOUT = Layout(4, 4)
+
+# Alignment of max_align_t, which is what malloc guarantees
+MAX_BUILTIN_ALIGN = 16
+
+
+def struct_layout(field_layouts, *, align=1):
+    """Get the layout of a struct whose fields have the given layouts in
+    declaration order. The alignment of the struct can be raised with
+    align."""
+    offset = 0
+    padding = 0
+    for field in field_layouts:
+        pad = -offset % field.align
+        padding += pad
+        offset += pad + field.size
+        align = max(align, field.align)
+
+    # Pad the end so consecutive structs in an array stay aligned
+    pad = -offset % align
+    return Layout(offset + pad, align, padding + pad)
+
+
+def min_padding_order(field_layouts):
+    """
+    Get the order of the fields that minimizes padding in a struct.
+
+    The size of every type is a multiple of its natural alignment, so placing
+    the fields in decreasing order of alignment leaves no gaps between them
+    other than those made by explicitly aligned fields.
+    The sort is stable so fields with equal alignment keep their declaration
+    order.
+    """
+    return sorted(range(len(field_layouts)),
+                  key=lambda i: -field_layouts[i].align)
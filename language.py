@@ -21,6 +21,20 @@ def get_args():
                         help="The name of the target executable.")
     parser.add_argument("-w", "--working-dir",
                         help="Working directory to store intermediate files.")
+    parser.add_argument("--reorder-fields", default=False, action="store_true",
+                        help="Reorder struct and class fields to minimize "
+                        "padding. Decorate a struct with @pinned to keep its "
+                        "declared order.")
+    parser.add_argument("--release", default=False, action="store_true",
+                        help="Compile without assertions, such as the bounds "
+                        "checks when indexing lists.")
+    parser.add_argument("--no-fold", dest="fold", default=True,
+                        action="store_false",
+                        help="Do not fold constant expressions or remove the "
+                        "code they make unreachable.")
+    parser.add_argument("--layout-report", default=False, action="store_true",
+                        help="Dump the size and padding of every struct and "
+                        "class before and after reordering their fields.")
 
     return parser.parse_args()
 
@@ -36,9 +50,15 @@ def main():
             print("------- {} --------".format(args.files[i]))
             print(ast)
     elif args.print:
-        dump_c_code_from_files(args.files)
+        dump_c_code_from_files(args.files, reorder_fields=args.reorder_fields,
+                               fold=args.fold)
+    elif args.layout_report:
+        dump_layout_report_from_files(args.files)
     else:
-        compile_lang_sources(args.files, output=args.output)
+        compile_lang_sources(args.files, output=args.output,
+                             reorder_fields=args.reorder_fields,
+                             fold=args.fold,
+                             release=args.release)
 
 
 if __name__ == "__main__":
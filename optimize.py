@@ -0,0 +1,263 @@
+"""
+Optimizations on checked ASTs, before they are converted to C.
+"""
+
+import math
+
+from lang_ast import *
+
+
+# Integer literals are ints in C, so only arithmetic on values in this range
+# gives the same result when folded
+INT_MIN = -2 ** 31
+INT_MAX = 2 ** 31 - 1
+
+# Statements that declare names in the block they are in
+DECLARATIONS = (VarDecl, VarDeclStmt, SpawnStmt, StmtGroup)
+
+
+def _c_div(a, b):
+    """Division that truncates towards zero like in C."""
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def _c_mod(a, b):
+    return a - _c_div(a, b) * b
+
+
+def _c_shift(a, b, shift):
+    # Shifting negative numbers or by the width of an int is undefined or
+    # implementation defined
+    if a < 0 or not 0 <= b < 32:
+        return None
+    return shift(a, b)
+
+
+INT_OPERATORS = {
+    Add: lambda a, b: a + b,
+    Sub: lambda a, b: a - b,
+    Mult: lambda a, b: a * b,
+    Div: lambda a, b: _c_div(a, b) if b else None,
+    Mod: lambda a, b: _c_mod(a, b) if b else None,
+    BitAnd: lambda a, b: a & b,
+    BitOr: lambda a, b: a | b,
+    Xor: lambda a, b: a ^ b,
+    LShift: lambda a, b: _c_shift(a, b, lambda a, b: a << b),
+    RShift: lambda a, b: _c_shift(a, b, lambda a, b: a >> b),
+}
+
+FLOAT_OPERATORS = {
+    Add: lambda a, b: a + b,
+    Sub: lambda a, b: a - b,
+    Mult: lambda a, b: a * b,
+    Div: lambda a, b: a / b if b else None,
+}
+
+# These return an int whatever the type of their operands
+COMPARISONS = {
+    Eq: lambda a, b: a == b,
+    Ne: lambda a, b: a != b,
+    Lt: lambda a, b: a < b,
+    Gt: lambda a, b: a > b,
+    Le: lambda a, b: a <= b,
+    Ge: lambda a, b: a >= b,
+    And: lambda a, b: bool(a) and bool(b),
+    Or: lambda a, b: bool(a) or bool(b),
+}
+
+
+def constant_value(node):
+    """Get the value of an int or float literal, or None if the node is not
+    one."""
+    if isinstance(node, (Int, Float)):
+        return node.n
+    return None
+
+
+def is_boolean(node):
+    """Check if an expression is always 0 or 1."""
+    return (isinstance(node, BinOp) and type(node.op) in COMPARISONS or
+            isinstance(node, UnaryOp) and isinstance(node.op, Not))
+
+
+def fits_int(n):
+    """Check if an integer literal is an int in C. Larger ones are longs,
+    and INT_MIN itself is the negation of a long literal."""
+    return INT_MIN < n <= INT_MAX
+
+
+def make_constant(value):
+    """Create the literal of a folded value, or None if C would not get the
+    same value."""
+    if value is None:
+        return None
+    elif isinstance(value, float):
+        return Float(value) if math.isfinite(value) else None
+    elif fits_int(value):
+        return Int(int(value))
+    return None
+
+
+class ConstantFolder(NodeTransformer):
+    """
+    Fold expressions on int and float literals, including the constants
+    made with define, and remove the code they make unreachable: branches of
+    ifs and whiles with constant tests, and statements after a return or
+    break.
+
+    Expressions are only folded when C would compute the same value of the
+    same type, so arithmetic on long literals, or that overflows an int,
+    divides by zero or shifts by more than the width of an int is left for
+    C. Casts are only folded to int and
+    double, which are the types of literals.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__defines = {}
+
+    def visit_list(self, seq):
+        new_seq = []
+        for node in seq:
+            new_node = self.visit(node)
+            if isinstance(node, StmtMixin) and isinstance(new_node, list):
+                new_seq += new_node
+            else:
+                new_seq.append(new_node)
+
+        for i, node in enumerate(new_seq):
+            if (isinstance(node, (Return, Break)) and
+                    not contains_node(new_seq[i + 1:], lambda n: isinstance(n, GeneratorYield))):
+                return new_seq[:i + 1]
+        return new_seq
+
+    def __branch(self, taken, dropped):
+        """The statements replacing an if or while that always takes one of
+        its branches. The other is dropped unless a generator can resume in
+        it."""
+        if contains_node(dropped, lambda n: isinstance(n, GeneratorYield)):
+            return None
+        elif any(isinstance(stmt, DECLARATIONS) for stmt in taken):
+            # Keep the block so the names do not leak out of it
+            return [If(Int(1), taken)]
+        return taken
+
+    def visit_Define(self, node):
+        if node.value is None:
+            return node
+
+        value = self.visit(node.value)
+        if isinstance(value, (Int, Float)):
+            self.__defines[node.name] = value
+        return Define(node.name, value)
+
+    def visit_Name(self, node):
+        if node.id in self.__defines:
+            return self.__defines[node.id]
+        return node
+
+    def visit_BinOp(self, node):
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        new_node = type(node)(left, node.op, right)
+
+        a = constant_value(left)
+        b = constant_value(right)
+        op = type(node.op)
+
+        # The right side is not evaluated if the left decides the result
+        if a is not None and (op is And and not a or op is Or and a):
+            return Int(int(bool(a)))
+        elif a is not None and op in (And, Or) and is_boolean(right):
+            return right
+
+        if a is None or b is None:
+            return new_node
+
+        if op in COMPARISONS:
+            value = int(COMPARISONS[op](a, b))
+        elif isinstance(a, float) or isinstance(b, float):
+            value = FLOAT_OPERATORS[op](a, b) if op in FLOAT_OPERATORS else None
+        elif op in INT_OPERATORS and fits_int(a) and fits_int(b):
+            # Arithmetic on longs gives a long, even if the result fits in an
+            # int
+            value = INT_OPERATORS[op](a, b)
+        else:
+            value = None
+
+        return make_constant(value) or new_node
+
+    visit_IntegralOp = visit_BitwiseOp = visit_LogicalOp = visit_BinOp
+
+    def visit_UnaryOp(self, node):
+        value = self.visit(node.value)
+        new_node = UnaryOp(node.op, value)
+
+        n = constant_value(value)
+        if n is None:
+            return new_node
+
+        op = type(node.op)
+        if op is UAdd:
+            return value
+        elif op is Not:
+            folded = int(not n)
+        elif isinstance(n, float):
+            folded = -n if op is USub else None
+        elif op in (USub, Invert) and fits_int(n):
+            folded = -n if op is USub else ~n
+        else:
+            folded = None
+
+        return make_constant(folded) or new_node
+
+    def visit_Cast(self, node):
+        expr = self.visit(node.expr)
+        new_node = Cast(node.target_type, expr)
+
+        n = constant_value(expr)
+        if n is None or not isinstance(node.target_type, NameType):
+            return new_node
+
+        target = node.target_type.id
+        if target == "int":
+            return make_constant(int(n)) or new_node
+        elif target == "double":
+            return make_constant(float(n)) or new_node
+        return new_node
+
+    def visit_If(self, node):
+        test = self.visit(node.test)
+        body = self.visit(node.body)
+        orelse = self.visit(node.orelse)
+
+        n = constant_value(test)
+        if n is not None:
+            taken, dropped = (body, orelse) if n else (orelse, body)
+            stmts = self.__branch(taken, dropped)
+            if stmts is not None:
+                return stmts
+
+        return If(test, body, orelse)
+
+    def visit_While(self, node):
+        test = self.visit(node.test)
+        body = self.visit(node.body)
+        orelse = self.visit(node.orelse)
+
+        # The else block runs once the test is false, so a loop that never
+        # runs is only its else block
+        n = constant_value(test)
+        if n is not None and not n:
+            stmts = self.__branch(orelse, body)
+            if stmts is not None:
+                return stmts
+
+        return While(test, body, orelse)
+
+
+def fold_constants(ast):
+    """Get a copy of a checked ast with its constant expressions folded and
+    the code they make unreachable removed."""
+    return ConstantFolder().visit(ast)
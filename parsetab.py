@@ -5,9 +5,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftFUNC_TYPEleftPOINTER_TYPEleftORleftANDleftBITORleftXORleftBITANDleftEQNEleftGTLTLEGEleftLSHIFTRSHIFTleftPLUSMINUSleftMULTDIVMODrightADDROFNOTCASTPREINCPREDECINVDEREFUSUBUADDleftARROWPOSTINCPOSTDECCALLLPARPERIODLBRACKETADDROF AMP AND ARROW ASSIGN BITAND BITOR BREAK CALL CARROT CASE CAST CHAR CLASS COLON COMMA DEC DEDENT DEF DEFINE DEREF DIV DOWHILE ELIF ELLIPSIS ELSE ENDIF ENUM EQ FLOAT FUNC_TYPE GE GT IF IFNDEF INC INCLUDE INDENT INT INV LBRACE LBRACKET LE LPAR LSHIFT LT MINUS MOD MULT NAME NE NEWLINE NOT NULL OR PASS PERIOD PIPE PLUS POINTER_TYPE POSTDEC POSTINC PREDEC PREINC RBRACE RBRACKET RETURN RPAR RSHIFT STRING STRUCT SWITCH TYPEDEF UADD USUB WHILE WS XORmodule : stmt_listmodule : emptystmt_list : stmt_list NEWLINEstmt_list : stmt_list stmtstmt_list : NEWLINEstmt_list : stmtfuncdef : DEF NAME parameters COLON suitefuncdef : DEF NAME parameters ARROW type_declaration COLON suiteparameters : LPAR RPARparameters : LPAR varargslist RPARvarargslist : varaglist_elemvaraglist_elem : NAME\n                          | var_declvaraglist_elem : ELLIPSISvarargslist : varargslist COMMA varaglist_elemstmt : simple_stmt\n                | compound_stmtsimple_stmt : small_stmt NEWLINEsmall_stmt : return_stmt\n                      | include_stmt\n                      | define_stmt\n                      | ifndef_stmt\n                      | endif_stmt\n                      | expr_stmt\n                      | assign_stmt\n                      | func_decl\n                      | var_decl_stmt\n                      | enum_decl_stmt\n                      | struct_decl_stmt\n                      | typedef_stmt\n                      | break\n                      | passtypedef_stmt : TYPEDEF type_declaration NAMEdefine_stmt : DEFINE NAME exprdefine_stmt : DEFINE NAMEifndef_stmt : IFNDEF NAMEendif_stmt : ENDIFpass : PASSbreak : BREAKenum_decl_stmt : enum_declenum_decl : ENUM NAME LBRACE enum_name_list RBRACEenum_name_list : NAMEenum_name_list : enum_name_list COMMA NAMEstruct_decl_stmt : struct_declstruct_decl : STRUCT NAME LBRACE struct_decl_list optional_comma RBRACEoptional_comma : COMMA\n                          | emptystruct_decl_list : struct_decl_list COMMA var_declstruct_decl_list : var_declfunc_decl : DEF NAME parametersfunc_decl : DEF NAME parameters ARROW type_declarationvar_decl_stmt : var_declvar_decl : NAME COLON type_declarationvar_decl : NAME COLON type_declaration ASSIGN exprtype_declaration : NAMEtype_declaration : LBRACE type_declaration RBRACEtype_declaration : type_declaration LT typedecl_list optional_comma GTtype_declaration : inline_func_decl %prec FUNC_TYPEinline_func_decl : param_type_list ARROW type_declaration %prec FUNC_TYPEparam_type_list : LPAR RPARparam_type_list : LPAR param_list_contents RPARparam_list_contents : type_declarationparam_list_contents : param_list_contents COMMA type_declarationtype_declaration : type_declaration bracket_list %prec POINTER_TYPEpointer_or_array : pointer\n                            | arraybracket_list : pointer_or_arraybracket_list : bracket_list pointer_or_arraypointer : MULTarray : LBRACKET expr RBRACKETinclude_stmt : INCLUDE stringexpr_stmt : exprassign_stmt : expr ASSIGN exprreturn_stmt : RETURN exprcompound_stmt : if_stmt\n                         | while_stmt\n                         | dowhile_stmt\n                         | switch_stmt\n                         | funcdef\n                         | classdefdowhile_stmt : DOWHILE expr COLON suitewhile_stmt : WHILE expr COLON suitewhile_stmt : WHILE expr COLON suite while_orelsewhile_orelse : ELSE COLON suiteif_stmt : IF expr COLON suiteif_stmt : IF expr COLON suite if_orelseif_orelse : ELSE COLON suiteif_orelse : ELIF expr COLON suiteif_orelse : ELIF expr COLON suite if_orelseswitch_stmt : SWITCH expr COLON switch_suiteswitch_suite : NEWLINE INDENT switch_stmts DEDENTswitch_stmts : case_listswitch_stmts : case_list defaultswitch_stmts : defaultdefault : ELSE COLON suitecase_list : casecase_list : case_list casecase : CASE case_expr_list COLON suitecase_expr_list : exprcase_expr_list : case_expr_list COMMA exprsuite : NEWLINE INDENT stmts DEDENTstmts : stmtstmts : stmts stmtexpr : expr PLUS exprexpr : expr MINUS exprexpr : expr MULT exprexpr : expr DIV exprexpr : expr MOD exprexpr : expr EQ exprexpr : expr LT exprexpr : expr GT exprexpr : expr LE exprexpr : expr GE exprexpr : expr AND exprexpr : expr OR exprexpr : expr AMP expr %prec BITANDexpr : expr PIPE expr %prec BITORexpr : expr CARROT expr %prec XORexpr : expr LSHIFT exprexpr : expr rshift expr %prec RSHIFTrshift : GT GTexpr : powerexpr : expr NE exprexpr : expr ARROW NAMEexpr : expr PERIOD NAMEexpr : LPAR expr RPARexpr : LT type_declaration GT expr %prec CASTexpr : MULT expr %prec DEREFexpr : PLUS expr %prec UADDexpr : MINUS expr %prec USUBexpr : expr INC %prec POSTINCexpr : expr DEC %prec POSTDECexpr : INC expr %prec PREINCexpr : DEC expr %prec PREDECexpr : NOT exprexpr : INV expratom : NULLpower : atomexpr : expr LPAR RPARexpr : expr LPAR arglist RPARexpr : expr LBRACKET expr RBRACKETexpr : AMP expr %prec ADDROFatom : NAMEatom : INTatom : FLOATatom : stringstring : STRINGatom : CHARatom : LBRACKET RBRACKETatom : LBRACKET array_contents RBRACKETarray_contents : exprarray_contents : array_contents COMMA exprarray_contents : array_contents COMMAarglist : arglist COMMA argumentarglist : argumentargument : exprempty : classdef : CLASS NAME COLON suiteclassdef : CLASS NAME LT name_list optional_comma GT COLON suiteclassdef : CLASS NAME LPAR typedecl_list optional_comma RPAR COLON suiteclassdef : CLASS NAME LT name_list optional_comma GT LPAR typedecl_list optional_comma RPAR COLON suitename_list : NAMEname_list : name_list COMMA NAMEtypedecl_list : type_declarationtypedecl_list : typedecl_list COMMA type_declaration'
+_lr_signature = 'leftFUNC_TYPEleftPOINTER_TYPEleftORleftANDleftBITORleftXORleftBITANDleftEQNEleftGTLTLEGEleftLSHIFTRSHIFTleftPLUSMINUSleftMULTDIVMODrightADDROFNOTCASTPREINCPREDECINVDEREFUSUBUADDleftARROWPOSTINCPOSTDECCALLLPARPERIODLBRACKETADDROF AMP AND ARROW AS ASSIGN AT BITAND BITOR BREAK CALL CARROT CASE CAST CHAR CLASS COLON COMMA CONST DEC DEDENT DEF DEFINE DEREF DIV DOWHILE ELIF ELLIPSIS ELSE ENDIF ENUM EQ FLOAT FOR FSTRING FUNC_TYPE GE GT IF IFNDEF IN INC INCLUDE INDENT INT INV JOIN LBRACE LBRACKET LE LPAR LSHIFT LT MINUS MOD MULT NAME NE NEWLINE NOT NULL OR PASS PERIOD PIPE PLUS POINTER_TYPE POSTDEC POSTINC PREDEC PREINC RBRACE RBRACKET RESTRICT RETURN RPAR RSHIFT SPAWN STRING STRUCT SWITCH SYNC TYPEDEF UADD USUB WHILE WITH WS XOR YIELDmodule : stmt_listmodule : emptystmt_list : stmt_list NEWLINEstmt_list : stmt_list stmtstmt_list : NEWLINEstmt_list : stmtfuncdef : DEF NAME parameters COLON suitefuncdef : DEF NAME parameters ARROW type_declaration COLON suiteparameters : LPAR RPARparameters : LPAR varargslist RPARvarargslist : varaglist_elemvaraglist_elem : NAME\n                          | var_declvaraglist_elem : ELLIPSISvarargslist : varargslist COMMA varaglist_elemstmt : simple_stmt\n                | compound_stmtsimple_stmt : small_stmt NEWLINEsmall_stmt : return_stmt\n                      | yield_stmt\n                      | sync_stmt\n                      | include_stmt\n                      | define_stmt\n                      | ifndef_stmt\n                      | endif_stmt\n                      | expr_stmt\n                      | assign_stmt\n                      | func_decl\n                      | var_decl_stmt\n                      | enum_decl_stmt\n                      | struct_decl_stmt\n                      | typedef_stmt\n                      | break\n                      | passtypedef_stmt : TYPEDEF type_declaration NAMEdefine_stmt : DEFINE NAME exprdefine_stmt : DEFINE NAMEifndef_stmt : IFNDEF NAMEendif_stmt : ENDIFpass : PASSbreak : BREAKenum_decl_stmt : enum_declenum_decl : ENUM NAME LBRACE enum_name_list RBRACEenum_name_list : NAMEenum_name_list : enum_name_list COMMA NAMEstruct_decl_stmt : struct_declstruct_decl : STRUCT NAME LBRACE struct_decl_list optional_comma RBRACEoptional_comma : COMMA\n                          | emptystruct_decl_list : struct_decl_list COMMA var_declstruct_decl_list : var_declfunc_decl : DEF NAME parametersfunc_decl : DEF NAME parameters ARROW type_declarationvar_decl_stmt : var_declvar_decl : NAME COLON type_declarationvar_decl : NAME COLON type_declaration ASSIGN exprvar_decl : inline_decorator var_decltype_declaration : NAMEtype_declaration : LBRACE type_declaration RBRACEtype_declaration : type_declaration LT type_param_list optional_comma GTtype_param_list : type_paramtype_param_list : type_param_list COMMA type_paramtype_param : type_declarationtype_param : INTtype_declaration : type_declaration CONSTtype_declaration : type_declaration RESTRICTtype_declaration : inline_func_decl %prec FUNC_TYPEinline_func_decl : param_type_list ARROW type_declaration %prec FUNC_TYPEparam_type_list : LPAR RPARparam_type_list : LPAR param_list_contents RPARparam_list_contents : type_declarationparam_list_contents : param_list_contents COMMA type_declarationtype_declaration : type_declaration bracket_list %prec POINTER_TYPEpointer_or_array : pointer\n                            | arraybracket_list : pointer_or_arraybracket_list : bracket_list pointer_or_arraypointer : MULTarray : LBRACKET expr RBRACKETinclude_stmt : INCLUDE stringexpr_stmt : exprassign_stmt : expr ASSIGN exprreturn_stmt : RETURN expryield_stmt : YIELD exprsync_stmt : SYNCcompound_stmt : if_stmt\n                         | while_stmt\n                         | dowhile_stmt\n                         | for_stmt\n                         | switch_stmt\n                         | with_stmt\n                         | funcdef\n                         | classdef\n                         | decorateddecorator : AT NAME NEWLINEdecorator : AT NAME LPAR arglist RPAR NEWLINEdecorators : decoratordecorators : decorators decoratordecorated : decorators simple_stmt\n                     | decorators classdef\n                     | decorators for_stmtinline_decorator : AT NAMEinline_decorator : AT NAME LPAR arglist RPARdowhile_stmt : DOWHILE expr COLON suitewhile_stmt : WHILE expr COLON suitewhile_stmt : WHILE expr COLON suite while_orelsewhile_orelse : ELSE COLON suitefor_stmt : FOR NAME IN expr COLON suiteif_stmt : IF expr COLON suiteif_stmt : IF expr COLON suite if_orelseif_orelse : ELSE COLON suiteif_orelse : ELIF expr COLON suiteif_orelse : ELIF expr COLON suite if_orelsewith_stmt : WITH expr COLON suitewith_stmt : WITH expr AS NAME COLON suiteswitch_stmt : SWITCH expr COLON switch_suiteswitch_suite : NEWLINE INDENT switch_stmts DEDENTswitch_stmts : case_listswitch_stmts : case_list defaultswitch_stmts : defaultdefault : ELSE COLON suitecase_list : casecase_list : case_list casecase : CASE case_expr_list COLON suitecase_expr_list : exprcase_expr_list : case_expr_list COMMA exprsuite : NEWLINE INDENT stmts DEDENTstmts : stmtstmts : stmts stmtexpr : expr PLUS exprexpr : expr MINUS exprexpr : expr MULT exprexpr : expr DIV exprexpr : expr MOD exprexpr : expr EQ exprexpr : expr LT exprexpr : expr GT exprexpr : expr LE exprexpr : expr GE exprexpr : expr AND exprexpr : expr OR exprexpr : expr AMP expr %prec BITANDexpr : expr PIPE expr %prec BITORexpr : expr CARROT expr %prec XORexpr : expr LSHIFT exprexpr : expr rshift expr %prec RSHIFTrshift : GT GTexpr : powerexpr : expr NE exprexpr : expr ARROW NAMEexpr : expr PERIOD NAMEexpr : LPAR expr RPARexpr : LT type_declaration GT expr %prec CASTexpr : MULT expr %prec DEREFexpr : PLUS expr %prec UADDexpr : MINUS expr %prec USUBexpr : expr INC %prec POSTINCexpr : expr DEC %prec POSTDECexpr : INC expr %prec PREINCexpr : DEC expr %prec PREDECexpr : NOT exprexpr : SPAWN expr %prec NOTexpr : JOIN expr %prec NOTexpr : INV expratom : NULLpower : atomexpr : expr LPAR RPARexpr : expr LPAR arglist RPARexpr : expr LBRACKET subscript_list RBRACKETsubscript_list : subscriptsubscript_list : subscript_list COMMA subscriptsubscript : exprsubscript : expr COLON exprsubscript : expr COLONsubscript : COLON exprsubscript : COLONexpr : AMP expr %prec ADDROFatom : NAMEatom : INTatom : FLOATatom : stringstring : STRINGatom : FSTRINGatom : CHARatom : LBRACKET RBRACKETatom : LBRACKET array_contents RBRACKETarray_contents : exprarray_contents : array_contents COMMA exprarray_contents : array_contents COMMAarglist : arglist COMMA argumentarglist : argumentargument : exprempty : classdef : CLASS NAME COLON suiteclassdef : CLASS NAME LT name_list optional_comma GT COLON suiteclassdef : CLASS NAME LPAR typedecl_list optional_comma RPAR COLON suiteclassdef : CLASS NAME LT name_list optional_comma GT LPAR typedecl_list optional_comma RPAR COLON suitename_list : NAMEname_list : name_list COMMA NAMEtypedecl_list : type_declarationtypedecl_list : typedecl_list COMMA type_declaration'
     
-_lr_action_items = {'NAME':([0,3,5,10,14,15,16,17,19,20,21,23,24,27,28,29,30,33,36,37,38,40,41,42,43,46,47,50,51,54,56,61,64,65,67,69,83,85,87,88,92,96,97,99,100,104,106,107,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,133,135,137,138,139,140,141,142,143,144,148,151,152,155,159,185,187,188,198,200,204,206,207,208,212,216,218,221,225,226,228,230,231,236,239,240,241,245,247,249,250,254,267,270,271,272,275,276,281,284,285,286,288,290,293,298,],[1,70,70,70,70,70,78,-76,70,80,70,70,83,89,-17,-75,-77,70,-6,-5,83,70,94,70,1,70,-78,100,-79,70,70,103,-16,-80,70,83,-55,83,83,-58,154,-4,-3,-18,70,70,70,70,70,167,70,70,70,70,70,70,70,70,70,70,70,70,180,70,70,70,70,70,70,191,70,-64,-66,-65,-67,-69,83,70,83,83,210,213,219,-121,70,-81,83,-68,83,-59,-56,-158,-85,-90,-82,70,1,191,-7,-70,83,256,-86,70,213,-83,269,-102,1,-57,70,-103,-101,-8,83,-87,-91,-84,-160,-159,-88,70,-89,-161,]),'DOWHILE':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[3,-76,-17,-75,-77,-6,-5,3,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,3,-7,-86,-83,-102,3,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'PIPE':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,121,-143,121,121,-130,121,-149,-135,-136,-134,-142,121,-133,121,-129,-128,121,-131,-132,121,-126,-150,121,-107,-139,121,121,-105,-124,-106,-116,-109,121,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,121,121,-127,-140,-141,121,121,121,121,]),'INT':([0,3,5,10,14,15,17,19,21,23,28,29,30,33,36,37,40,42,43,46,47,51,54,56,64,65,67,96,97,99,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,185,187,188,208,212,216,218,221,225,228,239,240,245,249,250,267,270,271,272,276,281,284,285,286,288,290,293,298,],[6,6,6,6,6,6,-76,6,6,6,-17,-75,-77,6,-6,-5,6,6,6,6,-78,-79,6,6,-16,-80,6,-4,-3,-18,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,-121,6,-81,-158,-85,-90,-82,6,6,-7,-86,6,-83,-102,6,6,-103,-101,-8,-87,-91,-84,-160,-159,-88,6,-89,-161,]),'NOT':([0,3,5,10,14,15,17,19,21,23,28,29,30,33,36,37,40,42,43,46,47,51,54,56,64,65,67,96,97,99,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,185,187,188,208,212,216,218,221,225,228,239,240,245,249,250,267,270,271,272,276,281,284,285,286,288,290,293,298,],[15,15,15,15,15,15,-76,15,15,15,-17,-75,-77,15,-6,-5,15,15,15,15,-78,-79,15,15,-16,-80,15,-4,-3,-18,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,-121,15,-81,-158,-85,-90,-82,15,15,-7,-86,15,-83,-102,15,15,-103,-101,-8,-87,-91,-84,-160,-159,-88,15,-89,-161,]),'$end':([0,9,13,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,228,239,245,271,272,276,281,284,285,286,288,293,298,],[-157,-2,0,-76,-17,-75,-77,-6,-5,-1,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,-7,-86,-83,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'NEWLINE':([0,1,2,4,6,7,8,11,12,17,18,22,25,26,28,29,30,31,34,35,36,37,39,43,44,45,47,48,49,51,52,53,55,57,58,59,60,62,63,64,65,66,68,70,73,76,77,78,79,81,82,83,88,90,93,96,97,98,99,100,101,105,108,129,130,131,132,134,136,138,139,140,141,142,150,153,154,156,157,158,160,163,165,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,186,188,195,197,200,203,206,207,208,212,216,218,222,223,224,227,228,229,230,239,245,246,252,254,258,261,268,271,272,273,274,276,277,278,281,284,285,286,288,291,293,297,298,],[37,-143,-31,-19,-144,-138,-137,-37,-39,-76,-28,-22,-40,-145,-17,-75,-77,-38,-25,-122,-6,-5,-24,97,-44,-147,-78,-23,99,-79,-21,-20,-52,-148,-32,-146,-27,-26,-30,-16,-80,-72,-29,-143,-130,-149,-135,-36,-136,-134,-142,-55,-58,-71,-133,-4,-3,-129,-18,-35,-128,-131,-132,-74,-53,189,-126,-150,-50,-64,-66,-65,-67,-69,189,189,-33,217,-34,189,-107,-139,-73,-105,-124,-106,-116,-109,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,-81,-9,189,-68,-127,-59,-56,-158,-85,-90,-82,-140,-141,-54,-10,-7,-51,-70,-86,-83,-41,189,-57,189,-45,189,-101,-8,189,189,-87,189,189,-91,-84,-160,-159,-88,189,-89,189,-161,]),'TYPEDEF':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[38,-76,-17,-75,-77,-6,-5,38,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,38,-7,-86,-83,-102,38,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'ASSIGN':([1,6,7,8,26,35,45,57,59,66,70,73,76,77,79,81,82,83,88,93,98,101,105,108,130,132,134,138,139,140,141,142,160,163,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,186,200,203,206,207,222,223,230,254,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,107,-143,-130,-149,-135,-136,-134,-142,-55,-58,-133,-129,-128,-131,-132,187,-126,-150,-64,-66,-65,-67,-69,-107,-139,-105,-124,-106,-116,-109,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,-68,-127,-59,-56,-140,-141,-70,-57,]),'ELSE':([212,218,243,264,266,271,280,288,295,],[238,244,263,263,-96,-101,-97,238,-98,]),'INC':([0,1,3,5,6,7,8,10,14,15,17,19,21,23,26,28,29,30,33,35,36,37,40,42,43,45,46,47,51,54,56,57,59,64,65,66,67,70,71,72,73,75,76,77,79,81,82,91,93,95,96,97,98,99,100,101,102,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,132,133,134,137,144,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,190,199,203,208,212,216,218,221,222,223,224,225,228,239,240,245,249,250,259,267,270,271,272,276,281,283,284,285,286,288,290,293,294,298,],[40,-143,40,40,-144,-138,-137,40,40,40,-76,40,40,40,-145,-17,-75,-77,40,-122,-6,-5,40,40,40,-147,40,-78,-79,40,40,-148,-146,-16,-80,105,40,-143,105,105,-130,105,-149,-135,-136,-134,-142,105,-133,105,-4,-3,-129,-18,40,-128,105,40,-131,40,40,-132,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,105,-126,40,-150,40,40,105,-107,-139,105,105,-105,-124,-106,-116,-109,105,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-121,-120,40,-81,105,105,-127,-158,-85,-90,-82,40,-140,-141,105,40,-7,-86,40,-83,-102,40,105,40,-103,-101,-8,-87,-91,105,-84,-160,-159,-88,40,-89,105,-161,]),'STRUCT':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[41,-76,-17,-75,-77,-6,-5,41,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,41,-7,-86,-83,-102,41,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'LPAR':([0,1,3,5,6,7,8,10,14,15,17,19,21,23,24,26,28,29,30,33,35,36,37,38,40,42,43,45,46,47,51,54,56,57,59,64,65,66,67,69,70,71,72,73,75,76,77,79,80,81,82,85,87,89,91,93,95,96,97,98,99,100,101,102,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,132,133,134,137,143,144,148,151,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,190,198,199,203,204,208,212,216,218,221,222,223,224,225,228,231,239,240,245,249,250,257,259,267,270,271,272,275,276,281,283,284,285,286,288,290,293,294,298,],[5,-143,5,5,-144,-138,-137,5,5,5,-76,5,5,5,85,-145,-17,-75,-77,5,-122,-6,-5,85,5,5,5,-147,5,-78,-79,5,5,-148,-146,-16,-80,106,5,85,-143,106,106,106,106,-149,106,106,135,106,106,85,85,151,106,106,106,-4,-3,106,-18,5,106,106,5,-131,5,5,-132,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,106,-126,5,-150,5,85,5,85,85,106,106,-139,106,106,106,-124,106,106,106,106,106,106,106,106,106,106,106,106,-125,106,106,106,106,-121,106,5,-81,106,85,106,106,85,-158,-85,-90,-82,5,-140,-141,106,5,-7,85,-86,5,-83,-102,5,275,106,5,-103,-101,-8,85,-87,-91,106,-84,-160,-159,-88,5,-89,106,-161,]),'IF':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[33,-76,-17,-75,-77,-6,-5,33,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,33,-7,-86,-83,-102,33,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'SWITCH':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[42,-76,-17,-75,-77,-6,-5,42,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,42,-7,-86,-83,-102,42,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'EQ':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,113,-143,113,113,-130,113,-149,-135,-136,-134,-142,113,-133,113,-129,-128,113,-131,-132,113,-126,-150,113,-107,-139,113,113,-105,-124,-106,113,-109,113,-112,113,113,-119,-110,-123,113,-108,-125,-104,-113,113,-111,-120,113,113,-127,-140,-141,113,113,113,113,]),'NULL':([0,3,5,10,14,15,17,19,21,23,28,29,30,33,36,37,40,42,43,46,47,51,54,56,64,65,67,96,97,99,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,185,187,188,208,212,216,218,221,225,228,239,240,245,249,250,267,270,271,272,276,281,284,285,286,288,290,293,298,],[8,8,8,8,8,8,-76,8,8,8,-17,-75,-77,8,-6,-5,8,8,8,8,-78,-79,8,8,-16,-80,8,-4,-3,-18,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-121,8,-81,-158,-85,-90,-82,8,8,-7,-86,8,-83,-102,8,8,-103,-101,-8,-87,-91,-84,-160,-159,-88,8,-89,-161,]),'DIV':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,104,-143,104,104,-130,104,-149,-135,-136,-134,-142,104,-133,104,-129,-128,104,-131,-132,104,-126,-150,104,-107,-139,104,104,104,-124,-106,104,104,104,104,104,104,104,104,104,104,-108,-125,104,104,104,104,104,104,104,-127,-140,-141,104,104,104,104,]),'AMP':([0,1,3,5,6,7,8,10,14,15,17,19,21,23,26,28,29,30,33,35,36,37,40,42,43,45,46,47,51,54,56,57,59,64,65,66,67,70,71,72,73,75,76,77,79,81,82,91,93,95,96,97,98,99,100,101,102,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,132,133,134,137,144,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,190,199,203,208,212,216,218,221,222,223,224,225,228,239,240,245,249,250,259,267,270,271,272,276,281,283,284,285,286,288,290,293,294,298,],[23,-143,23,23,-144,-138,-137,23,23,23,-76,23,23,23,-145,-17,-75,-77,23,-122,-6,-5,23,23,23,-147,23,-78,-79,23,23,-148,-146,-16,-80,112,23,-143,112,112,-130,112,-149,-135,-136,-134,-142,112,-133,112,-4,-3,-129,-18,23,-128,112,23,-131,23,23,-132,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,112,-126,23,-150,23,23,112,-107,-139,112,112,-105,-124,-106,-116,-109,112,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-121,-120,23,-81,112,112,-127,-158,-85,-90,-82,23,-140,-141,112,23,-7,-86,23,-83,-102,23,112,23,-103,-101,-8,-87,-91,112,-84,-160,-159,-88,23,-89,112,-161,]),'COLON':([1,6,7,8,26,35,45,57,59,70,71,73,76,77,79,81,82,83,88,89,91,93,95,98,101,102,105,108,132,134,136,138,139,140,141,142,160,163,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,186,191,195,200,203,206,207,213,222,223,227,229,230,238,244,254,255,257,259,263,282,283,294,296,],[69,-144,-138,-137,-145,-122,-147,-148,-146,-143,131,-130,-149,-135,-136,-134,-142,-55,-58,150,153,-133,156,-129,-128,158,-131,-132,-126,-150,197,-64,-66,-65,-67,-69,-107,-139,-105,-124,-106,-116,-109,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,69,-9,-68,-127,-59,-56,69,-140,-141,-10,252,-70,258,268,-57,273,274,277,278,291,-99,-100,297,]),'LSHIFT':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,118,-143,118,118,-130,118,-149,-135,-136,-134,-142,118,-133,118,-129,-128,118,-131,-132,118,-126,-150,118,-107,-139,118,118,-105,-124,-106,118,118,118,118,118,118,-119,118,118,118,-108,-125,-104,118,118,118,-120,118,118,-127,-140,-141,118,118,118,118,]),'NE':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,120,-143,120,120,-130,120,-149,-135,-136,-134,-142,120,-133,120,-129,-128,120,-131,-132,120,-126,-150,120,-107,-139,120,120,-105,-124,-106,120,-109,120,-112,120,120,-119,-110,-123,120,-108,-125,-104,-113,120,-111,-120,120,120,-127,-140,-141,120,120,120,120,]),'BREAK':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[12,-76,-17,-75,-77,-6,-5,12,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,12,-7,-86,-83,-102,12,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'COMMA':([6,7,8,26,35,45,57,59,70,73,74,75,76,77,79,81,82,83,88,93,98,101,105,108,130,132,133,134,138,139,140,141,142,145,147,160,161,162,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,191,192,193,194,196,200,201,202,203,206,207,209,210,211,214,215,219,220,222,223,224,230,234,248,251,253,254,256,260,269,282,283,287,294,],[-144,-138,-137,-145,-122,-147,-148,-146,-143,-130,133,-151,-149,-135,-136,-134,-142,-55,-58,-133,-129,-128,-131,-132,-53,-126,-153,-150,-64,-66,-65,-67,-69,-62,204,-107,221,-155,-139,-156,-105,-124,-106,-116,-109,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,-152,-12,-11,226,-14,-13,-68,231,-164,-127,-59,-56,231,-162,236,241,-49,-42,247,-140,-141,-54,-70,-63,-154,-15,-165,-57,-163,-48,-43,290,-99,231,-100,]),'PERIOD':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,123,-143,123,123,123,123,-149,123,123,123,123,123,123,123,123,123,123,-131,-132,123,-126,-150,123,123,-139,123,123,123,-124,123,123,123,123,123,123,123,123,123,123,123,123,-125,123,123,123,123,123,123,123,123,-140,-141,123,123,123,123,]),'PLUS':([0,1,3,5,6,7,8,10,14,15,17,19,21,23,26,28,29,30,33,35,36,37,40,42,43,45,46,47,51,54,56,57,59,64,65,66,67,70,71,72,73,75,76,77,79,81,82,91,93,95,96,97,98,99,100,101,102,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,132,133,134,137,144,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,190,199,203,208,212,216,218,221,222,223,224,225,228,239,240,245,249,250,259,267,270,271,272,276,281,283,284,285,286,288,290,293,294,298,],[46,-143,46,46,-144,-138,-137,46,46,46,-76,46,46,46,-145,-17,-75,-77,46,-122,-6,-5,46,46,46,-147,46,-78,-79,46,46,-148,-146,-16,-80,124,46,-143,124,124,-130,124,-149,-135,-136,-134,-142,124,-133,124,-4,-3,-129,-18,46,-128,124,46,-131,46,46,-132,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,124,-126,46,-150,46,46,124,-107,-139,124,124,-105,-124,-106,124,124,124,124,124,124,124,124,124,124,-108,-125,-104,124,124,124,-121,124,46,-81,124,124,-127,-158,-85,-90,-82,46,-140,-141,124,46,-7,-86,46,-83,-102,46,124,46,-103,-101,-8,-87,-91,124,-84,-160,-159,-88,46,-89,124,-161,]),'DEDENT':([17,28,29,30,47,51,64,65,99,188,208,212,216,218,228,239,245,249,250,262,264,265,266,270,271,272,276,279,280,281,284,285,286,288,289,293,295,298,],[-76,-17,-75,-77,-78,-79,-16,-80,-18,-81,-158,-85,-90,-82,-7,-86,-83,-102,271,-94,-92,281,-96,-103,-101,-8,-87,-93,-97,-91,-84,-160,-159,-88,-95,-89,-98,-161,]),'INV':([0,3,5,10,14,15,17,19,21,23,28,29,30,33,36,37,40,42,43,46,47,51,54,56,64,65,67,96,97,99,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,185,187,188,208,212,216,218,221,225,228,239,240,245,249,250,267,270,271,272,276,281,284,285,286,288,290,293,298,],[19,19,19,19,19,19,-76,19,19,19,-17,-75,-77,19,-6,-5,19,19,19,19,-78,-79,19,19,-16,-80,19,-4,-3,-18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-121,19,-81,-158,-85,-90,-82,19,19,-7,-86,19,-83,-102,19,19,-103,-101,-8,-87,-91,-84,-160,-159,-88,19,-89,-161,]),'ARROW':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,86,91,93,95,98,101,102,105,108,129,132,134,136,146,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,195,199,203,205,222,223,224,227,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,110,-143,110,110,110,110,-149,110,110,110,110,148,110,110,110,110,110,110,-131,-132,110,-126,-150,198,-60,110,110,-139,110,110,110,-124,110,110,110,110,110,110,110,110,110,110,110,110,-125,110,110,110,110,110,110,-9,110,110,-61,-140,-141,110,-10,110,110,110,]),'CARROT':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,126,-143,126,126,-130,126,-149,-135,-136,-134,-142,126,-133,126,-129,-128,126,-131,-132,126,-126,-150,126,-107,-139,126,126,-105,-124,-106,-116,-109,126,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,126,126,-127,-140,-141,126,126,126,126,]),'ELIF':([212,271,288,],[240,-101,240,]),'GT':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,83,84,88,91,93,95,98,101,102,105,108,127,129,132,134,138,139,140,141,142,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,200,201,202,203,206,207,210,211,222,223,224,230,231,232,233,236,237,253,254,256,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,127,-143,127,127,-130,127,-149,-135,-136,-134,-142,-55,144,-58,127,-133,127,-129,-128,127,-131,-132,185,127,-126,-150,-64,-66,-65,-67,-69,127,-107,-139,127,127,-105,-124,-106,127,127,127,-112,127,127,-119,-110,127,127,-108,-125,-104,-113,127,-111,-120,127,127,-68,-157,-164,-127,-59,-56,-162,-157,-140,-141,127,-70,-46,-47,254,-46,257,-165,-57,-163,127,127,127,]),'INCLUDE':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[32,-76,-17,-75,-77,-6,-5,32,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,32,-7,-86,-83,-102,32,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'LE':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,115,-143,115,115,-130,115,-149,-135,-136,-134,-142,115,-133,115,-129,-128,115,-131,-132,115,-126,-150,115,-107,-139,115,115,-105,-124,-106,115,115,115,-112,115,115,-119,-110,115,115,-108,-125,-104,-113,115,-111,-120,115,115,-127,-140,-141,115,115,115,115,]),'INDENT':([189,217,],[225,243,]),'DEFINE':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[50,-76,-17,-75,-77,-6,-5,50,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,50,-7,-86,-83,-102,50,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'ELLIPSIS':([135,226,],[194,194,]),'LBRACE':([24,38,69,85,87,94,103,143,148,151,198,204,231,275,],[87,87,87,87,87,155,159,87,87,87,87,87,87,87,]),'DEF':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[20,-76,-17,-75,-77,-6,-5,20,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,20,-7,-86,-83,-102,20,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'DEC':([0,1,3,5,6,7,8,10,14,15,17,19,21,23,26,28,29,30,33,35,36,37,40,42,43,45,46,47,51,54,56,57,59,64,65,66,67,70,71,72,73,75,76,77,79,81,82,91,93,95,96,97,98,99,100,101,102,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,132,133,134,137,144,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,190,199,203,208,212,216,218,221,222,223,224,225,228,239,240,245,249,250,259,267,270,271,272,276,281,283,284,285,286,288,290,293,294,298,],[21,-143,21,21,-144,-138,-137,21,21,21,-76,21,21,21,-145,-17,-75,-77,21,-122,-6,-5,21,21,21,-147,21,-78,-79,21,21,-148,-146,-16,-80,108,21,-143,108,108,-130,108,-149,-135,-136,-134,-142,108,-133,108,-4,-3,-129,-18,21,-128,108,21,-131,21,21,-132,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,108,-126,21,-150,21,21,108,-107,-139,108,108,-105,-124,-106,-116,-109,108,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-121,-120,21,-81,108,108,-127,-158,-85,-90,-82,21,-140,-141,108,21,-7,-86,21,-83,-102,21,108,21,-103,-101,-8,-87,-91,108,-84,-160,-159,-88,21,-89,108,-161,]),'RBRACKET':([6,7,8,14,26,35,45,57,59,70,73,74,75,76,77,79,81,82,93,98,101,105,108,132,133,134,160,163,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,],[-144,-138,-137,76,-145,-122,-147,-148,-146,-143,-130,134,-151,-149,-135,-136,-134,-142,-133,-129,-128,-131,-132,-126,-153,-150,-107,-139,-105,-124,-106,-116,-109,223,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,-152,230,-127,-140,-141,]),'FLOAT':([0,3,5,10,14,15,17,19,21,23,28,29,30,33,36,37,40,42,43,46,47,51,54,56,64,65,67,96,97,99,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,185,187,188,208,212,216,218,221,225,228,239,240,245,249,250,267,270,271,272,276,281,284,285,286,288,290,293,298,],[26,26,26,26,26,26,-76,26,26,26,-17,-75,-77,26,-6,-5,26,26,26,26,-78,-79,26,26,-16,-80,26,-4,-3,-18,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-121,26,-81,-158,-85,-90,-82,26,26,-7,-86,26,-83,-102,26,26,-103,-101,-8,-87,-91,-84,-160,-159,-88,26,-89,-161,]),'MULT':([0,1,3,5,6,7,8,10,14,15,17,19,21,23,26,28,29,30,33,35,36,37,40,42,43,45,46,47,51,54,56,57,59,64,65,66,67,70,71,72,73,75,76,77,79,81,82,83,84,88,91,92,93,95,96,97,98,99,100,101,102,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,130,132,133,134,137,138,139,140,141,142,144,145,149,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,190,199,200,202,203,206,207,208,212,216,218,221,222,223,224,225,228,229,230,234,239,240,245,249,250,253,254,259,267,270,271,272,276,281,283,284,285,286,288,290,293,294,298,],[54,-143,54,54,-144,-138,-137,54,54,54,-76,54,54,54,-145,-17,-75,-77,54,-122,-6,-5,54,54,54,-147,54,-78,-79,54,54,-148,-146,-16,-80,111,54,-143,111,111,-130,111,-149,-135,-136,-134,-142,-55,142,-58,111,142,-133,111,-4,-3,-129,-18,54,-128,111,54,-131,54,54,-132,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,111,142,-126,54,-150,54,142,-66,-65,-67,-69,54,142,142,111,-107,-139,111,111,111,-124,-106,111,111,111,111,111,111,111,111,111,111,-108,-125,111,111,111,111,-121,111,54,-81,111,111,-68,142,-127,142,-56,-158,-85,-90,-82,54,-140,-141,111,54,-7,142,-70,142,-86,54,-83,-102,54,142,-57,111,54,-103,-101,-8,-87,-91,111,-84,-160,-159,-88,54,-89,111,-161,]),'CLASS':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[27,-76,-17,-75,-77,-6,-5,27,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,27,-7,-86,-83,-102,27,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'ENDIF':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[11,-76,-17,-75,-77,-6,-5,11,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,11,-7,-86,-83,-102,11,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'LT':([0,1,3,5,6,7,8,10,14,15,17,19,21,23,26,28,29,30,33,35,36,37,40,42,43,45,46,47,51,54,56,57,59,64,65,66,67,70,71,72,73,75,76,77,79,81,82,83,84,88,89,91,92,93,95,96,97,98,99,100,101,102,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,130,132,133,134,137,138,139,140,141,142,144,145,149,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,190,199,200,202,203,206,207,208,212,216,218,221,222,223,224,225,228,229,230,234,239,240,245,249,250,253,254,259,267,270,271,272,276,281,283,284,285,286,288,290,293,294,298,],[24,-143,24,24,-144,-138,-137,24,24,24,-76,24,24,24,-145,-17,-75,-77,24,-122,-6,-5,24,24,24,-147,24,-78,-79,24,24,-148,-146,-16,-80,119,24,-143,119,119,-130,119,-149,-135,-136,-134,-142,-55,143,-58,152,119,143,-133,119,-4,-3,-129,-18,24,-128,119,24,-131,24,24,-132,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,119,143,-126,24,-150,24,-64,-66,-65,-67,-69,24,143,143,119,-107,-139,119,119,-105,-124,-106,119,119,119,-112,119,119,-119,-110,119,119,-108,-125,-104,-113,119,-111,-121,-120,24,-81,119,119,-68,143,-127,143,-56,-158,-85,-90,-82,24,-140,-141,119,24,-7,143,-70,143,-86,24,-83,-102,24,143,-57,119,24,-103,-101,-8,-87,-91,119,-84,-160,-159,-88,24,-89,119,-161,]),'LBRACKET':([0,1,3,5,6,7,8,10,14,15,17,19,21,23,26,28,29,30,33,35,36,37,40,42,43,45,46,47,51,54,56,57,59,64,65,66,67,70,71,72,73,75,76,77,79,81,82,83,84,88,91,92,93,95,96,97,98,99,100,101,102,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,130,132,133,134,137,138,139,140,141,142,144,145,149,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,190,199,200,202,203,206,207,208,212,216,218,221,222,223,224,225,228,229,230,234,239,240,245,249,250,253,254,259,267,270,271,272,276,281,283,284,285,286,288,290,293,294,298,],[14,-143,14,14,-144,-138,-137,14,14,14,-76,14,14,14,-145,-17,-75,-77,14,-122,-6,-5,14,14,14,-147,14,-78,-79,14,14,-148,-146,-16,-80,114,14,-143,114,114,114,114,-149,114,114,114,114,-55,137,-58,114,137,114,114,-4,-3,114,-18,14,114,114,14,-131,14,14,-132,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,114,137,-126,14,-150,14,137,-66,-65,-67,-69,14,137,137,114,114,-139,114,114,114,-124,114,114,114,114,114,114,114,114,114,114,114,114,-125,114,114,114,114,-121,114,14,-81,114,114,-68,137,114,137,-56,-158,-85,-90,-82,14,-140,-141,114,14,-7,137,-70,137,-86,14,-83,-102,14,137,-57,114,14,-103,-101,-8,-87,-91,114,-84,-160,-159,-88,14,-89,114,-161,]),'OR':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,117,-143,117,117,-130,117,-149,-135,-136,-134,-142,117,-133,117,-129,-128,117,-131,-132,117,-126,-150,117,-107,-139,117,117,-105,-124,-106,-116,-109,117,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,117,117,-127,-140,-141,117,117,117,117,]),'IFNDEF':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[16,-76,-17,-75,-77,-6,-5,16,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,16,-7,-86,-83,-102,16,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'RBRACE':([6,7,8,26,35,45,57,59,70,73,76,77,79,81,82,83,88,93,98,101,105,108,130,132,134,138,139,140,141,142,149,160,163,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,186,200,203,206,207,214,215,219,220,222,223,224,230,232,241,242,254,260,269,],[-144,-138,-137,-145,-122,-147,-148,-146,-143,-130,-149,-135,-136,-134,-142,-55,-58,-133,-129,-128,-131,-132,-53,-126,-150,-64,-66,-65,-67,-69,207,-107,-139,-105,-124,-106,-116,-109,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,-68,-127,-59,-56,-157,-49,-42,246,-140,-141,-54,-70,-47,-46,261,-57,-48,-43,]),'WHILE':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[56,-76,-17,-75,-77,-6,-5,56,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,56,-7,-86,-83,-102,56,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'AND':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,116,-143,116,116,-130,116,-149,-135,-136,-134,-142,116,-133,116,-129,-128,116,-131,-132,116,-126,-150,116,-107,-139,116,116,-105,-124,-106,-116,-109,116,-112,-114,116,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,116,116,-127,-140,-141,116,116,116,116,]),'CHAR':([0,3,5,10,14,15,17,19,21,23,28,29,30,33,36,37,40,42,43,46,47,51,54,56,64,65,67,96,97,99,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,185,187,188,208,212,216,218,221,225,228,239,240,245,249,250,267,270,271,272,276,281,284,285,286,288,290,293,298,],[57,57,57,57,57,57,-76,57,57,57,-17,-75,-77,57,-6,-5,57,57,57,57,-78,-79,57,57,-16,-80,57,-4,-3,-18,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-121,57,-81,-158,-85,-90,-82,57,57,-7,-86,57,-83,-102,57,57,-103,-101,-8,-87,-91,-84,-160,-159,-88,57,-89,-161,]),'RPAR':([6,7,8,26,35,45,57,59,70,72,73,76,77,79,81,82,83,85,88,93,98,101,105,106,108,130,132,134,135,138,139,140,141,142,145,147,160,161,162,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,186,191,192,193,194,196,200,202,203,206,207,209,222,223,224,230,231,232,234,235,248,251,253,254,287,292,],[-144,-138,-137,-145,-122,-147,-148,-146,-143,132,-130,-149,-135,-136,-134,-142,-55,146,-58,-133,-129,-128,-131,163,-132,-53,-126,-150,195,-64,-66,-65,-67,-69,-62,205,-107,222,-155,-139,-156,-105,-124,-106,-116,-109,-112,-114,-115,-119,-110,-123,-117,-108,-125,-104,-113,-118,-111,-120,-12,-11,227,-14,-13,-68,-164,-127,-59,-56,-157,-140,-141,-54,-70,-46,-47,-63,255,-154,-15,-165,-57,-157,296,]),'PASS':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[31,-76,-17,-75,-77,-6,-5,31,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,31,-7,-86,-83,-102,31,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'ENUM':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[61,-76,-17,-75,-77,-6,-5,61,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,61,-7,-86,-83,-102,61,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),'CASE':([243,264,266,271,280,295,],[267,267,-96,-101,-97,-98,]),'MOD':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,122,-143,122,122,-130,122,-149,-135,-136,-134,-142,122,-133,122,-129,-128,122,-131,-132,122,-126,-150,122,-107,-139,122,122,122,-124,-106,122,122,122,122,122,122,122,122,122,122,-108,-125,122,122,122,122,122,122,122,-127,-140,-141,122,122,122,122,]),'STRING':([0,3,5,10,14,15,17,19,21,23,28,29,30,32,33,36,37,40,42,43,46,47,51,54,56,64,65,67,96,97,99,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,185,187,188,208,212,216,218,221,225,228,239,240,245,249,250,267,270,271,272,276,281,284,285,286,288,290,293,298,],[45,45,45,45,45,45,-76,45,45,45,-17,-75,-77,45,45,-6,-5,45,45,45,45,-78,-79,45,45,-16,-80,45,-4,-3,-18,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-121,45,-81,-158,-85,-90,-82,45,45,-7,-86,45,-83,-102,45,45,-103,-101,-8,-87,-91,-84,-160,-159,-88,45,-89,-161,]),'GE':([1,6,7,8,26,35,45,57,59,66,70,71,72,73,75,76,77,79,81,82,91,93,95,98,101,102,105,108,129,132,134,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,186,190,199,203,222,223,224,259,283,294,],[-143,-144,-138,-137,-145,-122,-147,-148,-146,125,-143,125,125,-130,125,-149,-135,-136,-134,-142,125,-133,125,-129,-128,125,-131,-132,125,-126,-150,125,-107,-139,125,125,-105,-124,-106,125,125,125,-112,125,125,-119,-110,125,125,-108,-125,-104,-113,125,-111,-120,125,125,-127,-140,-141,125,125,125,125,]),'MINUS':([0,1,3,5,6,7,8,10,14,15,17,19,21,23,26,28,29,30,33,35,36,37,40,42,43,45,46,47,51,54,56,57,59,64,65,66,67,70,71,72,73,75,76,77,79,81,82,91,93,95,96,97,98,99,100,101,102,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,132,133,134,137,144,157,160,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,190,199,203,208,212,216,218,221,222,223,224,225,228,239,240,245,249,250,259,267,270,271,272,276,281,283,284,285,286,288,290,293,294,298,],[10,-143,10,10,-144,-138,-137,10,10,10,-76,10,10,10,-145,-17,-75,-77,10,-122,-6,-5,10,10,10,-147,10,-78,-79,10,10,-148,-146,-16,-80,109,10,-143,109,109,-130,109,-149,-135,-136,-134,-142,109,-133,109,-4,-3,-129,-18,10,-128,109,10,-131,10,10,-132,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,109,-126,10,-150,10,10,109,-107,-139,109,109,-105,-124,-106,109,109,109,109,109,109,109,109,109,109,-108,-125,-104,109,109,109,-121,109,10,-81,109,109,-127,-158,-85,-90,-82,10,-140,-141,109,10,-7,-86,10,-83,-102,10,109,10,-103,-101,-8,-87,-91,109,-84,-160,-159,-88,10,-89,109,-161,]),'RETURN':([0,17,28,29,30,36,37,43,47,51,64,65,96,97,99,188,208,212,216,218,225,228,239,245,249,250,270,271,272,276,281,284,285,286,288,293,298,],[67,-76,-17,-75,-77,-6,-5,67,-78,-79,-16,-80,-4,-3,-18,-81,-158,-85,-90,-82,67,-7,-86,-83,-102,67,-103,-101,-8,-87,-91,-84,-160,-159,-88,-89,-161,]),}
+_lr_action_items = {'NEWLINE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,35,39,49,51,54,55,56,57,59,60,66,78,79,80,81,82,83,84,85,86,87,89,111,112,124,126,130,131,132,135,136,137,138,139,141,142,143,144,145,146,147,148,149,150,151,154,159,160,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,184,191,192,194,195,196,198,200,205,206,207,208,209,210,211,218,220,221,222,229,231,234,237,238,241,243,245,247,253,262,263,265,266,269,277,284,286,287,289,290,291,292,301,305,309,310,314,315,322,323,329,331,334,337,338,339,341,342,345,348,349,351,352,354,356,358,359,364,365,],[4,85,-5,-6,-16,-17,87,-86,-87,-88,-89,-90,-91,-92,-93,-94,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-81,-178,-85,-181,-39,-54,-42,-46,-41,-40,-148,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,-178,-157,-158,-58,-67,-99,-100,-101,-83,-84,-80,-37,-38,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,-57,227,230,-82,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,-167,230,230,-55,242,230,-52,230,-65,-66,-73,-76,-74,-75,-78,-152,-36,-35,-186,-109,-168,-169,-105,-104,-116,-114,230,-9,-194,-153,-77,-59,-68,-52,-110,-106,230,-56,230,-7,-53,-10,-79,-43,336,230,230,-108,-115,230,-60,-53,-47,-111,230,-127,-107,-117,230,-8,230,230,-112,230,-195,-196,-113,230,-197,]),'$end':([0,1,2,3,4,5,6,7,9,10,11,12,13,14,15,16,17,85,86,87,130,131,132,229,237,238,241,243,253,277,284,290,315,322,337,339,341,342,348,352,356,358,359,365,],[-193,0,-1,-2,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,-3,-4,-18,-99,-100,-101,-109,-105,-104,-116,-114,-194,-110,-106,-7,-108,-115,-111,-127,-107,-117,-8,-112,-195,-196,-113,-197,]),'IF':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,85,86,87,130,131,132,229,237,238,241,243,253,277,280,284,290,312,313,315,322,337,339,340,341,342,348,352,356,358,359,365,],[34,34,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,-3,-4,-18,-99,-100,-101,-109,-105,-104,-116,-114,-194,-110,34,-106,-7,34,-128,-108,-115,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'WHILE':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,85,86,87,130,131,132,229,237,238,241,243,253,277,280,284,290,312,313,315,322,337,339,340,341,342,348,352,356,358,359,365,],[36,36,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,-3,-4,-18,-99,-100,-101,-109,-105,-104,-116,-114,-194,-110,36,-106,-7,36,-128,-108,-115,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'DOWHILE':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,85,86,87,130,131,132,229,237,238,241,243,253,277,280,284,290,312,313,315,322,337,339,340,341,342,348,352,356,358,359,365,],[37,37,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,-3,-4,-18,-99,-100,-101,-109,-105,-104,-116,-114,-194,-110,37,-106,-7,37,-128,-108,-115,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'FOR':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[38,38,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,38,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,38,-106,-7,38,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'SWITCH':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,85,86,87,130,131,132,229,237,238,241,243,253,277,280,284,290,312,313,315,322,337,339,340,341,342,348,352,356,358,359,365,],[40,40,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,-3,-4,-18,-99,-100,-101,-109,-105,-104,-116,-114,-194,-110,40,-106,-7,40,-128,-108,-115,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'WITH':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,85,86,87,130,131,132,229,237,238,241,243,253,277,280,284,290,312,313,315,322,337,339,340,341,342,348,352,356,358,359,365,],[41,41,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,-3,-4,-18,-99,-100,-101,-109,-105,-104,-116,-114,-194,-110,41,-106,-7,41,-128,-108,-115,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'DEF':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[42,42,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,134,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,42,-106,-7,42,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'CLASS':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[43,43,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,43,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,43,-106,-7,43,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'RETURN':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[47,47,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,47,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,47,-106,-7,47,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'YIELD':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[48,48,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,48,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,48,-106,-7,48,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'SYNC':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[49,49,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,49,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,49,-106,-7,49,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'INCLUDE':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[50,50,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,50,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,50,-106,-7,50,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'DEFINE':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[52,52,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,52,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,52,-106,-7,52,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'IFNDEF':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[53,53,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,53,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,53,-106,-7,53,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'ENDIF':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[54,54,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,54,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,54,-106,-7,54,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'TYPEDEF':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[58,58,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,58,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,58,-106,-7,58,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'BREAK':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[59,59,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,59,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,59,-106,-7,59,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'PASS':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[60,60,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,60,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,60,-106,-7,60,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'LPAR':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,35,36,37,39,40,41,44,45,46,47,48,51,58,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,115,116,118,119,120,121,122,125,128,129,130,131,132,133,135,136,138,141,142,143,144,145,146,147,148,149,150,151,153,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,190,193,202,203,204,212,214,218,219,220,222,223,224,227,228,229,231,232,233,234,235,236,237,238,239,240,241,243,246,253,262,264,268,270,271,277,279,280,282,284,287,290,298,300,303,311,312,313,315,321,322,325,336,337,339,340,341,342,347,348,350,352,355,356,358,359,361,365,],[45,45,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,45,113,45,45,-178,45,45,128,45,45,45,45,-181,128,-97,45,45,45,45,-148,45,45,45,45,45,45,45,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,113,-178,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-157,-158,45,45,113,113,128,113,113,199,202,128,128,113,-99,-100,-101,-98,113,113,45,113,113,113,113,113,113,113,113,113,113,-185,113,228,113,113,113,113,113,113,113,113,113,-147,113,113,113,113,113,113,113,113,113,113,-150,-151,113,-167,113,45,45,128,128,45,45,128,-152,199,113,-186,45,271,-95,45,-109,-168,45,45,-169,45,113,-105,-104,113,45,-116,-114,128,-194,113,113,128,113,45,-110,45,45,113,-106,113,-7,128,128,128,113,45,-128,-108,45,-115,350,-96,-111,-127,-129,-107,-117,113,-8,128,-112,45,-195,-196,-113,113,-197,]),'LT':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,35,36,37,39,40,41,45,46,47,48,51,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,115,116,119,120,122,123,124,126,129,130,131,132,133,135,136,138,140,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,190,193,194,204,205,206,207,208,209,210,211,212,213,217,218,220,222,223,227,228,229,231,232,233,234,235,236,237,238,239,240,241,243,253,257,258,262,263,264,265,266,270,271,277,279,280,282,284,287,290,291,301,302,311,312,313,315,321,322,328,329,331,336,337,339,340,341,342,347,348,352,355,356,358,359,361,365,],[44,44,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,44,97,44,44,-178,44,44,44,44,44,44,-181,-97,44,44,44,44,-148,44,44,44,44,44,44,44,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,97,-178,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-157,-158,44,44,97,97,97,97,201,203,-58,-67,97,-99,-100,-101,-98,97,97,44,203,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,97,97,-130,-131,-132,-133,-134,97,-136,-137,-147,-138,-139,97,97,97,97,97,-145,-146,97,-150,-151,97,-167,97,44,44,203,44,-65,-66,-73,-76,-74,-75,-78,44,203,203,-152,97,-186,44,-95,44,-109,-168,44,44,-169,44,97,-105,-104,97,44,-116,-114,-194,203,203,-153,-77,97,-59,203,97,44,-110,44,44,97,-106,97,-7,203,-79,203,97,44,-128,-108,44,-115,203,-60,203,-96,-111,-127,-129,-107,-117,97,-8,-112,44,-195,-196,-113,97,-197,]),'MULT':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,35,36,37,39,40,41,45,46,47,48,51,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,115,116,119,120,123,124,126,129,130,131,132,133,135,136,138,140,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,190,193,194,204,205,206,207,208,209,210,211,212,213,217,218,220,222,223,227,228,229,231,232,233,234,235,236,237,238,239,240,241,243,253,257,258,262,263,264,265,266,270,271,277,279,280,282,284,287,290,291,301,302,311,312,313,315,321,322,328,329,331,336,337,339,340,341,342,347,348,352,355,356,358,359,361,365,],[64,64,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,64,93,64,64,-178,64,64,64,64,64,64,-181,-97,64,64,64,64,-148,64,64,64,64,64,64,64,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,93,-178,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-157,-158,64,64,93,93,93,93,211,-58,-67,93,-99,-100,-101,-98,93,93,64,211,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,93,93,93,93,-132,-133,-134,93,93,93,-147,93,93,93,93,93,93,93,93,93,93,-150,-151,93,-167,93,64,64,211,64,-65,-66,211,-76,-74,-75,-78,64,211,211,-152,93,-186,64,-95,64,-109,-168,64,64,-169,64,93,-105,-104,93,64,-116,-114,-194,211,211,-153,-77,93,-59,211,93,64,-110,64,64,93,-106,93,-7,211,-79,211,93,64,-128,-108,64,-115,211,-60,211,-96,-111,-127,-129,-107,-117,93,-8,-112,64,-195,-196,-113,93,-197,]),'PLUS':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,35,36,37,39,40,41,45,46,47,48,51,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,115,116,119,120,129,130,131,132,133,135,136,138,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,190,193,204,212,218,220,222,223,227,228,229,231,232,233,234,235,236,237,238,239,240,241,243,253,262,264,270,271,277,279,280,282,284,287,290,311,312,313,315,321,322,336,337,339,340,341,342,347,348,352,355,356,358,359,361,365,],[62,62,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,62,91,62,62,-178,62,62,62,62,62,62,-181,-97,62,62,62,62,-148,62,62,62,62,62,62,62,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,91,-178,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-157,-158,62,62,91,91,91,91,91,-99,-100,-101,-98,91,91,62,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,91,91,-130,-131,-132,-133,-134,91,91,91,-147,91,91,91,91,91,91,91,91,91,91,-150,-151,91,-167,91,62,62,62,62,-152,91,-186,62,-95,62,-109,-168,62,62,-169,62,91,-105,-104,91,62,-116,-114,-194,-153,91,91,62,-110,62,62,91,-106,91,-7,91,62,-128,-108,62,-115,-96,-111,-127,-129,-107,-117,91,-8,-112,62,-195,-196,-113,91,-197,]),'MINUS':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,35,36,37,39,40,41,45,46,47,48,51,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,115,116,119,120,129,130,131,132,133,135,136,138,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,190,193,204,212,218,220,222,223,227,228,229,231,232,233,234,235,236,237,238,239,240,241,243,253,262,264,270,271,277,279,280,282,284,287,290,311,312,313,315,321,322,336,337,339,340,341,342,347,348,352,355,356,358,359,361,365,],[63,63,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,63,92,63,63,-178,63,63,63,63,63,63,-181,-97,63,63,63,63,-148,63,63,63,63,63,63,63,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,92,-178,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-157,-158,63,63,92,92,92,92,92,-99,-100,-101,-98,92,92,63,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,92,92,-130,-131,-132,-133,-134,92,92,92,-147,92,92,92,92,92,92,92,92,92,92,-150,-151,92,-167,92,63,63,63,63,-152,92,-186,63,-95,63,-109,-168,63,63,-169,63,92,-105,-104,92,63,-116,-114,-194,-153,92,92,63,-110,63,63,92,-106,92,-7,92,63,-128,-108,63,-115,-96,-111,-127,-129,-107,-117,92,-8,-112,63,-195,-196,-113,92,-197,]),'INC':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,35,36,37,39,40,41,45,46,47,48,51,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,115,116,119,120,129,130,131,132,133,135,136,138,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,190,193,204,212,218,220,222,223,227,228,229,231,232,233,234,235,236,237,238,239,240,241,243,253,262,264,270,271,277,279,280,282,284,287,290,311,312,313,315,321,322,336,337,339,340,341,342,347,348,352,355,356,358,359,361,365,],[67,67,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,67,111,67,67,-178,67,67,67,67,67,67,-181,-97,67,67,67,67,-148,67,67,67,67,67,67,67,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,111,-178,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-157,-158,67,67,111,111,111,111,111,-99,-100,-101,-98,111,111,67,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,111,111,-130,-131,-132,-133,-134,-135,-136,-137,-147,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,111,-167,111,67,67,67,67,-152,111,-186,67,-95,67,-109,-168,67,67,-169,67,111,-105,-104,111,67,-116,-114,-194,-153,111,111,67,-110,67,67,111,-106,111,-7,111,67,-128,-108,67,-115,-96,-111,-127,-129,-107,-117,111,-8,-112,67,-195,-196,-113,111,-197,]),'DEC':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,35,36,37,39,40,41,45,46,47,48,51,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,115,116,119,120,129,130,131,132,133,135,136,138,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,190,193,204,212,218,220,222,223,227,228,229,231,232,233,234,235,236,237,238,239,240,241,243,253,262,264,270,271,277,279,280,282,284,287,290,311,312,313,315,321,322,336,337,339,340,341,342,347,348,352,355,356,358,359,361,365,],[68,68,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,68,112,68,68,-178,68,68,68,68,68,68,-181,-97,68,68,68,68,-148,68,68,68,68,68,68,68,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,112,-178,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-157,-158,68,68,112,112,112,112,112,-99,-100,-101,-98,112,112,68,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,112,112,-130,-131,-132,-133,-134,-135,-136,-137,-147,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,112,-167,112,68,68,68,68,-152,112,-186,68,-95,68,-109,-168,68,68,-169,68,112,-105,-104,112,68,-116,-114,-194,-153,112,112,68,-110,68,68,112,-106,112,-7,112,68,-128,-108,68,-115,-96,-111,-127,-129,-107,-117,112,-8,-112,68,-195,-196,-113,112,-197,]),'NOT':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[69,69,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,69,69,69,69,69,69,69,69,69,-97,69,69,69,69,69,69,69,69,69,69,69,-3,-4,-18,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-99,-100,-101,-98,69,-147,69,69,69,69,69,-95,69,-109,69,69,69,-105,-104,69,-116,-114,-194,69,-110,69,69,-106,-7,69,-128,-108,69,-115,-96,-111,-127,-129,-107,-117,-8,-112,69,-195,-196,-113,-197,]),'SPAWN':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[70,70,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,70,70,70,70,70,70,70,70,70,-97,70,70,70,70,70,70,70,70,70,70,70,-3,-4,-18,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-99,-100,-101,-98,70,-147,70,70,70,70,70,-95,70,-109,70,70,70,-105,-104,70,-116,-114,-194,70,-110,70,70,-106,-7,70,-128,-108,70,-115,-96,-111,-127,-129,-107,-117,-8,-112,70,-195,-196,-113,-197,]),'JOIN':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[71,71,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,71,71,71,71,71,71,71,71,71,-97,71,71,71,71,71,71,71,71,71,71,71,-3,-4,-18,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-99,-100,-101,-98,71,-147,71,71,71,71,71,-95,71,-109,71,71,71,-105,-104,71,-116,-114,-194,71,-110,71,71,-106,-7,71,-128,-108,71,-115,-96,-111,-127,-129,-107,-117,-8,-112,71,-195,-196,-113,-197,]),'INV':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[72,72,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,72,72,72,72,72,72,72,72,72,-97,72,72,72,72,72,72,72,72,72,72,72,-3,-4,-18,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-99,-100,-101,-98,72,-147,72,72,72,72,72,-95,72,-109,72,72,72,-105,-104,72,-116,-114,-194,72,-110,72,72,-106,-7,72,-128,-108,72,-115,-96,-111,-127,-129,-107,-117,-8,-112,72,-195,-196,-113,-197,]),'AMP':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,35,36,37,39,40,41,45,46,47,48,51,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,115,116,119,120,129,130,131,132,133,135,136,138,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,190,193,204,212,218,220,222,223,227,228,229,231,232,233,234,235,236,237,238,239,240,241,243,253,262,264,270,271,277,279,280,282,284,287,290,311,312,313,315,321,322,336,337,339,340,341,342,347,348,352,355,356,358,359,361,365,],[65,65,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,65,103,65,65,-178,65,65,65,65,65,65,-181,-97,65,65,65,65,-148,65,65,65,65,65,65,65,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,103,-178,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-157,-158,65,65,103,103,103,103,103,-99,-100,-101,-98,103,103,65,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,103,103,-130,-131,-132,-133,-134,-135,-136,-137,-147,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,103,-167,103,65,65,65,65,-152,103,-186,65,-95,65,-109,-168,65,65,-169,65,103,-105,-104,103,65,-116,-114,-194,-153,103,103,65,-110,65,65,103,-106,103,-7,103,65,-128,-108,65,-115,-96,-111,-127,-129,-107,-117,103,-8,-112,65,-195,-196,-113,103,-197,]),'NAME':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,38,40,41,42,43,44,45,46,47,48,52,53,58,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,77,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,113,114,118,124,125,126,128,130,131,132,133,134,138,140,156,159,170,190,193,197,199,201,202,203,204,205,206,207,208,209,210,211,212,214,223,224,225,226,227,228,229,232,233,235,237,238,240,241,243,246,253,263,265,266,268,271,277,279,280,284,290,293,295,298,300,301,303,306,308,309,312,313,315,321,322,329,332,336,337,339,340,341,342,348,350,352,355,356,358,359,365,],[39,39,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,89,89,89,117,89,89,121,122,124,89,39,89,89,138,139,124,-97,89,89,89,89,89,89,89,89,89,89,89,155,157,158,159,-3,-4,-18,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,181,182,89,89,124,-58,124,-67,124,-99,-100,-101,-98,219,89,221,224,-102,-147,89,89,244,250,254,124,124,89,-65,-66,-73,-76,-74,-75,-78,89,124,89,-102,272,155,-95,89,-109,89,89,89,-105,-104,89,-116,-114,124,-194,-77,-59,-68,124,89,-110,89,39,-106,-7,250,326,124,124,-79,124,333,155,-103,39,-128,-108,89,-115,-60,-103,-96,-111,-127,-129,-107,-117,-8,124,-112,89,-195,-196,-113,-197,]),'ENUM':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[75,75,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,75,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,75,-106,-7,75,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'STRUCT':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,85,86,87,130,131,132,133,227,229,237,238,241,243,253,277,280,284,290,312,313,315,322,336,337,339,340,341,342,348,352,356,358,359,365,],[76,76,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,76,-97,-3,-4,-18,-99,-100,-101,-98,-95,-109,-105,-104,-116,-114,-194,-110,76,-106,-7,76,-128,-108,-115,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'AT':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,46,61,74,85,86,87,130,131,132,133,159,199,224,226,227,229,237,238,241,243,253,277,280,284,290,293,308,309,312,313,315,322,332,336,337,339,340,341,342,348,352,356,358,359,365,],[77,77,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,77,-97,156,-3,-4,-18,-99,-100,-101,-98,-102,156,-102,156,-95,-109,-105,-104,-116,-114,-194,-110,77,-106,-7,156,156,-103,77,-128,-108,-115,-103,-96,-111,-127,-129,-107,-117,-8,-112,-195,-196,-113,-197,]),'NULL':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[79,79,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,79,79,79,79,79,79,79,79,79,-97,79,79,79,79,79,79,79,79,79,79,79,-3,-4,-18,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-99,-100,-101,-98,79,-147,79,79,79,79,79,-95,79,-109,79,79,79,-105,-104,79,-116,-114,-194,79,-110,79,79,-106,-7,79,-128,-108,79,-115,-96,-111,-127,-129,-107,-117,-8,-112,79,-195,-196,-113,-197,]),'INT':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,203,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,300,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[80,80,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,80,80,80,80,80,80,80,80,80,-97,80,80,80,80,80,80,80,80,80,80,80,-3,-4,-18,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-99,-100,-101,-98,80,-147,80,80,261,80,80,80,-95,80,-109,80,80,80,-105,-104,80,-116,-114,-194,80,-110,80,80,-106,-7,261,80,-128,-108,80,-115,-96,-111,-127,-129,-107,-117,-8,-112,80,-195,-196,-113,-197,]),'FLOAT':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[81,81,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,81,81,81,81,81,81,81,81,81,-97,81,81,81,81,81,81,81,81,81,81,81,-3,-4,-18,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-99,-100,-101,-98,81,-147,81,81,81,81,81,-95,81,-109,81,81,81,-105,-104,81,-116,-114,-194,81,-110,81,81,-106,-7,81,-128,-108,81,-115,-96,-111,-127,-129,-107,-117,-8,-112,81,-195,-196,-113,-197,]),'FSTRING':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[82,82,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,82,82,82,82,82,82,82,82,82,-97,82,82,82,82,82,82,82,82,82,82,82,-3,-4,-18,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-99,-100,-101,-98,82,-147,82,82,82,82,82,-95,82,-109,82,82,82,-105,-104,82,-116,-114,-194,82,-110,82,82,-106,-7,82,-128,-108,82,-115,-96,-111,-127,-129,-107,-117,-8,-112,82,-195,-196,-113,-197,]),'CHAR':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[83,83,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,83,83,83,83,83,83,83,83,83,-97,83,83,83,83,83,83,83,83,83,83,83,-3,-4,-18,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-99,-100,-101,-98,83,-147,83,83,83,83,83,-95,83,-109,83,83,83,-105,-104,83,-116,-114,-194,83,-110,83,83,-106,-7,83,-128,-108,83,-115,-96,-111,-127,-129,-107,-117,-8,-112,83,-195,-196,-113,-197,]),'LBRACKET':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,35,36,37,39,40,41,45,46,47,48,51,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,115,116,119,120,123,124,126,129,130,131,132,133,135,136,138,140,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,190,193,194,204,205,206,207,208,209,210,211,212,213,217,218,220,222,223,227,228,229,231,232,233,234,235,236,237,238,239,240,241,243,253,257,258,262,263,264,265,266,270,271,277,279,280,282,284,287,290,291,301,302,311,312,313,315,321,322,328,329,331,336,337,339,340,341,342,347,348,352,355,356,358,359,361,365,],[73,73,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,73,114,73,73,-178,73,73,73,73,73,73,-181,-97,73,73,73,73,-148,73,73,73,73,73,73,73,-166,-165,-179,-180,-183,-184,-182,-3,-4,-18,114,-178,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-157,-158,73,73,114,114,114,114,212,-58,-67,114,-99,-100,-101,-98,114,114,73,212,114,114,114,114,114,114,114,114,114,114,-185,114,114,114,114,114,114,114,114,114,114,-147,114,114,114,114,114,114,114,114,114,114,-150,-151,114,-167,114,73,73,212,73,-65,-66,212,-76,-74,-75,-78,73,212,212,-152,114,-186,73,-95,73,-109,-168,73,73,-169,73,114,-105,-104,114,73,-116,-114,-194,212,212,114,-77,114,-59,212,114,73,-110,73,73,114,-106,114,-7,212,-79,212,114,73,-128,-108,73,-115,212,-60,212,-96,-111,-127,-129,-107,-117,114,-8,-112,73,-195,-196,-113,114,-197,]),'STRING':([0,2,4,5,6,7,9,10,11,12,13,14,15,16,17,34,36,37,40,41,45,46,47,48,50,61,62,63,64,65,67,68,69,70,71,72,73,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,130,131,132,133,138,170,190,193,204,212,223,227,228,229,232,233,235,237,238,240,241,243,253,271,277,279,280,284,290,312,313,315,321,322,336,337,339,340,341,342,348,352,355,356,358,359,365,],[84,84,-5,-6,-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,84,84,84,84,84,84,84,84,84,84,-97,84,84,84,84,84,84,84,84,84,84,84,-3,-4,-18,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-99,-100,-101,-98,84,-147,84,84,84,84,84,-95,84,-109,84,84,84,-105,-104,84,-116,-114,-194,84,-110,84,84,-106,-7,84,-128,-108,84,-115,-96,-111,-127,-129,-107,-117,-8,-112,84,-195,-196,-113,-197,]),'DEDENT':([6,7,9,10,11,12,13,14,15,16,17,87,130,131,132,229,237,238,241,243,253,277,284,290,312,313,315,316,317,318,319,322,337,339,340,341,342,343,344,348,352,353,356,358,359,360,365,],[-16,-17,-86,-87,-88,-89,-90,-91,-92,-93,-94,-18,-99,-100,-101,-109,-105,-104,-116,-114,-194,-110,-106,-7,339,-128,-108,342,-118,-120,-122,-115,-111,-127,-129,-107,-117,-119,-123,-8,-112,-121,-195,-196,-113,-124,-197,]),'ASSIGN':([35,39,51,66,78,79,80,81,82,83,84,89,111,112,124,126,141,142,143,144,145,146,147,148,149,150,151,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,184,194,205,206,207,208,209,210,211,218,222,231,234,262,263,265,266,301,329,],[90,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,-178,-157,-158,-58,-67,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,-167,240,-65,-66,-73,-76,-74,-75,-78,-152,-186,-168,-169,-153,-77,-59,-68,-79,-60,]),'DIV':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[94,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,94,-178,-157,-158,94,94,94,94,94,94,94,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,94,94,94,94,-132,-133,-134,94,94,94,94,94,94,94,94,94,94,94,94,94,-150,-151,94,-167,94,-152,94,-186,-168,-169,94,94,-153,94,94,94,94,94,94,94,]),'MOD':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[95,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,95,-178,-157,-158,95,95,95,95,95,95,95,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,95,95,95,95,-132,-133,-134,95,95,95,95,95,95,95,95,95,95,95,95,95,-150,-151,95,-167,95,-152,95,-186,-168,-169,95,95,-153,95,95,95,95,95,95,95,]),'EQ':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[96,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,96,-178,-157,-158,96,96,96,96,96,96,96,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,96,96,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,96,96,96,96,96,-145,-146,-149,-150,-151,96,-167,96,-152,96,-186,-168,-169,96,96,-153,96,96,96,96,96,96,96,]),'GT':([35,39,51,66,78,79,80,81,82,83,84,88,89,98,111,112,115,116,119,120,123,124,126,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,205,206,207,208,209,210,211,218,220,222,231,234,236,239,254,255,258,259,260,261,262,263,264,265,266,270,282,287,294,295,296,299,300,301,311,326,329,330,347,361,],[98,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,98,-178,170,-157,-158,98,98,98,98,204,-58,-67,98,98,98,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,98,98,-130,-131,-132,-133,-134,98,-136,-137,-138,-139,98,98,98,98,98,-145,-146,98,-150,-151,98,-167,98,-65,-66,-73,-76,-74,-75,-78,-152,98,-186,-168,-169,98,98,-198,-193,-63,-193,-61,-64,-153,-77,98,-59,-68,98,98,98,325,-48,-49,329,-48,-79,98,-199,-60,-62,98,98,]),'LE':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[99,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,99,-178,-157,-158,99,99,99,99,99,99,99,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,99,99,-130,-131,-132,-133,-134,99,-136,-137,-138,-139,99,99,99,99,99,-145,-146,99,-150,-151,99,-167,99,-152,99,-186,-168,-169,99,99,-153,99,99,99,99,99,99,99,]),'GE':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[100,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,100,-178,-157,-158,100,100,100,100,100,100,100,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,100,100,-130,-131,-132,-133,-134,100,-136,-137,-138,-139,100,100,100,100,100,-145,-146,100,-150,-151,100,-167,100,-152,100,-186,-168,-169,100,100,-153,100,100,100,100,100,100,100,]),'AND':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[101,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,101,-178,-157,-158,101,101,101,101,101,101,101,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,101,101,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,101,-142,-143,-144,-145,-146,-149,-150,-151,101,-167,101,-152,101,-186,-168,-169,101,101,-153,101,101,101,101,101,101,101,]),'OR':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[102,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,102,-178,-157,-158,102,102,102,102,102,102,102,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,102,102,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,102,-167,102,-152,102,-186,-168,-169,102,102,-153,102,102,102,102,102,102,102,]),'PIPE':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[104,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,104,-178,-157,-158,104,104,104,104,104,104,104,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,104,104,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,104,-167,104,-152,104,-186,-168,-169,104,104,-153,104,104,104,104,104,104,104,]),'CARROT':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[105,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,105,-178,-157,-158,105,105,105,105,105,105,105,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,105,105,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,105,-167,105,-152,105,-186,-168,-169,105,105,-153,105,105,105,105,105,105,105,]),'LSHIFT':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[106,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,106,-178,-157,-158,106,106,106,106,106,106,106,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,106,106,-130,-131,-132,-133,-134,106,106,106,106,106,106,106,106,106,106,-145,-146,106,-150,-151,106,-167,106,-152,106,-186,-168,-169,106,106,-153,106,106,106,106,106,106,106,]),'NE':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[108,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,108,-178,-157,-158,108,108,108,108,108,108,108,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,108,108,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,108,108,108,108,108,-145,-146,-149,-150,-151,108,-167,108,-152,108,-186,-168,-169,108,108,-153,108,108,108,108,108,108,108,]),'ARROW':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,127,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,198,215,218,220,222,231,234,236,239,247,262,264,267,269,270,282,287,292,311,347,361,],[109,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,109,-178,-157,-158,109,109,109,109,214,109,109,109,109,109,109,109,109,109,109,109,109,109,-185,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-150,-151,109,-167,109,246,-69,-152,109,-186,-168,-169,109,109,-9,109,109,-70,303,109,109,109,-10,109,109,109,]),'PERIOD':([35,39,51,66,78,79,80,81,82,83,84,88,89,111,112,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,151,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,187,218,220,222,231,234,236,239,262,264,270,282,287,311,347,361,],[110,-178,-181,-148,-166,-165,-179,-180,-183,-184,-182,110,-178,-157,-158,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-185,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-150,-151,110,-167,110,-152,110,-186,-168,-169,110,110,110,110,110,110,110,110,110,110,]),'COLON':([39,51,66,78,79,80,81,82,83,84,88,89,111,112,114,115,116,119,120,122,124,126,141,142,143,144,145,146,147,148,149,150,151,155,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,184,187,198,205,206,207,208,209,210,211,218,222,231,234,235,239,244,247,250,262,263,265,266,278,285,291,292,301,311,320,325,327,329,346,347,361,363,],[118,-181,-148,-166,-165,-179,-180,-183,-184,-182,160,-178,-157,-158,190,191,192,195,196,200,-58,-67,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,118,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,-167,233,245,-65,-66,-73,-76,-74,-75,-78,-152,-186,-168,-169,190,286,289,-9,118,-153,-77,-59,-68,310,314,323,-10,-79,338,345,349,351,-60,354,-125,-126,364,]),'LBRACE':([44,58,118,125,128,157,158,202,203,214,246,268,298,300,303,350,],[125,125,125,125,125,225,226,125,125,125,125,125,125,125,125,125,]),'AS':([51,66,78,79,80,81,82,83,84,89,111,112,120,141,142,143,144,145,146,147,148,149,150,151,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,184,218,222,231,234,262,],[-181,-148,-166,-165,-179,-180,-183,-184,-182,-178,-157,-158,197,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,-167,-152,-186,-168,-169,-153,]),'RPAR':([51,66,78,79,80,81,82,83,84,89,111,112,113,124,126,128,129,141,142,143,144,145,146,147,148,149,150,151,154,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,194,199,205,206,207,208,209,210,211,216,217,218,222,231,234,248,249,250,251,252,256,257,262,263,265,266,276,281,287,296,297,298,301,302,304,324,328,329,357,362,],[-181,-148,-166,-165,-179,-180,-183,-184,-182,-178,-157,-158,184,-58,-67,215,218,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,-57,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,-192,-167,231,-191,-55,247,-65,-66,-73,-76,-74,-75,-78,267,-71,-152,-186,-168,-169,292,-11,-12,-13,-14,-193,-200,-153,-77,-59,-68,309,-190,-56,-49,327,-48,-79,-72,332,-15,-201,-60,-193,363,]),'RBRACKET':([51,66,73,78,79,80,81,82,83,84,89,111,112,141,142,143,144,145,146,147,148,149,150,151,152,153,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,184,187,188,189,190,218,222,223,231,233,234,236,262,264,270,282,283,],[-181,-148,151,-166,-165,-179,-180,-183,-184,-182,-178,-157,-158,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,222,-187,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,-167,-172,234,-170,-176,-152,-186,-189,-168,-174,-169,-175,-153,301,-188,-173,-171,]),'COMMA':([51,66,78,79,80,81,82,83,84,89,111,112,124,126,141,142,143,144,145,146,147,148,149,150,151,152,153,154,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,194,205,206,207,208,209,210,211,216,217,218,222,223,231,233,234,236,248,249,250,251,252,254,255,256,257,258,259,260,261,262,263,265,266,270,272,273,274,275,276,281,282,283,287,301,302,304,324,326,328,329,330,333,335,346,347,357,361,],[-181,-148,-166,-165,-179,-180,-183,-184,-182,-178,-157,-158,-58,-67,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,223,-187,-57,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,-192,-167,232,-191,-172,235,-170,-176,-55,-65,-66,-73,-76,-74,-75,-78,268,-71,-152,-186,-189,-168,-174,-169,-175,293,-11,-12,-13,-14,-198,295,298,-200,-63,300,-61,-64,-153,-77,-59,-68,-188,-44,306,308,-51,232,-190,-173,-171,-56,-79,-72,232,-15,-199,-201,-60,-62,-45,-50,355,-125,298,-126,]),'RBRACE':([51,66,78,79,80,81,82,83,84,89,111,112,124,126,141,142,143,144,145,146,147,148,149,150,151,154,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,181,182,184,194,205,206,207,208,209,210,211,213,218,222,231,234,262,263,265,266,272,273,274,275,287,296,301,307,308,329,333,335,],[-181,-148,-166,-165,-179,-180,-183,-184,-182,-178,-157,-158,-58,-67,-155,-156,-154,-177,-159,-160,-161,-162,-163,-164,-185,-57,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-149,-150,-151,-167,-55,-65,-66,-73,-76,-74,-75,-78,265,-152,-186,-168,-169,-153,-77,-59,-68,-44,305,-193,-51,-56,-49,-79,334,-48,-60,-45,-50,]),'IN':([117,],[193,]),'CONST':([123,124,126,140,194,205,206,207,208,209,210,211,213,217,257,258,263,265,266,291,301,302,328,329,331,],[205,-58,-67,205,205,-65,-66,-73,-76,-74,-75,-78,205,205,205,205,-77,-59,-68,205,-79,205,205,-60,205,]),'RESTRICT':([123,124,126,140,194,205,206,207,208,209,210,211,213,217,257,258,263,265,266,291,301,302,328,329,331,],[206,-58,-67,206,206,-65,-66,-73,-76,-74,-75,-78,206,206,206,206,-77,-59,-68,206,-79,206,206,-60,206,]),'ELLIPSIS':([199,293,],[252,252,]),'ELSE':([229,237,288,317,319,339,344,352,360,],[278,285,320,320,-122,-127,-123,278,-124,]),'ELIF':([229,339,352,],[279,-127,279,]),'INDENT':([230,242,],[280,288,]),'CASE':([288,317,319,339,344,360,],[321,321,-122,-127,-123,-124,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -16,7 +16,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'stmts':([225,],[250,]),'struct_decl_list':([155,],[214,]),'atom':([0,3,5,10,14,15,19,21,23,33,40,42,43,46,54,56,67,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,187,221,225,240,250,267,290,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'power':([0,3,5,10,14,15,19,21,23,33,40,42,43,46,54,56,67,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,187,221,225,240,250,267,290,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'bracket_list':([84,92,130,145,149,202,206,229,234,253,],[138,138,138,138,138,138,138,138,138,138,]),'switch_stmt':([0,43,225,250,],[47,47,47,47,]),'stmt':([0,43,225,250,],[36,96,249,270,]),'enum_name_list':([159,],[220,]),'param_list_contents':([85,],[147,]),'optional_comma':([201,209,211,214,287,],[233,235,237,242,292,]),'return_stmt':([0,43,225,250,],[4,4,4,4,]),'if_stmt':([0,43,225,250,],[29,29,29,29,]),'array':([84,92,130,138,145,149,202,206,229,234,253,],[139,139,139,139,139,139,139,139,139,139,139,]),'case_list':([243,],[264,]),'case':([243,264,],[266,280,]),'assign_stmt':([0,43,225,250,],[34,34,34,34,]),'empty':([0,201,209,211,214,287,],[9,232,232,232,232,232,]),'default':([243,264,],[262,279,]),'stmt_list':([0,],[43,]),'type_declaration':([24,38,69,85,87,143,148,151,198,204,231,275,],[84,92,130,145,149,202,206,202,229,234,253,202,]),'struct_decl':([0,43,225,250,],[44,44,44,44,]),'if_orelse':([212,288,],[239,293,]),'suite':([131,150,153,158,197,252,258,268,273,274,277,278,291,297,],[188,208,212,218,228,272,276,284,285,286,288,289,295,298,]),'module':([0,],[13,]),'pointer':([84,92,130,138,145,149,202,206,229,234,253,],[140,140,140,140,140,140,140,140,140,140,140,]),'parameters':([80,],[136,]),'var_decl':([0,43,135,155,225,226,241,250,],[55,55,196,215,55,196,260,55,]),'name_list':([152,],[211,]),'typedecl_list':([143,151,275,],[201,209,287,]),'case_expr_list':([267,],[282,]),'endif_stmt':([0,43,225,250,],[48,48,48,48,]),'small_stmt':([0,43,225,250,],[49,49,49,49,]),'rshift':([66,71,72,73,75,77,79,81,82,91,93,95,98,101,102,129,157,160,164,165,166,168,169,170,171,172,173,174,175,176,177,178,179,181,182,183,184,186,190,199,203,224,259,283,294,],[128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,]),'param_type_list':([24,38,69,85,87,143,148,151,198,204,231,275,],[86,86,86,86,86,86,86,86,86,86,86,86,]),'expr_stmt':([0,43,225,250,],[39,39,39,39,]),'inline_func_decl':([24,38,69,85,87,143,148,151,198,204,231,275,],[88,88,88,88,88,88,88,88,88,88,88,88,]),'while_stmt':([0,43,225,250,],[17,17,17,17,]),'enum_decl_stmt':([0,43,225,250,],[18,18,18,18,]),'varargslist':([135,],[193,]),'switch_stmts':([243,],[265,]),'pointer_or_array':([84,92,130,138,145,149,202,206,229,234,253,],[141,141,141,200,141,141,141,141,141,141,141,]),'break':([0,43,225,250,],[2,2,2,2,]),'funcdef':([0,43,225,250,],[51,51,51,51,]),'define_stmt':([0,43,225,250,],[52,52,52,52,]),'expr':([0,3,5,10,14,15,19,21,23,33,40,42,43,46,54,56,67,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,187,221,225,240,250,267,290,],[66,71,72,73,75,77,79,81,82,91,93,95,66,98,101,102,129,157,160,164,165,166,168,169,170,171,172,173,174,175,176,177,178,179,181,182,183,184,186,190,199,203,224,164,66,259,66,283,294,]),'while_orelse':([218,],[245,]),'enum_decl':([0,43,225,250,],[25,25,25,25,]),'argument':([106,221,],[162,248,]),'switch_suite':([156,],[216,]),'ifndef_stmt':([0,43,225,250,],[22,22,22,22,]),'varaglist_elem':([135,226,],[192,251,]),'pass':([0,43,225,250,],[58,58,58,58,]),'string':([0,3,5,10,14,15,19,21,23,32,33,40,42,43,46,54,56,67,100,104,106,107,109,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,133,137,144,187,221,225,240,250,267,290,],[59,59,59,59,59,59,59,59,59,90,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'var_decl_stmt':([0,43,225,250,],[60,60,60,60,]),'func_decl':([0,43,225,250,],[62,62,62,62,]),'typedef_stmt':([0,43,225,250,],[63,63,63,63,]),'simple_stmt':([0,43,225,250,],[64,64,64,64,]),'compound_stmt':([0,43,225,250,],[28,28,28,28,]),'classdef':([0,43,225,250,],[65,65,65,65,]),'include_stmt':([0,43,225,250,],[53,53,53,53,]),'dowhile_stmt':([0,43,225,250,],[30,30,30,30,]),'arglist':([106,],[161,]),'struct_decl_stmt':([0,43,225,250,],[68,68,68,68,]),'array_contents':([14,],[74,]),}
+_lr_goto_items = {'module':([0,],[1,]),'stmt_list':([0,],[2,]),'empty':([0,255,256,259,274,357,],[3,296,296,296,296,296,]),'stmt':([0,2,280,312,],[5,86,313,340,]),'simple_stmt':([0,2,46,280,312,],[6,6,130,6,6,]),'compound_stmt':([0,2,280,312,],[7,7,7,7,]),'small_stmt':([0,2,46,280,312,],[8,8,8,8,8,]),'if_stmt':([0,2,280,312,],[9,9,9,9,]),'while_stmt':([0,2,280,312,],[10,10,10,10,]),'dowhile_stmt':([0,2,280,312,],[11,11,11,11,]),'for_stmt':([0,2,46,280,312,],[12,12,132,12,12,]),'switch_stmt':([0,2,280,312,],[13,13,13,13,]),'with_stmt':([0,2,280,312,],[14,14,14,14,]),'funcdef':([0,2,280,312,],[15,15,15,15,]),'classdef':([0,2,46,280,312,],[16,16,131,16,16,]),'decorated':([0,2,280,312,],[17,17,17,17,]),'return_stmt':([0,2,46,280,312,],[18,18,18,18,18,]),'yield_stmt':([0,2,46,280,312,],[19,19,19,19,19,]),'sync_stmt':([0,2,46,280,312,],[20,20,20,20,20,]),'include_stmt':([0,2,46,280,312,],[21,21,21,21,21,]),'define_stmt':([0,2,46,280,312,],[22,22,22,22,22,]),'ifndef_stmt':([0,2,46,280,312,],[23,23,23,23,23,]),'endif_stmt':([0,2,46,280,312,],[24,24,24,24,24,]),'expr_stmt':([0,2,46,280,312,],[25,25,25,25,25,]),'assign_stmt':([0,2,46,280,312,],[26,26,26,26,26,]),'func_decl':([0,2,46,280,312,],[27,27,27,27,27,]),'var_decl_stmt':([0,2,46,280,312,],[28,28,28,28,28,]),'enum_decl_stmt':([0,2,46,280,312,],[29,29,29,29,29,]),'struct_decl_stmt':([0,2,46,280,312,],[30,30,30,30,30,]),'typedef_stmt':([0,2,46,280,312,],[31,31,31,31,31,]),'break':([0,2,46,280,312,],[32,32,32,32,32,]),'pass':([0,2,46,280,312,],[33,33,33,33,33,]),'expr':([0,2,34,36,37,40,41,45,46,47,48,62,63,64,65,67,68,69,70,71,72,73,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,138,190,193,204,212,223,228,232,233,235,240,271,279,280,312,321,355,],[35,35,88,115,116,119,120,129,35,135,136,141,142,143,144,145,146,147,148,149,150,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,183,187,220,236,239,262,264,270,183,183,282,187,287,183,311,35,35,347,361,]),'decorators':([0,2,280,312,],[46,46,46,46,]),'string':([0,2,34,36,37,40,41,45,46,47,48,50,62,63,64,65,67,68,69,70,71,72,73,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,138,190,193,204,212,223,228,232,233,235,240,271,279,280,312,321,355,],[51,51,51,51,51,51,51,51,51,51,51,137,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'var_decl':([0,2,46,74,199,226,280,293,308,312,],[55,55,55,154,251,275,55,251,335,55,]),'enum_decl':([0,2,46,280,312,],[56,56,56,56,56,]),'struct_decl':([0,2,46,280,312,],[57,57,57,57,57,]),'decorator':([0,2,46,280,312,],[61,61,133,61,61,]),'power':([0,2,34,36,37,40,41,45,46,47,48,62,63,64,65,67,68,69,70,71,72,73,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,138,190,193,204,212,223,228,232,233,235,240,271,279,280,312,321,355,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'inline_decorator':([0,2,46,74,199,226,280,293,308,312,],[74,74,74,74,74,74,74,74,74,74,]),'atom':([0,2,34,36,37,40,41,45,46,47,48,62,63,64,65,67,68,69,70,71,72,73,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,114,138,190,193,204,212,223,228,232,233,235,240,271,279,280,312,321,355,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'rshift':([35,88,115,116,119,120,129,135,136,141,142,143,144,145,146,147,148,149,150,153,161,162,163,164,165,166,167,168,169,171,172,173,174,175,176,177,178,179,180,183,187,220,236,239,262,264,270,282,287,311,347,361,],[107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,]),'type_declaration':([44,58,118,125,128,202,203,214,246,268,298,300,303,350,],[123,140,194,213,217,257,258,266,291,302,328,258,331,257,]),'inline_func_decl':([44,58,118,125,128,202,203,214,246,268,298,300,303,350,],[126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'param_type_list':([44,58,118,125,128,202,203,214,246,268,298,300,303,350,],[127,127,127,127,127,127,127,127,127,127,127,127,127,127,]),'array_contents':([73,],[152,]),'arglist':([113,228,271,],[185,276,304,]),'argument':([113,228,232,271,],[186,186,281,186,]),'subscript_list':([114,],[188,]),'subscript':([114,235,],[189,283,]),'parameters':([121,219,],[198,269,]),'bracket_list':([123,140,194,213,217,257,258,266,291,302,328,331,],[207,207,207,207,207,207,207,207,207,207,207,207,]),'pointer_or_array':([123,140,194,207,213,217,257,258,266,291,302,328,331,],[208,208,208,263,208,208,208,208,208,208,208,208,208,]),'pointer':([123,140,194,207,213,217,257,258,266,291,302,328,331,],[209,209,209,209,209,209,209,209,209,209,209,209,209,]),'array':([123,140,194,207,213,217,257,258,266,291,302,328,331,],[210,210,210,210,210,210,210,210,210,210,210,210,210,]),'param_list_contents':([128,],[216,]),'suite':([160,191,192,196,200,245,286,289,310,314,323,338,345,349,351,354,364,],[229,237,238,243,253,290,315,322,337,341,348,352,353,356,358,360,365,]),'switch_suite':([195,],[241,]),'varargslist':([199,],[248,]),'varaglist_elem':([199,293,],[249,324,]),'name_list':([201,],[255,]),'typedecl_list':([202,350,],[256,357,]),'type_param_list':([203,],[259,]),'type_param':([203,300,],[260,330,]),'enum_name_list':([225,],[273,]),'struct_decl_list':([226,],[274,]),'if_orelse':([229,352,],[277,359,]),'while_orelse':([237,],[284,]),'optional_comma':([255,256,259,274,357,],[294,297,299,307,362,]),'stmts':([280,],[312,]),'switch_stmts':([288,],[316,]),'case_list':([288,],[317,]),'default':([288,317,],[318,343,]),'case':([288,317,],[319,344,]),'case_expr_list':([321,],[346,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -45,150 +45,186 @@ _lr_productions = [
   ('stmt -> compound_stmt','stmt',1,'p_stmt','cparse.py',165),
   ('simple_stmt -> small_stmt NEWLINE','simple_stmt',2,'p_simple_stmt','cparse.py',173),
   ('small_stmt -> return_stmt','small_stmt',1,'p_small_stmt','cparse.py',177),
-  ('small_stmt -> include_stmt','small_stmt',1,'p_small_stmt','cparse.py',178),
-  ('small_stmt -> define_stmt','small_stmt',1,'p_small_stmt','cparse.py',179),
-  ('small_stmt -> ifndef_stmt','small_stmt',1,'p_small_stmt','cparse.py',180),
-  ('small_stmt -> endif_stmt','small_stmt',1,'p_small_stmt','cparse.py',181),
-  ('small_stmt -> expr_stmt','small_stmt',1,'p_small_stmt','cparse.py',182),
-  ('small_stmt -> assign_stmt','small_stmt',1,'p_small_stmt','cparse.py',183),
-  ('small_stmt -> func_decl','small_stmt',1,'p_small_stmt','cparse.py',184),
-  ('small_stmt -> var_decl_stmt','small_stmt',1,'p_small_stmt','cparse.py',185),
-  ('small_stmt -> enum_decl_stmt','small_stmt',1,'p_small_stmt','cparse.py',186),
-  ('small_stmt -> struct_decl_stmt','small_stmt',1,'p_small_stmt','cparse.py',187),
-  ('small_stmt -> typedef_stmt','small_stmt',1,'p_small_stmt','cparse.py',188),
-  ('small_stmt -> break','small_stmt',1,'p_small_stmt','cparse.py',189),
-  ('small_stmt -> pass','small_stmt',1,'p_small_stmt','cparse.py',190),
-  ('typedef_stmt -> TYPEDEF type_declaration NAME','typedef_stmt',3,'p_typedef_stmt','cparse.py',196),
-  ('define_stmt -> DEFINE NAME expr','define_stmt',3,'p_define_stmt','cparse.py',203),
-  ('define_stmt -> DEFINE NAME','define_stmt',2,'p_define_stmt_empty','cparse.py',208),
-  ('ifndef_stmt -> IFNDEF NAME','ifndef_stmt',2,'p_ifndef_stmt','cparse.py',213),
-  ('endif_stmt -> ENDIF','endif_stmt',1,'p_endif_stmt','cparse.py',218),
-  ('pass -> PASS','pass',1,'p_pass','cparse.py',223),
-  ('break -> BREAK','break',1,'p_break','cparse.py',228),
-  ('enum_decl_stmt -> enum_decl','enum_decl_stmt',1,'p_enum_decl_stmt','cparse.py',234),
-  ('enum_decl -> ENUM NAME LBRACE enum_name_list RBRACE','enum_decl',5,'p_enum_decl','cparse.py',239),
-  ('enum_name_list -> NAME','enum_name_list',1,'p_enum_name_list','cparse.py',244),
-  ('enum_name_list -> enum_name_list COMMA NAME','enum_name_list',3,'p_enum_name_list_many','cparse.py',248),
-  ('struct_decl_stmt -> struct_decl','struct_decl_stmt',1,'p_struct_decl_stmt','cparse.py',254),
-  ('struct_decl -> STRUCT NAME LBRACE struct_decl_list optional_comma RBRACE','struct_decl',6,'p_struct_decl','cparse.py',259),
-  ('optional_comma -> COMMA','optional_comma',1,'p_optional_seq_comma','cparse.py',264),
-  ('optional_comma -> empty','optional_comma',1,'p_optional_seq_comma','cparse.py',265),
-  ('struct_decl_list -> struct_decl_list COMMA var_decl','struct_decl_list',3,'p_struct_decl_list','cparse.py',270),
-  ('struct_decl_list -> var_decl','struct_decl_list',1,'p_struct_decl_list_one','cparse.py',274),
-  ('func_decl -> DEF NAME parameters','func_decl',3,'p_func_decl','cparse.py',279),
-  ('func_decl -> DEF NAME parameters ARROW type_declaration','func_decl',5,'p_func_declwith_ret','cparse.py',285),
-  ('var_decl_stmt -> var_decl','var_decl_stmt',1,'p_var_decl_stmt','cparse.py',290),
-  ('var_decl -> NAME COLON type_declaration','var_decl',3,'p_vardecl','cparse.py',296),
-  ('var_decl -> NAME COLON type_declaration ASSIGN expr','var_decl',5,'p_vardecl_assign','cparse.py',302),
-  ('type_declaration -> NAME','type_declaration',1,'p_declaration_name','cparse.py',323),
-  ('type_declaration -> LBRACE type_declaration RBRACE','type_declaration',3,'p_type_declaration_scoped','cparse.py',328),
-  ('type_declaration -> type_declaration LT typedecl_list optional_comma GT','type_declaration',5,'p_type_declaration_generic','cparse.py',332),
-  ('type_declaration -> inline_func_decl','type_declaration',1,'p_function_declaration','cparse.py',338),
-  ('inline_func_decl -> param_type_list ARROW type_declaration','inline_func_decl',3,'p_inline_func_decl','cparse.py',342),
-  ('param_type_list -> LPAR RPAR','param_type_list',2,'p_param_type_list_empty','cparse.py',347),
-  ('param_type_list -> LPAR param_list_contents RPAR','param_type_list',3,'p_param_type_list_something','cparse.py',351),
-  ('param_list_contents -> type_declaration','param_list_contents',1,'p_param_list_contents','cparse.py',355),
-  ('param_list_contents -> param_list_contents COMMA type_declaration','param_list_contents',3,'p_param_list_contents_many','cparse.py',359),
-  ('type_declaration -> type_declaration bracket_list','type_declaration',2,'p_declaration_array','cparse.py',365),
-  ('pointer_or_array -> pointer','pointer_or_array',1,'p_pointer_or_array','cparse.py',382),
-  ('pointer_or_array -> array','pointer_or_array',1,'p_pointer_or_array','cparse.py',383),
-  ('bracket_list -> pointer_or_array','bracket_list',1,'p_bracket_list_one','cparse.py',387),
-  ('bracket_list -> bracket_list pointer_or_array','bracket_list',2,'p_bracket_list_many','cparse.py',391),
-  ('pointer -> MULT','pointer',1,'p_pointer','cparse.py',395),
-  ('array -> LBRACKET expr RBRACKET','array',3,'p_array','cparse.py',399),
-  ('include_stmt -> INCLUDE string','include_stmt',2,'p_include_standard','cparse.py',403),
-  ('expr_stmt -> expr','expr_stmt',1,'p_expr_stmt','cparse.py',408),
-  ('assign_stmt -> expr ASSIGN expr','assign_stmt',3,'p_assign','cparse.py',414),
-  ('return_stmt -> RETURN expr','return_stmt',2,'p_return_stmt','cparse.py',419),
-  ('compound_stmt -> if_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',426),
-  ('compound_stmt -> while_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',427),
-  ('compound_stmt -> dowhile_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',428),
-  ('compound_stmt -> switch_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',429),
-  ('compound_stmt -> funcdef','compound_stmt',1,'p_compound_stmt','cparse.py',430),
-  ('compound_stmt -> classdef','compound_stmt',1,'p_compound_stmt','cparse.py',431),
-  ('dowhile_stmt -> DOWHILE expr COLON suite','dowhile_stmt',4,'p_dowhile','cparse.py',439),
-  ('while_stmt -> WHILE expr COLON suite','while_stmt',4,'p_while_stmt','cparse.py',445),
-  ('while_stmt -> WHILE expr COLON suite while_orelse','while_stmt',5,'p_while_stmt_orelse','cparse.py',450),
-  ('while_orelse -> ELSE COLON suite','while_orelse',3,'p_while_orelse','cparse.py',455),
-  ('if_stmt -> IF expr COLON suite','if_stmt',4,'p_if_stmt','cparse.py',460),
-  ('if_stmt -> IF expr COLON suite if_orelse','if_stmt',5,'p_if_else','cparse.py',465),
-  ('if_orelse -> ELSE COLON suite','if_orelse',3,'p_orelse_else','cparse.py',470),
-  ('if_orelse -> ELIF expr COLON suite','if_orelse',4,'p_orelse_elif_no_orelse','cparse.py',474),
-  ('if_orelse -> ELIF expr COLON suite if_orelse','if_orelse',5,'p_orelse_elif_with_orelse','cparse.py',479),
-  ('switch_stmt -> SWITCH expr COLON switch_suite','switch_stmt',4,'p_switch','cparse.py',485),
-  ('switch_suite -> NEWLINE INDENT switch_stmts DEDENT','switch_suite',4,'p_switch_suite','cparse.py',490),
-  ('switch_stmts -> case_list','switch_stmts',1,'p_switch_stmts_case_list','cparse.py',494),
-  ('switch_stmts -> case_list default','switch_stmts',2,'p_switch_stmts_cases_with_default','cparse.py',498),
-  ('switch_stmts -> default','switch_stmts',1,'p_switch_stmts_default','cparse.py',502),
-  ('default -> ELSE COLON suite','default',3,'p_default','cparse.py',506),
-  ('case_list -> case','case_list',1,'p_case_list_one','cparse.py',511),
-  ('case_list -> case_list case','case_list',2,'p_case_list','cparse.py',515),
-  ('case -> CASE case_expr_list COLON suite','case',4,'p_case','cparse.py',519),
-  ('case_expr_list -> expr','case_expr_list',1,'p_case_expr_list_one','cparse.py',524),
-  ('case_expr_list -> case_expr_list COMMA expr','case_expr_list',3,'p_case_expr_list','cparse.py',528),
-  ('suite -> NEWLINE INDENT stmts DEDENT','suite',4,'p_suite','cparse.py',533),
-  ('stmts -> stmt','stmts',1,'p_stmts_1','cparse.py',537),
-  ('stmts -> stmts stmt','stmts',2,'p_stmts_2','cparse.py',541),
-  ('expr -> expr PLUS expr','expr',3,'p_add_expr','cparse.py',549),
-  ('expr -> expr MINUS expr','expr',3,'p_sub_expr','cparse.py',554),
-  ('expr -> expr MULT expr','expr',3,'p_mult_expr','cparse.py',559),
-  ('expr -> expr DIV expr','expr',3,'p_div_expr','cparse.py',564),
-  ('expr -> expr MOD expr','expr',3,'p_mod_expr','cparse.py',569),
-  ('expr -> expr EQ expr','expr',3,'p_eq_expr','cparse.py',574),
-  ('expr -> expr LT expr','expr',3,'p_lt_expr','cparse.py',579),
-  ('expr -> expr GT expr','expr',3,'p_gt_expr','cparse.py',584),
-  ('expr -> expr LE expr','expr',3,'p_le_expr','cparse.py',589),
-  ('expr -> expr GE expr','expr',3,'p_ge_expr','cparse.py',594),
-  ('expr -> expr AND expr','expr',3,'p_and_expr','cparse.py',599),
-  ('expr -> expr OR expr','expr',3,'p_or_expr','cparse.py',604),
-  ('expr -> expr AMP expr','expr',3,'p_bitand_expr','cparse.py',611),
-  ('expr -> expr PIPE expr','expr',3,'p_bitor_expr','cparse.py',616),
-  ('expr -> expr CARROT expr','expr',3,'p_xor_expr','cparse.py',621),
-  ('expr -> expr LSHIFT expr','expr',3,'p_lshift_expr','cparse.py',626),
-  ('expr -> expr rshift expr','expr',3,'p_rshift_expr','cparse.py',631),
-  ('rshift -> GT GT','rshift',2,'p_rshift','cparse.py',636),
-  ('expr -> power','expr',1,'p_comparison_power','cparse.py',640),
-  ('expr -> expr NE expr','expr',3,'p_ne','cparse.py',644),
-  ('expr -> expr ARROW NAME','expr',3,'p_expr_struct_deref','cparse.py',649),
-  ('expr -> expr PERIOD NAME','expr',3,'p_expr_struct_access','cparse.py',654),
-  ('expr -> LPAR expr RPAR','expr',3,'p_comparison_scoped','cparse.py',659),
-  ('expr -> LT type_declaration GT expr','expr',4,'p_comparison_cast','cparse.py',663),
-  ('expr -> MULT expr','expr',2,'p_comparison_deref','cparse.py',668),
-  ('expr -> PLUS expr','expr',2,'p_comparison_uadd','cparse.py',673),
-  ('expr -> MINUS expr','expr',2,'p_comparison_usub','cparse.py',678),
-  ('expr -> expr INC','expr',2,'p_post_inc','cparse.py',685),
-  ('expr -> expr DEC','expr',2,'p_post_dec','cparse.py',690),
-  ('expr -> INC expr','expr',2,'p_pre_inc','cparse.py',697),
-  ('expr -> DEC expr','expr',2,'p_pre_dec','cparse.py',702),
-  ('expr -> NOT expr','expr',2,'p_comparison_not','cparse.py',707),
-  ('expr -> INV expr','expr',2,'p_inv_expr','cparse.py',712),
-  ('atom -> NULL','atom',1,'p_null','cparse.py',717),
-  ('power -> atom','power',1,'p_power_1','cparse.py',722),
-  ('expr -> expr LPAR RPAR','expr',3,'p_call','cparse.py',726),
-  ('expr -> expr LPAR arglist RPAR','expr',4,'p_call_args','cparse.py',731),
-  ('expr -> expr LBRACKET expr RBRACKET','expr',4,'p_index','cparse.py',747),
-  ('expr -> AMP expr','expr',2,'p_address_of','cparse.py',754),
-  ('atom -> NAME','atom',1,'p_atom_name','cparse.py',759),
-  ('atom -> INT','atom',1,'p_atom_int','cparse.py',764),
-  ('atom -> FLOAT','atom',1,'p_atom_float','cparse.py',769),
-  ('atom -> string','atom',1,'p_atom_str','cparse.py',774),
-  ('string -> STRING','string',1,'p_str','cparse.py',778),
-  ('atom -> CHAR','atom',1,'p_atom_char','cparse.py',783),
-  ('atom -> LBRACKET RBRACKET','atom',2,'p_atom_array_empty','cparse.py',788),
-  ('atom -> LBRACKET array_contents RBRACKET','atom',3,'p_atom_array','cparse.py',793),
-  ('array_contents -> expr','array_contents',1,'p_array_litral_contents','cparse.py',798),
-  ('array_contents -> array_contents COMMA expr','array_contents',3,'p_array_litral_contents_2','cparse.py',802),
-  ('array_contents -> array_contents COMMA','array_contents',2,'p_array_litral_contents_3','cparse.py',806),
-  ('arglist -> arglist COMMA argument','arglist',3,'p_arglist','cparse.py',816),
-  ('arglist -> argument','arglist',1,'p_arglist_one_arg','cparse.py',820),
-  ('argument -> expr','argument',1,'p_argument','cparse.py',824),
-  ('empty -> <empty>','empty',0,'p_empty','cparse.py',828),
-  ('classdef -> CLASS NAME COLON suite','classdef',4,'p_class_decl_plain','cparse.py',833),
-  ('classdef -> CLASS NAME LT name_list optional_comma GT COLON suite','classdef',8,'p_class_decl_generic','cparse.py',838),
-  ('classdef -> CLASS NAME LPAR typedecl_list optional_comma RPAR COLON suite','classdef',8,'p_class_decl_parents','cparse.py',844),
-  ('classdef -> CLASS NAME LT name_list optional_comma GT LPAR typedecl_list optional_comma RPAR COLON suite','classdef',12,'p_class_decl_generics_and_parents','cparse.py',850),
-  ('name_list -> NAME','name_list',1,'p_name_list_one','cparse.py',856),
-  ('name_list -> name_list COMMA NAME','name_list',3,'p_name_list','cparse.py',860),
-  ('typedecl_list -> type_declaration','typedecl_list',1,'p_typedecl_list_one','cparse.py',864),
-  ('typedecl_list -> typedecl_list COMMA type_declaration','typedecl_list',3,'p_type_decl_list','cparse.py',868),
+  ('small_stmt -> yield_stmt','small_stmt',1,'p_small_stmt','cparse.py',178),
+  ('small_stmt -> sync_stmt','small_stmt',1,'p_small_stmt','cparse.py',179),
+  ('small_stmt -> include_stmt','small_stmt',1,'p_small_stmt','cparse.py',180),
+  ('small_stmt -> define_stmt','small_stmt',1,'p_small_stmt','cparse.py',181),
+  ('small_stmt -> ifndef_stmt','small_stmt',1,'p_small_stmt','cparse.py',182),
+  ('small_stmt -> endif_stmt','small_stmt',1,'p_small_stmt','cparse.py',183),
+  ('small_stmt -> expr_stmt','small_stmt',1,'p_small_stmt','cparse.py',184),
+  ('small_stmt -> assign_stmt','small_stmt',1,'p_small_stmt','cparse.py',185),
+  ('small_stmt -> func_decl','small_stmt',1,'p_small_stmt','cparse.py',186),
+  ('small_stmt -> var_decl_stmt','small_stmt',1,'p_small_stmt','cparse.py',187),
+  ('small_stmt -> enum_decl_stmt','small_stmt',1,'p_small_stmt','cparse.py',188),
+  ('small_stmt -> struct_decl_stmt','small_stmt',1,'p_small_stmt','cparse.py',189),
+  ('small_stmt -> typedef_stmt','small_stmt',1,'p_small_stmt','cparse.py',190),
+  ('small_stmt -> break','small_stmt',1,'p_small_stmt','cparse.py',191),
+  ('small_stmt -> pass','small_stmt',1,'p_small_stmt','cparse.py',192),
+  ('typedef_stmt -> TYPEDEF type_declaration NAME','typedef_stmt',3,'p_typedef_stmt','cparse.py',198),
+  ('define_stmt -> DEFINE NAME expr','define_stmt',3,'p_define_stmt','cparse.py',205),
+  ('define_stmt -> DEFINE NAME','define_stmt',2,'p_define_stmt_empty','cparse.py',210),
+  ('ifndef_stmt -> IFNDEF NAME','ifndef_stmt',2,'p_ifndef_stmt','cparse.py',215),
+  ('endif_stmt -> ENDIF','endif_stmt',1,'p_endif_stmt','cparse.py',220),
+  ('pass -> PASS','pass',1,'p_pass','cparse.py',225),
+  ('break -> BREAK','break',1,'p_break','cparse.py',230),
+  ('enum_decl_stmt -> enum_decl','enum_decl_stmt',1,'p_enum_decl_stmt','cparse.py',236),
+  ('enum_decl -> ENUM NAME LBRACE enum_name_list RBRACE','enum_decl',5,'p_enum_decl','cparse.py',241),
+  ('enum_name_list -> NAME','enum_name_list',1,'p_enum_name_list','cparse.py',246),
+  ('enum_name_list -> enum_name_list COMMA NAME','enum_name_list',3,'p_enum_name_list_many','cparse.py',250),
+  ('struct_decl_stmt -> struct_decl','struct_decl_stmt',1,'p_struct_decl_stmt','cparse.py',256),
+  ('struct_decl -> STRUCT NAME LBRACE struct_decl_list optional_comma RBRACE','struct_decl',6,'p_struct_decl','cparse.py',261),
+  ('optional_comma -> COMMA','optional_comma',1,'p_optional_seq_comma','cparse.py',266),
+  ('optional_comma -> empty','optional_comma',1,'p_optional_seq_comma','cparse.py',267),
+  ('struct_decl_list -> struct_decl_list COMMA var_decl','struct_decl_list',3,'p_struct_decl_list','cparse.py',272),
+  ('struct_decl_list -> var_decl','struct_decl_list',1,'p_struct_decl_list_one','cparse.py',276),
+  ('func_decl -> DEF NAME parameters','func_decl',3,'p_func_decl','cparse.py',281),
+  ('func_decl -> DEF NAME parameters ARROW type_declaration','func_decl',5,'p_func_declwith_ret','cparse.py',287),
+  ('var_decl_stmt -> var_decl','var_decl_stmt',1,'p_var_decl_stmt','cparse.py',292),
+  ('var_decl -> NAME COLON type_declaration','var_decl',3,'p_vardecl','cparse.py',298),
+  ('var_decl -> NAME COLON type_declaration ASSIGN expr','var_decl',5,'p_vardecl_assign','cparse.py',304),
+  ('var_decl -> inline_decorator var_decl','var_decl',2,'p_vardecl_decorated','cparse.py',310),
+  ('type_declaration -> NAME','type_declaration',1,'p_declaration_name','cparse.py',331),
+  ('type_declaration -> LBRACE type_declaration RBRACE','type_declaration',3,'p_type_declaration_scoped','cparse.py',336),
+  ('type_declaration -> type_declaration LT type_param_list optional_comma GT','type_declaration',5,'p_type_declaration_generic','cparse.py',340),
+  ('type_param_list -> type_param','type_param_list',1,'p_type_param_list_one','cparse.py',344),
+  ('type_param_list -> type_param_list COMMA type_param','type_param_list',3,'p_type_param_list_many','cparse.py',348),
+  ('type_param -> type_declaration','type_param',1,'p_type_param','cparse.py',352),
+  ('type_param -> INT','type_param',1,'p_type_param_int','cparse.py',356),
+  ('type_declaration -> type_declaration CONST','type_declaration',2,'p_type_declaration_const','cparse.py',366),
+  ('type_declaration -> type_declaration RESTRICT','type_declaration',2,'p_type_declaration_restrict','cparse.py',371),
+  ('type_declaration -> inline_func_decl','type_declaration',1,'p_function_declaration','cparse.py',378),
+  ('inline_func_decl -> param_type_list ARROW type_declaration','inline_func_decl',3,'p_inline_func_decl','cparse.py',382),
+  ('param_type_list -> LPAR RPAR','param_type_list',2,'p_param_type_list_empty','cparse.py',387),
+  ('param_type_list -> LPAR param_list_contents RPAR','param_type_list',3,'p_param_type_list_something','cparse.py',391),
+  ('param_list_contents -> type_declaration','param_list_contents',1,'p_param_list_contents','cparse.py',395),
+  ('param_list_contents -> param_list_contents COMMA type_declaration','param_list_contents',3,'p_param_list_contents_many','cparse.py',399),
+  ('type_declaration -> type_declaration bracket_list','type_declaration',2,'p_declaration_array','cparse.py',405),
+  ('pointer_or_array -> pointer','pointer_or_array',1,'p_pointer_or_array','cparse.py',422),
+  ('pointer_or_array -> array','pointer_or_array',1,'p_pointer_or_array','cparse.py',423),
+  ('bracket_list -> pointer_or_array','bracket_list',1,'p_bracket_list_one','cparse.py',427),
+  ('bracket_list -> bracket_list pointer_or_array','bracket_list',2,'p_bracket_list_many','cparse.py',431),
+  ('pointer -> MULT','pointer',1,'p_pointer','cparse.py',435),
+  ('array -> LBRACKET expr RBRACKET','array',3,'p_array','cparse.py',439),
+  ('include_stmt -> INCLUDE string','include_stmt',2,'p_include_standard','cparse.py',443),
+  ('expr_stmt -> expr','expr_stmt',1,'p_expr_stmt','cparse.py',448),
+  ('assign_stmt -> expr ASSIGN expr','assign_stmt',3,'p_assign','cparse.py',454),
+  ('return_stmt -> RETURN expr','return_stmt',2,'p_return_stmt','cparse.py',459),
+  ('yield_stmt -> YIELD expr','yield_stmt',2,'p_yield_stmt','cparse.py',464),
+  ('sync_stmt -> SYNC','sync_stmt',1,'p_sync_stmt','cparse.py',469),
+  ('compound_stmt -> if_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',476),
+  ('compound_stmt -> while_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',477),
+  ('compound_stmt -> dowhile_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',478),
+  ('compound_stmt -> for_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',479),
+  ('compound_stmt -> switch_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',480),
+  ('compound_stmt -> with_stmt','compound_stmt',1,'p_compound_stmt','cparse.py',481),
+  ('compound_stmt -> funcdef','compound_stmt',1,'p_compound_stmt','cparse.py',482),
+  ('compound_stmt -> classdef','compound_stmt',1,'p_compound_stmt','cparse.py',483),
+  ('compound_stmt -> decorated','compound_stmt',1,'p_compound_stmt','cparse.py',484),
+  ('decorator -> AT NAME NEWLINE','decorator',3,'p_decorator','cparse.py',490),
+  ('decorator -> AT NAME LPAR arglist RPAR NEWLINE','decorator',6,'p_decorator_args','cparse.py',495),
+  ('decorators -> decorator','decorators',1,'p_decorators','cparse.py',500),
+  ('decorators -> decorators decorator','decorators',2,'p_decorators_many','cparse.py',504),
+  ('decorated -> decorators simple_stmt','decorated',2,'p_decorated','cparse.py',508),
+  ('decorated -> decorators classdef','decorated',2,'p_decorated','cparse.py',509),
+  ('decorated -> decorators for_stmt','decorated',2,'p_decorated','cparse.py',510),
+  ('inline_decorator -> AT NAME','inline_decorator',2,'p_inline_decorator','cparse.py',526),
+  ('inline_decorator -> AT NAME LPAR arglist RPAR','inline_decorator',5,'p_inline_decorator_args','cparse.py',531),
+  ('dowhile_stmt -> DOWHILE expr COLON suite','dowhile_stmt',4,'p_dowhile','cparse.py',540),
+  ('while_stmt -> WHILE expr COLON suite','while_stmt',4,'p_while_stmt','cparse.py',546),
+  ('while_stmt -> WHILE expr COLON suite while_orelse','while_stmt',5,'p_while_stmt_orelse','cparse.py',551),
+  ('while_orelse -> ELSE COLON suite','while_orelse',3,'p_while_orelse','cparse.py',556),
+  ('for_stmt -> FOR NAME IN expr COLON suite','for_stmt',6,'p_for_stmt','cparse.py',561),
+  ('if_stmt -> IF expr COLON suite','if_stmt',4,'p_if_stmt','cparse.py',567),
+  ('if_stmt -> IF expr COLON suite if_orelse','if_stmt',5,'p_if_else','cparse.py',572),
+  ('if_orelse -> ELSE COLON suite','if_orelse',3,'p_orelse_else','cparse.py',577),
+  ('if_orelse -> ELIF expr COLON suite','if_orelse',4,'p_orelse_elif_no_orelse','cparse.py',581),
+  ('if_orelse -> ELIF expr COLON suite if_orelse','if_orelse',5,'p_orelse_elif_with_orelse','cparse.py',586),
+  ('with_stmt -> WITH expr COLON suite','with_stmt',4,'p_with_stmt','cparse.py',592),
+  ('with_stmt -> WITH expr AS NAME COLON suite','with_stmt',6,'p_with_stmt_as','cparse.py',597),
+  ('switch_stmt -> SWITCH expr COLON switch_suite','switch_stmt',4,'p_switch','cparse.py',603),
+  ('switch_suite -> NEWLINE INDENT switch_stmts DEDENT','switch_suite',4,'p_switch_suite','cparse.py',608),
+  ('switch_stmts -> case_list','switch_stmts',1,'p_switch_stmts_case_list','cparse.py',612),
+  ('switch_stmts -> case_list default','switch_stmts',2,'p_switch_stmts_cases_with_default','cparse.py',616),
+  ('switch_stmts -> default','switch_stmts',1,'p_switch_stmts_default','cparse.py',620),
+  ('default -> ELSE COLON suite','default',3,'p_default','cparse.py',624),
+  ('case_list -> case','case_list',1,'p_case_list_one','cparse.py',629),
+  ('case_list -> case_list case','case_list',2,'p_case_list','cparse.py',633),
+  ('case -> CASE case_expr_list COLON suite','case',4,'p_case','cparse.py',637),
+  ('case_expr_list -> expr','case_expr_list',1,'p_case_expr_list_one','cparse.py',642),
+  ('case_expr_list -> case_expr_list COMMA expr','case_expr_list',3,'p_case_expr_list','cparse.py',646),
+  ('suite -> NEWLINE INDENT stmts DEDENT','suite',4,'p_suite','cparse.py',651),
+  ('stmts -> stmt','stmts',1,'p_stmts_1','cparse.py',655),
+  ('stmts -> stmts stmt','stmts',2,'p_stmts_2','cparse.py',659),
+  ('expr -> expr PLUS expr','expr',3,'p_add_expr','cparse.py',667),
+  ('expr -> expr MINUS expr','expr',3,'p_sub_expr','cparse.py',672),
+  ('expr -> expr MULT expr','expr',3,'p_mult_expr','cparse.py',677),
+  ('expr -> expr DIV expr','expr',3,'p_div_expr','cparse.py',682),
+  ('expr -> expr MOD expr','expr',3,'p_mod_expr','cparse.py',687),
+  ('expr -> expr EQ expr','expr',3,'p_eq_expr','cparse.py',692),
+  ('expr -> expr LT expr','expr',3,'p_lt_expr','cparse.py',697),
+  ('expr -> expr GT expr','expr',3,'p_gt_expr','cparse.py',702),
+  ('expr -> expr LE expr','expr',3,'p_le_expr','cparse.py',707),
+  ('expr -> expr GE expr','expr',3,'p_ge_expr','cparse.py',712),
+  ('expr -> expr AND expr','expr',3,'p_and_expr','cparse.py',717),
+  ('expr -> expr OR expr','expr',3,'p_or_expr','cparse.py',722),
+  ('expr -> expr AMP expr','expr',3,'p_bitand_expr','cparse.py',729),
+  ('expr -> expr PIPE expr','expr',3,'p_bitor_expr','cparse.py',734),
+  ('expr -> expr CARROT expr','expr',3,'p_xor_expr','cparse.py',739),
+  ('expr -> expr LSHIFT expr','expr',3,'p_lshift_expr','cparse.py',744),
+  ('expr -> expr rshift expr','expr',3,'p_rshift_expr','cparse.py',749),
+  ('rshift -> GT GT','rshift',2,'p_rshift','cparse.py',754),
+  ('expr -> power','expr',1,'p_comparison_power','cparse.py',758),
+  ('expr -> expr NE expr','expr',3,'p_ne','cparse.py',762),
+  ('expr -> expr ARROW NAME','expr',3,'p_expr_struct_deref','cparse.py',767),
+  ('expr -> expr PERIOD NAME','expr',3,'p_expr_struct_access','cparse.py',772),
+  ('expr -> LPAR expr RPAR','expr',3,'p_comparison_scoped','cparse.py',777),
+  ('expr -> LT type_declaration GT expr','expr',4,'p_comparison_cast','cparse.py',781),
+  ('expr -> MULT expr','expr',2,'p_comparison_deref','cparse.py',786),
+  ('expr -> PLUS expr','expr',2,'p_comparison_uadd','cparse.py',791),
+  ('expr -> MINUS expr','expr',2,'p_comparison_usub','cparse.py',796),
+  ('expr -> expr INC','expr',2,'p_post_inc','cparse.py',803),
+  ('expr -> expr DEC','expr',2,'p_post_dec','cparse.py',808),
+  ('expr -> INC expr','expr',2,'p_pre_inc','cparse.py',815),
+  ('expr -> DEC expr','expr',2,'p_pre_dec','cparse.py',820),
+  ('expr -> NOT expr','expr',2,'p_comparison_not','cparse.py',825),
+  ('expr -> SPAWN expr','expr',2,'p_spawn_expr','cparse.py',830),
+  ('expr -> JOIN expr','expr',2,'p_join_expr','cparse.py',835),
+  ('expr -> INV expr','expr',2,'p_inv_expr','cparse.py',840),
+  ('atom -> NULL','atom',1,'p_null','cparse.py',845),
+  ('power -> atom','power',1,'p_power_1','cparse.py',850),
+  ('expr -> expr LPAR RPAR','expr',3,'p_call','cparse.py',854),
+  ('expr -> expr LPAR arglist RPAR','expr',4,'p_call_args','cparse.py',859),
+  ('expr -> expr LBRACKET subscript_list RBRACKET','expr',4,'p_index','cparse.py',866),
+  ('subscript_list -> subscript','subscript_list',1,'p_subscript_list_one','cparse.py',878),
+  ('subscript_list -> subscript_list COMMA subscript','subscript_list',3,'p_subscript_list_many','cparse.py',882),
+  ('subscript -> expr','subscript',1,'p_subscript','cparse.py',886),
+  ('subscript -> expr COLON expr','subscript',3,'p_slice','cparse.py',892),
+  ('subscript -> expr COLON','subscript',2,'p_slice_from','cparse.py',897),
+  ('subscript -> COLON expr','subscript',2,'p_slice_to','cparse.py',902),
+  ('subscript -> COLON','subscript',1,'p_slice_all','cparse.py',907),
+  ('expr -> AMP expr','expr',2,'p_address_of','cparse.py',914),
+  ('atom -> NAME','atom',1,'p_atom_name','cparse.py',919),
+  ('atom -> INT','atom',1,'p_atom_int','cparse.py',924),
+  ('atom -> FLOAT','atom',1,'p_atom_float','cparse.py',929),
+  ('atom -> string','atom',1,'p_atom_str','cparse.py',934),
+  ('string -> STRING','string',1,'p_str','cparse.py',938),
+  ('atom -> FSTRING','atom',1,'p_atom_fstring','cparse.py',943),
+  ('atom -> CHAR','atom',1,'p_atom_char','cparse.py',1018),
+  ('atom -> LBRACKET RBRACKET','atom',2,'p_atom_array_empty','cparse.py',1023),
+  ('atom -> LBRACKET array_contents RBRACKET','atom',3,'p_atom_array','cparse.py',1028),
+  ('array_contents -> expr','array_contents',1,'p_array_litral_contents','cparse.py',1033),
+  ('array_contents -> array_contents COMMA expr','array_contents',3,'p_array_litral_contents_2','cparse.py',1037),
+  ('array_contents -> array_contents COMMA','array_contents',2,'p_array_litral_contents_3','cparse.py',1041),
+  ('arglist -> arglist COMMA argument','arglist',3,'p_arglist','cparse.py',1051),
+  ('arglist -> argument','arglist',1,'p_arglist_one_arg','cparse.py',1055),
+  ('argument -> expr','argument',1,'p_argument','cparse.py',1059),
+  ('empty -> <empty>','empty',0,'p_empty','cparse.py',1063),
+  ('classdef -> CLASS NAME COLON suite','classdef',4,'p_class_decl_plain','cparse.py',1068),
+  ('classdef -> CLASS NAME LT name_list optional_comma GT COLON suite','classdef',8,'p_class_decl_generic','cparse.py',1073),
+  ('classdef -> CLASS NAME LPAR typedecl_list optional_comma RPAR COLON suite','classdef',8,'p_class_decl_parents','cparse.py',1079),
+  ('classdef -> CLASS NAME LT name_list optional_comma GT LPAR typedecl_list optional_comma RPAR COLON suite','classdef',12,'p_class_decl_generics_and_parents','cparse.py',1085),
+  ('name_list -> NAME','name_list',1,'p_name_list_one','cparse.py',1091),
+  ('name_list -> name_list COMMA NAME','name_list',3,'p_name_list','cparse.py',1095),
+  ('typedecl_list -> type_declaration','typedecl_list',1,'p_typedecl_list_one','cparse.py',1099),
+  ('typedecl_list -> typedecl_list COMMA type_declaration','typedecl_list',3,'p_type_decl_list','cparse.py',1103),
 ]
@@ -0,0 +1,145 @@
+import os
+import unittest
+import subprocess
+import tempfile
+
+from compiler import *
+from lang_types import *
+
+
+class TestAlignment(unittest.TestCase):
+    def test_syntax(self):
+        """Test parsing alignment and packing decorators."""
+        code = """
+struct A {@align(64) x: int, y: char}
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(
+            ast,
+            Module([
+                StructDecl(Struct("A", [
+                    VarDecl("x", NameType("int"),
+                            decorators=[Decorator("align", [Int(64)])]),
+                    VarDecl("y", NameType("char")),
+                ]))
+            ])
+        )
+        self.assertEqual(str(ast), code)
+
+        code = """
+@packed
+@align(8)
+struct A {x: int}
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(
+            ast.body[0].decorators,
+            [Decorator("packed"), Decorator("align", [Int(8)])]
+        )
+        self.assertEqual(str(ast), code)
+
+        # Decorators on their own line are the same as inline ones
+        ast = code_to_ast("@align(16)\nx: int")
+        self.assertEqual(str(ast), "@align(16) x: int")
+
+    def test_c_code(self):
+        code = """
+@packed
+@align(8)
+struct A {@align(4) x: int, y: char}
+
+def func():
+    @align(32) buf: char[10]
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            "struct A {_Alignas(4) int x; char y;} __attribute__((packed, aligned(8)));",
+            c_code
+        )
+        self.assertIn("_Alignas(32) char buf[10];", c_code)
+
+    def test_layouts(self):
+        """Test alignment and packing are reflected in the struct layouts."""
+        inferer = Inferer()
+        inferer.check(code_to_ast("""
+@packed
+struct A {c: char, @align(8) x: int, d: char}
+
+@packed
+@align(8)
+struct B {c: char, x: int}
+
+@align(16)
+struct C {c: char, @align(64) v: long}
+
+struct D {c: char, b: B}
+        """.strip()))
+        self.assertEqual(inferer.type_layout(LangType("A")), Layout(16, 8, 10))
+        self.assertEqual(inferer.type_layout(LangType("B")), Layout(8, 8, 3))
+        self.assertEqual(inferer.type_layout(LangType("C")), Layout(128, 64, 119))
+        self.assertEqual(inferer.type_layout(LangType("D")), Layout(16, 8, 7))
+
+    def test_invalid_alignment(self):
+        for code in ("struct A {@align(3) x: int}",
+                     "@align(x)\nstruct A {x: int}",
+                     "@align\nx: int"):
+            with self.assertRaises(RuntimeError):
+                code_to_ast(code, infer=True)
+
+    def test_aligned_class_allocation(self):
+        """Test over aligned classes are allocated with aligned_alloc."""
+        code = """
+class A:
+    @align(64)
+    x: int
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("_Alignas(64) int x;", c_code)
+        self.assertIn("init_A(((A*)aligned_alloc(64, sizeof(A))));", c_code)
+
+    def test_aligned_class_in_arena(self):
+        """Test over aligned classes allocated from an arena are aligned."""
+        code = """
+class A:
+    @align(64)
+    x: int
+
+def main() -> int:
+    misaligned = 0
+    with arena(100) as a:
+        for i in range(8):
+            small = malloc(24)
+            obj = new_A()
+            if <size_t>obj % 64:
+                misaligned++
+        objs = new_A_array(3)
+        if <size_t>objs % 64:
+            misaligned++
+        big = new_A_array(100)
+        if <size_t>big % 64:
+            misaligned++
+    printf("%d\\n", misaligned)
+    return 0
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            "A *obj = init_A(((A*)arena_alloc_aligned(a, sizeof(A), 64)));",
+            c_code)
+        self.assertIn(
+            "A *objs = init_A_array(((A*)arena_alloc_aligned(a, (sizeof(A) * 3), 64)), 3);",
+            c_code)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "arena_align.cu")
+            with open(source, "w") as f:
+                f.write(code)
+            out = run_files([source], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"0\n")
+
+    def test_alignment_example(self):
+        out = run_files(["examples/alignment.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"128 7\n6\n16\n64 7\n0\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import os
+import unittest
+import subprocess
+import tempfile
+
+from compiler import *
+
+
+class TestArena(unittest.TestCase):
+    def test_with_syntax(self):
+        """Test parsing a with block with and without a name."""
+        code = """
+with arena(1024) as a:
+    pass
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(
+            ast,
+            Module([
+                With(
+                    Call(Name("arena"), [Int(1024)]),
+                    [Pass()],
+                    "a"
+                )
+            ])
+        )
+        self.assertEqual(str(ast), code)
+
+        code = """
+with arena(1024):
+    pass
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(
+            ast.body[0],
+            With(Call(Name("arena"), [Int(1024)]), [Pass()])
+        )
+        self.assertEqual(str(ast), code)
+
+    def test_allocations_use_arena(self):
+        """Test malloc and class constructors inside the block allocate from
+        the arena."""
+        code = """
+class A:
+    x: int
+
+def func():
+    with arena(1024) as a:
+        p = <int*>malloc(sizeof(int))
+        obj = new_A()
+    p2 = <int*>malloc(sizeof(int))
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <lang_arena.h>", c_code)
+        self.assertIn(
+            "Arena *a __attribute__((cleanup(arena_cleanup))) = arena_new(1024);",
+            c_code
+        )
+        self.assertIn("int *p = ((int*)arena_alloc(a, sizeof(int)));", c_code)
+        self.assertIn(
+            "A *obj = init_A(((A*)arena_alloc(a, sizeof(A))));",
+            c_code
+        )
+        self.assertIn("int *p2 = ((int*)malloc(sizeof(int)));", c_code)
+
+    def test_frees_in_arena(self):
+        """Test free(), realloc() and destructors only leave memory to the
+        arena if an arena owns it."""
+        code = """
+class A:
+    x: int
+
+class B:
+    x: int
+
+    def __del__(self: B*):
+        pass
+
+def func(q: int*):
+    with arena(1024) as a:
+        p = <int*>calloc(2, sizeof(int))
+        p = <int*>realloc(p, sizeof(int) * 4)
+        free(p)
+        free(q)
+        obj = new_A()
+        del_A(obj)
+        b = new_B()
+        del_B(b)
+        bs = new_B_array(2)
+        del_B_array(bs, 2)
+        with arena(64) as inner:
+            free(p)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("""\
+static void lang_arena_del_A(Arena *arena, A *self){
+    if (!arena_owns(arena, self)) {
+        del_A(self);
+    }
+}""", c_code)
+        self.assertIn("""\
+static void lang_arena_del_B_array(Arena *arena, B *self, size_t count){
+    if (arena_owns(arena, self)) {
+        fini_B_array(self, count);
+    }
+    else {
+        del_B_array(self, count);
+    }
+}""", c_code)
+
+        body = c_code[c_code.index("int func(int *q){"):]
+        self.assertIn("int *p = ((int*)arena_calloc(a, 2, sizeof(int)));", body)
+        self.assertIn("p = ((int*)arena_realloc(a, p, (sizeof(int) * 4)));", body)
+        self.assertIn("arena_release(a, p);", body)
+        self.assertIn("arena_release(a, q);", body)
+        self.assertIn("lang_arena_del_A(a, obj);", body)
+        self.assertIn("lang_arena_del_B(a, b);", body)
+        self.assertIn("lang_arena_del_B_array(a, bs, 2);", body)
+        self.assertIn("= arena_new_nested(64, a);", body)
+        self.assertIn("arena_release(inner, p);", body)
+        self.assertNotIn("free(", body)
+
+        # Memory from before the block is freed, and memory of an arena
+        # keeps its contents when reallocated
+        code = """
+class Buffer:
+    size: int
+
+    def __init__(self: Buffer*, size: int):
+        self->size = size
+
+    def __del__(self: Buffer*):
+        printf("closed %d\\n", self->size)
+
+def main() -> int:
+    heap = new_Buffer(1)
+    q = <int*>malloc(sizeof(int))
+    with arena(64) as a:
+        p = <int*>calloc(4, sizeof(int))
+        p[3] = 7
+        p = <int*>realloc(p, sizeof(int) * 100)
+        p[99] = 1
+        printf("%d %d %d\\n", p[0], p[3], arena_owns(a, p))
+        q = <int*>realloc(q, sizeof(int) * 2)
+        printf("%d\\n", arena_owns(a, q))
+        obj = new_Buffer(2)
+        with arena(64):
+            free(p)
+            del_Buffer(obj)
+            del_Buffer(heap)
+        free(q)
+        printf("%d\\n", p[3])
+    return 0
+        """.strip()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "release.cu")
+            with open(source, "w") as f:
+                f.write(code)
+            out = run_files([source], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout,
+                         b"0 7 1\n0\nclosed 2\nclosed 1\n7\n")
+
+    def test_unknown_context(self):
+        """Only arenas can be used as with contexts."""
+        code = """
+def func():
+    with open(1):
+        pass
+        """.strip()
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code, infer=True)
+
+    def test_arena_example(self):
+        out = run_files(["examples/arena.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout,
+                         b"54900000\n42\nclosed 8\nclosed 4\nclosed 4\nclosed 16\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
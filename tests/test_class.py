@@ -161,6 +161,25 @@ class A:
             )
         )
 
+    def test_bound_method_call(self):
+        """Test the instance is passed to methods once and calls with
+        missing arguments are not mistaken for checked calls."""
+        code = """
+class A:
+    x: int
+
+    def get(self: A*, k: int) -> int:
+        return self->x + k
+
+def func(a: A*) -> int:
+    return a->get(a->get(1))
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("return a->get(a, a->get(a, 1));", c_code)
+
+        with self.assertRaises(TypeError):
+            code_to_ast(code.replace("a->get(a->get(1))", "a->get()"), infer=True)
+
 
 if __name__ == "__main__":
     unittest.main()
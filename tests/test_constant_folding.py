@@ -0,0 +1,130 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+def folded_c_code(code):
+    return fold_constants(code_to_ast(code, infer=True)).c_code()
+
+
+class TestConstantFolding(unittest.TestCase):
+    def test_fold_expressions(self):
+        """Test folding follows the C semantics of int and double
+        literals."""
+        code = """
+define N 10
+define HALF N / 2
+
+def func() -> int:
+    a = (N * 4 + 3) % 7 - -7 / 2
+    b = (HALF << 2) | (~0 & 3)
+    c: double = <double>N / 4 + 1
+    d = <int>3.9 + (N > HALF) + (0 and N)
+    return a
+        """.strip()
+        c_code = folded_c_code(code)
+        self.assertIn("#define HALF 5", c_code)
+        self.assertIn("int a = 4;", c_code)
+        self.assertIn("int b = 23;", c_code)
+        self.assertIn("double c = 3.5;", c_code)
+        self.assertIn("int d = 4;", c_code)
+
+    def test_unfoldable(self):
+        """Test expressions C would not compute the same way are kept."""
+        code = """
+def func(x: int) -> int:
+    a = 2147483647 + 1
+    b = 1 / 0
+    c = 1 << 32
+    d = -1 >> 1
+    e = <long>1 * 2
+    f = x * (2 + 3)
+    g = 1 and x > 2
+    h: long = 3000000000 - 1000000000
+    i: long = -3000000000
+    return a
+        """.strip()
+        c_code = folded_c_code(code)
+        self.assertIn("int a = (2147483647 + 1);", c_code)
+        self.assertIn("int b = (1 / 0);", c_code)
+        self.assertIn("int c = (1 << 32);", c_code)
+        self.assertIn("int d = (-1 >> 1);", c_code)
+        self.assertIn("long long e = (((long long)1) * 2);", c_code)
+        self.assertIn("int f = (x * 5);", c_code)
+        self.assertIn("int g = (x > 2);", c_code)
+        # Arithmetic on longs stays a long
+        self.assertIn("long long h = (3000000000 - 1000000000);", c_code)
+        self.assertIn("long long i = -3000000000;", c_code)
+
+    def test_dead_branches(self):
+        code = """
+define DEBUG 0
+
+def func(x: int) -> int:
+    if DEBUG:
+        printf("debug\\n")
+    elif x > 2:
+        x = 2
+    if not DEBUG:
+        y = 1
+        x = x + y
+    if 1:
+        x = x + 1
+    while DEBUG:
+        x = 0
+    else:
+        x = x * 2
+    while 1:
+        break
+        x = 3
+    return x
+    x = 4
+        """.strip()
+        self.assertIn("""\
+int func(int x){
+    if ((x > 2)) {
+        x = 2;
+    }
+    if (1) {
+        int y = 1;
+        x = (x + y);
+    }
+    x = (x + 1);
+    x = (x * 2);
+    while (1) {
+        break;
+    }
+    return x;
+}""", folded_c_code(code))
+
+    def test_generators(self):
+        """Test code a generator resumes in is kept."""
+        code = """
+def gen() -> int:
+    if 0:
+        yield 1
+    while 1:
+        break
+        yield 2
+        """.strip()
+        c_code = folded_c_code(code)
+        self.assertIn("lang_resume_1:;", c_code)
+        self.assertIn("lang_resume_2:;", c_code)
+
+    def test_constant_folding_example(self):
+        expected = b"""\
+-3 -1 -3 1
+-17 128 22
+1 0 1
+3.700000 -2
+total 3
+"""
+        for fold in (True, False):
+            out = run_files(["examples/constant_folding.cu"],
+                            stdout=subprocess.PIPE, fold=fold)
+            self.assertEqual(out.stdout, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
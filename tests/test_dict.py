@@ -0,0 +1,68 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestDict(unittest.TestCase):
+    def test_dict_specialization(self):
+        """Test the builtin Dict can be used without being declared and that
+        indexing is lowered to its methods."""
+        code = """
+def func(d: Dict<int, double>*) -> double:
+    (*d)[2] = 1.5
+    return (*d)[2]
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <lang_hash.h>", c_code)
+        self.assertIn("struct Dict_int_double {int *keys; double *values; unsigned int *dists;",
+                      c_code)
+        self.assertIn("Dict_int_double___setitem__(d, 2, 1.5);", c_code)
+        self.assertIn("return (*Dict_int_double___getitem__(d, 2));", c_code)
+
+    def test_hash(self):
+        """Test hash() and hash_eq() are lowered for the type of the
+        argument."""
+        code = """
+class A:
+    x: int
+
+    def __hash__(self: A*) -> size_t:
+        return hash(self->x)
+
+    def __eq__(self: A*, other: A*) -> int:
+        return self->x == other->x
+
+def func(i: int, s: char*, p: int*, a: A*):
+    hash(i)
+    hash(s)
+    hash(p)
+    hash(a)
+    hash_eq(i, i)
+    hash_eq(s, s)
+    hash_eq(a, a)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("lang_hash_int(i);", c_code)
+        self.assertIn("lang_hash_str(s);", c_code)
+        self.assertIn("lang_hash_ptr(p);", c_code)
+        self.assertIn("A___hash__(a);", c_code)
+        self.assertIn("(i == i);", c_code)
+        self.assertIn("lang_eq_str(s, s);", c_code)
+        self.assertIn("A___eq__(a, a);", c_code)
+
+    def test_unhashable(self):
+        code = """
+def func(x: double):
+    hash(x)
+        """.strip()
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code, infer=True)
+
+    def test_dict_example(self):
+        out = run_files(["examples/dict.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"5000 9801 0 -1\n4 3 1\n3\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
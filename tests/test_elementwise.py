@@ -0,0 +1,132 @@
+import os
+import unittest
+import subprocess
+import tempfile
+
+from compiler import *
+from lang_types import *
+
+
+class TestElementwise(unittest.TestCase):
+    def test_fused_loop(self):
+        """Test an elementwise expression is lowered to one loop without
+        temporaries."""
+        code = """
+def func(a: int[4], b: int[4], c: int[4], k: int):
+    c = a * b + k
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("""\
+    {
+        Span_int lang_ew0 = Span_int_slice(c, 4, 0, 4);
+        Span_int lang_ew1 = Span_int_slice(a, 4, 0, 4);
+        Span_int lang_ew2 = Span_int_slice(b, 4, 0, 4);
+        assert((lang_ew1.length == lang_ew0.length));
+        assert((lang_ew2.length == lang_ew0.length));
+        #pragma omp simd
+        for (size_t lang_i = 0; lang_i < lang_ew0.length; lang_i++) {
+            lang_ew0.data[lang_i] = ((lang_ew1.data[lang_i] * lang_ew2.data[lang_i]) + k);
+        }
+    }""", c_code)
+
+    def test_overlapping_operands(self):
+        """Test operands that are other parts of the target are read before
+        the target is written."""
+        code = """
+def main() -> int:
+    a: int[4] = [1, 5, 9, 13]
+    a[1:] = a[:3] + 1
+    b: int[4] = [1, 5, 9, 13]
+    b = b + 1
+    printf("%d %d %d %d %d\\n", a[0], a[1], a[2], a[3], b[3])
+    return 0
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <string.h>", c_code)
+        self.assertIn("""\
+        int *lang_ew2 = ((int*)malloc((sizeof((*lang_ew0.data)) * lang_ew0.length)));
+        #pragma omp simd
+        for (size_t lang_i = 0; lang_i < lang_ew0.length; lang_i++) {
+            lang_ew2[lang_i] = (lang_ew1.data[lang_i] + 1);
+        }
+        memcpy(lang_ew0.data, lang_ew2, (sizeof((*lang_ew0.data)) * lang_ew0.length));
+        free(lang_ew2);
+    }""", c_code)
+
+        # An operand that is the whole target is read and written in place
+        self.assertIn("lang_ew0.data[lang_i] = (lang_ew1.data[lang_i] + 1);",
+                      c_code)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "overlap.cu")
+            with open(source, "w") as f:
+                f.write(code)
+            out = run_files([source], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"1 2 6 10 14\n")
+
+    def test_new_variable(self):
+        """Test assigning to a new variable declares an array of the size of
+        the operands."""
+        code = """
+def func(a: double[3]):
+    b = -a
+    c: double[3] = a * 2
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("double b[3];", c_code)
+        self.assertIn("lang_ew0.data[lang_i] = -lang_ew1.data[lang_i];", c_code)
+        self.assertIn("double c[3];", c_code)
+
+    def test_calls_evaluated_once(self):
+        code = """
+def scale() -> float:
+    return 2.0
+
+def func(a: Span<float>):
+    a = a * scale()
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("float lang_ew2 = scale();", c_code)
+        self.assertIn("lang_ew0.data[lang_i] = (lang_ew1.data[lang_i] * lang_ew2);",
+                      c_code)
+
+    def test_infer(self):
+        """Test the types of elementwise expressions."""
+        code = """
+a: int[4]
+s: Span<double>
+p: int*
+        """.strip()
+        inferer = Inferer()
+        inferer.check(code_to_ast(code))
+        t = inferer.infer(code_to_ast("a * s").body[0].value)
+        self.assertIsInstance(t, ElementwiseType)
+        self.assertEqual(t.contents, DOUBLE_TYPE)
+        self.assertEqual(t.size, Int(4))
+
+        # Pointers are still shifted
+        self.assertIsInstance(inferer.infer(code_to_ast("p + 1").body[0].value), PointerType)
+
+    def test_size_mismatch(self):
+        code = """
+def func(a: int[4], b: int[3]):
+    a = a + b
+        """.strip()
+        with self.assertRaises(TypeError):
+            code_to_ast(code, infer=True)
+
+    def test_unknown_size(self):
+        code = """
+def func(a: Span<int>):
+    b = a + 1
+        """.strip()
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code, infer=True)
+
+    def test_elementwise_example(self):
+        out = run_files(["examples/elementwise.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"9 24 16\n12.5 18.5\n24 -1 -4\n999000\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
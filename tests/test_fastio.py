@@ -0,0 +1,61 @@
+import os
+import unittest
+import subprocess
+import tempfile
+
+from compiler import *
+
+
+class TestFastIO(unittest.TestCase):
+    def run_code(self, code, input):
+        # The C file is written next to the source, so both are made in a
+        # temporary directory
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "fastio.cu")
+            with open(source, "w") as f:
+                f.write(code)
+            return run_files([source], stdout=subprocess.PIPE, input=input).stdout
+
+    def test_header(self):
+        code = """
+def func() -> int:
+    x = read_int()
+    write_int(x)
+    return x
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <lang_fastio.h>", c_code)
+        self.assertIn("int x = read_int();", c_code)
+
+    def test_read(self):
+        code = """
+def main() -> int:
+    line: char[8]
+    a = read_long()
+    b = read_float()
+    read_line(line, 8)
+    while read_line(line, 8) >= 0:
+        write_str(line)
+        write_char('|')
+    write_char('\\n')
+    write_int(a)
+    write_char(' ')
+    write_float(b, 3)
+    write_flush()
+    printf(" printed after the flush\\n")
+    return 0
+        """.strip()
+        out = self.run_code(code, b"  -9000000000\n2.5e-1 rest\nfirst\nsecond line\n\nlast")
+        self.assertEqual(
+            out,
+            b"first|second |line||last|\n-9000000000 0.250 printed after the flush\n"
+        )
+
+    def test_fastio_example(self):
+        out = run_files(["examples/fastio.cu"], stdout=subprocess.PIPE,
+                        input=b"1 2\n-3\n  40 \n")
+        self.assertEqual(out.stdout, b"2 4 -6 80 \ncount 4, sum 40, mean 10.00\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
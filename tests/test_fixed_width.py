@@ -0,0 +1,92 @@
+import unittest
+import subprocess
+
+from compiler import *
+from lang_types import *
+
+
+class TestFixedWidth(unittest.TestCase):
+    def test_qualifier_syntax(self):
+        """Test qualifiers apply to the type before them."""
+        code = """
+a: char const*
+b: float* restrict
+c: int const* const
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(
+            ast.body[0].decl.type,
+            Pointer(Qualified(NameType("char"), "const"))
+        )
+        self.assertEqual(
+            ast.body[1].decl.type,
+            Qualified(Pointer(NameType("float")), "restrict")
+        )
+        self.assertEqual(str(ast), code)
+
+    def test_c_decls(self):
+        code = """
+def func(x: float const* restrict, y: float* restrict, n: int8) -> uint64:
+    a: int const = 2
+    b: char* const* = NULL
+    c: int16[4]
+    d = <uint32 const>a
+    return <uint64>n
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <stdint.h>", c_code)
+        self.assertIn("uint64_t func(float const *restrict x, float *restrict y, int8_t n){",
+                      c_code)
+        self.assertIn("int const a = 2;", c_code)
+        self.assertIn("char *const *b = NULL;", c_code)
+        self.assertIn("int16_t c[4];", c_code)
+
+        # Copies do not keep the qualifiers
+        self.assertIn("uint32_t d = ((uint32_t const)a);", c_code)
+
+    def test_fixed_width_arithmetic(self):
+        """Test 64 bit integers are not narrowed in arithmetic."""
+        code = """
+def func(a: int64, b: int32, c: uint64) -> int64:
+    d = a * b
+    e = c + 1
+    a = a + b
+    return d
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("int64_t d = (a * b);", c_code)
+        self.assertIn("uint64_t e = (c + 1);", c_code)
+
+    def test_layout(self):
+        inferer = Inferer()
+        inferer.check(code_to_ast("struct A {a: uint8, b: int16 const, c: int64}"))
+        self.assertEqual(inferer.type_layout(LangType("A")), Layout(16, 8, 5))
+
+    def test_const_errors(self):
+        errors = [
+            "def func(a: int const):\n    a = 2",
+            "def func(p: char const*):\n    p[0] = 'a'",
+            "def func(p: char const*):\n    *p = 'a'",
+            # Pointers to const cannot become pointers to non-const
+            "def func(p: char const*):\n    q: char* = p",
+            "def func(p: char const*, q: char*):\n    q = p",
+        ]
+        for code in errors:
+            with self.assertRaises(TypeError, msg=code):
+                code_to_ast(code, infer=True)
+
+        # The pointer itself can still change
+        code_to_ast("def func(p: char const*, q: char*):\n    p = q\n    p[0]",
+                    infer=True)
+
+    def test_restrict_needs_pointer(self):
+        with self.assertRaises(RuntimeError):
+            code_to_ast("a: int restrict", infer=True)
+
+    def test_fixed_width_example(self):
+        out = run_files(["examples/fixed_width.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"2.5 16.5\n4 350\n1099511627776 -56 hi\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import os
+import unittest
+import subprocess
+import tempfile
+
+from compiler import *
+
+
+class TestFor(unittest.TestCase):
+    def test_for_syntax(self):
+        code = """
+for i in range(10):
+    pass
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(
+            ast,
+            Module([
+                For("i", Call(Name("range"), [Int(10)]), [Pass()])
+            ])
+        )
+        self.assertEqual(str(ast), code)
+
+    def test_c_for(self):
+        """Test range() is lowered to a C for loop that only evaluates the
+        stop and step once."""
+        code = """
+def func(n: size_t, k: int):
+    for i in range(n):
+        pass
+    for i in range(1, 10, 2):
+        pass
+    for i in range(10, 0, -1):
+        pass
+    for i in range(k, 0, k):
+        pass
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            "for (size_t i = 0, lang_i_stop = n; i < lang_i_stop; i++) {",
+            c_code)
+        self.assertIn("for (int i = 1; i < 10; i += 2) {", c_code)
+        self.assertIn("for (int i = 10; i > 0; i--) {", c_code)
+        self.assertIn(
+            "for (int i = k, lang_i_step = k; (lang_i_step > 0 ? i < 0 : i > 0); i += lang_i_step) {",
+            c_code)
+
+    def test_unsigned_index(self):
+        """Test the index keeps the typedef of the bounds and unsigned
+        indices count down to 0 without comparing them to -1."""
+        code = """
+def func():
+    n: size_t = 3
+    for j in range(0, n, 2):
+        pass
+    for i in range(n - 1, -1, -1):
+        pass
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            "for (size_t j = 0, lang_j_stop = n; j < lang_j_stop; j += 2) {",
+            c_code)
+        self.assertIn("for (size_t i = (n - 1) + 1; i-- > 0; ) {", c_code)
+
+        errors = [
+            "def func(n: size_t):\n    for i in range(n, -2, -1):\n        pass",
+            "def func(n: size_t):\n    for i in range(-1, n):\n        pass",
+            "def func(n: uint):\n    for i in range(n, -1, -2):\n        pass",
+        ]
+        for code in errors:
+            with self.assertRaises(TypeError, msg=code):
+                code_to_ast(code, infer=True)
+
+    def test_signed_step(self):
+        """Test a signed step of an unsigned index can be negative and that
+        negative steps stop at the stop instead of wrapping the index around
+        below 0."""
+        code = """
+def count(n: size_t, k: int) -> int:
+    c = 0
+    for i in range(n, 0, k):
+        c++
+    return c
+
+def count_by_2(n: size_t) -> int:
+    c = 0
+    for i in range(n, 0, -2):
+        c++
+    return c
+
+def values(n: size_t, k: int) -> int:
+    for i in range(n, 0, k):
+        yield <int>i
+
+def main() -> int:
+    printf("%d %d %d %d\\n", count(5, -1), count(5, -2), count(5, 2),
+           count_by_2(5))
+    for x in values(5, -2):
+        printf("%d ", x)
+    printf("\\n")
+    return 0
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("int lang_i_step = k;", c_code)
+        self.assertIn(
+            "for (size_t i = n; (lang_i_step > 0 ? i < 0 : i > 0); "
+            "i = (lang_i_step < 0 && i - 0 <= -lang_i_step) ? 0 : i + lang_i_step) {",
+            c_code)
+        self.assertIn("for (size_t i = n; i > 0; i = (i - 0 > 2) ? i - 2 : 0) {",
+                      c_code)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "step.cu")
+            with open(source, "w") as f:
+                f.write(code)
+            out = run_files([source], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"5 3 0 3\n5 3 1 \n")
+
+    def test_scope(self):
+        """Test the index is only declared in the loop."""
+        code = """
+def func():
+    x: char = 'a'
+    for x in range(3):
+        y = x + 1
+    z: char = x
+        """.strip()
+        code_to_ast(code, infer=True)
+
+        with self.assertRaises(KeyError):
+            code_to_ast("def func():\n    for i in range(3):\n        pass\n    j = i", infer=True)
+
+    def test_errors(self):
+        errors = [
+            # Only range() can be iterated over
+            "def func(a: int*):\n    for i in a:\n        pass",
+            "def func():\n    for i in range():\n        pass",
+            "def func():\n    for i in range(0, 10, 0):\n        pass",
+        ]
+        for code in errors:
+            with self.assertRaises(RuntimeError, msg=code):
+                code_to_ast(code, infer=True)
+
+        with self.assertRaises(TypeError):
+            code_to_ast("def func(x: double):\n    for i in range(x):\n        pass", infer=True)
+
+    def test_for_example(self):
+        out = run_files(["examples/for_range.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"285\n4 3 2 1 0 \n10 7 4 1 \n8 16 42 \n10 20 21 x\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
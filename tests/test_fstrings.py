@@ -0,0 +1,108 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestFStrings(unittest.TestCase):
+    def test_fstring_syntax(self):
+        code = 'printf(f"fib #{x}: {fib(x):5} {{x}} {a[1:2]}\\n")'
+        ast = code_to_ast(code)
+        fstring = ast.body[0].value.args[0]
+        self.assertEqual(fstring, FString([
+            Str("fib #"),
+            FormattedValue(Name("x")),
+            Str(": "),
+            FormattedValue(Call(Name("fib"), [Name("x")]), "5"),
+            Str(" {x} "),
+            FormattedValue(Slice(Name("a"), Int(1), Int(2))),
+            Str("\\n"),
+        ]))
+        self.assertEqual(str(ast), code)
+
+        for code in ('f"{x"', 'f"x}"', 'f"{}"', 'f"{x = 1}"'):
+            with self.assertRaises(RuntimeError, msg=code):
+                code_to_ast(code)
+
+    def test_printf(self):
+        """Test the conversions come from the types of the values."""
+        code = """
+def func(x: int, y: ulong, z: double, c: char, s: char*, p: int*, v: str):
+    printf(f"{x} {y:08} {z:.2} {c} {s} {p} {v:4} 100%")
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            'printf("%lld %08lu %.2f %c %s %p %4.*s 100%%", ((long long)x), '
+            '((unsigned long)y), z, c, s, ((void*)p), ((int)v.length), v.data);',
+            c_code
+        )
+
+    def test_fixed_width_chars(self):
+        """Test int8 and uint8 are formatted as integers, not as the chars
+        they are typedefs of."""
+        code = """
+def func(a: int8, b: uint8, c: char):
+    x: int8 = 65
+    printf(f"{x} {a} {b} {c}")
+    write_str(f"{a}{b}{c}")
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            'printf("%lld %lld %lu %c", ((long long)x), ((long long)a), '
+            '((unsigned long)b), c);',
+            c_code
+        )
+        self.assertIn("""\
+    write_int(a);
+    write_uint(b);
+    write_char(c);
+""", c_code)
+
+    def test_writers(self):
+        """Test f-strings written without printf call the writer of each
+        type."""
+        code = """
+def func(x: uint, y: double, s: char*, v: str):
+    write_str(f"{x}:{y:.1}{s}")
+    b = str_builder_new()
+    str_builder_append(b, f"{s}{v}{y}")
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("""\
+    write_uint(x);
+    write_str(":");
+    write_float(y, 1);
+    write_str(s);
+""", c_code)
+        self.assertIn("""\
+    str_builder_append(b, str_from(s));
+    str_builder_append(b, v);
+    str_builder_append_float(b, y, 6);
+""", c_code)
+
+    def test_errors(self):
+        errors = [
+            # f-strings are only passed to the functions that write them
+            (RuntimeError, 'def func(x: int):\n    s = f"{x}"'),
+            (RuntimeError, 'def func(x: int):\n    fputs(f"{x}", stderr)'),
+            # Widths are only supported by printf
+            (RuntimeError, 'def func(x: int):\n    write_str(f"{x:5}")'),
+            (RuntimeError, 'def func(x: int):\n    printf(f"{x:>5}")'),
+            # Only printf formats pointers
+            (TypeError, 'def func(x: int*):\n    write_str(f"{x}")'),
+        ]
+        for error, code in errors:
+            with self.assertRaises(error, msg=code):
+                code_to_ast(code, infer=True)
+
+    def test_fstrings_example(self):
+        out = run_files(["examples/fstrings.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(
+            out.stdout,
+            b"fib #5: 5\nfib #6: 8\nfib #7: 13\n  thirds [   3] 0.333 100%\n"
+            b"thirds 3 0.33 1099511627776 !\n[0:55][1:89][2:144] has 19 chars\n"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestGenerators(unittest.TestCase):
+    def test_yield_syntax(self):
+        code = """
+def count(n: int) -> int:
+    i = 0
+    while (i < n):
+        yield i
+        i++
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(ast.body[0].body[1].body[0], Yield(Name("i")))
+        self.assertEqual(str(ast), code)
+
+    def test_state_machine(self):
+        """Test the variables of a generator are kept in its state and each
+        yield can be resumed from."""
+        code = """
+def count(n: int) -> int:
+    i = 0
+    while i < n:
+        yield i
+        i++
+    yield -1
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            "struct count_state {int lang_state; int n; int i;};", c_code)
+        self.assertIn("count_state count(int n){", c_code)
+        self.assertIn(
+            "int count_next(count_state *lang_gen, int *lang_out){", c_code)
+        self.assertIn("""\
+    switch (lang_gen->lang_state) {
+        case 0:
+            break;
+        case 1:
+            goto lang_resume_1;
+        case 2:
+            goto lang_resume_2;
+        default:
+            return 0;
+    }
+    lang_gen->i = 0;
+    while ((lang_gen->i < lang_gen->n)) {
+        *lang_out = lang_gen->i;
+        lang_gen->lang_state = 1;
+        return 1;
+        lang_resume_1:;
+        lang_gen->i++;
+    }""", c_code)
+
+    def test_for_generator(self):
+        """Test the state of a generator created in a for loop is kept on the
+        stack and a generator in a variable is advanced in place."""
+        code = """
+def count(n: int) -> int:
+    for i in range(n):
+        yield i
+
+def func():
+    for x in count(10):
+        pass
+    c = count(3)
+    for x in c:
+        pass
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            "struct count_state {int lang_state; int n; int i; int lang_i_stop;};",
+            c_code)
+        self.assertIn("""\
+    {
+        count_state lang_x_gen = count(10);
+        int x;
+        while (count_next(&(lang_x_gen), &(x))) {
+        }
+    }""", c_code)
+        self.assertIn("while (count_next(&(c), &(x))) {", c_code)
+
+    def test_errors(self):
+        errors = [
+            # Generators cannot return values
+            "def gen() -> int:\n    yield 1\n    return 2",
+            # Only generators and ranges can be iterated over
+            "def func(a: int*):\n    for x in a:\n        pass",
+            # yield outside of a function
+            "yield 1",
+        ]
+        for code in errors:
+            with self.assertRaises(RuntimeError, msg=code):
+                code_to_ast(code, infer=True)
+
+        with self.assertRaises(TypeError):
+            code_to_ast("def gen(p: int*) -> int:\n    yield p", infer=True)
+
+    def test_generators_example(self):
+        out = run_files(["examples/generators.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"12 7 40 3 41 \n12 40 41 \n*\n**\n***\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
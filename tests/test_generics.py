@@ -0,0 +1,97 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestGenerics(unittest.TestCase):
+    def test_generic_class_syntax(self):
+        code = """
+class A<T, U>:
+    x: T
+    y: U*
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(ast.body[0].generics, ["T", "U"])
+        self.assertEqual(str(ast), code)
+
+    def test_specialization(self):
+        """Test a specialization is created for each type parameter used."""
+        code = """
+class A<T>:
+    x: T
+
+    def get(self: A<T>*) -> T:
+        return self->x
+
+def func(a: A<int>*, b: A<char*>*) -> int:
+    return a->get() + sizeof(A_int)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#ifndef _LANG_SPEC_A_int\n#define _LANG_SPEC_A_int", c_code)
+        self.assertIn("struct A_int {int x; int (*get)(A_int*);};", c_code)
+        self.assertIn("static int A_int_get(A_int *self){", c_code)
+        self.assertIn("static A_int* new_A_int(){", c_code)
+        self.assertIn("struct A_char_ptr {char *x; char* (*get)(A_char_ptr*);};",
+                      c_code)
+        self.assertIn("int func(A_int *a, A_char_ptr *b){", c_code)
+        self.assertIn("return (a->get(a) + sizeof(A_int));", c_code)
+
+        # Only created once and before the function using them
+        self.assertEqual(c_code.count("struct A_int {"), 1)
+        self.assertLess(c_code.index("#endif"), c_code.index("int func("))
+
+    def test_substitution(self):
+        """Test the type parameters are replaced everywhere in the class."""
+        code = """
+class A<T>:
+    data: T*
+
+    def __init__(self: A*, n: int):
+        self->data = <T*>malloc(sizeof(T) * n)
+
+x: A<double>*
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("self->data = ((double*)malloc((sizeof(double) * n)));",
+                      c_code)
+        self.assertIn("A_double *x;", c_code)
+
+    def test_nested_specialization(self):
+        """Test generic type parameters are specialized first."""
+        code = """
+class A<T>:
+    x: T
+
+def func():
+    a: A<A<int>*>* = new_A_A_int_ptr()
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertLess(c_code.index("struct A_int {"),
+                        c_code.index("struct A_A_int_ptr {A_int *x;"))
+        self.assertIn("A_A_int_ptr *a = new_A_A_int_ptr();", c_code)
+
+    def test_invalid_specialization(self):
+        for code in ("class A<T>:\n    x: T\nx: A<int, int>",
+                     "x: B<int>"):
+            with self.assertRaises(RuntimeError):
+                code_to_ast(code, infer=True)
+
+        # Qualified types have no name in C
+        with self.assertRaises(TypeError):
+            code_to_ast("class A<T>:\n    x: T\nx: A<int const>", infer=True)
+
+    def test_generic_class_example(self):
+        out = run_files(["examples/generic_class.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"4950\n3.75\n12\n42\n")
+
+    def test_multiple_translation_units(self):
+        out = run_files(
+            ["examples/generics/box.cu", "examples/generics/box_test.cu"],
+            stdout=subprocess.PIPE
+        )
+        self.assertEqual(out.stdout, b"42\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import subprocess
+import os
+
+from compiler import *
+
+
+class TestIO(unittest.TestCase):
+    def test_map_file(self):
+        """Test map_file() and unmap_file() are added when used."""
+        code = """
+def func(path: char*) -> int:
+    f = map_file(path)
+    c = f[0]
+    unmap_file(f)
+    return c
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <lang_io.h>", c_code)
+        self.assertIn("static Span_uchar map_file(char *path){", c_code)
+        self.assertIn("static void unmap_file(Span_uchar file){", c_code)
+        self.assertIn("Span_uchar f = map_file(path);", c_code)
+        self.assertEqual(c_code.count("static Span_uchar map_file("), 1)
+
+        # Functions named map_file can still be declared
+        code = """
+def map_file(path: char*) -> int:
+    return 0
+
+def func(path: char*) -> int:
+    return map_file(path)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertNotIn("lang_io.h", c_code)
+
+    def test_posix_io(self):
+        code = """
+def func(path: char*) -> int:
+    fd = open(path, O_RDONLY)
+    p = mmap(NULL, 4096, PROT_READ, MAP_PRIVATE, fd, 0)
+    if p == MAP_FAILED:
+        return -1
+    madvise(p, 4096, MADV_WILLNEED)
+    buf: char[16]
+    n = read(fd, buf, 16)
+    close(fd)
+    munmap(p, 4096)
+    return <int>n
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <fcntl.h>", c_code)
+        self.assertIn("#include <sys/mman.h>", c_code)
+        self.assertIn("#include <unistd.h>", c_code)
+        self.assertIn("long long n = read(fd, buf, 16);", c_code)
+
+    def test_map_file_example(self):
+        try:
+            out = run_files(["examples/map_file.cu"], stdout=subprocess.PIPE)
+        finally:
+            if os.path.exists("numbers.txt"):
+                os.remove("numbers.txt")
+        self.assertEqual(out.stdout, b"100000 lines, 588890 bytes, sum 4999950000\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
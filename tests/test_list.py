@@ -0,0 +1,97 @@
+import os
+import unittest
+import subprocess
+import tempfile
+
+from compiler import *
+
+
+class TestList(unittest.TestCase):
+    def test_list_specialization(self):
+        """Test the builtin List can be used without being declared."""
+        code = """
+def func() -> int:
+    lst: List<int>* = new_List_int()
+    lst->append(2)
+    (*lst)[0] = 3
+    x = (*lst)[0]
+    del_List_int(lst)
+    return x
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <assert.h>", c_code)
+        self.assertIn("struct List_int {int *data; size_t length; size_t capacity;",
+                      c_code)
+        self.assertIn("static int* List_int___getitem__(List_int *self, size_t i){",
+                      c_code)
+        self.assertIn("assert((i < self->length));", c_code)
+        self.assertIn("List_int_reserve(self, (self->capacity * 2));", c_code)
+        self.assertIn("(*List_int___getitem__(lst, 0)) = 3;", c_code)
+        self.assertIn("int x = (*List_int___getitem__(lst, 0));", c_code)
+
+    def test_list_by_value(self):
+        """Test indexing a list stored by value."""
+        code = """
+struct P {x: int}
+
+def func():
+    lst: List<P>
+    init_List_P(&lst)
+    lst[0].x = 1
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("List_P lst;", c_code)
+        self.assertIn("(*List_P___getitem__(&(lst), 0)).x = 1;", c_code)
+
+    def test_list_array(self):
+        """Test pointers to Lists are indexed as arrays of Lists."""
+        code = """
+def func(i: int) -> size_t:
+    lists: List<int>* = new_List_int_array(4)
+    lists[i].append(1)
+    n = lists[i].length + (*lists)[0]
+    del_List_int_array(lists, 4)
+    return n
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("lists[i].append(&(lists[i]), 1);", c_code)
+        self.assertIn(
+            "size_t n = (lists[i].length + (*List_int___getitem__(lists, 0)));",
+            c_code)
+        subprocess.run(
+            ["gcc", "-std=c11", "-fsyntax-only", "-Werror", "-x", "c", "-"],
+            input=c_code.encode(),
+            check=True,
+        )
+
+    def test_list_example(self):
+        out = run_files(["examples/list.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"1000 332833500\n7 999 999\n0\n6 4\n")
+
+    def test_bounds_check(self):
+        """Test indexing past the end only fails when not compiled for
+        release."""
+        code = b"""
+def main():
+    lst: List<int>* = new_List_int()
+    lst->reserve(4)
+    printf("%d\\n", <int>lst->length)
+    x = (*lst)[2]
+    return 0
+        """
+        # The C file is written next to the source, so both are made in a
+        # temporary directory
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "bounds.cu")
+            with open(source, "wb") as f:
+                f.write(code)
+
+            with self.assertRaises(subprocess.CalledProcessError):
+                run_files([source], stdout=subprocess.PIPE)
+
+            out = run_files([source], stdout=subprocess.PIPE, release=True)
+            self.assertEqual(out.stdout, b"0\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestNDArray(unittest.TestCase):
+    def test_index_syntax(self):
+        code = """
+a = b[i, j]
+a = b[1:n, :, i:]
+b[i, j, k] = 2
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertIsInstance(ast.body[0].right, MultiIndex)
+        self.assertIsInstance(ast.body[1].right.indices[0], SliceRange)
+        self.assertIsNone(ast.body[1].right.indices[1].start)
+        self.assertIsInstance(ast.body[2].left, MultiIndex)
+        self.assertEqual(str(ast), code)
+
+    def test_rank_syntax(self):
+        ast = code_to_ast("a: NDArray<float, 3>")
+        self.assertEqual(ast.body[0].decl.type.type_params[1], Int(3))
+        self.assertEqual(str(ast), "a: NDArray<float, 3>")
+
+    def test_specialization(self):
+        code = """
+def func(a: NDArray<double, 2>):
+    pass
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("struct NDArray_double_2 {double *data; size_t shape[2]; size_t strides[2];};",
+                      c_code)
+        self.assertIn("static NDArray_double_2 NDArray_double_2_new(size_t d0, size_t d1){",
+                      c_code)
+        self.assertIn("static NDArray_double_2 NDArray_double_2_transpose(NDArray_double_2 a){",
+                      c_code)
+        self.assertIn("static void NDArray_double_2_free(NDArray_double_2 a){",
+                      c_code)
+
+    def test_index(self):
+        """Test indices are lowered to the offset into the data."""
+        code = """
+def func(a: NDArray<int, 2>, b: NDArray<int, 1>, i: int, j: int):
+    a[i, j] = b[j]
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("""
+static int* NDArray_int_2_at(NDArray_int_2 a, size_t i0, size_t i1){
+    assert(((i0 < a.shape[0]) && (i1 < a.shape[1])));
+    return ((a.data + (i0 * a.strides[0])) + (i1 * a.strides[1]));
+}
+        """.strip(), c_code)
+        self.assertIn("(*NDArray_int_2_at(a, i, j)) = (*NDArray_int_1_at(b, j));",
+                      c_code)
+
+    def test_view(self):
+        code = """
+def func(a: NDArray<int, 2>, b: NDArray<int, 1>):
+    c = a[1:, :2]
+    d = b[:]
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("NDArray_int_2 c = NDArray_int_2_view(a, 1, ((size_t)-1), 0, 2);",
+                      c_code)
+        self.assertIn("NDArray_int_1 d = NDArray_int_1_view(b, 0, ((size_t)-1));",
+                      c_code)
+
+    def test_wrong_number_of_indices(self):
+        code = """
+def func(a: NDArray<int, 2>):
+    a[1] = 2
+        """.strip()
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code, infer=True)
+
+    def test_mixed_index_and_slice(self):
+        code = """
+def func(a: NDArray<int, 2>):
+    b = a[1, :]
+        """.strip()
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code, infer=True)
+
+    def test_bad_rank(self):
+        with self.assertRaises(RuntimeError):
+            code_to_ast("a: NDArray<int, 0>", infer=True)
+        with self.assertRaises(RuntimeError):
+            code_to_ast("a: NDArray<int>", infer=True)
+        with self.assertRaises(RuntimeError):
+            code_to_ast("a: List<2>", infer=True)
+
+    def test_multi_index_needs_ndarray(self):
+        code = """
+def func(a: int*):
+    b = a[1, 2]
+        """.strip()
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code, infer=True)
+
+    def test_ndarray_example(self):
+        out = run_files(["examples/ndarray.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"2 3 12\n1 6 0\n15 4 8\n7 12\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestObjectArray(unittest.TestCase):
+    def test_array_functions(self):
+        """Test the array constructor and destructor are generated for a
+        class."""
+        code = """
+class A:
+    x: int
+
+    def __init__(self: A*, x: int):
+        self->x = x
+
+def func():
+    objs = new_A_array(10, 2)
+    objs[3].x = 4
+    del_A_array(objs, 10)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            "A* init_A_array(A *lang_objs, size_t lang_count, int x){",
+            c_code)
+        self.assertIn("init_A((lang_objs + lang_idx), x);", c_code)
+        self.assertIn(
+            "return init_A_array(((A*)malloc((sizeof(A) * lang_count))), "
+            "lang_count, x);",
+            c_code
+        )
+        self.assertIn(
+            "void del_A_array(A *lang_objs, size_t lang_count){", c_code)
+        self.assertIn("A *objs = new_A_array(10, 2);", c_code)
+        self.assertIn("objs[3].x = 4;", c_code)
+
+    def test_array_destructor_calls_del(self):
+        """Test __del__ is only run on each element if it is defined."""
+        code = """
+class A:
+    x: int
+
+class B:
+    x: int
+
+    def __del__(self: B*):
+        pass
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertNotIn("A___del__", c_code)
+        self.assertIn("B___del__((lang_objs + lang_idx));", c_code)
+
+    def test_array_function_names(self):
+        """Test the names in the generated array functions do not clash with
+        the parameters of __init__."""
+        code = """
+class Counter:
+    n: int
+
+    def __init__(self: Counter*, count: int, objs: int, idx: int):
+        self->n = count + objs + idx
+
+def main() -> int:
+    cs = new_Counter_array(3, 1, 2, 3)
+    printf("%d\\n", cs[2].n)
+    del_Counter_array(cs, 3)
+    return 0
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            "Counter* init_Counter_array(Counter *lang_objs, "
+            "size_t lang_count, int count, int objs, int idx){",
+            c_code)
+
+    def test_getitem_class_array(self):
+        """Test arrays of objects are indexed as arrays even if the class
+        defines __getitem__, which is only called on an object."""
+        code = """
+class Vec:
+    x: int
+    data: int[4]
+
+    def __getitem__(self: Vec*, i: int) -> int*:
+        return &self->data[i]
+
+def func() -> int:
+    vs = new_Vec_array(3)
+    vs[1].x = 2
+    v: Vec
+    v[1] = 3
+    return vs[1].x + v[1]
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("vs[1].x = 2;", c_code)
+        self.assertIn("(*Vec___getitem__(&(v), 1)) = 3;", c_code)
+        self.assertIn("return (vs[1].x + (*Vec___getitem__(&(v), 1)));", c_code)
+
+        # __getitem__ returns a pointer to the element
+        code = """
+class Vec:
+    x: int
+
+    def __getitem__(self: Vec*, i: int) -> int:
+        return self->x
+
+def func() -> int:
+    v: Vec
+    return v[1]
+        """.strip()
+        with self.assertRaises(TypeError):
+            code_to_ast(code, infer=True)
+
+    def test_arena_array(self):
+        """Test array constructors inside an arena allocate from it."""
+        code = """
+class A:
+    x: int
+
+def func(n: int):
+    with arena(1024) as a:
+        objs = new_A_array(n)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn(
+            "A *objs = init_A_array(((A*)arena_alloc(a, (sizeof(A) * n))), n);",
+            c_code
+        )
+
+    def test_object_array_example(self):
+        out = run_files(["examples/object_array.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"375\n8\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestParallel(unittest.TestCase):
+    def test_parallel_syntax(self):
+        code = """
+@parallel
+for i in range(10):
+    pass
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(
+            ast,
+            Module([
+                For("i", Call(Name("range"), [Int(10)]), [Pass()],
+                    [Decorator("parallel")])
+            ])
+        )
+        self.assertEqual(str(ast), code)
+
+    def test_omp_pragma(self):
+        """Test parallel loops only declare their index and get the
+        reductions of the shared variables."""
+        code = """
+def func(a: int*, n: int):
+    total = 0
+    prod = 1
+    @parallel
+    for i in range(n):
+        x = a[i]
+        total = total + x
+        prod = x * prod
+        total = total - 1
+    @parallel
+    for i in range(0, 100, 2):
+        a[i] = i
+        """.strip()
+        ast = code_to_ast(code, infer=True)
+        c_code = ast.c_code()
+        self.assertIn("""\
+    {
+        int lang_i_stop = n;
+        #pragma omp parallel for reduction(*:prod) reduction(+:total)
+        for (int i = 0; i < lang_i_stop; i++) {""", c_code)
+        self.assertIn("""\
+    #pragma omp parallel for
+    for (int i = 0; i < 100; i += 2) {""", c_code)
+        self.assertTrue(uses_openmp(ast))
+        self.assertFalse(uses_openmp(code_to_ast(
+            "def func():\n    for i in range(3):\n        pass", infer=True)))
+
+    def test_data_races(self):
+        races = [
+            # Assigning a shared variable
+            ("x = 0\n@parallel\nfor i in range(10):\n    x = i",
+             "Data race on shared variable 'x'"),
+            # Reading a reduced variable
+            ("x = 0\n@parallel\nfor i in range(10):\n    x = x + i\n    y = x",
+             "Shared variable 'x' is read"),
+            # Reducing with different operators
+            ("x = 0\n@parallel\nfor i in range(10):\n    x = x + i\n    x = x * i",
+             "Shared variable 'x' is reduced with both"),
+            # Writing through the address of a shared variable
+            ("x = 0\n@parallel\nfor i in range(10):\n    p = &x",
+             "Data race on shared variable 'x'"),
+            # Changing the index
+            ("@parallel\nfor i in range(10):\n    i++",
+             "Cannot assign to the index 'i'"),
+            # Leaving the loop early
+            ("@parallel\nfor i in range(10):\n    break",
+             "Cannot break out of a parallel loop"),
+            # Non constant step
+            ("n = 2\n@parallel\nfor i in range(0, 10, n):\n    pass",
+             "The step of a parallel loop must be a constant"),
+        ]
+        for code, message in races:
+            code = "def func():\n" + "\n".join(
+                "    " + line for line in code.split("\n"))
+            with self.assertRaises(RuntimeError, msg=code) as cm:
+                code_to_ast(code, infer=True)
+            self.assertIn(message, str(cm.exception), msg=code)
+
+            # The error points to the source
+            self.assertNotIn("(-1, -1)", str(cm.exception), msg=code)
+
+        # Variables declared in the loop are private
+        code_to_ast("""
+def func():
+    @parallel
+    for i in range(10):
+        x = i
+        x = x + 1
+        for j in range(i):
+            x++
+        """.strip(), infer=True)
+
+    def test_parallel_example(self):
+        out = run_files(["examples/parallel.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"332833500 500 31\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
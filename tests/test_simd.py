@@ -0,0 +1,108 @@
+import os
+import unittest
+import subprocess
+import tempfile
+
+from compiler import *
+from lang_types import *
+
+
+class TestSimd(unittest.TestCase):
+    def test_vector_ops(self):
+        """Test operators on vectors and numbers used for every lane."""
+        code = """
+def func(a: float32x4, b: float32x4, x: double) -> float32x4:
+    c = a * b + x
+    d = -c / 2
+    e: float32x4 = [1.0, 2.0, 3.0, 4.0]
+    e[0] = c[1]
+    return d - e
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <lang_simd.h>", c_code)
+        self.assertIn("float32x4 c = ((a * b) + ((float)x));", c_code)
+        self.assertIn("float32x4 d = (-c / ((float)2));", c_code)
+        self.assertIn("float32x4 e = {1.0, 2.0, 3.0, 4.0};", c_code)
+        self.assertIn("e[0] = c[1];", c_code)
+
+    def test_comparison_mask(self):
+        """Test comparing vectors gives a mask of signed integers of the same
+        width."""
+        code = """
+def func(a: float64x2, b: float64x2, c: uint8x16):
+    m = a < b
+    n = c == 0
+    o = m & (a >= b)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("int64x2 m = (a < b);", c_code)
+        self.assertIn("int8x16 n = (c == ((unsigned char)0));", c_code)
+        self.assertIn("int64x2 o = (m & (a >= b));", c_code)
+
+    def test_signed_byte_lanes(self):
+        """Test the lanes of int8x16 are -1 where a comparison is true, even
+        on targets where char is unsigned."""
+        code = """
+def main() -> int:
+    data: char[16]
+    for i in range(16):
+        data[i] = <char>i
+    m = int8x16_load(data) < int8x16_splat(8)
+    printf("%d %d\\n", <int>m[0], <int>m[15])
+    return 0
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            exe = os.path.join(tmp_dir, "a.out")
+            subprocess.run(
+                ["gcc", "-std=c11", "-funsigned-char", "-Wall", "-Werror",
+                 "-I" + C_INCLUDE_DIR, "-x", "c", "-", "-o", exe],
+                input=c_code.encode(),
+                check=True,
+            )
+            out = subprocess.run([exe], stdout=subprocess.PIPE, check=True)
+        self.assertEqual(out.stdout, b"-1 0\n")
+
+    def test_functions(self):
+        code = """
+def func(p: int*) -> int:
+    v = int32x4_load(p)
+    mask: int32x4 = [3, 2, 1, 0]
+    int32x4_store(p, int32x4_shuffle(v, mask))
+    return int32x4_sum(v + int32x4_splat(1))
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("int32x4 v = int32x4_load(p);", c_code)
+        self.assertIn("int32x4_store(p, int32x4_shuffle(v, mask));", c_code)
+
+    def test_type_errors(self):
+        errors = [
+            # Different vector types
+            "def func(a: float32x4, b: int32x4):\n    c = a + b",
+            # Bitwise operations need integral lanes
+            "def func(a: float32x4, b: float32x4):\n    c = a & b",
+            "def func(a: float32x4):\n    c = ~a",
+            # Logical operators cannot be used on the masks
+            "def func(a: int32x4, b: int32x4):\n    c = a and b",
+            # Pointers cannot be used as lanes
+            "def func(a: int32x4, p: int*):\n    c = a + p",
+        ]
+        for code in errors:
+            with self.assertRaises(TypeError, msg=code):
+                code_to_ast(code, infer=True)
+
+    def test_layout(self):
+        """Test vectors are aligned to their size."""
+        inferer = Inferer()
+        inferer.check(code_to_ast("struct A {a: char, b: int32x4}"))
+        self.assertEqual(inferer.type_layout(LangType("A")), Layout(32, 16, 15))
+        self.assertEqual(vector_mask_type(VECTOR_TYPES["float32x4"]),
+                         VECTOR_TYPES["int32x4"])
+
+    def test_simd_example(self):
+        out = run_files(["examples/simd.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"90\n41 31 21 11\n80 100 100\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
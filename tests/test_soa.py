@@ -0,0 +1,86 @@
+import unittest
+import subprocess
+
+from compiler import *
+from lang_types import *
+
+
+class TestSoa(unittest.TestCase):
+    def test_soa_struct(self):
+        """Test an @soa array is stored as one array per member."""
+        code = """
+struct A {x: int, y: double}
+
+def func():
+    @soa arr: A[16]
+    arr[2].x = 3
+    arr[1].y = arr[2].x * 2.0
+    p = &arr[3].y
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("struct A_soa0 {int x[16]; double y[16];};", c_code)
+        self.assertIn("A_soa0 arr;", c_code)
+        self.assertIn("arr.x[2] = 3;", c_code)
+        self.assertIn("arr.y[1] = (arr.x[2] * 2.0);", c_code)
+        self.assertIn("double *p = &(arr.y[3]);", c_code)
+
+    def test_soa_class(self):
+        """Test methods of a class are not stored per element."""
+        code = """
+class A:
+    x: int
+
+    def get(self: A*) -> int:
+        return self->x
+
+@soa arr: A[4]
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("struct A_soa0 {int x[4];};", c_code)
+
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code + "\narr[0].get()", infer=True)
+
+    def test_whole_element_access(self):
+        """Elements of an @soa array can only be accessed through their
+        members."""
+        code = """
+struct A {x: int}
+
+def func():
+    @soa arr: A[4]
+    a = arr[0]
+        """.strip()
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code, infer=True)
+
+    def test_soa_not_array(self):
+        """Test @soa arrays cannot be used as arrays or pointers of their
+        elements."""
+        self.assertNotEqual(ArrayType(LangType("A"), Int(4)),
+                            SoaArrayType(LangType("A"), Int(4), {}))
+        self.assertNotEqual(SoaArrayType(LangType("A"), Int(4), {}),
+                            ArrayType(LangType("A"), Int(4)))
+
+        errors = [
+            "def first_x(arr: A*) -> int:\n    return arr[0].x\n"
+            "def func() -> int:\n    @soa ps: A[8]\n    return first_x(ps)",
+            "def func():\n    @soa ps: A[8]\n    p: A* = ps",
+        ]
+        for code in errors:
+            with self.assertRaises(TypeError, msg=code):
+                code_to_ast("struct A {x: int}\n" + code, infer=True)
+
+    def test_invalid_soa(self):
+        for code in ("@soa arr: int[4]",
+                     "struct A {x: int}\n@soa arr: A*"):
+            with self.assertRaises(RuntimeError):
+                code_to_ast(code, infer=True)
+
+    def test_soa_example(self):
+        out = run_files(["examples/soa.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"5000 10000 999\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestSort(unittest.TestCase):
+    def test_sort_specialization(self):
+        """Test sort is specialized once per element type and comparison."""
+        code = """
+def key(x: double*) -> int:
+    return <int>*x
+
+def func(a: int*, b: int*, c: double*, n: int):
+    sort(a, n)
+    sort(b, n)
+    sort(c, n, key)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("static int lang_less_int(int *a, int *b){\n    return ((*a) < (*b));",
+                      c_code)
+        self.assertIn("static void lang_sort_int(int *arr, size_t n){", c_code)
+        self.assertIn("lang_sort_int(a, n);", c_code)
+        self.assertIn("lang_sort_int(b, n);", c_code)
+        self.assertEqual(c_code.count("static void lang_sort_int("), 1)
+
+        self.assertIn("static int lang_less_double_by_key(double *a, double *b){\n    return (key(a) < key(b));",
+                      c_code)
+        self.assertIn("lang_sort_double_by_key(c, n);", c_code)
+
+    def test_bisect(self):
+        code = """
+def func(a: char*, n: int, lst: List<char>*) -> size_t:
+    return bisect_left(a, n, 'c') + bisect_right(lst, 'd')
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("static size_t lang_bisect_left_char(char *arr, size_t n, char x){",
+                      c_code)
+        self.assertIn("return (lang_bisect_left_char(a, n, 'c') + "
+                      "lang_bisect_right_char(lst->data, lst->length, 'd'));",
+                      c_code)
+
+    def test_sort_needs_comparison(self):
+        """Test structs cannot be sorted without a comparison."""
+        code = """
+struct A {x: int}
+
+def func(a: A*, n: int):
+    sort(a, n)
+        """.strip()
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code, infer=True)
+
+    def test_sort_example(self):
+        out = run_files(["examples/sort.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"1 999 107\n999 0\n4 2 3 1\n2 5 9 2\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
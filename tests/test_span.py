@@ -0,0 +1,137 @@
+import os
+import unittest
+import subprocess
+import tempfile
+
+from compiler import *
+
+
+class TestSpan(unittest.TestCase):
+    def test_slice_syntax(self):
+        code = """
+a = b[1:n]
+a = b[:2]
+a = b[i:]
+a = b[:]
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertIsInstance(ast.body[0].right, Slice)
+        self.assertIsNone(ast.body[1].right.start)
+        self.assertIsNone(ast.body[2].right.end)
+        self.assertEqual(str(ast), code)
+
+    def test_slice(self):
+        """Test slices are lowered to the Span of the element type."""
+        code = """
+def func(arr: int[10], p: int*, lst: List<int>*, s: Span<int>):
+    a = arr[2:]
+    b = p[1:5]
+    c = lst[:3]
+    d = s[1:]
+    e = s[1:2]
+    s[0] = 1
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("struct Span_int {int *data; size_t length;};", c_code)
+        self.assertIn("int func(int arr[10], int *p, List_int *lst, Span_int s){",
+                      c_code)
+        self.assertIn("Span_int a = Span_int_slice(arr, 10, 2, 10);", c_code)
+        self.assertIn("Span_int b = Span_int_slice(p, ((size_t)-1), 1, 5);",
+                      c_code)
+        self.assertIn("Span_int c = Span_int_slice(lst->data, lst->length, 0, 3);",
+                      c_code)
+        self.assertIn("Span_int d = Span_int_suffix(s, 1);", c_code)
+        self.assertIn("Span_int e = Span_int_subspan(s, 1, 2);", c_code)
+        self.assertIn("(*Span_int_at(s, 0)) = 1;", c_code)
+
+    def test_span_conversion(self):
+        """Test arrays and Lists passed as Spans are sliced whole."""
+        code = """
+def total(s: Span<char>) -> int:
+    return 0
+
+def func(arr: char[4], lst: List<char>) -> int:
+    return total(arr) + total(&lst)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("return (total(Span_char_slice(arr, 4, 0, 4)) + "
+                      "total(Span_char_slice(lst.data, lst.length, 0, lst.length)));",
+                      c_code)
+
+    def test_slice_evaluated_once(self):
+        """Test a List that is not a variable is only evaluated once when it
+        is sliced or sorted."""
+        code = """
+calls: int = 0
+lst: List<int>* = NULL
+
+def get_list() -> List<int>*:
+    calls++
+    return lst
+
+def total(s: Span<int>) -> int:
+    t = 0
+    for i in range(s.length):
+        t = t + s[i]
+    return t
+
+def main() -> int:
+    lst = new_List_int()
+    lst->append(3)
+    lst->append(1)
+    lst->append(2)
+    a = get_list()[1:]
+    b = get_list()[:2]
+    sort(get_list())
+    printf("%d %d %d %d\\n", calls, total(a), total(b), total(get_list()))
+    del_List_int(lst)
+    return 0
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("Span_int a = lang_slice0(get_list(), 1);", c_code)
+        self.assertIn("Span_int b = lang_slice1(get_list(), 0, 2);", c_code)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "once.cu")
+            with open(source, "w") as f:
+                f.write(code)
+            out = run_files([source], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"4 5 3 6\n")
+
+    def test_pointer_slice_needs_end(self):
+        code = """
+def func(p: int*):
+    a = p[1:]
+        """.strip()
+        with self.assertRaises(RuntimeError):
+            code_to_ast(code, infer=True)
+
+    def test_bounds_check(self):
+        """Test slicing past the end fails when not compiled for release."""
+        code = b"""
+def main():
+    arr: int[4] = [1, 2, 3, 4]
+    s = arr[2:5]
+    printf("%d\\n", <int>s.length)
+    return 0
+        """
+        # The C file is written next to the source, so both are made in a
+        # temporary directory
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "bounds.cu")
+            with open(source, "wb") as f:
+                f.write(code)
+
+            with self.assertRaises(subprocess.CalledProcessError):
+                run_files([source], stdout=subprocess.PIPE)
+
+            out = run_files([source], stdout=subprocess.PIPE, release=True)
+            self.assertEqual(out.stdout, b"3\n")
+
+    def test_span_example(self):
+        out = run_files(["examples/span.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"21 18 3\n27 20 3\n40 1\n6 3 1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import subprocess
+import os
+
+from compiler import *
+
+
+class TestSpawn(unittest.TestCase):
+    def test_spawn_syntax(self):
+        code = """
+def func(n: int) -> int:
+    x = spawn func(n - 1)
+    spawn func(n - 2)
+    sync
+    return join x
+        """.strip()
+        ast = code_to_ast(code)
+        body = ast.body[0].body
+        self.assertEqual(body[0], Assign(
+            Name("x"),
+            Spawn(Call(Name("func"), [BinOp(Name("n"), Sub(), Int(1))]))
+        ))
+        self.assertEqual(body[2], Sync())
+        self.assertEqual(body[3], Return(Join(Name("x"))))
+
+    def test_futures(self):
+        """Test spawned calls get a future on the stack that is waited for
+        when it goes out of scope."""
+        code = """
+def work(p: int*, n: int):
+    return 0
+
+def func(p: int*) -> int:
+    x = spawn work(p, 1)
+    spawn work(p, 2)
+    sync
+    x = spawn work(p, 3)
+    return join x
+        """.strip()
+        ast = code_to_ast(code, infer=True)
+        self.assertTrue(uses_threads(ast))
+        c_code = ast.c_code()
+        self.assertIn("#include <lang_tasks.h>", c_code)
+        self.assertIn("""\
+struct lang_future_work {
+    lang_task task;
+    int *arg0;
+    int arg1;
+    int result;
+};""", c_code)
+        self.assertIn("""\
+    lang_future_work x __attribute__((cleanup(lang_future_work_sync))) = {0};
+    lang_future_work_spawn(&(x), p, 1);
+    lang_future_work lang_spawn0 __attribute__((cleanup(lang_future_work_sync))) = {0};
+    lang_future_work_spawn(&(lang_spawn0), p, 2);
+    lang_future_work_sync(&(x));
+    lang_future_work_sync(&(lang_spawn0));
+    lang_future_work_spawn(&(x), p, 3);
+    return lang_future_work_join(&(x));""", c_code)
+
+    def test_errors(self):
+        errors = [
+            # Only calls can be spawned
+            "def func(x: int):\n    y = spawn x",
+            # Futures can only be stored in variables
+            "def f() -> int:\n    return 1\ndef func():\n    y = 1 + spawn f()",
+            # Calls are only spawned in functions
+            "def f() -> int:\n    return 1\ny = spawn f()",
+        ]
+        for code in errors:
+            with self.assertRaises(RuntimeError, msg=code):
+                code_to_ast(code, infer=True)
+
+        with self.assertRaises(TypeError):
+            code_to_ast("def func(x: int):\n    y = join x", infer=True)
+
+    def run_with_threads(self, source, args, threads):
+        exe = compile_lang_sources([source])
+        env = dict(os.environ, LANG_NUM_THREADS=str(threads))
+        return subprocess.run(["./" + exe] + args, env=env, check=True,
+                              stdout=subprocess.PIPE).stdout
+
+    def test_spawn_examples(self):
+        for threads in (1, 4):
+            self.assertEqual(
+                self.run_with_threads("examples/spawn_fib.cu", ["25"], threads),
+                b"fib(25) = 75025\n")
+            self.assertEqual(
+                self.run_with_threads("examples/spawn_sort.cu", ["100000"], threads),
+                b"sorted 100000 numbers, 0 out of order\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
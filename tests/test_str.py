@@ -0,0 +1,52 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestStr(unittest.TestCase):
+    def test_literal_size(self):
+        """Test the size of literals accounts for escape sequences."""
+        self.assertEqual(Str("abc").c_size(), 3)
+        self.assertEqual(Str(r"a\nb\"").c_size(), 4)
+        self.assertEqual(Str(r"\x41\101\\").c_size(), 3)
+        self.assertEqual(Str("é").c_size(), 2)
+
+    def test_literal_coercion(self):
+        """Test string literals used as a str get their length at compile
+        time."""
+        code = """
+def name() -> str:
+    return "abc"
+
+def func(s: str):
+    t: str = "a\\tb"
+    t = "hello"
+    func("hi")
+    x: char* = "not a str"
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <lang_str.h>", c_code)
+        self.assertIn('return ((str){"abc", 3});', c_code)
+        self.assertIn('str t = ((str){"a\\tb", 3});', c_code)
+        self.assertIn('t = ((str){"hello", 5});', c_code)
+        self.assertIn('func(((str){"hi", 2}));', c_code)
+        self.assertIn('char *x = "not a str";', c_code)
+
+    def test_str_hash(self):
+        code = """
+def func(a: str, b: str):
+    hash(a)
+    hash_eq(a, b)
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("str_hash(a);", c_code)
+        self.assertIn("str_eq(a, b);", c_code)
+
+    def test_strings_example(self):
+        out = run_files(["examples/strings.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"58890 300\nworld 5 1\n1 0\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
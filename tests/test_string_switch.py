@@ -0,0 +1,72 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestStringSwitch(unittest.TestCase):
+    def test_perfect_hash(self):
+        """Test every key gets its own slot in the smallest power of 2
+        table."""
+        for n in (1, 2, 3, 7, 8, 100, 1000):
+            keys = ["key{}".format(i).encode() for i in range(n)]
+            seed, size, displacements = perfect_hash(keys)
+            self.assertEqual(size, max(2, 1 << (n - 1).bit_length()))
+            slots = {perfect_hash_slot(key, seed, size, displacements)
+                     for key in keys}
+            self.assertEqual(len(slots), n)
+            self.assertTrue(all(0 <= slot < size for slot in slots))
+
+    def test_switch_lowering(self):
+        code = """
+def dispatch(cmd: char*) -> int:
+    switch cmd:
+        case "get", "fetch":
+            return 1
+        case "put\\n":
+            return 2
+        else:
+            return 0
+    return -1
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        self.assertIn("#include <string.h>", c_code)
+        self.assertIn("static int lang_switch0(const char *data) {", c_code)
+        self.assertIn("""\
+    switch (lang_switch0(cmd)){
+        case 0:
+            return 1;
+        case 1:
+            return 2;
+        default:
+            return 0;
+    }""", c_code)
+
+        # The keys are placed at the slots of their hashes
+        switch_def = StrSwitchDef("f", ["get", "fetch", "put\\n"], [0, 0, 1], False)
+        lines = switch_def.c_code()
+        self.assertIn('"put\\n"', lines)
+        self.assertIn("memcmp(keys[h], data, n)", lines)
+
+    def test_errors(self):
+        errors = [
+            # Cases must be literals
+            (TypeError, 'def func(s: char*, t: char*):\n    switch s:\n        case t:\n            pass'),
+            # Cases cannot repeat
+            (RuntimeError, 'def func(s: char*):\n    switch s:\n        case "a":\n            pass\n        case "b", "a":\n            pass'),
+        ]
+        for error, code in errors:
+            with self.assertRaises(error, msg=code):
+                code_to_ast(code, infer=True)
+
+    def test_string_switch_example(self):
+        out = run_files(["examples/string_switch.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"34\n")
+
+        out = run_files(["examples/string_switch.cu"], stdout=subprocess.PIPE,
+                        exe_args=["3", "4", "+", "5", "mul", "neg"])
+        self.assertEqual(out.stdout, b"-35\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
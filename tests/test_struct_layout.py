@@ -0,0 +1,103 @@
+import unittest
+import subprocess
+
+from compiler import *
+from lang_types import *
+
+
+class TestStructLayout(unittest.TestCase):
+    def test_decorator_syntax(self):
+        """Test parsing decorated structs and classes."""
+        code = """
+@pinned
+struct A {x: int}
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(
+            ast,
+            Module([
+                StructDecl(
+                    Struct("A", [VarDecl("x", NameType("int"))]),
+                    [Decorator("pinned")]
+                )
+            ])
+        )
+        self.assertEqual(str(ast), code)
+
+        code = """
+@pinned
+class A:
+    x: int
+        """.strip()
+        ast = code_to_ast(code)
+        self.assertEqual(ast.body[0].decorators, [Decorator("pinned")])
+        self.assertEqual(str(ast), code)
+
+        with self.assertRaises(RuntimeError):
+            code_to_ast("@pinned\nfunc()")
+
+    def test_struct_layout(self):
+        """Test the layouts computed for structs."""
+        inferer = Inferer()
+        inferer.check(code_to_ast("""
+struct A {a: char, b: long, c: char}
+struct B {a: A, b: char, c: int[3]}
+struct C {a: char*, b: ushort}
+        """.strip()))
+        self.assertEqual(
+            inferer.type_layout(LangType("A")),
+            Layout(24, 8, 14)
+        )
+        self.assertEqual(
+            inferer.type_layout(LangType("B")),
+            Layout(40, 8, 3)
+        )
+        self.assertEqual(
+            inferer.type_layout(LangType("C")),
+            Layout(16, 8, 6)
+        )
+        self.assertEqual(inferer.layout_report(), [
+            "struct A: size 24, align 8, padding 14 -> size 16, align 8, padding 6",
+            "struct B: size 40, align 8, padding 3 -> size 40, align 8, padding 3",
+            "struct C: size 16, align 8, padding 6 -> size 16, align 8, padding 6",
+        ])
+
+    def test_reorder_fields(self):
+        """Test fields are only reordered when enabled."""
+        code = """
+struct A {a: char, b: long, c: char, d: int}
+        """.strip()
+        inferer = Inferer()
+        c_code = inferer.check(code_to_ast(code)).c_code()
+        self.assertIn("struct A {char a; long long b; char c; int d;};", c_code)
+
+        inferer = Inferer(reorder_fields=True)
+        c_code = inferer.check(code_to_ast(code)).c_code()
+        self.assertIn("struct A {long long b; int d; char a; char c;};", c_code)
+        self.assertEqual(inferer.type_layout(LangType("A")), Layout(16, 8, 2))
+
+    def test_pinned(self):
+        """Test pinned structs are never reordered."""
+        code = """
+@pinned
+struct A {a: char, b: long, c: char}
+        """.strip()
+        inferer = Inferer(reorder_fields=True)
+        c_code = inferer.check(code_to_ast(code)).c_code()
+        self.assertIn("struct A {char a; long long b; char c;};", c_code)
+        self.assertEqual(inferer.type_layout(LangType("A")), Layout(24, 8, 14))
+
+        with self.assertRaises(RuntimeError):
+            Inferer().check(code_to_ast("@unknown\nstruct A {a: char}"))
+
+    def test_struct_layout_example(self):
+        out = run_files(["examples/struct_layout.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"15\n40 12\n32\n")
+
+        out = run_files(["examples/struct_layout.cu"], stdout=subprocess.PIPE,
+                        reorder_fields=True)
+        self.assertEqual(out.stdout, b"15\n24 12\n24\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
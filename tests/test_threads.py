@@ -0,0 +1,84 @@
+import unittest
+import subprocess
+
+from compiler import *
+
+
+class TestThreads(unittest.TestCase):
+    def test_atomics(self):
+        code = """
+count: atomic_int
+
+def incr() -> int:
+    old = atomic_int_fetch_add(&count, 1, memory_order_relaxed)
+    expected = old + 1
+    atomic_int_compare_exchange(&count, &expected, 0, memory_order_acq_rel, memory_order_acquire)
+    atomic_thread_fence(memory_order_seq_cst)
+    return atomic_int_load(&count, memory_order_acquire)
+        """.strip()
+        ast = code_to_ast(code, infer=True)
+        self.assertFalse(uses_threads(ast))
+        c_code = ast.c_code()
+        self.assertIn("#include <lang_atomic.h>", c_code)
+        self.assertIn("atomic_int count;", c_code)
+        self.assertIn("int old = atomic_int_fetch_add(&(count), 1, memory_order_relaxed);", c_code)
+
+    def test_atomic_value_types(self):
+        """Test the values of the atomics have the C types of the language
+        types, so pointers to them can be passed to compare_exchange."""
+        code = """
+total: atomic_long
+bits: atomic_ulong
+
+def swap() -> int:
+    e: long = 0
+    ue: ulong = 0
+    a = atomic_long_compare_exchange(&total, &e, 1, memory_order_seq_cst, memory_order_seq_cst)
+    b = atomic_ulong_compare_exchange(&bits, &ue, 1, memory_order_seq_cst, memory_order_seq_cst)
+    return a + b
+        """.strip()
+        c_code = code_to_ast(code, infer=True).c_code()
+        subprocess.run(
+            ["gcc", "-std=c11", "-fsyntax-only", "-Werror", "-I" + C_INCLUDE_DIR,
+             "-x", "c", "-"],
+            input=c_code.encode(),
+            check=True,
+        )
+
+    def test_atomic_errors(self):
+        # There is no arithmetic on atomic pointers
+        with self.assertRaises(KeyError):
+            code_to_ast("x: atomic_ptr\ndef func():\n    atomic_ptr_fetch_add(&x, NULL, memory_order_relaxed)", infer=True)
+
+        # Atomics cannot be assigned directly
+        with self.assertRaises(TypeError):
+            code_to_ast("x: atomic_int\ndef func():\n    x = 1", infer=True)
+
+    def test_pthreads(self):
+        code = """
+lock: pthread_mutex_t
+
+def work(arg: void*) -> void*:
+    pthread_mutex_lock(&lock)
+    pthread_mutex_unlock(&lock)
+    return arg
+
+def main():
+    pthread_mutex_init(&lock, NULL)
+    thread: pthread_t
+    pthread_create(&thread, NULL, work, NULL)
+    pthread_join(thread, NULL)
+        """.strip()
+        ast = code_to_ast(code, infer=True)
+        self.assertTrue(uses_threads(ast))
+        c_code = ast.c_code()
+        self.assertIn("#include <pthread.h>", c_code)
+        self.assertIn("pthread_create(&(thread), NULL, work, NULL);", c_code)
+
+    def test_threads_example(self):
+        out = run_files(["examples/threads.cu"], stdout=subprocess.PIPE)
+        self.assertEqual(out.stdout, b"50 1275 1 -1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()